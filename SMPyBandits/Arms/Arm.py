@@ -5,6 +5,8 @@ from __future__ import division, print_function  # Python 2 compatibility
 __author__ = "Lilian Besson"
 __version__ = "0.6"
 
+import numpy as np
+
 
 class Arm(object):
     """ Base class for an arm class."""
@@ -39,6 +41,36 @@ class Arm(object):
 
     # --- Random samples
 
+    #: Random generator given to :meth:`set_random_generator`, or None to use the global :mod:`numpy.random` stream.
+    _generator = None
+
+    @property
+    def random_generator(self):
+        """ The random generator used to draw samples: the one given to :meth:`set_random_generator`, or by default the global :mod:`numpy.random` stream (which is seeded at every repetition by the :class:`Environment.Evaluator`)."""
+        return np.random if self._generator is None else self._generator
+
+    def set_random_generator(self, generator=None):
+        """ Draw all the next samples from this :class:`numpy.random.Generator` (or :class:`numpy.random.RandomState`), e.g., to share the random stream of an experiment. Give ``None`` to go back to the global :mod:`numpy.random` stream.
+
+        - Two arms with generators seeded the same way draw the same samples:
+
+        >>> from Bernoulli import Bernoulli; from Gaussian import Gaussian; from DiscreteArm import DiscreteArm
+        >>> for arm1, arm2 in [(Bernoulli(0.3), Bernoulli(0.3)), (Gaussian(0.3, 0.1), Gaussian(0.3, 0.1)), (DiscreteArm({0: 0.5, 1: 0.5}), DiscreteArm({0: 0.5, 1: 0.5}))]:
+        ...     arm1.set_random_generator(np.random.default_rng(42))
+        ...     arm2.set_random_generator(np.random.default_rng(42))
+        ...     print([arm1.draw() for _ in range(10)] == [arm2.draw() for _ in range(10)], np.all(arm1.draw_nparray(10) == arm2.draw_nparray(10)))
+        True True
+        True True
+        True True
+        """
+        self._generator = generator
+
+    # --- Change of parameter
+
+    def set_param(self, param):
+        """ Change the main parameter of this arm in place (the first argument of its constructor, e.g., its mean, as drawn by :class:`Environment.MAB.NonStationaryMAB`), keeping its other parameters and its random generator."""
+        raise NotImplementedError("This method set_param(param) has to be implemented in the class inheriting from Arm.")
+
     def draw(self, t=None):
         """ Draw one random sample."""
         raise NotImplementedError("This method draw(t) has to be implemented in the class inheriting from Arm.")
@@ -47,6 +79,17 @@ class Arm(object):
         """ Draw a numpy array of random samples, of a certain shape."""
         raise NotImplementedError("This method draw_nparray(t) has to be implemented in the class inheriting from Arm.")
 
+    # --- Vectorized samples, from many arms of the same family
+
+    def vector_params(self):
+        """ Parameters of this arm, as a tuple of numbers, used by :meth:`draw_vect` to draw one sample from many arms of the same family at once (see :meth:`Environment.MAB.MAB.draw_many`). ``None`` if it is not supported by this arm."""
+        return None
+
+    @staticmethod
+    def draw_vect(params, generator):
+        """ Draw one random sample from each of many arms of this family, given the numpy arrays of their parameters (one array for each value of :meth:`vector_params`), from the random ``generator``."""
+        raise NotImplementedError("This method draw_vect(params, generator) has to be implemented in the class inheriting from Arm.")
+
     # --- Lower bound
 
     @staticmethod
@@ -63,3 +106,13 @@ class Arm(object):
     def oneHOI(mumax, mu):
         """ One term for the HOI factor for this arm."""
         return 1 - (mumax - mu)
+
+    # --- Vectorized versions, on numpy arrays of means
+
+    def kl_vect(self, x, y):
+        """ Vectorized version of :meth:`kl`, on numpy arrays (with broadcasting). Arms having an array-native divergence in :mod:`kullback` override it."""
+        return np.vectorize(self.kl, otypes=[float])(x, y)
+
+    def oneLR_vect(self, mumax, mus):
+        """ Vectorized version of :meth:`oneLR`, for an array of means ``mus``."""
+        return np.vectorize(self.oneLR, otypes=[float])(mumax, mus)
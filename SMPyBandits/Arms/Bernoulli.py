@@ -25,15 +25,14 @@ __author__ = "Lilian Besson"
 __version__ = "0.6"
 
 import numpy as np
-from numpy.random import binomial
 
 # Local imports
 try:
     from .Arm import Arm
-    from .kullback import klBern
+    from .kullback import klBern, klBern_vect
 except ImportError:
     from Arm import Arm
-    from kullback import klBern
+    from kullback import klBern, klBern_vect
 
 
 class Bernoulli(Arm):
@@ -45,16 +44,31 @@ class Bernoulli(Arm):
         self.probability = probability  #: Parameter p for this Bernoulli arm
         self.mean = probability  #: Mean for this Bernoulli arm
 
+    def set_param(self, probability):
+        """ Change the parameter p (and the mean) of this arm in place."""
+        assert 0 <= probability <= 1, "Error, the parameter probability for Bernoulli class has to be in [0, 1]."  # DEBUG
+        self.probability = self.mean = probability
+
     # --- Random samples
 
     def draw(self, t=None):
         """ Draw one random sample."""
-        return binomial(1, self.probability)
+        return self.random_generator.binomial(1, self.probability)
         # return np.asarray(binomial(1, self.probability), dtype=float)
 
     def draw_nparray(self, shape=(1,)):
         """ Draw a numpy array of random samples, of a certain shape."""
-        return np.asarray(binomial(1, self.probability, shape), dtype=float)
+        return np.asarray(self.random_generator.binomial(1, self.probability, shape), dtype=float)
+
+    def vector_params(self):
+        """ Parameters of this arm, for :meth:`draw_vect`."""
+        return (self.probability,)
+
+    @staticmethod
+    def draw_vect(params, generator):
+        """ Draw one random sample from each of many Bernoulli arms, with only one uniform draw for each."""
+        probabilities, = params
+        return np.asarray(generator.random(np.shape(probabilities)) < probabilities, dtype=float)
 
     # --- Printing
 
@@ -82,6 +96,17 @@ class Bernoulli(Arm):
         """ One term of the Lai & Robbins lower bound for Bernoulli arms: (mumax - mu) / KL(mu, mumax). """
         return (mumax - mu) / klBern(mu, mumax)
 
+    @staticmethod
+    def kl_vect(x, y):
+        """ The kl(x, y) to use for this arm, on numpy arrays."""
+        return klBern_vect(x, y)
+
+    @staticmethod
+    def oneLR_vect(mumax, mus):
+        """ Terms of the Lai & Robbins lower bound for Bernoulli arms, for an array of means ``mus``. """
+        mus = np.asarray(mus, dtype=float)
+        return (mumax - mus) / klBern_vect(mus, mumax)
+
 
 # Only export and expose the class defined here
 __all__ = ["Bernoulli"]
@@ -26,7 +26,6 @@ __version__ = "0.5"
 
 # from random import random
 import numpy as np
-from numpy.random import binomial as npbinomial
 
 # Local imports
 try:
@@ -48,16 +47,21 @@ class Binomial(Arm):
         self.draws = draws  #: Parameter n for this Binomial arm
         self.mean = probability * draws  #: Mean for this Binomial arm
 
+    def set_param(self, probability):
+        """ Change the parameter p (and the mean) of this arm in place, keeping its number of draws."""
+        assert 0 <= probability <= 1, "Error, the parameter probability for Binomial class has to be in [0, 1]."  # DEBUG
+        self.probability = probability
+        self.mean = probability * self.draws
+
     # --- Random samples
 
     def draw(self, t=None):
         """ Draw one random sample. The parameter t is ignored in this Arm."""
-        # return np.asarray(npbinomial(self.draws, self.probability), dtype=float)
-        return npbinomial(self.draws, self.probability)
+        return self.random_generator.binomial(self.draws, self.probability)
 
     def draw_nparray(self, shape=(1,)):
         """ Draw a numpy array of random samples, of a certain shape."""
-        return np.asarray(npbinomial(self.draws, self.probability, shape), dtype=float)
+        return np.asarray(self.random_generator.binomial(self.draws, self.probability, size=shape), dtype=float)
 
     # --- Printing
 
@@ -54,6 +54,12 @@ class Constant(Arm):
         self.amplitude = amplitude  #: Known amplitude of rewards
         self.mean = constant_reward  #: Mean for this Constant arm
 
+    def set_param(self, constant_reward):
+        """ Change the constant reward (and the mean) of this arm in place, keeping its amplitude."""
+        constant_reward = float(constant_reward)
+        self.constant_reward = self.mean = constant_reward
+        self.lower = min(self.lower, np.floor(constant_reward))
+
     # --- Random samples
 
     def draw(self, t=None):
@@ -64,6 +70,16 @@ class Constant(Arm):
         """ Draw a numpy array of constant samples, of a certain shape."""
         return np.full(shape, self.constant_reward)
 
+    def vector_params(self):
+        """ Parameters of this arm, for :meth:`draw_vect`."""
+        return (self.constant_reward,)
+
+    @staticmethod
+    def draw_vect(params, generator):
+        """ Constant samples from each of many Constant arms."""
+        constant_rewards, = params
+        return np.array(constant_rewards, dtype=float)
+
     # --- Printing
 
     def __str__(self):
@@ -16,23 +16,23 @@ D({-1: 0.25, 0: 0.5, 1: 0.25})
 >>> D3values.draw()
 0
 >>> D3values.draw_nparray(20)
-array([ 0,  0,  0,  0,  0,  0,  1,  1,  0,  1,  0,  0,  1, -1, -1, -1,  1,
-        1,  1,  1])
+array([ 1,  0,  0,  0,  0,  0,  1,  0,  0,  1,  0,  0,  0, -1, -1, -1,  1,
+        1,  1,  0])
 
 - Another example, with heavy tail:
 
 >>> D5values = DiscreteArm({-1000: 0.001, 0: 0.5, 1: 0.25, 2:0.25, 1000: 0.001})
 >>> D5values
-D({-1000: 0.001, 0: 0.5, 1: 0.25, 2:0.25, 1000: 0.001})
+D({-1e+03: 0.001, 0: 0.5, 1: 0.25, 2: 0.25, 1e+03: 0.001})
 >>> D5values.mean
 0.75
 
 Examples of sampling from an arm:
 
 >>> D5values.draw()
-2
+1
 >>> D5values.draw_nparray(20)
-array([0, 2, 0, 1, 0, 2, 1, 0, 0, 2, 0, 1, 0, 1, 1, 1, 2, 1, 0, 0])
+array([1, 1, 0, 2, 0, 2, 0, 1, 0, 1, 1, 0, 0, 2, 2, 2, 2, 1, 0, 1])
 """
 from __future__ import division, print_function  # Python 2 compatibility
 
@@ -40,15 +40,16 @@ __author__ = "Lilian Besson"
 __version__ = "0.9"
 
 import numpy as np
-from numpy.random import choice
 
 # Local imports
 try:
     from .Arm import Arm
     from .kullback import klBern
+    from .categorical import AliasTable
 except ImportError:
     from Arm import Arm
     from kullback import klBern
+    from categorical import AliasTable
 
 
 class DiscreteArm(Arm):
@@ -70,16 +71,17 @@ class DiscreteArm(Arm):
         self._amplitude = max(self._values) - self._lower
         self.mean = sum(v * p for v, p in self._items)  #: Mean for this DiscreteArm arm
         self.size = len(self._values)  #: Number of different values in this DiscreteArm arm
+        self._alias_table = AliasTable(self._probabilities)
 
     # --- Random samples
 
     def draw(self, t=None):
-        """ Draw one random sample."""
-        return choice(self._values, p=self._probabilities)
+        r""" Draw one random sample, in :math:`\mathcal{O}(1)` thanks to a precomputed alias table (see :class:`categorical.AliasTable`)."""
+        return self._values[self._alias_table.draw(self._generator)]
 
     def draw_nparray(self, shape=(1,)):
         """ Draw a numpy array of random samples, of a certain shape."""
-        return np.asarray(choice(self._values, p=self._probabilities, replace=True, size=shape))
+        return self._values[self._alias_table.draw_nparray(shape, self._generator)]
 
     # --- Printing
 
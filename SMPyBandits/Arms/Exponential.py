@@ -14,31 +14,29 @@ Example of creating an arm:
 Examples of sampling from an arm:
 
 >>> Exp03.draw()  # doctest: +ELLIPSIS
-0.052...
+0.248...
 >>> Exp03.draw_nparray(20)  # doctest: +ELLIPSIS,+NORMALIZE_WHITESPACE
-array([0.18..., 0.10..., 0.15..., 0.18..., 0.26...,
-       0.13..., 0.25..., 0.03..., 0.01..., 0.29... ,
-       0.07..., 0.19..., 0.17..., 0.02... , 0.82... ,
-       0.76..., 1.     , 0.05..., 0.07..., 0.04...])
+array([0.39..., 0.28..., 0.24..., 0.17..., 0.32...,
+       0.18..., 0.69..., 1.        , 0.15..., 0.49...,
+       0.23..., 0.26..., 0.81..., 0.02..., 0.02...,
+       0.00..., 0.55..., 0.47..., 0.63..., 1.        ])
 """
 from __future__ import division, print_function  # Python 2 compatibility
 
 __author__ = "Olivier Cappé, Aurélien Garivier, Lilian Besson"
 __version__ = "0.5"
 
-from math import isinf, exp, log
-from random import random
+from math import isinf, exp
 import numpy as np
-from numpy.random import random as nprandom
 from scipy.optimize import minimize
 
 # Local imports
 try:
     from .Arm import Arm
-    from .kullback import klExp
+    from .kullback import klExp, klExp_vect
 except ImportError:
     from Arm import Arm
-    from kullback import klExp
+    from kullback import klExp, klExp_vect
 
 
 def p_of_expectation(expectation, trunc=1):
@@ -68,24 +66,38 @@ class Exponential(Arm):
     # def __init__(self, p, trunc=float('+inf')):
     def __init__(self, p, trunc=1):
         """New arm."""
-        self.p = p  #: Parameter p for Exponential arm
-        assert p > 0, "Error, the parameter 'p' for Exponential arm has to be > 0."
         self.trunc = trunc  #: Max value of reward
         assert trunc > 0, "Error, the parameter 'trunc' for Exponential arm has to be > 0."
-        if isinf(trunc):
+        Exponential.set_param(self, p)
+
+    def set_param(self, p):
+        """ Change the parameter p (and the mean) of this arm in place, keeping its truncation."""
+        assert p > 0, "Error, the parameter 'p' for Exponential arm has to be > 0."
+        self.p = p  #: Parameter p for Exponential arm
+        if isinf(self.trunc):
             self.mean = 1. / p  #: Mean of Exponential arm
         else:
-            self.mean = (1. - exp(-p * trunc)) / p
+            self.mean = (1. - exp(-p * self.trunc)) / p
 
     # --- Random samples
 
     def draw(self, t=None):
         """ Draw one random sample. The parameter t is ignored in this Arm."""
-        return min((-1. / self.p) * log(random()), self.trunc)
+        return min(self.random_generator.exponential(1. / self.p), self.trunc)
 
     def draw_nparray(self, shape=(1,)):
-        """ Draw one random sample. The parameter t is ignored in this Arm."""
-        return np.minimum((-1. / self.p) * np.log(nprandom(shape)), self.trunc)
+        """ Draw a numpy array of random samples, of a certain shape."""
+        return np.minimum(self.random_generator.exponential(1. / self.p, size=shape), self.trunc)
+
+    def vector_params(self):
+        """ Parameters of this arm, for :meth:`draw_vect`."""
+        return (self.p, self.trunc)
+
+    @staticmethod
+    def draw_vect(params, generator):
+        """ Draw one random sample from each of many Exponential arms."""
+        ps, truncs = params
+        return np.minimum(generator.exponential(1. / ps), truncs)
 
     # --- Printing
 
@@ -113,6 +125,17 @@ class Exponential(Arm):
         """ One term of the Lai & Robbins lower bound for Exponential arms: (mumax - mu) / KL(mu, mumax). """
         return (mumax - mu) / klExp(mu, mumax)
 
+    @staticmethod
+    def kl_vect(x, y):
+        """ The kl(x, y) to use for this arm, on numpy arrays."""
+        return klExp_vect(x, y)
+
+    @staticmethod
+    def oneLR_vect(mumax, mus):
+        """ Terms of the Lai & Robbins lower bound for Exponential arms, for an array of means ``mus``. """
+        mus = np.asarray(mus, dtype=float)
+        return (mumax - mus) / klExp_vect(mus, mumax)
+
     def oneHOI(self, mumax, mu):
         """ One term for the HOI factor for this arm."""
         return 1 - (mumax - mu) / self.trunc
@@ -129,6 +152,10 @@ class ExponentialFromMean(Exponential):
         p = p_of_expectation(mean)
         super(ExponentialFromMean, self).__init__(p, trunc=trunc)
 
+    def set_param(self, mean):
+        """ Change the mean of this arm in place."""
+        super(ExponentialFromMean, self).set_param(p_of_expectation(mean))
+
 
 class UnboundedExponential(Exponential):
     """ Exponential distributed arm, not truncated, ie. trunc =  oo."""
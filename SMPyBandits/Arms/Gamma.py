@@ -14,21 +14,19 @@ Example of creating an arm:
 Examples of sampling from an arm:
 
 >>> Gamma03.draw()  # doctest: +ELLIPSIS
-0.079...
+0.135...
 >>> Gamma03.draw_nparray(20)  # doctest: +ELLIPSIS,+NORMALIZE_WHITESPACE
-array([1.35...e-01, 1.84...e-01, 5.71...e-02, 6.36...e-02,
-       4.94...e-01, 1.51...e-01, 1.48...e-04, 2.25...e-06,
-       4.56...e-01, 1.00...e+00, 7.59...e-02, 8.12...e-04,
-       1.54...e-03, 1.14...e-01, 1.18...e-02, 7.30...e-02,
-       1.76...e-06, 1.94...e-01, 1.00...e+00, 3.30...e-02])
+array([1.84...e-01, 5.71...e-02, 6.36...e-02, 4.94...e-01,
+       1.51...e-01, 1.48...e-04, 2.25...e-06, 4.56...e-01,
+       1.00...e+00, 7.59...e-02, 8.12...e-04, 1.54...e-03,
+       1.14...e-01, 1.18...e-02, 7.30...e-02, 1.76...e-06,
+       1.94...e-01, 1.00...e+00, 3.30...e-02, 2.58...e-01])
 """
 from __future__ import division, print_function  # Python 2 compatibility
 
 __author__ = "Lilian Besson"
 __version__ = "0.6"
 
-from random import gammavariate
-from numpy.random import gamma
 import numpy as np
 
 # Local imports
@@ -63,15 +61,21 @@ class Gamma(Arm):
         self.min = mini  #: Lower value of rewards
         self.max = maxi  #: Larger value of rewards
 
+    def set_param(self, shape):
+        """ Change the shape parameter (and the mean) of this arm in place, keeping its scale and its truncation."""
+        assert shape > 0, "Error, the parameter 'shape' for Gamma arm has to be > 0."
+        self.shape = shape
+        self.mean = shape * self.scale
+
     # --- Random samples
 
     def draw(self, t=None):
         """ Draw one random sample. The parameter t is ignored in this Arm."""
-        return min(max(gammavariate(self.shape, self.scale), self.min), self.max)
+        return min(max(self.random_generator.gamma(self.shape, self.scale), self.min), self.max)
 
     def draw_nparray(self, shape=(1,)):
         """ Draw a numpy array of random samples, of a certain shape."""
-        return np.minimum(np.maximum(gamma(self.shape, self.scale, size=shape), self.min), self.max)
+        return np.clip(self.random_generator.gamma(self.shape, self.scale, size=shape), self.min, self.max)
 
     # --- Printing
 
@@ -111,6 +115,10 @@ class GammaFromMean(Gamma):
         shape = mean / scale
         super(GammaFromMean, self).__init__(shape, scale=scale, mini=mini, maxi=maxi)
 
+    def set_param(self, mean):
+        """ Change the mean of this arm in place, with shape = mean / scale."""
+        super(GammaFromMean, self).set_param(mean / self.scale)
+
 
 class UnboundedGamma(Gamma):
     """ Gamma distributed arm, not truncated, ie. supported in (-oo,  oo)."""
@@ -14,30 +14,28 @@ N(0.3, 0.05)
 Examples of sampling from an arm:
 
 >>> Gauss03.draw()  # doctest: +ELLIPSIS
-0.3470...
+0.3882...
 >>> Gauss03.draw_nparray(20)  # doctest: +ELLIPSIS,+NORMALIZE_WHITESPACE
-array([0.388..., 0.320..., 0.348... , 0.412..., 0.393... ,
-       0.251..., 0.347..., 0.292..., 0.294..., 0.320...,
-       0.307..., 0.372..., 0.338..., 0.306..., 0.322...,
-       0.316..., 0.374..., 0.289..., 0.315..., 0.257...])
+array([0.320..., 0.348..., 0.412..., 0.393..., 0.251...,
+       0.347..., 0.292..., 0.294..., 0.320..., 0.307...,
+       0.372..., 0.338..., 0.306..., 0.322..., 0.316...,
+       0.374..., 0.289..., 0.315..., 0.257..., 0.172...])
 """
 from __future__ import division, print_function  # Python 2 compatibility
 
 __author__ = "Olivier Cappé, Aurélien Garivier, Lilian Besson"
 __version__ = "0.9"
 
-from random import gauss
-from numpy.random import standard_normal
 import numpy as np
 from scipy.special import erf
 
 # Local imports
 try:
     from .Arm import Arm
-    from .kullback import klGauss
+    from .kullback import klGauss, klGauss_vect
 except ImportError:
     from Arm import Arm
-    from kullback import klGauss
+    from kullback import klGauss, klGauss_vect
 
 oo = float('+inf')  # Nice way to write +infinity
 
@@ -59,6 +57,10 @@ class Gaussian(Arm):
         assert mini <= maxi, "Error, the parameter 'mini' for Gaussian arm has to < 'maxi'."  # DEBUG
         self.min = mini  #: Lower value of rewards
         self.max = maxi  #: Higher value of rewards
+
+    def set_param(self, mu):
+        """ Change the mean of this arm in place, keeping its variance and its truncation."""
+        self.mu = self.mean = mu
         # XXX if needed, compute the true mean : Cf. https://en.wikipedia.org/wiki/Truncated_normal_distribution#Moments
         # real_mean = mu + sigma * (phi(mini) - phi(maxi)) / (Phi(maxi) - Phi(mini))
 
@@ -66,11 +68,21 @@ class Gaussian(Arm):
 
     def draw(self, t=None):
         """ Draw one random sample. The parameter t is ignored in this Arm."""
-        return min(max(gauss(self.mu, self.sigma), self.min), self.max)
+        return min(max(self.random_generator.normal(self.mu, self.sigma), self.min), self.max)
 
     def draw_nparray(self, shape=(1,)):
         """ Draw a numpy array of random samples, of a certain shape."""
-        return np.minimum(np.maximum(self.mu + self.sigma * standard_normal(shape), self.min), self.max)
+        return np.minimum(np.maximum(self.mu + self.sigma * self.random_generator.standard_normal(shape), self.min), self.max)
+
+    def vector_params(self):
+        """ Parameters of this arm, for :meth:`draw_vect`."""
+        return (self.mu, self.sigma, self.min, self.max)
+
+    @staticmethod
+    def draw_vect(params, generator):
+        """ Draw one random sample from each of many Gaussian arms."""
+        mus, sigmas, minis, maxis = params
+        return np.minimum(np.maximum(mus + sigmas * generator.standard_normal(np.shape(mus)), minis), maxis)
 
     # --- Printing
 
@@ -96,6 +108,15 @@ class Gaussian(Arm):
         """ One term of the Lai & Robbins lower bound for Gaussian arms: (mumax - mu) / KL(mu, mumax). """
         return (mumax - mu) / klGauss(mu, mumax, self.sigma)
 
+    def kl_vect(self, x, y):
+        """ The kl(x, y) to use for this arm, on numpy arrays."""
+        return klGauss_vect(x, y, self.sigma)
+
+    def oneLR_vect(self, mumax, mus):
+        """ Terms of the Lai & Robbins lower bound for Gaussian arms, for an array of means ``mus``. """
+        mus = np.asarray(mus, dtype=float)
+        return (mumax - mus) / klGauss_vect(mus, mumax, self.sigma)
+
     def oneHOI(self, mumax, mu):
         """ One term for the HOI factor for this arm."""
         return 1 - (mumax - mu) / self.max
@@ -179,11 +200,11 @@ class UnboundedGaussian(Gaussian):
 
     def draw(self, t=None):
         """ Draw one random sample. The parameter t is ignored in this Arm."""
-        return gauss(self.mu, self.sigma)
+        return self.random_generator.normal(self.mu, self.sigma)
 
     def draw_nparray(self, shape=(1,)):
         """ Draw a numpy array of random samples, of a certain shape."""
-        return self.mu + self.sigma * standard_normal(shape)
+        return self.mu + self.sigma * self.random_generator.standard_normal(shape)
 
     def __repr__(self):
         return "N({:.3g}, {:.3g})".format(self.mu, self.sigma)
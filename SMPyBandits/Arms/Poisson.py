@@ -26,30 +26,33 @@ __version__ = "0.6"
 
 from math import isinf, exp
 import numpy as np
-from scipy.stats import poisson
 
 # Local imports
 try:
     from .Arm import Arm
-    from .kullback import klPoisson
+    from .kullback import klPoisson, klPoisson_vect
 except ImportError:
     from Arm import Arm
-    from kullback import klPoisson
+    from kullback import klPoisson, klPoisson_vect
 
 
 class Poisson(Arm):
     """ Poisson distributed arm, possibly truncated.
 
     - Default is to not truncate.
-    - Warning: the draw() method is QUITE inefficient! (15 seconds for 200000 draws, 62 µs for 1).
+    - Samples are drawn directly from the random generator of the arm (see :meth:`Arm.set_random_generator`), not with :func:`scipy.stats.poisson.rvs` which was QUITE inefficient (62 µs for 1 draw).
     """
 
     def __init__(self, p, trunc=1):
         """New arm."""
+        self.trunc = trunc  #: Max value of rewards
+        Poisson.set_param(self, p)
+
+    def set_param(self, p):
+        """ Change the parameter p (and the mean) of this arm in place, keeping its truncation."""
         assert p >= 0, "Error, the parameter 'p' for Poisson arm has to be >= 0."  # DEBUG
         self.p = p  #: Parameter p for Poisson arm
-        self.trunc = trunc  #: Max value of rewards
-        if isinf(trunc):
+        if isinf(self.trunc):
             self.mean = p  #: Mean for this Poisson arm
         else:  # Warning: this is very slow if self.trunc is large!
             q = exp(-p)
@@ -65,11 +68,21 @@ class Poisson(Arm):
 
     def draw(self, t=None):
         """ Draw one random sample. The parameter t is ignored in this Arm."""
-        return min(poisson.rvs(self.p), self.trunc)
+        return min(self.random_generator.poisson(self.p), self.trunc)
 
     def draw_nparray(self, shape=(1,)):
         """ Draw a numpy array of random samples, of a certain shape."""
-        return np.minimum(poisson.rvs(self.p, size=shape), self.trunc)
+        return np.minimum(self.random_generator.poisson(self.p, size=shape), self.trunc)
+
+    def vector_params(self):
+        """ Parameters of this arm, for :meth:`draw_vect`."""
+        return (self.p, self.trunc)
+
+    @staticmethod
+    def draw_vect(params, generator):
+        """ Draw one random sample from each of many Poisson arms."""
+        ps, truncs = params
+        return np.minimum(generator.poisson(ps), truncs).astype(float)
 
     # --- Printing
 
@@ -94,6 +107,17 @@ class Poisson(Arm):
         """ One term of the Lai & Robbins lower bound for Poisson arms: (mumax - mu) / KL(mu, mumax). """
         return (mumax - mu) / klPoisson(mu, mumax)
 
+    @staticmethod
+    def kl_vect(x, y):
+        """ The kl(x, y) to use for this arm, on numpy arrays."""
+        return klPoisson_vect(x, y)
+
+    @staticmethod
+    def oneLR_vect(mumax, mus):
+        """ Terms of the Lai & Robbins lower bound for Poisson arms, for an array of means ``mus``. """
+        mus = np.asarray(mus, dtype=float)
+        return (mumax - mus) / klPoisson_vect(mus, mumax)
+
 
 class UnboundedPoisson(Poisson):
     """ Poisson distributed arm, not truncated, ie. trunc =  oo."""
@@ -14,20 +14,18 @@ U(0, 1)
 Examples of sampling from an arm:
 
 >>> Unif01.draw()  # doctest: +ELLIPSIS
-0.8444...
+0.5488...
 >>> Unif01.draw_nparray(20)  # doctest: +ELLIPSIS,+NORMALIZE_WHITESPACE
-array([0.54... , 0.71..., 0.60..., 0.54..., 0.42... ,
-       0.64..., 0.43..., 0.89...  , 0.96..., 0.38...,
-       0.79..., 0.52..., 0.56..., 0.92..., 0.07...,
-       0.08... , 0.02... , 0.83..., 0.77..., 0.87...])
+array([0.71..., 0.60..., 0.54..., 0.42..., 0.64...,
+       0.43..., 0.89..., 0.96..., 0.38..., 0.79...,
+       0.52..., 0.56..., 0.92..., 0.07..., 0.08...,
+       0.02..., 0.83..., 0.77..., 0.87..., 0.97...])
 """
 from __future__ import division, print_function  # Python 2 compatibility
 
 __author__ = "Lilian Besson"
 __version__ = "0.6"
 
-from random import random
-from numpy.random import random as nprandom
 
 # Local imports
 try:
@@ -71,11 +69,11 @@ class UniformArm(Arm):
 
     def draw(self, t=None):
         """ Draw one random sample. The parameter t is ignored in this Arm."""
-        return self.lower + (random() * self.amplitude)
+        return self.lower + (self.random_generator.random() * self.amplitude)
 
     def draw_nparray(self, shape=(1,)):
         """ Draw a numpy array of random samples, of a certain shape."""
-        return self.lower + (nprandom(shape) * self.amplitude)
+        return self.lower + (self.random_generator.random(shape) * self.amplitude)
 
     # --- Printing
 
@@ -20,7 +20,8 @@ Also contains:
 - :func:`uniformMeansWithSparsity`, to generate uniformly spaced means of arms, with sparsity constraints.
 - :func:`randomMeans`, to generate randomly spaced means of arms.
 - :func:`randomMeansWithGapBetweenMbestMworst`, to generate randomly spaced means of arms, with a constraint on the gap between the M-best arms and the (K-M)-worst arms.
-- :func:`randomMeansWithSparsity`, to generate randomly spaced means of arms with sparsity constraint.
+- :func:`randomMeansWithSparsity` and :func:`randomMeansWithSparsity2`, to generate randomly spaced means of arms with sparsity constraint.
+- All these random generators use exact rejection-free samplers for the gap constraints, and can return a ``(nbRepetitions, nbArms)`` array of means in one call, with ``nbRepetitions=R``.
 - :func:`shuffled`, to return a shuffled version of a list.
 - Utility functions :func:`array_from_str` :func:`list_from_str` and :func:`tuple_from_str` to obtain a `numpy.ndarray`, a `list` or a `tuple` from a string (used for the CLI env variables interface).
 - :func:`optimal_selection_probabilities`.
@@ -142,158 +143,168 @@ def uniformMeansWithSparsity(nbArms=10, sparsity=3, delta=0.05, lower=0., lowerN
         return shuffled(list(mus))
 
 
-def randomMeans(nbArms=3, mingap=None, lower=0., amplitude=1., isSorted=True):
+def _sortedUniformsWithGaps(nbRepetitions, gaps):
+    r"""Return a ``(nbRepetitions, len(gaps) + 1)`` array of sorted uniform samples in [0, 1], whose consecutive spacings satisfy :math:`x_{i+1} - x_i \geq g_i`, without any rejection.
+
+    - It is exactly the law of sorted i.i.d. uniform samples conditioned on the spacings constraints: sorted uniform samples in :math:`[0, 1 - \sum_i g_i]` are shifted by the cumulated gaps, and this map is a translation from the ordered simplex to the constrained one.
+    """
+    gaps = np.asarray(gaps, dtype=float)
+    totalGap = np.sum(gaps)
+    assert totalGap < 1, "Error: the total gap {:.3g} has to be < 1.".format(totalGap)  # DEBUG
+    mus = np.sort(np.random.rand(nbRepetitions, len(gaps) + 1), axis=1) * (1. - totalGap)
+    mus[:, 1:] += np.cumsum(gaps)
+    return mus
+
+
+def _shuffledRows(mus):
+    """Return a copy of a 2D array with an independent random permutation of each row."""
+    permutations = np.argsort(np.random.rand(*np.shape(mus)), axis=1)
+    return np.take_along_axis(mus, permutations, axis=1)
+
+
+def _finalizeMeans(mus, isSorted, nbRepetitions):
+    """Sort (or shuffle) each row of a ``(nbRepetitions, nbArms)`` array of means, and return it, or its unique row as a list if ``nbRepetitions=None``."""
+    mus = np.sort(mus, axis=1) if isSorted else _shuffledRows(mus)
+    return list(mus[0]) if nbRepetitions is None else mus
+
+
+def randomMeans(nbArms=3, mingap=None, lower=0., amplitude=1., isSorted=True, nbRepetitions=None):
     """Return a list of means of arms, randomly sampled uniformly in [lower, lower + amplitude], with a min gap >= mingap.
 
     - All means will be different, except if ``mingap=None``, with a min gap > 0.
+    - The gap constraint is obtained without any rejection, see :func:`_sortedUniformsWithGaps`.
 
     >>> import numpy as np; np.random.seed(1234)  # reproducible results
     >>> randomMeans(nbArms=3, mingap=0.05)  # doctest: +ELLIPSIS
-    [0.191..., 0.437..., 0.622...]
+    [0.172..., 0.443..., 0.659...]
     >>> randomMeans(nbArms=3, mingap=0.01)  # doctest: +ELLIPSIS
-    [0.276..., 0.801..., 0.958...]
+    [0.267..., 0.774..., 0.789...]
 
     - Means are sorted, except if ``isSorted=False``.
 
-    >>> import random; random.seed(1234)  # reproducible results
     >>> randomMeans(nbArms=5, mingap=0.01, isSorted=True)  # doctest: +ELLIPSIS
-    [0.006..., 0.229..., 0.416..., 0.535..., 0.899...]
+    [0.265..., 0.353..., 0.789..., 0.870..., 0.959...]
     >>> randomMeans(nbArms=5, mingap=0.01, isSorted=False)  # doctest: +ELLIPSIS
-    [0.419..., 0.932..., 0.072..., 0.755..., 0.650...]
+    [0.490..., 0.724..., 0.355..., 0.558..., 0.686...]
+
+    - With ``nbRepetitions=R``, a ``(R, nbArms)`` array of means is returned, with one independent problem by row:
+
+    >>> randomMeans(nbArms=4, mingap=0.1, nbRepetitions=2)  # doctest: +ELLIPSIS
+    array([[0.052..., 0.358..., 0.630..., 0.953...],
+           [0.221..., 0.378..., 0.655..., 0.852...]])
     """
     assert nbArms >= 1, "Error: 'nbArms' = {} has to be >= 1.".format(nbArms)  # DEBUG
     assert amplitude > 0, "Error: 'amplitude' = {:.3g} has to be > 0.".format(amplitude)  # DEBUG
-    mus = np.random.rand(nbArms)
+    gaps = np.zeros(nbArms - 1)
     if mingap is not None and mingap > 0:
         assert (nbArms * mingap) < (amplitude / 2.), "Error: 'mingap' = {:.3g} is too large, it might be impossible to find a vector of means with such a large gap for {} arms.".format(mingap, nbArms)  # DEBUG
-        # while len(set(mus)) == nbArms and np.min(np.abs(np.diff(mus))) <= mingap:  # Ensure a min gap > mingap
-        while np.min(np.abs(np.diff(mus))) <= mingap:  # Ensure a min gap > mingap
-            mus = np.random.rand(nbArms)
-    if isSorted:
-        return sorted(list(lower + (amplitude * mus)))
-    else:
-        np.random.shuffle(mus)  # Useless
-        return list(lower + (amplitude * mus))
+        gaps[:] = mingap
+    mus = _sortedUniformsWithGaps(1 if nbRepetitions is None else nbRepetitions, gaps)
+    return _finalizeMeans(lower + (amplitude * mus), isSorted, nbRepetitions)
 
 
-def randomMeansWithGapBetweenMbestMworst(nbArms=3, mingap=None, nbPlayers=2, lower=0., amplitude=1., isSorted=True):
+def randomMeansWithGapBetweenMbestMworst(nbArms=3, mingap=None, nbPlayers=2, lower=0., amplitude=1., isSorted=True, nbRepetitions=None):
     """Return a list of means of arms, randomly sampled uniformly in [lower, lower + amplitude], with a min gap >= mingap between the set Mbest and Mworst.
+
+    - The gap constraint is obtained without any rejection, see :func:`_sortedUniformsWithGaps`, and ``nbRepetitions`` works like for :func:`randomMeans`.
+
+    >>> import numpy as np; np.random.seed(1234)  # reproducible results
+    >>> randomMeansWithGapBetweenMbestMworst(nbArms=5, mingap=0.4, nbPlayers=2)  # doctest: +ELLIPSIS
+    [0.114..., 0.262..., 0.373..., 0.867..., 0.871...]
     """
     assert nbArms >= 1, "Error: 'nbArms' = {} has to be >= 1.".format(nbArms)  # DEBUG
     assert amplitude > 0, "Error: 'amplitude' = {:.3g} has to be > 0.".format(amplitude)  # DEBUG
-    mus = np.random.rand(nbArms)
+    gaps = np.zeros(nbArms - 1)
     if mingap is not None and mingap > 0 and nbPlayers < nbArms:
         assert mingap < amplitude, "Error: 'mingap' = {:.3g} is too large, it might be impossible to find a vector of means with such a large gap for {} arms.".format(mingap, nbArms)  # DEBUG
-        def gap(mus):
-            sorted_mus = sorted(mus)
-            mu_Mbest = sorted_mus[-nbPlayers]
-            mu_Mworst = sorted_mus[-nbPlayers-1]
-            return mu_Mbest - mu_Mworst
-        # while len(set(mus)) == nbArms and gap(mus) <= mingap:  # Ensure a min gap > mingap
-        while gap(mus) <= mingap:  # Ensure a min gap > mingap
-            mus = np.random.rand(nbArms)
-    if isSorted:
-        return sorted(list(lower + (amplitude * mus)))
-    else:
-        np.random.shuffle(mus)  # Useless
-        return list(lower + (amplitude * mus))
+        gaps[nbArms - nbPlayers - 1] = mingap
+    mus = _sortedUniformsWithGaps(1 if nbRepetitions is None else nbRepetitions, gaps)
+    return _finalizeMeans(lower + (amplitude * mus), isSorted, nbRepetitions)
 
 
-def randomMeansWithSparsity(nbArms=10, sparsity=3, mingap=0.01, delta=0.05, lower=0., lowerNonZero=0.5, amplitude=1., isSorted=True):
+def randomMeansWithSparsity(nbArms=10, sparsity=3, mingap=0.01, delta=0.05, lower=0., lowerNonZero=0.5, amplitude=1., isSorted=True, nbRepetitions=None):
     """Return a list of means of arms, in [lower, lower + amplitude], with a min gap >= mingap.
 
     - Exactly ``nbArms-sparsity`` arms will have a mean = ``lower`` and the others are randomly sampled uniformly in ``[lowerNonZero, lower + amplitude]``.
     - All means will be different, except if ``mingap=None``, with a min gap > 0.
+    - The gap constraint is obtained without any rejection, see :func:`_sortedUniformsWithGaps`, and ``nbRepetitions`` works like for :func:`randomMeans`.
 
     >>> import numpy as np; np.random.seed(1234)  # reproducible results
     >>> randomMeansWithSparsity(nbArms=6, sparsity=2, mingap=0.05)  # doctest: +ELLIPSIS
-    [0.0, 0.0, 0.0, 0.0, 0.595..., 0.811...]
+    [0.025, 0.175, 0.325, 0.475, 0.590..., 0.820...]
     >>> randomMeansWithSparsity(nbArms=6, sparsity=2, mingap=0.01)  # doctest: +ELLIPSIS
-    [0.0, 0.0, 0.0, 0.0, 0.718..., 0.892...]
+    [0.025, 0.175, 0.325, 0.475, 0.716..., 0.893...]
 
     - Means are sorted, except if ``isSorted=False``.
 
-    >>> import random; random.seed(1234)  # reproducible results
     >>> randomMeansWithSparsity(nbArms=6, sparsity=2, mingap=0.01, isSorted=True)  # doctest: +ELLIPSIS
-    [0.0, 0.0, 0.0, 0.0, 0.636..., 0.889...]
+    [0.025, 0.175, 0.325, 0.475, 0.634..., 0.891...]
     >>> randomMeansWithSparsity(nbArms=6, sparsity=2, mingap=0.01, isSorted=False)  # doctest: +ELLIPSIS
-    [0.0, 0.0, 0.900..., 0.638..., 0.0, 0.0]
+    [0.325, 0.475, 0.636..., 0.901..., 0.175, 0.025]
     """
     assert nbArms >= 1, "Error: 'nbArms' = {} has to be >= 1.".format(nbArms)  # DEBUG
     assert amplitude > 0, "Error: 'amplitude' = {:.3g} has to be > 0.".format(amplitude)  # DEBUG
     assert 0 <= sparsity <= nbArms, "Error: 'sparsity' = {} has to be 0 <= sparsity <= nbArms = {} ...".format(sparsity, nbArms)  # DEBUG
     assert lower <= lowerNonZero, "Error: 'lower' = {:.3g} has to be <= 'lowerNonZero' = {:.3g} ...".format(lower, lowerNonZero)  # DEBUG
-    mus = np.sort(np.random.rand(sparsity))
+    repetitions = 1 if nbRepetitions is None else nbRepetitions
+    gaps = np.zeros(max(0, sparsity - 1))
     if mingap is not None and mingap > 0:
         assert (nbArms * mingap) < (amplitude / 2.), "Error: 'mingap' = {:.3g} is too large, it might be impossible to find a vector of means with such a large gap for {} arms.".format(mingap, nbArms)  # DEBUG
-        while len(set(mus)) == sparsity and np.min(np.abs(np.diff(mus))) <= mingap:  # Ensure a min gap > mingap
-            mus = np.sort(np.random.rand(sparsity))
+        gaps[:] = mingap
+    mus = _sortedUniformsWithGaps(repetitions, gaps) if sparsity > 0 else np.zeros((repetitions, 0))
     # bad_mus = [lower] * (nbArms - sparsity)  # WARNING this was putting all the bad arms on 0 !
     if lowerNonZero == lower:
-        bad_mus = list(lower + np.zeros(nbArms - sparsity))
+        bad_mus = lower + np.zeros(nbArms - sparsity)
     else:
-        bad_mus = list(lower + (lowerNonZero - lower) * np.linspace(delta, 1 - delta, nbArms - sparsity))
+        bad_mus = lower + (lowerNonZero - lower) * np.linspace(delta, 1 - delta, nbArms - sparsity)
     good_mus = lowerNonZero + ((lower + amplitude - lowerNonZero) * mus)
-    mus = list(bad_mus) + list(good_mus)
+    mus = np.hstack([np.tile(bad_mus, (repetitions, 1)), good_mus])
 
     # Just some check...
-    assert len(mus) == nbArms, "Error: randomMeansWithSparsity() created a list mus of size = {} not = nbArms = {}...".format(len(mus), nbArms)  # DEBUG
-    assert len([m for m in mus if m > lowerNonZero]) == sparsity, "Error: randomMeansWithSparsity() created a list mus of with sparsity = {} not equal to s = {}...".format(len([m for m in mus if m >= lowerNonZero]), sparsity)  # DEBUG
-    assert len([m for m in mus if m <= lowerNonZero]) == (nbArms - sparsity), "Error: randomMeansWithSparsity() created a list mus of with a number of zero component = {} not equal to K - s = {}...".format(len([m for m in mus if m < lowerNonZero]), nbArms - sparsity)  # DEBUG
+    assert np.shape(mus) == (repetitions, nbArms), "Error: randomMeansWithSparsity() created an array mus of shape = {} not = (nbRepetitions, nbArms) = {}...".format(np.shape(mus), (repetitions, nbArms))  # DEBUG
+    assert np.all(np.sum(mus > lowerNonZero, axis=1) == sparsity), "Error: randomMeansWithSparsity() created a list mus of with sparsity not equal to s = {}...".format(sparsity)  # DEBUG
     # print("randomMeansWithSparsity() returns mus = {} ...".format(np.asarray(mus)))  # DEBUG
-
-    if isSorted:
-        return sorted(list(mus))
-    else:
-        return shuffled(list(mus))
+    return _finalizeMeans(mus, isSorted, nbRepetitions)
 
 
-def randomMeansWithSparsity2(nbArms=10, sparsity=3, mingap=0.01, lower=-1.0, lowerNonZero=0.0, amplitude=2.0, isSorted=True):
+def randomMeansWithSparsity2(nbArms=10, sparsity=3, mingap=0.01, lower=-1.0, lowerNonZero=0.0, amplitude=2.0, isSorted=True, nbRepetitions=None):
     """Return a list of means of arms, in [lower, lower + amplitude], with a min gap >= mingap.
 
     - Exactly ``nbArms-sparsity`` arms will have a mean sampled uniformly in ``[lower, lowerNonZero]`` and the others are randomly sampled uniformly in ``[lowerNonZero, lower + amplitude]``.
     - All means will be different, except if ``mingap=None``, with a min gap > 0.
+    - The gap constraint is obtained without any rejection, see :func:`_sortedUniformsWithGaps`, and ``nbRepetitions`` works like for :func:`randomMeans`.
 
     >>> import numpy as np; np.random.seed(1234)  # reproducible results
     >>> randomMeansWithSparsity2(nbArms=6, sparsity=2, mingap=0.05)  # doctest: +ELLIPSIS
-    [0.0, 0.0, 0.0, 0.0, 0.595..., 0.811...]
+    [-0.837..., -0.577..., -0.371..., -0.182..., 0.258..., 0.790...]
     >>> randomMeansWithSparsity2(nbArms=6, sparsity=2, mingap=0.01)  # doctest: +ELLIPSIS
-    [0.0, 0.0, 0.0, 0.0, 0.718..., 0.892...]
+    [-0.731..., -0.212..., -0.130..., -0.040..., 0.354..., 0.505...]
 
     - Means are sorted, except if ``isSorted=False``.
 
-    >>> import random; random.seed(1234)  # reproducible results
     >>> randomMeansWithSparsity2(nbArms=6, sparsity=2, mingap=0.01, isSorted=True)  # doctest: +ELLIPSIS
-    [0.0, 0.0, 0.0, 0.0, 0.636..., 0.889...]
+    [-0.640..., -0.445..., -0.317..., -0.278..., 0.013..., 0.508...]
     >>> randomMeansWithSparsity2(nbArms=6, sparsity=2, mingap=0.01, isSorted=False)  # doctest: +ELLIPSIS
-    [0.0, 0.0, 0.900..., 0.638..., 0.0, 0.0]
+    [0.074..., -0.230..., 0.375..., -0.393..., -0.113..., -0.646...]
     """
     assert nbArms >= 1, "Error: 'nbArms' = {} has to be >= 1.".format(nbArms)  # DEBUG
     assert amplitude > 0, "Error: 'amplitude' = {:.3g} has to be > 0.".format(amplitude)  # DEBUG
     assert 0 <= sparsity <= nbArms, "Error: 'sparsity' = {} has to be 0 <= sparsity <= nbArms = {} ...".format(sparsity, nbArms)  # DEBUG
     assert lower <= lowerNonZero, "Error: 'lower' = {:.3g} has to be <= 'lowerNonZero' = {:.3g} ...".format(lower, lowerNonZero)  # DEBUG
-    # first the bad
-    nb_bad = nbArms - sparsity
-    mus = np.sort(np.random.rand(nb_bad))
+    repetitions = 1 if nbRepetitions is None else nbRepetitions
+    nb_bad, nb_good = nbArms - sparsity, sparsity
+    gap = 0.
     if mingap is not None and mingap > 0:
         assert (nbArms * mingap) < (amplitude / 2.), "Error: 'mingap' = {:.3g} is too large, it might be impossible to find a vector of means with such a large gap for {} arms.".format(mingap, nbArms)  # DEBUG
-        while len(set(mus)) == nb_bad and np.min(np.abs(np.diff(mus))) <= mingap:  # Ensure a min gap > mingap
-            mus = np.sort(np.random.rand(nb_bad))
+        gap = mingap
+    # first the bad
+    mus = _sortedUniformsWithGaps(repetitions, np.full(max(0, nb_bad - 1), gap)) if nb_bad > 0 else np.zeros((repetitions, 0))
     bad_mus = lower + ((lowerNonZero - lower) * mus)
-    assert np.min(bad_mus) >= lower and np.max(bad_mus) <= lowerNonZero, "Error: bad generation of 'bad_mus', in interval [{:.3g},{:.3g}] instead of [{:.3g},{:.3g}]...".format(np.min(bad_mus), np.max(bad_mus), lower, lowerNonZero)  # DEBUG
     # then the good
-    nb_good = sparsity
-    mus = np.sort(np.random.rand(nb_good))
-    if mingap is not None and mingap > 0:
-        while len(set(mus)) == nb_good and np.min(np.abs(np.diff(mus))) <= mingap:  # Ensure a min gap > mingap
-            mus = np.sort(np.random.rand(nb_good))
+    mus = _sortedUniformsWithGaps(repetitions, np.full(max(0, nb_good - 1), gap)) if nb_good > 0 else np.zeros((repetitions, 0))
     good_mus = lowerNonZero + ((lower + amplitude - lowerNonZero) * mus)
-    assert np.min(good_mus) >= lowerNonZero and np.max(good_mus) <= lower + amplitude, "Error: bad generation of 'good_mus', in interval [{:.3g},{:.3g}] instead of [{:.3g},{:.3g}]...".format(np.min(good_mus), np.max(good_mus), lowerNonZero, lower + amplitude)  # DEBUG
-    mus = list(bad_mus) + list(good_mus)
-    if isSorted:
-        return sorted(list(mus))
-    else:
-        return shuffled(list(mus))
+    mus = np.hstack([bad_mus, good_mus])
+    return _finalizeMeans(mus, isSorted, nbRepetitions)
 
 
 def array_from_str(my_str):
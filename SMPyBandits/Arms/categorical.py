@@ -0,0 +1 @@
+../Policies/categorical.py
\ No newline at end of file
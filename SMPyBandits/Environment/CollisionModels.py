@@ -4,7 +4,7 @@
 Collision models are generic functions, taking:
 
 - the time: ``t``
-- the arms of the current environment: ``arms``
+- the arms of the current environment: ``arms`` (a list of arms, or the :class:`Environment.MAB.MAB` problem itself, to use its vectorized draws)
 - the list of players: ``players``
 - the numpy array of their choices: ``choices``
 - the numpy array to store their rewards: ``rewards``
@@ -17,6 +17,8 @@ As far as now, there is 4 different collision models implemented:
 - :func:`onlyUniqUserGetsReward`: simple collision model, where only the players alone on one arm sample it and receive the reward (default).
 - :func:`rewardIsSharedUniformly`: in case of more than one player on one arm, only one player (uniform choice) can sample it and receive the reward.
 - :func:`closerUserGetsReward`: in case of more than one player on one arm, only the closer player can sample it and receive the reward. It can take, or create if not given, a random distance of each player to the base station (random number in [0, 1]).
+
+All of them resolve the collisions of all the players at once, on the numpy array of their choices (see :func:`collisionsOfChoices`), and then give the rewards and inform of the collisions with :func:`giveRewards` and :func:`handleCollisions`. These use one batched call ``players.getRewards(playerIds, arms, rewards)`` (or ``players.handleCollisions(...)``) if the players support it, and one call to ``getReward`` (or ``handleCollision``) for each player otherwise.
 """
 from __future__ import division, print_function  # Python 2 compatibility
 
@@ -50,36 +52,103 @@ def handleCollision_or_getZeroReward(player, arm, lower=0):
         player.getReward(arm, lower)  # XXX Strong assumption on the model
 
 
+# --- Vectorized collision resolution
+
+def draw_each(arms, t):
+    """ One random sample from each arm, as a numpy array: with the vectorized :meth:`Environment.MAB.MAB.draw_each` if ``arms`` is a MAB problem, or one call to ``draw`` for each arm of a list."""
+    if hasattr(arms, 'draw_each'):
+        return arms.draw_each(t)
+    return np.array([a.draw(t) for a in arms], dtype=float)
+
+
+def draw_many(arms, armIds, t):
+    """ One random sample from each of the arms ``armIds``, as a numpy array: with the vectorized :meth:`Environment.MAB.MAB.draw_many` if ``arms`` is a MAB problem, or one call to ``draw`` for each arm of a list."""
+    if hasattr(arms, 'draw_many'):
+        return arms.draw_many(armIds, t)
+    return np.array([arms[armId].draw(t) for armId in armIds], dtype=float)
+
+
+def collisionsOfChoices(choices, nbArms):
+    """ Resolve the collisions of all the players at once, from the numpy array of their choices (a negative choice is a non-activated player).
+
+    - Return the number of players on each arm, and the mask of the activated players who are in collision (not alone on their arm).
+
+    >>> nbPlayersOnArms, collided = collisionsOfChoices(np.array([0, 2, 2, -1, 1]), 4)
+    >>> nbPlayersOnArms
+    array([1, 1, 2, 0])
+    >>> collided
+    array([False,  True,  True, False, False])
+    """
+    isActive = choices >= 0
+    nbPlayersOnArms = np.bincount(choices[isActive], minlength=nbArms)
+    collided = isActive & (nbPlayersOnArms[np.where(isActive, choices, 0)] > 1)
+    return nbPlayersOnArms, collided
+
+
+def winnersOfChoices(choices, keys):
+    """ Mask of the players who have the smallest key among the players who chose the same arm (ties are broken uniformly at random), for all the arms at once.
+
+    >>> winnersOfChoices(np.array([1, 0, 1, 1]), np.array([0.5, 0.9, 0.2, 0.7]))
+    array([False,  True,  True, False])
+    """
+    order = np.lexsort((np.random.random_sample(len(choices)), keys, choices))  # by arm, then by key, then randomly
+    sortedChoices = choices[order]
+    isFirst = np.ones(len(order), dtype=bool)
+    isFirst[1:] = sortedChoices[1:] != sortedChoices[:-1]
+    winners = np.zeros(len(choices), dtype=bool)
+    winners[order[isFirst]] = True
+    return winners
+
+
+def giveRewards(players, playerIds, arms, rewards):
+    """ Give these rewards to these players: with one call to ``players.getRewards(playerIds, arms, rewards)`` if the players support it (e.g., a bank of players), or one call to ``getReward`` for each player otherwise."""
+    if hasattr(players, 'getRewards'):
+        players.getRewards(playerIds, arms, rewards)
+    else:
+        for playerId, arm, reward in zip(playerIds, arms, rewards):
+            players[playerId].getReward(arm, reward)
+
+
+def handleCollisions(players, playerIds, arms, rewards=None):
+    """ Inform these players of their collisions: with one call to ``players.handleCollisions(playerIds, arms, rewards)`` if the players support it, or one call to ``handleCollision(arm, reward)`` for each player otherwise.
+
+    - If the ``rewards`` they observe are not given, they observe a reward of 0, and a player without a ``handleCollision`` method gets this reward of 0 (see :func:`handleCollision_or_getZeroReward`).
+    """
+    if hasattr(players, 'handleCollisions'):
+        players.handleCollisions(playerIds, arms, np.zeros(len(playerIds)) if rewards is None else rewards)
+    elif rewards is None:
+        for playerId, arm in zip(playerIds, arms):
+            handleCollision_or_getZeroReward(players[playerId], arm)
+    else:
+        for playerId, arm, reward in zip(playerIds, arms, rewards):
+            players[playerId].handleCollision(arm, reward)
+
+
+# --- Collision models
+
 def onlyUniqUserGetsReward(t, arms, players, choices, rewards, pulls, collisions):
     """ Simple collision model where only the players alone on one arm samples it and receives the reward.
 
     - This is the default collision model, cf. [[Multi-Player Bandits Revisited, Lilian Besson and Emilie Kaufmann, 2017]](https://hal.inria.fr/hal-01629733).
     - The numpy array 'choices' is increased according to the number of users who collided (it is NOT binary).
+    - Support for player non activated, by choosing a negative index.
     """
     # First, sense in all the arms
-    sensing = [a.draw(t) for a in arms]
+    sensing = draw_each(arms, t)
     # XXX Yes, I know, it's suboptimal to sample each arm even if no player chose it
-    # But a quick benchmark showed it was quicker than
-    # sensing = [a.draw(t) for i,a in enumerate(arms) if nbCollisions[i]>=0]
-
-    nbCollisions = np.bincount(choices, minlength=len(arms)) - 1
-    # print("onlyUniqUserGetsReward() at time t = {}, nbCollisions = {}.".format(t, nbCollisions))  # DEBUG
-
-    # if np.max(nbCollisions) >= 1:  # DEBUG
-    #     print("- onlyUniqUserGetsReward: some collisions on channels {} at time t = {} ...".format(np.nonzero(np.array(nbCollisions) >= 1)[0], t))  # DEBUG
-    for i, player in enumerate(players):  # Loop is needed because player is needed
-        # FIXED pulls counts the number of selection, not the number of successful selection!! HUGE BUG! See https://github.com/SMPyBandits/SMPyBandits/issues/33
-        pulls[i, choices[i]] += 1
-        if nbCollisions[choices[i]] < 1:  # No collision
-            player.getReward(choices[i], sensing[choices[i]])  # Observing *sensing*
-            rewards[i] = sensing[choices[i]]  # Storing actual rewards
-        else:
-            # print("  - 1 collision on channel {} : {} other users chose it at time t = {} ...".format(choices[i], nbCollisions[choices[i]], t))  # DEBUG
-            collisions[choices[i]] += 1  # Should be counted here, onlyUniqUserGetsReward
-            # handleCollision_or_getZeroReward(player, choices[i])  # NOPE
-            player.handleCollision(choices[i], sensing[choices[i]])  # Observing *sensing* but collision
-            # If learning is done on sensing, handleCollision uses this reward
-            # But if learning is done on ACK, handleCollision does not use this reward
+    # But it is only one vectorized call
+    isActive = choices >= 0
+    _, collided = collisionsOfChoices(choices, len(arms))
+    alone = isActive & ~collided
+    # FIXED pulls counts the number of selection, not the number of successful selection!! HUGE BUG! See https://github.com/SMPyBandits/SMPyBandits/issues/33
+    activeIds = np.flatnonzero(isActive)
+    pulls[activeIds, choices[activeIds]] += 1
+    collisions += np.bincount(choices[collided], minlength=len(arms)).astype(collisions.dtype)  # Should be counted here, onlyUniqUserGetsReward
+    rewards[alone] = sensing[choices[alone]]  # Storing actual rewards
+    giveRewards(players, np.flatnonzero(alone), choices[alone], sensing[choices[alone]])  # Observing *sensing*
+    # If learning is done on sensing, handleCollision uses this reward
+    # But if learning is done on ACK, handleCollision does not use this reward
+    handleCollisions(players, np.flatnonzero(collided), choices[collided], sensing[choices[collided]])  # Observing *sensing* but collision
 
 
 # Default collision model to use
@@ -92,29 +161,9 @@ def onlyUniqUserGetsRewardSparse(t, arms, players, choices, rewards, pulls, coll
     - This is the default collision model, cf. [[Multi-Player Bandits Revisited, Lilian Besson and Emilie Kaufmann, 2017]](https://hal.inria.fr/hal-01629733).
     - The numpy array 'choices' is increased according to the number of users who collided (it is NOT binary).
     - Support for player non activated, by choosing a negative index.
+    - It is now the same as :func:`onlyUniqUserGetsReward`, which supports non activated players as well.
     """
-    # First, sense in all the arms
-    sensing = [a.draw(t) for a in arms]
-
-    nbCollisions = np.bincount(choices[choices >= 0], minlength=len(arms)) - 1
-    # print("onlyUniqUserGetsRewardSparse() at time t = {}, nbCollisions = {}.".format(t, nbCollisions))  # DEBUG
-
-    # if np.max(nbCollisions) >= 1:  # DEBUG
-    #     print("- onlyUniqUserGetsRewardSparse: some collisions on channels {} at time t = {} ...".format(np.nonzero(np.array(nbCollisions) >= 1)[0], t))  # DEBUG
-    for i, player in enumerate(players):  # Loop is needed because player is needed
-        # FIXED pulls counts the number of selection, not the number of successful selection!! HUGE BUG! See https://github.com/SMPyBandits/SMPyBandits/issues/33
-        if choices[i] >= 0:
-            pulls[i, choices[i]] += 1
-            if nbCollisions[choices[i]] < 1:  # No collision
-                player.getReward(choices[i], sensing[choices[i]])  # Observing *sensing*
-                rewards[i] = sensing[choices[i]]  # Storing actual rewards
-            else:
-                # print("  - 1 collision on channel {} : {} other users chose it at time t = {} ...".format(choices[i], nbCollisions[choices[i]], t))  # DEBUG
-                collisions[choices[i]] += 1  # Should be counted here, onlyUniqUserGetsRewardSparse
-                # handleCollision_or_getZeroReward(player, choices[i])  # NOPE
-                player.handleCollision(choices[i], sensing[choices[i]])  # Observing *sensing* but collision
-                # If learning is done on sensing, handleCollision uses this reward
-                # But if learning is done on ACK, handleCollision does not use this reward
+    return onlyUniqUserGetsReward(t, arms, players, choices, rewards, pulls, collisions)
 
 
 def allGetRewardsAndUseCollision(t, arms, players, choices, rewards, pulls, collisions):
@@ -125,22 +174,17 @@ def allGetRewardsAndUseCollision(t, arms, players, choices, rewards, pulls, coll
 
     - This is the NOT default collision model, cf. [Liu & Zhao, 2009](https://arxiv.org/abs/0910.2065v3) collision model 1.
     - The numpy array 'choices' is increased according to the number of users who collided (it is NOT binary).
+    - Support for player non activated, by choosing a negative index.
     """
-    nbCollisions = np.bincount(choices, minlength=len(arms)) - 1  # XXX this is faster!
-    # print("allGetRewardsAndUseCollision() at time t = {}, nbCollisions = {}.".format(t, nbCollisions))  # DEBUG
-    # if np.max(nbCollisions) >= 1:  # DEBUG
-    #     print("- allGetRewardsAndUseCollision: some collisions on channels {} at time t = {} ...".format(np.nonzero(np.array(nbCollisions) >= 1)[0], t))  # DEBUG
-    for i, player in enumerate(players):  # Loop is needed because player is needed
-        # FIXED pulls counts the number of selection, not the number of successful selection!! HUGE BUG! See https://github.com/SMPyBandits/SMPyBandits/issues/33
-        pulls[i, choices[i]] += 1
-
-        rewards[i] = arms[choices[i]].draw(t)
-        player.getReward(choices[i], rewards[i])
-
-        if nbCollisions[choices[i]] >= 1:  # If collision
-            # print("  - 1 collision on channel {} : {} other users chose it at time t = {} ...".format(choices[i], nbCollisions[choices[i]], t))  # DEBUG
-            collisions[choices[i]] += 1  # Should be counted here, allGetRewardsAndUseCollision
-            player.handleCollision(choices[i], rewards[i])  # FIXED
+    _, collided = collisionsOfChoices(choices, len(arms))
+    playerIds = np.flatnonzero(choices >= 0)  # Only the activated players
+    # FIXED pulls counts the number of selection, not the number of successful selection!! HUGE BUG! See https://github.com/SMPyBandits/SMPyBandits/issues/33
+    pulls[playerIds, choices[playerIds]] += 1
+    rewards[playerIds] = draw_many(arms, choices[playerIds], t)
+    giveRewards(players, playerIds, choices[playerIds], rewards[playerIds])
+    collisions += np.bincount(choices[collided], minlength=len(arms)).astype(collisions.dtype)  # Should be counted here, allGetRewardsAndUseCollision
+    collidedIds = np.flatnonzero(collided)
+    handleCollisions(players, collidedIds, choices[collidedIds], rewards[collidedIds])  # FIXED
 
 
 def noCollision(t, arms, players, choices, rewards, pulls, collisions):
@@ -148,12 +192,27 @@ def noCollision(t, arms, players, choices, rewards, pulls, collisions):
 
     - It corresponds to the single-player simulation: each player is a policy, compared without collision.
     - The numpy array 'collisions' is not modified.
+    - Support for player non activated, by choosing a negative index.
     """
-    for i, player in enumerate(players):
-        rewards[i] = arms[choices[i]].draw(t)
-        player.getReward(choices[i], rewards[i])
-        pulls[i, choices[i]] += 1
-        # collisions[choices[i]] += 0  # that's the idea, but useless to do it
+    playerIds = np.flatnonzero(choices >= 0)  # Only the activated players
+    rewards[playerIds] = draw_many(arms, choices[playerIds], t)
+    giveRewards(players, playerIds, choices[playerIds], rewards[playerIds])
+    pulls[playerIds, choices[playerIds]] += 1
+    # collisions[choices[i]] += 0  # that's the idea, but useless to do it
+
+
+def _onlyWinnersGetReward(t, arms, players, choices, rewards, pulls, collisions, keys):
+    """ Common part of :func:`rewardIsSharedUniformly` and :func:`closerUserGetsReward`: on each arm, only the activated player of smallest key samples it and receives the reward, the others are informed of a collision (the non activated players, with a negative choice, are ignored)."""
+    nbPlayersOnArms, _ = collisionsOfChoices(choices, len(arms))
+    collisions += np.maximum(nbPlayersOnArms - 1, 0).astype(collisions.dtype)  # Increase nb of collisions for nb of player who chose it, minus 1 (eg, if 1 then no collision, if 2 then one collision)
+    playerIds = np.flatnonzero(choices >= 0)  # Only the activated players
+    choices = choices[playerIds]
+    pulls[playerIds, choices] += 1  # pulls counts the number of selections, not the number of successful selections
+    winners = winnersOfChoices(choices, keys[playerIds])
+    rewards[playerIds[winners]] = draw_many(arms, choices[winners], t)
+    giveRewards(players, playerIds[winners], choices[winners], rewards[playerIds[winners]])
+    # The other players cannot
+    handleCollisions(players, playerIds[~winners], choices[~winners])
 
 
 def rewardIsSharedUniformly(t, arms, players, choices, rewards, pulls, collisions):
@@ -165,24 +224,25 @@ def rewardIsSharedUniformly(t, arms, players, choices, rewards, pulls, collision
 
     .. Note:: it can also model a choice from the users point of view: in a time frame (eg. 1 second), when there is a collision, each colliding user chose (uniformly) a random small time offset (eg. 20 ms), and start sensing + emitting again after that time. The first one to sense is alone, it transmits, and the next ones find the channel used when sensing. So only one player is transmitting, and from the base station point of view, it is the same as if it was chosen uniformly among the colliding users.
 
+    - Support for player non activated, by choosing a negative index: they do not pull any arm, and are not informed of anything.
+
+    >>> import sys; sys.path.insert(0, '..'); from Arms import Constant
+    >>> class Logger(object):
+    ...     def __init__(self, playerId): self.playerId = playerId
+    ...     def getReward(self, arm, reward): print("Player", self.playerId, "gets", reward, "from arm", arm)
+    ...     def handleCollision(self, arm, reward): print("Player", self.playerId, "collides on arm", arm)
+    >>> choices = np.array([-1, -1, 0, 1])
+    >>> rewards, pulls, collisions = np.zeros(4), np.zeros((4, 2), dtype=int), np.zeros(2, dtype=int)
+    >>> rewardIsSharedUniformly(0, [Constant(0.5), Constant(0.9)], [Logger(i) for i in range(4)], choices, rewards, pulls, collisions)
+    Player 2 gets 0.5 from arm 0
+    Player 3 gets 0.9 from arm 1
+    >>> rewards
+    array([0. , 0. , 0.5, 0.9])
+    >>> pulls.tolist(), collisions
+    ([[0, 0], [0, 0], [1, 0], [0, 1]], array([0, 0]))
     """
-    # For each arm, explore who chose it
-    for armId, arm in enumerate(arms):
-        # If he is alone, sure to be chosen, otherwise only one get randomly chosen
-        players_who_chose_it = np.nonzero(choices == armId)[0]
-        # print("players_who_chose_it =", players_who_chose_it)  # DEBUG
-        # print("np.shape(players_who_chose_it) =", np.shape(players_who_chose_it))  # DEBUG
-        # if len(players_who_chose_it) > 1:  # DEBUG
-        #     print("- rewardIsSharedUniformly: for arm {}, {} users won't have a reward at time t = {} ...".format(armId, len(players_who_chose_it) - 1, t))  # DEBUG
-        if np.size(players_who_chose_it) > 0:
-            collisions[armId] += np.size(players_who_chose_it) - 1   # Increase nb of collisions for nb of player who chose it, minus 1 (eg, if 1 then no collision, if 2 then one collision)
-            i = np.random.choice(players_who_chose_it)
-            rewards[i] = arm.draw(t)
-            players[i].getReward(armId, rewards[i])
-            pulls[i, armId] += 1
-            for j in players_who_chose_it:
-                if i != j:
-                    handleCollision_or_getZeroReward(players[j], armId)
+    # Same keys for all the players: the winner on each arm is chosen uniformly at random
+    _onlyWinnersGetReward(t, arms, players, choices, rewards, pulls, collisions, np.zeros(len(choices)))
 
 
 # XXX Using a cache to not regenerate a random vector of distances. Siooooux!
@@ -207,32 +267,8 @@ def closerUserGetsReward(t, arms, players, choices, rewards, pulls, collisions,
         distances = np.linspace(0, 1, len(players) + 1, endpoint=False)[1:]
     elif isinstance(distances, str) and distances == 'random':  # Or fully uniform
         distances = random_distances(len(players))
-    # For each arm, explore who chose it
-    for armId, arm in enumerate(arms):
-        # If he is alone, sure to be chosen, otherwise only the closest one can sample
-        players_who_chose_it = np.nonzero(choices == armId)[0]
-        # print("players_who_chose_it =", players_who_chose_it)  # DEBUG
-        # if np.size(players_who_chose_it) > 1:  # DEBUG
-        #     print("- rewardIsSharedUniformly: for arm {}, {} users won't have a reward at time t = {} ...".format(armId, np.size(players_who_chose_it) - 1, t))  # DEBUG
-        if np.size(players_who_chose_it) > 0:
-            collisions[armId] += np.size(players_who_chose_it) - 1   # Increase nb of collisions for nb of player who chose it, minus 1 (eg, if 1 then no collision, if 2 then one collision as the closest gets it)
-            distancesChosen = distances[players_who_chose_it]
-            smaller_distance = np.min(distancesChosen)
-            # print("Using distances to chose the user who can pull arm {} : only users at the minimal distance = {} can transmit ...".format(armId, smaller_distance))  # DEBUG
-            if np.count_nonzero(distancesChosen == smaller_distance) == 1:
-                i = players_who_chose_it[np.argmin(distancesChosen)]
-                # print("Only one user is at minimal distance, of index i =", i)  # DEBUG
-            else:   # XXX very low probability, if the distances are randomly chosen
-                i = players_who_chose_it[np.random.choice(np.nonzero(distancesChosen == smaller_distance))]
-                print("  Randomly choosing one user at minimal distance = {:.4g}, among {}... Index i = {} was chose !".format(smaller_distance, np.count_nonzero(distancesChosen == smaller_distance), i + 1))  # DEBUG
-            # Player i can pull the armId
-            rewards[i] = arm.draw(t)
-            players[i].getReward(armId, rewards[i])
-            pulls[i, armId] += 1
-            for j in players_who_chose_it:
-                # The other players cannot
-                if i != j:
-                    handleCollision_or_getZeroReward(players[j], armId)
+    # Only the closest player on each arm can sample it (randomly chosen among the closest ones, with a very low probability if the distances are randomly chosen)
+    _onlyWinnersGetReward(t, arms, players, choices, rewards, pulls, collisions, np.asarray(distances, dtype=float))
 
 
 #: List of possible collision models
@@ -272,5 +308,8 @@ __all__ = [
     "rewardIsSharedUniformly",
     "defaultCollisionModel",
     "collision_models",
-    "full_lost_if_collision"
+    "full_lost_if_collision",
+    "collisionsOfChoices",
+    "giveRewards",
+    "handleCollisions",
 ]
@@ -30,7 +30,7 @@ try:
     from .plotsettings import BBOX_INCHES, signature, maximizeWindow, palette, makemarkers, add_percent_formatter, legend, show_and_save, nrows_ncols, addTextForWorstCases
     from .sortedDistance import weightedDistance, manhattan, kendalltau, spearmanr, gestalt, meanDistance, sortedDistance
     # Local imports, objects and functions
-    from .MAB import MAB, MarkovianMAB, ChangingAtEachRepMAB, NonStationaryMAB, PieceWiseStationaryMAB, IncreasingMAB
+    from .MAB import MAB, MarkovianMAB, ChangingAtEachRepMAB, NonStationaryMAB, PieceWiseStationaryMAB, IncreasingMAB, ChangePointSchedule
     from .Result import Result
     from .memory_consumption import getCurrentMemory, sizeof_fmt
 except ImportError:
@@ -41,7 +41,7 @@ except ImportError:
     from plotsettings import BBOX_INCHES, signature, maximizeWindow, palette, makemarkers, add_percent_formatter, legend, show_and_save, nrows_ncols, addTextForWorstCases
     from sortedDistance import weightedDistance, manhattan, kendalltau, spearmanr, gestalt, meanDistance, sortedDistance
     # Local imports, objects and functions
-    from MAB import MAB, MarkovianMAB, ChangingAtEachRepMAB, NonStationaryMAB, PieceWiseStationaryMAB, IncreasingMAB
+    from MAB import MAB, MarkovianMAB, ChangingAtEachRepMAB, NonStationaryMAB, PieceWiseStationaryMAB, IncreasingMAB, ChangePointSchedule
     from Result import Result
     from memory_consumption import getCurrentMemory, sizeof_fmt
 
@@ -246,6 +246,10 @@ class Evaluator(object):
             self.lastPulls[envId][policyId, :, repeatId] = r.pulls
             self.runningTimes[envId][policyId, repeatId] = r.running_time
 
+        # Draw the problems of all the repetitions at once, the same ones for all policies
+        if env.isChangingAtEachRepetition:
+            env.newRandomArmsOfRepetitions(self.repetitions)
+
         # Start for all policies
         for policyId, policy in enumerate(self.policies):
             print("\n\n\n- Evaluating policy #{}/{}: {} ...".format(policyId + 1, self.nbPolicies, policy))
@@ -253,14 +257,14 @@ class Evaluator(object):
                 seeds = np.random.randint(low=0, high=100 * self.repetitions, size=self.repetitions)
                 repeatIdout = 0
                 for r in Parallel(n_jobs=self.cfg['n_jobs'], verbose=self.cfg['verbosity'])(
-                    delayed(delayed_play)(env, policy, self.horizon, random_shuffle=self.random_shuffle, random_invert=self.random_invert, nb_break_points=self.nb_break_points, allrewards=allrewards, seed=seeds[repeatId], repeatId=repeatId, useJoblib=self.useJoblib)
+                    delayed(delayed_play)(env.repetition(repeatId) if env.isChangingAtEachRepetition else env, policy, self.horizon, random_shuffle=self.random_shuffle, random_invert=self.random_invert, nb_break_points=self.nb_break_points, allrewards=allrewards, seed=seeds[repeatId], repeatId=repeatId, useJoblib=self.useJoblib)
                     for repeatId in tqdm(range(self.repetitions), desc="Repeat||")
                 ):
                     store(r, policyId, repeatIdout)
                     repeatIdout += 1
             else:
                 for repeatId in tqdm(range(self.repetitions), desc="Repeat"):
-                    r = delayed_play(env, policy, self.horizon, random_shuffle=self.random_shuffle, random_invert=self.random_invert, nb_break_points=self.nb_break_points, allrewards=allrewards, repeatId=repeatId, useJoblib=self.useJoblib)
+                    r = delayed_play(env.repetition(repeatId) if env.isChangingAtEachRepetition else env, policy, self.horizon, random_shuffle=self.random_shuffle, random_invert=self.random_invert, nb_break_points=self.nb_break_points, allrewards=allrewards, repeatId=repeatId, useJoblib=self.useJoblib)
                     store(r, policyId, repeatId)
 
     # --- Save to disk methods
@@ -369,11 +373,13 @@ class Evaluator(object):
     def getAverageWeightedSelections(self, policyId, envId=0):
         """Extract weighted count of selections."""
         weighted_selections = np.zeros(self.horizon)
+        # compute the (nbArms, horizon) array of means only once, and not for each arm
+        allMeans = self.envs[envId].get_allMeans(horizon=self.horizon) if hasattr(self.envs[envId], 'get_allMeans') else None
         for armId in range(self.envs[envId].nbArms):
             mean_selections = self.allPulls[envId][policyId, armId, :] / float(self.repetitions)
             # FIXME this is wrong for non-stationary bandits
-            if hasattr(self.envs[envId], 'get_allMeans'):
-                meanOfThisArm = self.envs[envId].get_allMeans(horizon=self.horizon)[armId, :]
+            if allMeans is not None:
+                meanOfThisArm = allMeans[armId, :]
             else:
                 meanOfThisArm = self.envs[envId].means[armId]
             weighted_selections += meanOfThisArm * mean_selections
@@ -409,9 +415,10 @@ class Evaluator(object):
     def getAllLastWeightedSelections(self, policyId, envId=0):
         """Extract weighted count of selections."""
         all_last_weighted_selections = np.zeros(self.repetitions)
+        allMeans = self.envs[envId].get_allMeans(horizon=self.horizon) if hasattr(self.envs[envId], 'get_allMeans') else None
         for armId in range(self.envs[envId].nbArms):
-            if hasattr(self.envs[envId], 'get_allMeans'):
-                meanOfThisArm = self.envs[envId].get_allMeans(horizon=self.horizon)[armId, :]
+            if allMeans is not None:
+                meanOfThisArm = allMeans[armId, :]
                 # FIXME this is wrong for non-stationary bandits, and it cannot be made correct
                 meanOfThisArm = meanOfThisArm[-1]  # take only the last mean… but it's wrong!
                 meanOfThisArm = np.mean(meanOfThisArm)  # XXX take average?
@@ -851,6 +858,10 @@ def delayed_play(env, policy, horizon,
         random_invert = False
     if nb_break_points > 0:
         t_events = [i * int(horizon / float(nb_break_points)) for i in range(nb_break_points)]
+        scheduleOfEvents = ChangePointSchedule([tau for tau in t_events if tau > 0])
+    if env.isDynamic:
+        # only compare t to the next change point, instead of scanning the list of change points at every step
+        scheduleOfChanges = ChangePointSchedule(getattr(env, 'changePoints', []))
 
     prettyRange = tqdm(range(horizon), desc="Time t") if repeatId == 0 else range(horizon)
     for t in prettyRange:
@@ -870,7 +881,7 @@ def delayed_play(env, policy, horizon,
         result.store(t, choice, reward)
 
         if env.isDynamic:
-            if t in env.changePoints:
+            if scheduleOfChanges.is_change_point(t):
                 means = env.newRandomArms(t)
                 indexes_bestarm = np.nonzero(np.isclose(means, np.max(means)))[0]
                 result.change_in_arms(t, indexes_bestarm)
@@ -878,13 +889,14 @@ def delayed_play(env, policy, horizon,
 
         # XXX remove these two special cases when the NonStationaryMAB is ready?
         # FIXME regret is not correct when displayed for these two guys…
+        is_event = (random_shuffle or random_invert) and scheduleOfEvents.is_change_point(t)
         # XXX Experimental : shuffle the arms at the middle of the simulation
-        if random_shuffle and t > 0 and t in t_events:
+        if random_shuffle and is_event:
                 indexes_bestarm = env.new_order_of_arm(shuffled(env.arms))
                 result.change_in_arms(t, indexes_bestarm)
                 if repeatId == 0: print("\nShuffling the arms, best arm(s) = {}, at time t = {} ...".format(indexes_bestarm, t))  # DEBUG
         # XXX Experimental : invert the order of the arms at the middle of the simulation
-        if random_invert and t > 0 and t in t_events:
+        if random_invert and is_event:
                 indexes_bestarm = env.new_order_of_arm(env.arms[::-1])
                 result.change_in_arms(t, indexes_bestarm)
                 if repeatId == 0: print("\nInverting the order of the arms, best arm(s) = {}, at time t = {} ...".format(indexes_bestarm, t))  # DEBUG
@@ -52,7 +52,7 @@ except ImportError:
 
 REPETITIONS = 1  #: Default nb of repetitions
 DELTA_T_PLOT = 50  #: Default sampling rate for plotting
-COUNT_RANKS_MARKOV_CHAIN = False  #: If true, count and then print a lot of statistics for the Markov Chain of the underlying configurations on ranks
+COUNT_RANKS_MARKOV_CHAIN = False  #: If true, count the transitions of the Markov Chain of the underlying configurations on ranks, and save its statistics with the results
 
 MORE_ACCURATE = False          #: Use the count of selections instead of rewards for a more accurate mean/std reward measure.
 MORE_ACCURATE = True           #: Use the count of selections instead of rewards for a more accurate mean/std reward measure.
@@ -96,14 +96,15 @@ class EvaluatorMultiPlayers(object):
         self.plot_lowerbounds = self.cfg.get('plot_lowerbounds', plot_lowerbounds)  #: Should we plot the lower-bounds?
         self.useJoblib = USE_JOBLIB and self.cfg['n_jobs'] != 1  #: Use joblib to parallelize for loop on repetitions (useful)
         self.showplot = self.cfg.get('showplot', True)  #: Show the plot (interactive display or not)
-        self.count_ranks_markov_chain = self.cfg.get('count_ranks_markov_chain', COUNT_RANKS_MARKOV_CHAIN)#: If true, count and then print a lot of statistics for the Markov Chain of the underlying configurations on ranks
+        self.count_ranks_markov_chain = self.cfg.get('count_ranks_markov_chain', COUNT_RANKS_MARKOV_CHAIN)  #: If true, count the transitions of the Markov Chain of the underlying configurations on ranks, and save its statistics with the results
 
         self.change_labels = self.cfg.get('change_labels', {})  #: Possibly empty dictionary to map 'playerId' to new labels (overwrite their name).
         self.append_labels = self.cfg.get('append_labels', {})  #: Possibly empty dictionary to map 'playerId' to new labels (by appending the result from 'append_labels').
 
         # Internal object memory
         self.envs = []  #: List of environments
-        self.players = []  #: List of players
+        self.players = []  #: List of players (of the last env that was prepared, or printed and plotted)
+        self.playersOfEnv = dict()  #: For each env, list of its players (created by :meth:`prepareOneEnv`)
         self.__initEnvironments__()
         # Internal vectorial memory
         self.rewards = dict()  #: For each env, history of rewards
@@ -119,6 +120,7 @@ class EvaluatorMultiPlayers(object):
         self.lastCumRewards = dict()  #: For each env, last accumulated rewards, to compute variance and histogram of whole regret R_T
         self.runningTimes = dict()  #: For each env, keep the history of running times
         self.memoryConsumption = dict()  #: For each env, keep the history of running times
+        self.rankTransitions = dict()  #: For each env, count the transitions between the configurations of the ranks of the players, if ``count_ranks_markov_chain`` (see :meth:`getRankMarkovChain`)
 
         print("Number of environments to try:", len(self.envs))  # DEBUG
         # XXX: WARNING no memorized vectors should have dimension duration * repetitions, that explodes the RAM consumption!
@@ -136,8 +138,10 @@ class EvaluatorMultiPlayers(object):
             self.freeTransmissions[envId] = np.zeros((self.nbPlayers, self.horizon), dtype=np.int32)
             self.runningTimes[envId] = np.zeros((self.nbPlayers, self.repetitions))
             self.memoryConsumption[envId] = np.zeros((self.nbPlayers, self.repetitions))
+            self.rankTransitions[envId] = RankTransitions()
         # To speed up plotting
         self._times = np.arange(1, 1 + self.horizon)
+        self._indexes_bestarm = dict()  # For each env, the position of the best arms
 
     # --- Init methods
 
@@ -147,7 +151,7 @@ class EvaluatorMultiPlayers(object):
         for configuration_arms in self.cfg['environment']:
             if isinstance(configuration_arms, dict) \
                 and "arm_type" in configuration_arms and "params" in configuration_arms \
-                and "function" in configuration_arms["params"] and "args" in configuration_arms["params"]:
+                and "newMeans" in configuration_arms["params"] and "args" in configuration_arms["params"]:
                     MB = ChangingAtEachRepMAB(configuration_arms)
             elif isinstance(configuration_arms, dict) \
                 and "arm_type" in configuration_arms and configuration_arms["arm_type"] == "Markovian" \
@@ -188,49 +192,59 @@ class EvaluatorMultiPlayers(object):
 
     def startOneEnv(self, envId, env):
         """Simulate that env."""
-        print("\n\nEvaluating environment:", repr(env))  # DEBUG
-        self.players = []
-        self.__initPlayers__(env)
-        # Get the position of the best arms
-        means = env.means
-        bestarm = env.maxArm
-        indexes_bestarm = np.nonzero(np.isclose(means, bestarm))[0]
-
-        def store(r, repeatId):
-            """Store the result of the experiment r."""
-            self.rewards[envId] += np.cumsum(r.rewards, axis=1)  # cumsum on time
-            # self.rewardsSquared[envId] += np.cumsum(r.rewards ** 2, axis=1)  # cumsum on time
-            # self.rewardsSquared[envId] += np.cumsum(r.rewardsSquared, axis=1)  # cumsum on time
-            self.lastCumRewards[envId][repeatId] = np.sum(r.rewards)  # sum on time and sum on players
-            self.pulls[envId] += r.pulls
-            self.lastPulls[envId][:, :, repeatId] = r.pulls
-            self.allPulls[envId] += r.allPulls
-            self.collisions[envId] += r.collisions
-            self.lastCumCollisions[envId][:, repeatId] = np.sum(r.collisions, axis=1)  # sum on time
-            for playerId in range(self.nbPlayers):
-                self.nbSwitchs[envId][playerId, 1:] += (np.diff(r.choices[playerId, :]) != 0)
-                self.bestArmPulls[envId][playerId, :] += np.cumsum(np.in1d(r.choices[playerId, :], indexes_bestarm))
-                # FIXME there is probably a bug in this computation
-                self.freeTransmissions[envId][playerId, :] += np.array([r.choices[playerId, t] not in r.collisions[:, t] for t in range(self.horizon)])
-                self.runningTimes[envId][playerId, repeatId] = r.running_time
-                self.memoryConsumption[envId][playerId, repeatId] = r.memory_consumption
-
-        # Start now
+        self.prepareOneEnv(envId, env)
         if self.useJoblib:
-            seeds = np.random.randint(low=0, high=100 * self.repetitions, size=self.repetitions)
+            seeds = np.random.randint(low=0, high=100 * self.repetitions, size=self.repetitions).tolist()  # Python integers, as random.seed does not accept numpy integers
             repeatIdout = 0
             for r in Parallel(n_jobs=self.cfg['n_jobs'], verbose=self.cfg['verbosity'])(
-                delayed(delayed_play)(env, self.players, self.horizon, self.collisionModel, seed=seeds[repeatId], repeatId=repeatId, count_ranks_markov_chain=self.count_ranks_markov_chain, useJoblib=self.useJoblib)
+                delayed(delayed_play)(**self.argsOfPlay(envId, env, repeatId, seed=seeds[repeatId]))
                 for repeatId in tqdm(range(self.repetitions), desc="Repeat||")
             ):
-                store(r, repeatIdout)
+                self.storeResult(r, envId, repeatIdout)
                 repeatIdout += 1
-            if env.isChangingAtEachRepetition:
-                env._t += self.repetitions  # new self.repetitions draw!
         else:
             for repeatId in tqdm(range(self.repetitions), desc="Repeat"):
-                r = delayed_play(env, self.players, self.horizon, self.collisionModel, repeatId=repeatId, count_ranks_markov_chain=self.count_ranks_markov_chain, useJoblib=self.useJoblib)
-                store(r, repeatId)
+                r = delayed_play(**self.argsOfPlay(envId, env, repeatId))
+                self.storeResult(r, envId, repeatId)
+
+    def prepareOneEnv(self, envId, env):
+        """Prepare the simulations of that env: create its players (kept in :attr:`playersOfEnv`), and draw the problems of all the repetitions."""
+        print("\n\nEvaluating environment:", repr(env))  # DEBUG
+        self.players = []
+        self.__initPlayers__(env)
+        self.playersOfEnv[envId] = self.players
+        # Get the position of the best arms
+        self._indexes_bestarm[envId] = np.nonzero(np.isclose(env.means, env.maxArm))[0]
+        # Draw the problems of all the repetitions at once
+        if env.isChangingAtEachRepetition:
+            env.newRandomArmsOfRepetitions(self.repetitions)
+
+    def argsOfPlay(self, envId, env, repeatId, seed=None):
+        """Arguments of the call to :func:`delayed_play` for this repetition on that env (after :meth:`prepareOneEnv`), as a dictionary. It only reads the state of the evaluator."""
+        return dict(env=env.repetition(repeatId) if env.isChangingAtEachRepetition else env, players=self.playersOfEnv[envId], horizon=self.horizon, collisionModel=self.collisionModel,
+                    seed=seed, repeatId=repeatId, count_ranks_markov_chain=self.count_ranks_markov_chain, useJoblib=self.useJoblib)
+
+    def storeResult(self, r, envId, repeatId):
+        """Store the result r of the experiment of this repetition on that env."""
+        indexes_bestarm = self._indexes_bestarm[envId]
+        self.rewards[envId] += np.cumsum(r.rewards, axis=1)  # cumsum on time
+        # self.rewardsSquared[envId] += np.cumsum(r.rewards ** 2, axis=1)  # cumsum on time
+        # self.rewardsSquared[envId] += np.cumsum(r.rewardsSquared, axis=1)  # cumsum on time
+        self.lastCumRewards[envId][repeatId] = np.sum(r.rewards)  # sum on time and sum on players
+        self.pulls[envId] += r.pulls
+        self.lastPulls[envId][:, :, repeatId] = r.pulls
+        r.addAllPulls(self.allPulls[envId])
+        self.collisions[envId] += r.collisions
+        self.lastCumCollisions[envId][:, repeatId] = np.sum(r.collisions, axis=1)  # sum on time
+        # All the players at once, on the (nbPlayers, horizon) array of choices
+        self.nbSwitchs[envId][:, 1:] += (np.diff(r.choices, axis=1) != 0)
+        self.bestArmPulls[envId] += np.cumsum(np.isin(r.choices, indexes_bestarm), axis=1)
+        # A transmission is free if there was no collision on the chosen arm
+        self.freeTransmissions[envId] += (r.collisions[r.choices, np.arange(self.horizon)] == 0)
+        self.runningTimes[envId][:, repeatId] = r.running_time
+        self.memoryConsumption[envId][:, repeatId] = r.memory_consumption
+        if r.rankTransitions is not None:
+            self.rankTransitions[envId].merge(r.rankTransitions)
 
     # --- Save to disk methods
 
@@ -279,7 +293,12 @@ class EvaluatorMultiPlayers(object):
                     print("Error: when saving the Evaluator object to a HDF5 file, the dataset named {} (value of type {} and shape {} and dtype {}) couldn't be saved. Skipping...".format(name_of_dataset, type(data), data.shape, data.dtype))  # DEBUG
                     print("Exception:\n", e)  # DEBUG
 
-            # 3.d. compute and store data for that env
+            # 3.d. store the Markov chain of the configurations of the ranks, if it was counted
+            if len(self.rankTransitions[envId]) > 0:
+                for name_of_dataset, data in zip(["rankStates", "rankTransitions", "rankTransitionCounts", "rankTransitionMatrix", "rankStationaryDistribution"], self.getRankMarkovChain(envId)):
+                    sbgrp.create_dataset(name_of_dataset, data=data)
+
+            # 3.e. compute and store data for that env
             for methodName in ["getRunningTimes", "getMemoryConsumption", "getPulls", "getNbSwitchs", "getBestArmPulls", "getfreeTransmissions", "getCollisions", "getRewards", "getFirstRegretTerm", "getSecondRegretTerm", "getThirdRegretTerm", "getCentralizedRegret", "getLastRegrets"]:
                 if not hasattr(self, methodName): continue
                 name_of_dataset = methodName.replace("get", "")
@@ -487,6 +506,25 @@ class EvaluatorMultiPlayers(object):
         stds  = [ np.std(memories) for memories in all_memories ]
         return means, stds, all_memories
 
+    def getRankMarkovChain(self, envId=0):
+        """Get the empirical Markov chain on the configurations of the ranks of the players (if ``count_ranks_markov_chain``, for players with ranks, like :class:`PoliciesMultiPlayers.rhoRand`).
+
+        - Return the visited states (number of players having each rank 1, 2, ..., one state per row), the transitions (pairs of indexes of states), their counts, their empirical probabilities (the non-zero entries of the empirical transition matrix), and the empirical stationary distribution.
+        - The stationary distribution is estimated by the frequency of each state: it is stationary for the empirical transition matrix, up to the first and last steps of each repetition.
+        """
+        transitions = self.rankTransitions[envId]
+        # The states are sorted, to not depend on their order of first visit
+        order = sorted(range(len(transitions)), key=lambda code: transitions.states[code])
+        nbRanks = max([self.nbPlayers] + [len(state) for state in transitions.states])
+        states = np.array([transitions.states[code] + (0,) * (nbRanks - len(transitions.states[code])) for code in order], dtype=int).reshape((len(order), nbRanks))
+        sortedCounts = transitions.counts[np.ix_(order, order)]
+        pairs = np.transpose(np.nonzero(sortedCounts))
+        counts = sortedCounts[pairs[:, 0], pairs[:, 1]]
+        outCounts = np.bincount(pairs[:, 0], weights=counts, minlength=len(states))
+        probabilities = counts / outCounts[pairs[:, 0]]
+        stationary = outCounts / np.sum(outCounts)
+        return states, pairs, counts, probabilities, stationary
+
     # --- Plotting methods
 
     def plotRewards(self, envId=0, savefig=None, semilogx=False, moreAccurate=None):
@@ -1059,6 +1097,77 @@ class EvaluatorMultiPlayers(object):
         return text
 
 
+def bankOfPlayers(players):
+    """ The bank of these players (see :class:`PoliciesMultiPlayers.PlayerBank`) if they are exactly all the children of one multi-player policy that uses a bank, or None."""
+    if len(players) == 0:
+        return None
+    mother = getattr(players[0], 'mother', None)
+    bank = getattr(mother, 'bank', None)
+    if bank is None or len(players) != len(mother.children) or any(player is not child for player, child in zip(players, mother.children)):
+        return None
+    return bank
+
+
+class RankTransitions(object):
+    """ Count the transitions of the Markov chain on the configurations of the ranks of the players, in place, one transition at a time.
+
+    - The state at time t is the number of players having each rank 1, 2, ... (the bincount of their ranks), stored without its last zeros, to not depend on the largest rank seen.
+    - The states are encoded as integers, in their order of first visit, and the transitions are counted in a dense ``(S, S)`` array of small integers (``S`` the number of visited states, which is small as the ranks policies converge), grown when needed.
+    - Counts from other repetitions are added with :meth:`merge`.
+
+    >>> counter = RankTransitions()
+    >>> for ranks in [[1, 1, 2], [1, 2, 3], [1, 2, 3], [2, 2, 2]]:
+    ...     counter.visit(ranks)
+    >>> counter.states
+    [(2, 1), (1, 1, 1), (0, 3)]
+    >>> counter.counts
+    array([[0, 1, 0],
+           [0, 1, 1],
+           [0, 0, 0]], dtype=int32)
+    """
+
+    def __init__(self):
+        self.states = []  #: Visited states, in their order of first visit (the code of a state is its index).
+        self._codes = dict()
+        self._counts = np.zeros((0, 0), dtype=np.int32)
+        self._last = None
+
+    def __len__(self):
+        return len(self.states)
+
+    @property
+    def counts(self):
+        """ Counts of the transitions, as a ``(S, S)`` array indexed by the codes of the starting and ending states."""
+        nbStates = len(self.states)
+        return self._counts[:nbStates, :nbStates]
+
+    def code(self, state):
+        """ Code of this state (a tuple), giving a new code if it was never visited."""
+        try:
+            return self._codes[state]
+        except KeyError:
+            code = self._codes[state] = len(self.states)
+            self.states.append(state)
+            if code >= len(self._counts):
+                # Double the size of the array of counts, so it is reallocated only a few times
+                counts = np.zeros((2 * code + 1, 2 * code + 1), dtype=np.int32)
+                counts[:code, :code] = self._counts[:code, :code]
+                self._counts = counts
+            return code
+
+    def visit(self, ranks):
+        """ Visit the configuration of these ranks (1, 2, ...), and count the transition from the previous one."""
+        code = self.code(tuple(np.trim_zeros(np.bincount(ranks)[1:], 'b')))
+        if self._last is not None:
+            self._counts[self._last, code] += 1
+        self._last = code
+
+    def merge(self, other):
+        """ Add the counts of the transitions of another counter."""
+        codes = np.array([self.code(state) for state in other.states], dtype=int)
+        self._counts[codes[:, np.newaxis], codes] += other.counts
+
+
 def delayed_play(env, players, horizon, collisionModel,
         seed=None, repeatId=0,
         count_ranks_markov_chain=False,
@@ -1074,6 +1183,10 @@ def delayed_play(env, players, horizon, collisionModel,
     if env.isChangingAtEachRepetition:
         means = env.newRandomArms()
     players = deepcopy(players)
+    # If the players are the children of one policy using a bank, the bank computes their choices at once
+    bank = bankOfPlayers(players)
+    if bank is not None:
+        players = bank
     nbArms = env.nbArms
     nbPlayers = len(players)
     # random_arm_orders = [np.random.permutation(nbArms) for i in range(nbPlayers)]
@@ -1087,14 +1200,11 @@ def delayed_play(env, players, horizon, collisionModel,
     pulls = np.zeros((nbPlayers, nbArms), dtype=np.int32)
     collisions = np.zeros(nbArms, dtype=np.int32)
 
-    # print the ranks if possible  # DEBUG
-    all_players_have_ranks = count_ranks_markov_chain and (repeatId == 0) and all([hasattr(p, 'rank') for p in players])  # DEBUG
-    # this will count all the transitions in the Markov chain, to count their empirical probability at the end  # DEBUG
+    # Count the transitions of the Markov chain of the configurations of their ranks, if possible
+    all_players_have_ranks = count_ranks_markov_chain and all([hasattr(p, 'rank') for p in players])
     if all_players_have_ranks:
-        markov_chain_transitions = dict()  # DEBUG
-        ranks = [p.rank for p in players]
-        binranks = tuple(np.bincount(ranks, minlength=nbPlayers + 1)[1:])
-        state = binranks
+        result.rankTransitions = RankTransitions()
+        result.rankTransitions.visit([p.rank for p in players])
 
     prettyRange = tqdm(range(horizon), desc="Time t") if repeatId == 0 else range(horizon)
     for t in prettyRange:
@@ -1103,66 +1213,28 @@ def delayed_play(env, players, horizon, collisionModel,
         pulls.fill(0)
         collisions.fill(0)
         # Every player decides which arm to pull
-        for playerId, player in enumerate(players):
-            # XXX here, the environment should apply ONCE a random permutation to each player, in order for the non-modified UCB-like algorithms to work fine in case of collisions (their initial exploration phase is non-random hence leading to only collisions in the first steps, and ruining the performance)
-            # choices[i] = random_arm_orders[i][player.choice()]
-            choices[playerId] = player.choice()
-            # # print(" Round t = \t{}, player \t#{:>2}/{} ({}) \tchose : {} ...".format(t, playerId + 1, len(players), player, choices[playerId]))  # DEBUG
+        if bank is not None:
+            choices[:] = bank.choices()
+        else:
+            for playerId, player in enumerate(players):
+                # XXX here, the environment should apply ONCE a random permutation to each player, in order for the non-modified UCB-like algorithms to work fine in case of collisions (their initial exploration phase is non-random hence leading to only collisions in the first steps, and ruining the performance)
+                # choices[i] = random_arm_orders[i][player.choice()]
+                choices[playerId] = player.choice()
+                # # print(" Round t = \t{}, player \t#{:>2}/{} ({}) \tchose : {} ...".format(t, playerId + 1, len(players), player, choices[playerId]))  # DEBUG
 
         # Then we decide if there is collisions and what to do why them
         # XXX It is here that the player may receive a reward, if there is no collisions
-        collisionModel(t, env.arms, players, choices, rewards, pulls, collisions)
+        collisionModel(t, env, players, choices, rewards, pulls, collisions)
 
         # Finally we store the results
         result.store(t, choices, rewards, pulls, collisions)
 
         # XXX During the simulation, if using rhoRand or other ranks policy
-        if all_players_have_ranks and t > 1:
-            ranks = [p.rank for p in players]
-            binranks = tuple(np.bincount(ranks, minlength=nbPlayers + 1)[1:])
-            # print(" Round t = \t{}, the list of ranks is \t{}\n   and the point of view of ranks it is \t{} ...".format(t, ranks, binranks))  # DEBUG
-            previous_state, state = state, binranks
-            markov_chain_transitions[(previous_state, state)] = markov_chain_transitions.get((previous_state, state), 0) + 1
-            # print("  One more transition from {} to {} ... Currently it was seen {} times ...".format(previous_state, state, markov_chain_transitions[(previous_state, state)]))
+        if all_players_have_ranks:
+            result.rankTransitions.visit([p.rank for p in players])
 
     # Print the quality of estimation of arm ranking for this policy, just for 1st repetition
     if repeatId == 0:
-        if all_players_have_ranks:
-            # At the end, print the information about the markov chain states and transitions
-            print("==> Information about the markov chain states:")  # DEBUG
-            states = {s1 for (s1, _) in markov_chain_transitions} or {s2 for (_, s2) in markov_chain_transitions}
-            states = sorted(list(states))  # sort it, once and for all
-            print("    The Markov chain has {:>4} = (2M-1 choose M) differents states ...".format(len(states)))  # DEBUG
-            for s in states:
-                print("        ", s)
-            print("==> Information about the markov chain transitions:")  # DEBUG
-            count_states = {}
-            for (sum_count_out, s1) in sorted(zip([
-                    sum(
-                        markov_chain_transitions.get((s11, s3), 0)
-                        for s3 in states
-                    ) for s11 in states],
-                    states)):
-                print("\nState s1 = {} was seen {:>6} times ...".format(s1, sum_count_out))  # DEBUG
-                count_states[tuple(sorted(s1))] = \
-                    count_states.get(tuple(sorted(s1)), 0) + sum_count_out
-                for (count, s2) in sorted(zip([
-                        markov_chain_transitions.get((s1, s3), 0)
-                        for s3 in states],
-                        states)):
-                    if count > 0:
-                        print("    The transition {} --> {} was seen {:>7} times ({:.2%}) ...".format(s1, s2, count, count / float(horizon)))  # DEBUG
-                        if sum_count_out > 0:
-                            print("        So the estimated proba is {:.3g} ...".format(count / sum_count_out))
-            # now from the set point of view
-            print("\n\nNow with states just counting the strong partitions of M = {} ...".format(nbPlayers))  # DEBUG
-            suniques = list({tuple(sorted(s1)) for s1 in states})
-            for (seen, sunique) in sorted(zip(
-                    [count_states[s] for s in suniques],
-                    suniques)):
-                print("    The state {} was seen {:>7} times ({:.2%}) ...".format(sunique, seen, seen / float(horizon)))  # DEBUG
-        # DONE for this visualization
-
         for playerId, player in enumerate(players):
             try:
                 order = player.estimatedOrder()
@@ -1187,6 +1259,56 @@ def delayed_play(env, players, horizon, collisionModel,
     return result
 
 
+def delayed_play_with_id(taskId, **kwargs):
+    """Call :func:`delayed_play` with these arguments, and return its result with the identifier of this task (the results of a pool of tasks can arrive in any order)."""
+    return taskId, delayed_play(**kwargs)
+
+
+def startAllEvaluators(evaluators, n_jobs=1, verbosity=5):
+    """Simulate all the envs for all these evaluators (one for each list of players), with one pool of tasks for all the repetitions of all the evaluators on all the envs.
+
+    - It keeps all the cores busy across the evaluators, instead of running one pool of repetitions after the other (one for each call to :meth:`EvaluatorMultiPlayers.startOneEnv`).
+    - The result of each repetition is stored in the accumulators of its evaluator (see :meth:`EvaluatorMultiPlayers.storeResult`) as soon as it is finished, in any order, and then it is dropped.
+    - It is a generator: it yields ``(evaluatorId, envId)`` as soon as all the repetitions of this evaluator on this env are finished, so they can be printed, saved and plotted while the next ones are running (with :attr:`EvaluatorMultiPlayers.players` set to the players of this env).
+    - All the evaluators are prepared for all the envs before the first task: the tasks are pulled by joblib from another thread, while the main thread prints, saves and plots, so they must not change the state of the evaluators.
+    - It works only for :class:`EvaluatorMultiPlayers` (:class:`EvaluatorSparseMultiPlayers` has its own :meth:`startOneEnv`).
+    """
+    nbEnvs = len(evaluators[0].envs)
+    remaining = {(evaluatorId, envId): evaluation.repetitions for envId in range(nbEnvs) for evaluatorId, evaluation in enumerate(evaluators)}
+
+    seeds = dict()
+    for envId in range(nbEnvs):
+        for evaluatorId, evaluation in enumerate(evaluators):
+            evaluation.prepareOneEnv(envId, evaluation.envs[envId])
+            seeds[(evaluatorId, envId)] = np.random.randint(low=0, high=100 * evaluation.repetitions, size=evaluation.repetitions).tolist()  # Python integers, as random.seed does not accept numpy integers
+
+    def tasks():
+        """ Arguments of all the tasks, read from the prepared evaluators (this generator can be consumed from another thread)."""
+        for envId in range(nbEnvs):
+            for evaluatorId, evaluation in enumerate(evaluators):
+                env = evaluation.envs[envId]
+                for repeatId in range(evaluation.repetitions):
+                    yield (evaluatorId, envId, repeatId), evaluation.argsOfPlay(envId, env, repeatId, seed=seeds[(evaluatorId, envId)][repeatId])
+
+    if USE_JOBLIB and n_jobs != 1:
+        try:
+            results = Parallel(n_jobs=n_jobs, verbose=verbosity, return_as="generator_unordered")(
+                delayed(delayed_play_with_id)(taskId, **kwargs) for taskId, kwargs in tasks()
+            )
+        except (TypeError, ValueError):  # Older versions of joblib only give all the results at the end (TypeError before 1.3, ValueError for 'generator_unordered' before 1.4)
+            results = Parallel(n_jobs=n_jobs, verbose=verbosity)(
+                delayed(delayed_play_with_id)(taskId, **kwargs) for taskId, kwargs in tasks()
+            )
+    else:
+        results = (delayed_play_with_id(taskId, **kwargs) for taskId, kwargs in tasks())
+    for (evaluatorId, envId, repeatId), r in tqdm(results, total=sum(remaining.values()), desc="Tasks||"):
+        evaluators[evaluatorId].storeResult(r, envId, repeatId)
+        remaining[(evaluatorId, envId)] -= 1
+        if remaining[(evaluatorId, envId)] == 0:
+            evaluators[evaluatorId].players = evaluators[evaluatorId].playersOfEnv[envId]
+            yield evaluatorId, envId
+
+
 def _extract(text):
     """ Extract the str of a player, if it is a child, printed as '#[0-9]+<...>' --> ... """
     try:
@@ -50,6 +50,7 @@ except ImportError:
 
 REPETITIONS = 1  #: Default nb of repetitions
 ACTIVATION = 1  #: Default probability of activation
+ACTIVATION_BLOCK = 1000  #: Number of steps for which the activation times of all the players are drawn at once
 DELTA_T_PLOT = 50  #: Default sampling rate for plotting
 
 MORE_ACCURATE = False          #: Use the count of selections instead of rewards for a more accurate mean/std reward measure.
@@ -92,30 +93,32 @@ class EvaluatorSparseMultiPlayers(EvaluatorMultiPlayers):
             self.lastCumRewards[envId][repeatId] = np.sum(r.rewards)  # sum on time and sum on policies
             self.pulls[envId] += r.pulls
             self.lastPulls[envId][:, :, repeatId] = r.pulls
-            self.allPulls[envId] += r.allPulls
+            r.addAllPulls(self.allPulls[envId])
             self.collisions[envId] += r.collisions
             self.lastCumCollisions[envId][:, repeatId] = np.sum(r.collisions, axis=1)  # sum on time
-            for playerId in range(self.nbPlayers):
-                self.nbSwitchs[envId][playerId, 1:] += (np.diff(r.choices[playerId, :]) != 0)
-                self.bestArmPulls[envId][playerId, :] += np.cumsum(np.in1d(r.choices[playerId, :], indexes_bestarm))
-                # FIXME there is probably a bug in this computation
-                self.freeTransmissions[envId][playerId, :] += np.array([r.choices[playerId, t] not in r.collisions[:, t] for t in range(self.horizon)])
+            # All the players at once, on the (nbPlayers, horizon) array of choices
+            self.nbSwitchs[envId][:, 1:] += (np.diff(r.choices, axis=1) != 0)
+            self.bestArmPulls[envId] += np.cumsum(np.isin(r.choices, indexes_bestarm), axis=1)
+            # A transmission is free if the player was activated and there was no collision on the chosen arm
+            isActive = r.choices >= 0
+            self.freeTransmissions[envId] += isActive & (r.collisions[np.where(isActive, r.choices, 0), np.arange(self.horizon)] == 0)
 
         # Start now
+        # Draw the problems of all the repetitions at once
+        if env.isChangingAtEachRepetition:
+            env.newRandomArmsOfRepetitions(self.repetitions)
         if self.useJoblib:
-            seeds = np.random.randint(low=0, high=100 * self.repetitions, size=self.repetitions)
+            seeds = np.random.randint(low=0, high=100 * self.repetitions, size=self.repetitions).tolist()  # Python integers, as random.seed does not accept numpy integers
             repeatIdout = 0
             for r in Parallel(n_jobs=self.cfg['n_jobs'], verbose=self.cfg['verbosity'])(
-                delayed(delayed_play)(env, self.players, self.horizon, self.collisionModel, self.activations, seed=seeds[repeatId], repeatId=repeatId)
+                delayed(delayed_play)(env.repetition(repeatId) if env.isChangingAtEachRepetition else env, self.players, self.horizon, self.collisionModel, self.activations, seed=seeds[repeatId], repeatId=repeatId)
                 for repeatId in tqdm(range(self.repetitions), desc="Repeat||")
             ):
                 store(r, repeatIdout)
                 repeatIdout += 1
-            if env.isChangingAtEachRepetition:
-                env._t += self.repetitions  # new self.repetitions draw!
         else:
             for repeatId in tqdm(range(self.repetitions), desc="Repeat"):
-                r = delayed_play(env, self.players, self.horizon, self.collisionModel, self.activations, repeatId=repeatId)
+                r = delayed_play(env.repetition(repeatId) if env.isChangingAtEachRepetition else env, self.players, self.horizon, self.collisionModel, self.activations, repeatId=repeatId)
                 store(r, repeatId)
 
     # --- Getter methods
@@ -247,9 +250,53 @@ class EvaluatorSparseMultiPlayers(EvaluatorMultiPlayers):
         return text
 
 
+def activationsOfBlock(nextTimes, activations, end):
+    """ Activation times of all the players before the time ``end``, drawn for each player with geometric gaps from its next activation time ``nextTimes[playerId]`` (updated in place with the first one after ``end``).
+
+    - It costs one loop on the players and one draw for each activation, not one draw for each player at each step: it is the same as iid Bernoulli activations of each player at each step, as the gaps between two activations are geometric.
+    - Return the arrays ``(times, playerIds)`` of all the activations, sorted by time (and by player for the same time).
+
+    >>> np.random.seed(0)
+    >>> nextTimes = np.random.geometric([1, 0.5, 0.1]) - 1  # first activation times
+    >>> times, playerIds = activationsOfBlock(nextTimes, [1, 0.5, 0.1], 4)
+    >>> times, playerIds
+    (array([0, 1, 1, 2, 3]), array([0, 0, 1, 0, 0]))
+    >>> nextTimes
+    array([4, 6, 8])
+
+    - On average, each player is activated a fraction ``activations[playerId]`` of the steps:
+
+    >>> times, playerIds = activationsOfBlock(nextTimes, [1, 0.5, 0.1], 100004)
+    >>> np.round(np.bincount(playerIds) / 100000., 2)
+    array([1. , 0.5, 0.1])
+    """
+    allTimes, allIds = [], []
+    for playerId, p in enumerate(activations):
+        t = nextTimes[playerId]
+        while t < end:
+            # Enough gaps to reach the end, on average, in one draw
+            times = t + np.cumsum(np.concatenate(([0], np.random.geometric(p, size=int((end - t) * p) + 1))))
+            nbBefore = np.searchsorted(times, end)
+            allTimes.append(times[:nbBefore])
+            allIds.append(np.full(nbBefore, playerId))
+            t = times[nbBefore] if nbBefore < len(times) else times[-1] + np.random.geometric(p)
+        nextTimes[playerId] = t
+    if not allTimes:
+        return np.zeros(0, dtype=int), np.zeros(0, dtype=int)
+    times, playerIds = np.concatenate(allTimes), np.concatenate(allIds)
+    order = np.argsort(times, kind='mergesort')  # stable, so by player for the same time
+    return times[order], playerIds[order]
+
+
 def delayed_play(env, players, horizon, collisionModel, activations,
                  seed=None, repeatId=0):
-    """Helper function for the parallelization."""
+    """Helper function for the parallelization.
+
+    - Each player is activated at each step with its own probability (iid Bernoulli), and the activation times of each player are drawn with geometric gaps, for a block of :data:`ACTIVATION_BLOCK` steps at once (see :func:`activationsOfBlock`): the steps without any activated player are skipped.
+    - Only the activated players choose an arm and are stored. The collision model is given all the players, with a choice of -1 for the non activated ones (they are ignored), so the parameters indexed by player (e.g., the distances of :func:`CollisionModels.closerUserGetsReward`) are still the ones of each player.
+
+    .. warning:: What is still dense: the collision models work with numpy arrays of size M (cheap vectorized operations, but not proportional to the number of activated players), and the results are stored in dense ``(M, horizon)`` arrays (see :class:`ResultMultiPlayers`), on which the evaluator computes its statistics, with a choice of -1 and a reward of 0 for the non activated players.
+    """
     # Give a unique seed to random & numpy.random for each call of this function
     try:
         if seed is not None:
@@ -263,51 +310,45 @@ def delayed_play(env, players, horizon, collisionModel, activations,
     players = deepcopy(players)
     nbArms = env.nbArms
     nbPlayers = len(players)
+    activations = np.broadcast_to(np.asarray(activations, dtype=float), (nbPlayers,))
     # Start game
     for player in players:
         player.startGame()
-    # Store results
-    result = ResultMultiPlayers(env.nbArms, horizon, nbPlayers, means=means)
+    # Store results, only for the activated players
+    result = ResultMultiPlayers(env.nbArms, horizon, nbPlayers, means=means, sparse=True)
+    collisions = np.zeros(nbArms, dtype=int)
+    # Choices, rewards and pulls of all the players for one step, only reset for the activated players after each step
+    choices = np.full(nbPlayers, -1, dtype=int)
     rewards = np.zeros(nbPlayers)
-    choices = np.zeros(nbPlayers, dtype=int)
     pulls = np.zeros((nbPlayers, nbArms), dtype=int)
-    collisions = np.zeros(nbArms, dtype=int)
 
     nbActivations = np.zeros(nbPlayers, dtype=int)
-
-    prettyRange = tqdm(range(horizon), desc="Time t") if repeatId == 0 else range(horizon)
-    for t in prettyRange:
-        # Reset the array, faster than reallocating them!
-        rewards.fill(0)
-        choices.fill(-100000)
-        pulls.fill(0)
-        collisions.fill(0)
-        # Decide who gets activated
-        # # 1. pure iid Bernoulli activations, so sum(random_activations) == np.random.binomial(nbPlayers, activation) if activations are all the same
-        # random_activations = np.random.random_sample(nbPlayers) <= activations
-        # FIXME finish these experiments
-        # 2. maybe first decide how many players from [0, nbArms] or [0, nbPlayers] are activated, then who
-        # nb_activated_players = np.random.binomial(nbArms, np.mean(activations))
-        nb_activated_players = np.random.binomial(nbPlayers, np.mean(activations))
-        # who_is_activated = np.random.choice(nbPlayers, size=nb_activated_players, replace=False)
-        who_is_activated = np.random.choice(nbPlayers, size=nb_activated_players, replace=False, p=np.asarray(activations)/np.sum(activations))
-        random_activations = np.in1d(np.arange(nbPlayers), who_is_activated)
-        # Every player decides which arm to pull
-        for playerId, player in enumerate(players):
-            # if with_proba(activations[playerId]):
-            if random_activations[playerId]:
-                nbActivations[playerId] += 1
-                choices[playerId] = player.choice()
-                # print(" Round t = \t{}, player \t#{:>2}/{} ({}) \tgot activated and chose : {} ...".format(t, playerId + 1, len(players), player, choices[playerId]))  # DEBUG
-            # else:
-            #     print(" Round t = \t{}, player \t#{:>2}/{} ({}) \tdid not get activated ...".format(t, playerId + 1, len(players), player))  # DEBUG
-
-        # Then we decide if there is collisions and what to do why them
-        # XXX It is here that the player may receive a reward, if there is no collisions
-        collisionModel(t, env.arms, players, choices, rewards, pulls, collisions)
-
-        # Finally we store the results
-        result.store(t, choices, rewards, pulls, collisions)
+    nextTimes = np.random.geometric(activations) - 1  # First activation time of each player
+
+    blocks = range(0, horizon, ACTIVATION_BLOCK)
+    prettyRange = tqdm(blocks, desc="Time t (by blocks of {})".format(ACTIVATION_BLOCK)) if repeatId == 0 else blocks
+    for start in prettyRange:
+        block = min(ACTIVATION_BLOCK, horizon - start)
+        # Decide who gets activated, for a block of steps at once: the activation times of each player
+        times, activatedIds = activationsOfBlock(nextTimes, activations, start + block)
+        nbActivations += np.bincount(activatedIds, minlength=nbPlayers)
+        stepsWithActivations, firstOfTimes = np.unique(times, return_index=True)
+        firstOfTimes = np.append(firstOfTimes, len(times))
+        for i, t in enumerate(stepsWithActivations):
+            playerIds = activatedIds[firstOfTimes[i]:firstOfTimes[i + 1]]
+            # Only the activated players decide which arm to pull
+            choices[playerIds] = [players[playerId].choice() for playerId in playerIds]
+            collisions.fill(0)
+
+            # Then we decide if there is collisions and what to do why them, between the activated players
+            # XXX It is here that the player may receive a reward, if there is no collisions
+            collisionModel(t, env, players, choices, rewards, pulls, collisions)
+
+            # Finally we store the results
+            result.storeActive(t, playerIds, choices[playerIds], rewards[playerIds], pulls[playerIds], collisions)
+            choices[playerIds] = -1
+            rewards[playerIds] = 0
+            pulls[playerIds] = 0
 
     # Print the quality of estimation of arm ranking for this policy, just for 1st repetition
     if repeatId == 0:
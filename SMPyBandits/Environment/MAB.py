@@ -14,19 +14,11 @@ from __future__ import division, print_function  # Python 2 compatibility
 __author__ = "Lilian Besson"
 __version__ = "0.9"
 
+from copy import copy
+import inspect
 import numpy as np
 import matplotlib.pyplot as plt
 
-try:
-    from .pykov import Chain
-except ImportError as e:
-    try:
-        from pykov import Chain
-    except ImportError:
-        print("Warning: 'pykov' module seems to not be available. But it is shipped with SMPyBandits. Weird.")
-        print("Dou you want to try to install it from https://github.com/riccardoscalco/Pykov ?")
-        print("Warning: the 'MarkovianMAB' class will not work...")
-
 # Local imports
 try:
     from .plotsettings import signature, wraptext, wraplatex, palette, makemarkers, legend, show_and_save
@@ -120,6 +112,14 @@ class MAB(object):
     def __repr__(self):
         return "{}(nbArms: {}, arms: {}, minArm: {:.3g}, maxArm: {:.3g})".format(self.__class__.__name__, self.nbArms, self.arms, self.minArm, self.maxArm)
 
+    # A MAB problem can be used as the list of its arms, e.g., by the collision models (see :mod:`CollisionModels`), which then use its vectorized draws
+
+    def __len__(self):
+        return len(self.arms)
+
+    def __getitem__(self, armId):
+        return self.arms[armId]
+
     def reprarms(self, nbPlayers=None, openTag='', endTag='^*', latex=True):
         """ Return a str representation of the list of the arms (like `repr(self.arms)` but better)
 
@@ -158,17 +158,76 @@ class MAB(object):
 
     # --- Draw samples
 
+    def set_random_generator(self, generator=None):
+        """ Make every arm draw its samples from this :class:`numpy.random.Generator`, see :meth:`Arms.Arm.set_random_generator` (``None`` to use the global :mod:`numpy.random` stream)."""
+        for arm in self.arms:
+            if hasattr(arm, 'set_random_generator'):
+                arm.set_random_generator(generator)
+        self._forgetDrawingGroups()
+
+    def _forgetDrawingGroups(self):
+        """ Forget the cached groups of arms of :meth:`_drawingGroups`, to call if the arms are modified in place."""
+        self.__dict__.pop('_drawingCache', None)
+
+    def _drawingGroups(self):
+        """ Group the arms of the same family (and random generator), to draw one sample from all of them with one call to their :meth:`Arms.Arm.draw_vect`.
+
+        - Return ``(drawers, groupOf, positionIn)``: the list of ``(draw_vect, generator, params)`` with ``params`` the tuple of arrays of the parameters of the arms of each group, the group of each arm (or ``-1`` if it has to be drawn alone) and its position in its group.
+        - It is cached, until the list of arms is replaced (or :meth:`_forgetDrawingGroups` is called).
+        """
+        arms = self.arms
+        cache = self.__dict__.get('_drawingCache')
+        if cache is not None and cache[0] is arms:
+            return cache[1]
+        groups = {}
+        for armId, arm in enumerate(arms):
+            params = arm.vector_params() if hasattr(arm, 'vector_params') else None
+            if params is not None:
+                armIds, allParams = groups.setdefault((type(arm), arm.random_generator), ([], []))
+                armIds.append(armId)
+                allParams.append(params)
+        drawers = []
+        groupOf = np.full(len(arms), -1)
+        positionIn = np.zeros(len(arms), dtype=int)
+        for (arm_type, generator), (armIds, allParams) in groups.items():
+            groupOf[armIds] = len(drawers)
+            positionIn[armIds] = np.arange(len(armIds))
+            drawers.append((arm_type.draw_vect, generator, tuple(np.array(param, dtype=float) for param in zip(*allParams))))
+        self._drawingCache = (arms, (drawers, groupOf, positionIn))
+        return drawers, groupOf, positionIn
+
     def draw(self, armId, t=1):
         """ Return a random sample from the armId-th arm, at time t. Usually t is not used."""
         return self.arms[armId].draw(t)
 
+    def draw_many(self, armIds, t=1):
+        """ Return a numpy array of one random sample from each of the arms ``armIds`` (an arm can be given more than once), at time t. Usually t is not used.
+
+        - The arms of the same family (Bernoulli, Gaussian etc, see :meth:`Arms.Arm.draw_vect`) are drawn with one numpy call, from the parameters cached in :meth:`_drawingGroups`, the other arms are drawn one by one.
+        - For problems with their own :meth:`draw` (e.g., :class:`MarkovianMAB`), it is called for each arm.
+        """
+        armIds = np.asarray(armIds, dtype=int)
+        if type(self).draw is not MAB.draw:
+            return np.array([self.draw(armId, t) for armId in armIds], dtype=float)
+        drawers, groupOf, positionIn = self._drawingGroups()
+        groups = groupOf[armIds]
+        rewards = np.zeros(np.shape(armIds))
+        for group, (draw_vect, generator, params) in enumerate(drawers):
+            inGroup = groups == group
+            if np.any(inGroup):
+                positions = positionIn[armIds[inGroup]]
+                rewards[inGroup] = draw_vect(tuple(param[positions] for param in params), generator)
+        for i in np.flatnonzero(groups < 0):
+            rewards[i] = self.arms[armIds[i]].draw(t)
+        return rewards
+
     def draw_nparray(self, armId, shape=(1,)):
         """ Return a numpy array of random sample from the armId-th arm, of a certain shape."""
         return self.arms[armId].draw_nparray(shape)
 
     def draw_each(self, t=1):
-        """ Return a random sample from each arm, at time t. Usually t is not used."""
-        return np.array([self.draw(armId, t) for armId in range(self.nbArms)])
+        """ Return a random sample from each arm, at time t. Usually t is not used (see :meth:`draw_many`)."""
+        return self.draw_many(np.arange(self.nbArms), t)
 
     def draw_each_nparray(self, shape=(1,)):
         """ Return a numpy array of random sample from each arm, of a certain shape."""
@@ -215,11 +274,7 @@ class MAB(object):
 
         - It is a numpy array of shape (nbArms, horizon).
         """
-        # allMeans = np.tile(self.means, (horizon, 1)).T
-        allMeans = np.zeros((self.nbArms, horizon))
-        for t in range(horizon):
-            allMeans[:, t] = self.means
-        return allMeans
+        return np.tile(np.asarray(self.means, dtype=float)[:, np.newaxis], (1, horizon))
 
     #
     # --- Estimate sparsity
@@ -242,11 +297,32 @@ class MAB(object):
         # or bring back this feature when working on sparse simulations
         return "" if s == K else ", $s={}$".format(s)
 
+    #
+    # --- Memoize the complexity constants
+
+    def _complexityKey(self):
+        """ Key identifying the current problem, for :meth:`_memoized`: the means of the arms and the sparsity."""
+        return np.asarray(self.means, dtype=float).tobytes(), self._sparsity
+
+    def _memoized(self, name, compute, *args):
+        """ Return ``compute(*args)``, cached for this MAB instance by ``(name, args)``.
+
+        - The cached value is computed again if :meth:`_complexityKey` changed since (e.g., the arms were changed by :meth:`new_order_of_arm` or by a non-stationary problem).
+        """
+        cache = self.__dict__.setdefault('_complexityCache', {})
+        key = self._complexityKey()
+        if (name, args) not in cache or cache[(name, args)][0] != key:
+            cache[(name, args)] = (key, compute(*args))
+        return cache[(name, args)][1]
+
     #
     # --- Compute lower bounds
 
     def lowerbound(self):
         r""" Compute the constant :math:`C(\mu)`, for the [Lai & Robbins] lower-bound for this MAB problem (complexity), using functions from ``kullback.py`` or ``kullback.so`` (see :mod:`Arms.kullback`). """
+        return self._memoized('lowerbound', self._lowerbound)
+
+    def _lowerbound(self):
         return sum(a.oneLR(self.maxArm, a.mean) for a in self.arms if a.mean != self.maxArm)
 
     def lowerbound_sparse(self, sparsity=None):
@@ -258,7 +334,9 @@ class MAB(object):
             sparsity = self._sparsity
         if sparsity is None:
             sparsity = self.nbArms
+        return self._memoized('lowerbound_sparse', self._lowerbound_sparse, sparsity)
 
+    def _lowerbound_sparse(self, sparsity):
         try:
             try:
                 from Policies.OSSB import solve_optimization_problem__sparse_bandits
@@ -274,28 +352,36 @@ class MAB(object):
 
     def hoifactor(self):
         """ Compute the HOI factor H_OI(mu), the Optimal Arm Identification (OI) factor, for this MAB problem (complexity). Cf. (3.3) in Navikkumar MODI's thesis, "Machine Learning and Statistical Decision Making for Green Radio" (2017)."""
+        return self._memoized('hoifactor', self._hoifactor)
+
+    def _hoifactor(self):
         return sum(a.oneHOI(self.maxArm, a.mean) for a in self.arms if a.mean != self.maxArm) / float(self.nbArms)
 
-    def lowerbound_multiplayers(self, nbPlayers=1):
-        """ Compute our multi-players lower bound for this MAB problem (complexity), using functions from :mod:`kullback`. """
-        sortedMeans = sorted(self.means)
+    def _terms_multiplayers(self, means, nbPlayers):
+        """ Centralized and [Anandkumar et al., 2010] lower bounds for these means, with the vectorized :meth:`Arms.Arm.oneLR_vect` and :meth:`Arms.Arm.kl_vect` on all the pairs (best arm, worst arm) at once."""
+        sortedMeans = np.sort(np.asarray(means, dtype=float))
         assert nbPlayers <= len(sortedMeans), "Error: this lowerbound_multiplayers() for a MAB problem is only valid when there is less users than arms. Here M = {} > K = {} ...".format(nbPlayers, len(sortedMeans))  # DEBUG
         # FIXME it is highly suboptimal to have a lowerbound = 0 if nbPlayers == nbArms ! We have to finish the theoretical analysis!
         bestMeans = sortedMeans[-nbPlayers:]
         worstMeans = sortedMeans[:-nbPlayers]
         worstOfBestMean = bestMeans[0]
-
         # Our lower bound is this:
-        oneLR = self.arms[0].oneLR
-        centralized_lowerbound = sum(oneLR(worstOfBestMean, oneOfWorstMean) for oneOfWorstMean in worstMeans)
+        centralized_lowerbound = np.sum(self.arms[0].oneLR_vect(worstOfBestMean, worstMeans))
+        # The initial lower bound in Theorem 6 from [Anandkumar et al., 2010]
+        anandkumar_lowerbound = np.sum((worstOfBestMean - worstMeans[np.newaxis, :]) / self.arms[0].kl_vect(worstMeans[np.newaxis, :], bestMeans[:, np.newaxis]))
+        return centralized_lowerbound, anandkumar_lowerbound
+
+    def lowerbound_multiplayers(self, nbPlayers=1):
+        """ Compute our multi-players lower bound for this MAB problem (complexity), using functions from :mod:`kullback`. """
+        return self._memoized('lowerbound_multiplayers', self._lowerbound_multiplayers, nbPlayers)
+
+    def _lowerbound_multiplayers(self, nbPlayers):
+        centralized_lowerbound, anandkumar_lowerbound = self._terms_multiplayers(self.means, nbPlayers)
         print(" -  For {} players, Anandtharam et al. centralized lower-bound gave = {:.3g} ...".format(nbPlayers, centralized_lowerbound))  # DEBUG
 
         our_lowerbound = nbPlayers * centralized_lowerbound
         print(" -  For {} players, our lower bound gave = {:.3g} ...".format(nbPlayers, our_lowerbound))  # DEBUG
 
-        # The initial lower bound in Theorem 6 from [Anandkumar et al., 2010]
-        kl = self.arms[0].kl
-        anandkumar_lowerbound = sum(sum((worstOfBestMean - oneOfWorstMean) / kl(oneOfWorstMean, oneOfBestMean) for oneOfWorstMean in worstMeans) for oneOfBestMean in bestMeans)
         print(" -  For {} players, the initial lower bound in Theorem 6 from [Anandkumar et al., 2010] gave = {:.3g} ...".format(nbPlayers, anandkumar_lowerbound))  # DEBUG
 
         # Check that our bound is better (ie bigger)
@@ -305,13 +391,24 @@ class MAB(object):
 
     def upperbound_collisions(self, nbPlayers, times):
         """ Compute Anandkumar et al. multi-players upper bound for this MAB problem (complexity), for UCB only. Warning: it is HIGHLY asymptotic! """
-        sortedMeans = sorted(self.means)
-        assert nbPlayers <= len(sortedMeans), "Error: this lowerbound_multiplayers() for a MAB problem is only valid when there is less users than arms. Here M = {} > K = {} ...".format(nbPlayers, len(sortedMeans))  # DEBUG
-        bestMeans = sortedMeans[-nbPlayers:][::-1]
+        Upsilon, boundOnExpectedTprime_cstTerm, boundOnExpectedTprime_logT = self._memoized('upperbound_collisions', self._terms_upperbound_collisions, nbPlayers)
+        # Add them up
+        boundOnExpectedTprime = boundOnExpectedTprime_cstTerm + boundOnExpectedTprime_logT * np.log(2 + times)
 
-        def worstMeans_of_a(a):
-            """ Give the worst min if their is a arms."""
-            return sortedMeans[:-(a + 1)]
+        # The upper bound in Theorem 3 from [Anandkumar et al., 2010]
+        upperbound = nbPlayers * (Upsilon + 1) * boundOnExpectedTprime
+        print(" -  For {} players, Anandkumar et al. upper bound for the total cumulated number of collisions is {:.3g} here ...".format(nbPlayers, upperbound[-1]))  # DEBUG
+
+        return upperbound
+
+    def _terms_upperbound_collisions(self, nbPlayers):
+        """ Constant terms of :meth:`upperbound_collisions`, that do not depend on the times."""
+        sortedMeans = np.sort(np.asarray(self.means, dtype=float))
+        nbArms = len(sortedMeans)
+        assert nbPlayers <= nbArms, "Error: this lowerbound_multiplayers() for a MAB problem is only valid when there is less users than arms. Here M = {} > K = {} ...".format(nbPlayers, nbArms)  # DEBUG
+        bestMeans = sortedMeans[-nbPlayers:][::-1]
+        # The a-th best arm is compared to the worst means sortedMeans[:-(a + 1)]
+        isWorstOf = np.arange(nbArms)[np.newaxis, :] < (nbArms - 1 - np.arange(nbPlayers))[:, np.newaxis]
 
         # First, the bound in Lemma 2 from [Anandkumar et al., 2010] uses this Upsilon(U, U)
         Upsilon = binomialCoefficient(nbPlayers, 2 * nbPlayers - 1)
@@ -319,33 +416,14 @@ class MAB(object):
 
         # First, the constant term
         from math import pi
-        boundOnExpectedTprime_cstTerm = nbPlayers * sum(
-            sum(
-                (1 + pi**2 / 3.)
-                for (b, mu_star_b) in enumerate(worstMeans_of_a(a))
-            )
-            for (a, mu_star_a) in enumerate(bestMeans)
-        )
+        boundOnExpectedTprime_cstTerm = nbPlayers * (1 + pi**2 / 3.) * np.count_nonzero(isWorstOf)
         print(" -  For {} players, the bound with (1 + pi^2 / 3) = {:.3g} ...".format(nbPlayers, boundOnExpectedTprime_cstTerm))
 
         # And the term to multiply with log(t)
-        boundOnExpectedTprime_logT = nbPlayers * sum(
-            sum(
-                8. / (mu_star_b - mu_star_a)**2
-                for (b, mu_star_b) in enumerate(worstMeans_of_a(a))
-            )
-            for (a, mu_star_a) in enumerate(bestMeans)
-        )
+        gaps = sortedMeans[np.newaxis, :] - bestMeans[:, np.newaxis]
+        boundOnExpectedTprime_logT = nbPlayers * np.sum(8. / gaps[isWorstOf]**2)
         print(" -  For {} players, the bound with (8 / (mu_b^* - mu_a^*)^2) = {:.3g} ...".format(nbPlayers, boundOnExpectedTprime_logT))
-
-        # Add them up
-        boundOnExpectedTprime = boundOnExpectedTprime_cstTerm + boundOnExpectedTprime_logT * np.log(2 + times)
-
-        # The upper bound in Theorem 3 from [Anandkumar et al., 2010]
-        upperbound = nbPlayers * (Upsilon + 1) * boundOnExpectedTprime
-        print(" -  For {} players, Anandkumar et al. upper bound for the total cumulated number of collisions is {:.3g} here ...".format(nbPlayers, upperbound[-1]))  # DEBUG
-
-        return upperbound
+        return Upsilon, boundOnExpectedTprime_cstTerm, boundOnExpectedTprime_logT
 
     # --- Plot methods
 
@@ -403,11 +481,135 @@ def dict_of_transition_matrix(mat):
 
 
 def transition_matrix_of_dict(dic):
-    """ Convert a dictionary mapping (state, state) to probabilities (as used by :class:`pykov.Chain`) to a transition matrix (numpy array)."""
+    """ Convert a dictionary mapping (state, state) to probabilities (as used by :class:`pykov.Chain`) to a transition matrix (numpy array), with rows and columns ordered by sorted states (missing transitions have probability 0).
+
+    >>> transition_matrix_of_dict({(0, 0): 0.7, (0, 1): 0.3, (1, 0): 0.5, (1, 1): 0.5})
+    array([[0.7, 0.3],
+           [0.5, 0.5]])
+    """
     keys = list(dic.keys())
-    xkeys = sorted(list({i for i, _ in keys}))
-    ykeys = sorted(list({j for _, j in keys}))
-    return np.array([[dic[(i, j)] for i in xkeys] for j in ykeys])
+    states = sorted(list({i for i, _ in keys} | {j for _, j in keys}))
+    return np.array([[dic.get((i, j), 0.) for j in states] for i in states])
+
+
+def steady_distribution(mat):
+    r""" Compute the steady distribution :math:`\pi` of a right stochastic transition matrix :math:`P`, with one linear solve of :math:`\pi (P - I) = 0, \sum_i \pi_i = 1`.
+
+    - Raise a ValueError if the Markov chain is not ergodic (if the steady distribution is not unique).
+
+    >>> steady_distribution([[0.7, 0.3], [0.5, 0.5]])
+    array([0.625, 0.375])
+    """
+    mat = np.asarray(mat, dtype=float)
+    nbStates = len(mat)
+    generator = mat.T - np.eye(nbStates)
+    if np.linalg.matrix_rank(generator) < nbStates - 1:
+        raise ValueError("The Markov chain of transition matrix {} is non-ergodic, and so does not have a steady state distribution... Please choose another transition matrix that as to be irreducible, aperiodic, and reversible.".format(mat.tolist()))
+    system = np.vstack([generator, np.ones(nbStates)])
+    target = np.zeros(nbStates + 1)
+    target[-1] = 1
+    steady = np.linalg.lstsq(system, target, rcond=None)[0]
+    return np.maximum(0, steady)
+
+
+class MarkovArmBank(object):
+    r""" Array-backed bank of the K Markov chains of a :class:`MarkovianMAB`, one for each arm.
+
+    - ``transitions`` is a list of K transition matrices *or* dictionaries (to specify non-integer states).
+    - The states of the chain of arm :math:`k` are coded by integers :math:`0, \dots, n_k - 1`, and :attr:`labels` gives their values (used as rewards).
+    - All the transition matrices are stored as cumulative rows, in one dense array of shape :math:`(K, S, S)` with :math:`S = \max_k n_k` (padded with ones).
+    - Moving one chain costs one uniform draw and a binary search in one cumulative row (:meth:`move`), and moving all the chains (restless model) uses one vectorized draw of K uniforms (:meth:`move_all`).
+    - The steady distributions, and so the means of the arms, are computed only once, with :func:`steady_distribution`.
+
+    >>> bank = MarkovArmBank([{(0, 0): 0.7, (0, 1): 0.3, (1, 0): 0.5, (1, 1): 0.5}, [[0.2, 0.8], [0.6, 0.4]]])
+    >>> bank.means  # doctest: +ELLIPSIS
+    array([0.375     , 0.571428...])
+    >>> bank.states
+    array([0., 0.])
+    >>> np.random.seed(0)
+    >>> [bank.move(1) for _ in range(8)]
+    [1.0, 1.0, 1.0, 0.0, 1.0, 1.0, 0.0, 1.0]
+    >>> bank.move_all()
+    array([1., 0.])
+
+    - The chains can also be moved with their own random generator, see :meth:`set_random_generator`:
+
+    >>> bank.reset(); bank.set_random_generator(np.random.default_rng(42))
+    >>> [bank.move(1) for _ in range(8)]
+    [1.0, 0.0, 1.0, 1.0, 0.0, 1.0, 1.0, 1.0]
+    """
+
+    #: Random generator given to :meth:`set_random_generator`, or None to use the global :mod:`numpy.random` stream.
+    _generator = None
+
+    def __init__(self, transitions, initial_state=0):
+        labels, matrices = [], []
+        for transition in transitions:
+            if isinstance(transition, dict):
+                keys = list(transition.keys())
+                states = sorted(list({i for i, _ in keys} | {j for _, j in keys}))
+                labels.append(np.array(states, dtype=float))
+                matrices.append(transition_matrix_of_dict(transition))
+            else:
+                matrix = np.array(transition, dtype=float)
+                labels.append(np.arange(len(matrix), dtype=float))
+                matrices.append(matrix)
+        # make every transition matrix a right stochastic transition matrix
+        matrices = [matrix / np.sum(matrix, axis=1)[:, np.newaxis] for matrix in matrices]
+
+        self.nbArms = len(matrices)  #: Number of arms.
+        self.nbStates = np.array([len(matrix) for matrix in matrices])  #: Number of states of each chain.
+        self.matrices = matrices  #: List of the K right stochastic transition matrices.
+        maxNbStates = np.max(self.nbStates)
+        self.labels = np.zeros((self.nbArms, maxNbStates))  #: Values of the states of each chain, of shape (K, S).
+        self.cumulatives = np.ones((self.nbArms, maxNbStates, maxNbStates))  #: Cumulative rows of the transition matrices, of shape (K, S, S).
+        for armId, (label, matrix) in enumerate(zip(labels, matrices)):
+            nbStates = len(label)
+            self.labels[armId, :nbStates] = label
+            self.cumulatives[armId, :nbStates, :nbStates] = np.cumsum(matrix, axis=1)
+            self.cumulatives[armId, :nbStates, nbStates - 1] = 1.  # no rounding error on the last column
+
+        self.steadys = [steady_distribution(matrix) for matrix in matrices]  #: Steady distributions of each chain.
+        self.means = np.array([np.dot(label, steady) for label, steady in zip(labels, self.steadys)])  #: Means of each arm, from their steady distributions.
+
+        # Initial state of each chain, the one of value initial_state (or the first one)
+        self._initial_codes = np.array([
+            int(np.nonzero(label == initial_state)[0][0]) if np.any(label == initial_state) else 0
+            for label in labels
+        ])
+        self.codes = np.copy(self._initial_codes)  #: Current state of each chain, as integer codes.
+        self._arms = np.arange(self.nbArms)
+
+    def reset(self):
+        """ Put back every chain in its initial state."""
+        self.codes[:] = self._initial_codes
+
+    @property
+    def states(self):
+        """ Values of the current states of the K chains."""
+        return self.labels[self._arms, self.codes]
+
+    @property
+    def random_generator(self):
+        """ The random generator used to move the chains: the one given to :meth:`set_random_generator`, or by default the global :mod:`numpy.random` stream."""
+        return np.random if self._generator is None else self._generator
+
+    def set_random_generator(self, generator=None):
+        """ Move the chains with this :class:`numpy.random.Generator` (or :class:`numpy.random.RandomState`), like :meth:`Arms.Arm.set_random_generator`. Give ``None`` to go back to the global :mod:`numpy.random` stream."""
+        self._generator = generator
+
+    def move(self, armId):
+        """ Move the chain of arm ``armId`` (one step), and return the value of its new state."""
+        code = np.searchsorted(self.cumulatives[armId, self.codes[armId]], self.random_generator.random(), side='right')
+        self.codes[armId] = code
+        return float(self.labels[armId, code])
+
+    def move_all(self):
+        """ Move the K chains (one step each, with one uniform draw for each chain), and return the values of their new states."""
+        uniforms = self.random_generator.random(self.nbArms)
+        rows = self.cumulatives[self._arms, self.codes]
+        self.codes[:] = np.sum(rows <= uniforms[:, np.newaxis], axis=1)
+        return self.labels[self._arms, self.codes]
 
 
 class MarkovianMAB(MAB):
@@ -438,7 +640,7 @@ class MarkovianMAB(MAB):
             }
         }
 
-    - This class requires the [pykov](https://github.com/riccardoscalco/Pykov) module to represent and use Markov chain.
+    - The Markov chains are represented and moved with numpy arrays, in a :class:`MarkovArmBank`.
     """
 
     def __init__(self, configuration):
@@ -471,9 +673,8 @@ class MarkovianMAB(MAB):
         self.dict_transitions = dict_transitions
         print(" - Using these transition dictionaries:", dict_transitions)  # DEBUG
 
-        # FIXED this will fail harshly if Pykov is not installed/present
-        self.chains = [Chain(d) for d in dict_transitions]
-        print(" - For these Markov chains:", self.chains)  # DEBUG
+        #: Array-backed bank of Markov chains, one for each arm
+        self.bank = MarkovArmBank(transitions)
 
         self.rested = configuration["params"].get("rested", RESTED)  #: Rested or not Markovian model?
         print(" - Rested:", self.rested)  # DEBUG
@@ -481,23 +682,10 @@ class MarkovianMAB(MAB):
         self.nbArms = len(self.matrix_transitions)  #: Number of arms
         print(" - with 'nbArms' =", self.nbArms)  # DEBUG
 
-        # # Make every transition matrix a right stochastic transition matrix
-        # for c in self.chains:
-        #     c.stochastic()
-
-        # Means of arms = steady distribution
-        self.states = [np.array(list(c.states())) for c in self.chains]
-        print(" - and states:", self.states)  # DEBUG
-        try:
-            self.steadys = [np.array(list(c.steady().values())) for c in self.chains]
-        except ValueError:
-            for c in self.chains:
-                if len(c.steady()) == 0:
-                    print("[ERROR] the steady state of the Markov chain {} was not-found because it is non-ergodic...".format(c))
-                    raise ValueError("The Markov chain {} is non-ergodic, and so does not have a steady state distribution... Please choose another transition matrix that as to be irreducible, aperiodic, and reversible.".format(c))
-        # If the steady state exist, go on
+        # Means of arms = steady distribution, computed once with a linear solve
+        self.steadys = self.bank.steadys  #: Steady distributions of each Markov chain.
         print(" - and steady state distributions:", self.steadys)  # DEBUG
-        self.means = np.array([np.dot(s, p) for s, p in zip(self.states, self.steadys)])  #: Means of each arms, from their steady distributions.
+        self.means = self.bank.means  #: Means of each arms, from their steady distributions.
         print(" - so it gives arms of means:", self.means)  # DEBUG
 
         self.arms = [configuration["params"]["steadyArm"](mean) for mean in self.means]
@@ -509,10 +697,18 @@ class MarkovianMAB(MAB):
         self.minArm = np.min(self.means)  #: Min mean of arms
         print(" - with 'minArm' =", self.minArm)  # DEBUG
 
-        #: States of each arm, initially they are all busy
-        self.states = np.zeros(self.nbArms)
         print("DONE for creating this MarkovianMAB problem...")  # DEBUG
 
+    @property
+    def states(self):
+        """ Current states of each arm, initially they are all busy (state 0)."""
+        return self.bank.states
+
+    def set_random_generator(self, generator=None):
+        """ Move the Markov chains with this random generator (and the steady arms draw from it), see :meth:`MarkovArmBank.set_random_generator`."""
+        super(MarkovianMAB, self).set_random_generator(generator)
+        self.bank.set_random_generator(generator)
+
     def __repr__(self):
         return "{}(nbArms: {}, chains: {}, arms: {})".format(self.__class__.__name__, self.nbArms, self.matrix_transitions, self.arms)
 
@@ -553,25 +749,12 @@ class MarkovianMAB(MAB):
         - If *rested* Markovian, only the state of the Markov chain of arm `armId` changes. It is the simpler model, and the default model.
         - But if *restless* (non rested) Markovian, the states of all the Markov chain of all arms change (not only `armId`).
         """
-        # 1. Get current state for that arm, and its Markov chain
-        state, chain = self.states[armId], self.chains[armId]
-        # 2. Sample from that Markov chain
-        nextState = chain.move(state)
-        # 3. Update the state
-        self.states[armId] = nextState
-        # print("- For the arm #{}, previously in the state {}, the Markov chain moved to state {} ...".format(armId, state, nextState))  # DEBUG
-
-        if not self.rested:
+        if self.rested:
+            # Only the Markov chain of that arm moves
+            return self.bank.move(armId)
+        else:
             # print("- Non-rested Markovian model, every other arm is also moving...")  # DEBUG
-            for armId2 in range(self.nbArms):
-                # For each other arm, they evolve
-                if armId2 != armId:
-                    state, chain = self.states[armId2], self.chains[armId2]
-                    nextState = chain.move(state)
-                    # print("    - For the arm #{}, previously in the state {}, the Markov chain moved to state {} ...".format(armId, state, nextState))  # DEBUG
-                    self.states[armId2] = nextState
-
-        return float(nextState)
+            return float(self.bank.move_all()[armId])
 
 
 # --- ChangingAtEachRepMAB
@@ -579,10 +762,21 @@ class MarkovianMAB(MAB):
 VERBOSE = True
 VERBOSE = False  #: Whether to be verbose when generating new arms for Dynamic MAB
 
+def _acceptsNbRepetitions(newMeans):
+    """ True if this generator of means accepts a ``nbRepetitions`` argument, and so can generate all the repetitions in one call (like :func:`Arms.randomMeans`)."""
+    try:
+        if not hasattr(inspect, 'signature'):  # Python 2
+            return 'nbRepetitions' in inspect.getargspec(newMeans).args
+        return 'nbRepetitions' in inspect.signature(newMeans).parameters
+    except (TypeError, ValueError):
+        return False
+
+
 class ChangingAtEachRepMAB(MAB):
     """Like a stationary MAB problem, but the arms are (randomly) regenerated for each repetition, with the :meth:`newRandomArms` method.
 
     - ``M.arms`` and ``M.means`` is changed after each call to :meth:`newRandomArms`, but not ``nbArm``. All the other methods are carefully written to still make sense (``Mbest``, ``Mworst``, ``minArm``, ``maxArm``).
+    - The means of all the repetitions can also be generated at once with :meth:`newRandomArmsOfRepetitions`, and then :meth:`repetition` gives a light copy of the problem for one repetition, holding only its own means. The complexity terms (:meth:`lowerbound`, :meth:`hoifactor`) are computed on all the draws at once.
 
     .. warning:: It works perfectly fine, but it is still experimental, be careful when using this feature.
 
@@ -617,6 +811,7 @@ class ChangingAtEachRepMAB(MAB):
         print("\n\n ==> Creating the dynamic arms ...")  # DEBUG
         # Keep track of the successive mean vectors
         self._historyOfMeans = []  # Historic of the means vectors
+        self._meansOfRepetition = None  # Fixed means, for a light copy given by repetition()
         self._t = 0  # nb of calls to the function for generating new arms
         # Generate a first mean vector
         self.newRandomArms()
@@ -654,7 +849,12 @@ class ChangingAtEachRepMAB(MAB):
     # --- Dynamic arms and means
 
     def newRandomArms(self, t=None, verbose=VERBOSE):
-        """Generate a new list of arms, from ``arm_type(params['newMeans'](*params['args']))``."""
+        """Generate a new list of arms, from ``arm_type(params['newMeans'](*params['args']))``.
+
+        - For a light copy given by :meth:`repetition`, the means of that repetition are simply returned, nothing is drawn.
+        """
+        if self._meansOfRepetition is not None:
+            return self._meansOfRepetition
         one_draw_of_means = self.newMeans(**self.args)
         self._arms = [self.arm_type(mean) for mean in one_draw_of_means]
         self.nbArms = len(self._arms)  # useless
@@ -665,6 +865,32 @@ class ChangingAtEachRepMAB(MAB):
             # print("Currently self._t = {} and self._historyOfMeans = {} ...".format(self._t, self._historyOfMeans))  # DEBUG
         return one_draw_of_means
 
+    def newRandomArmsOfRepetitions(self, nbRepetitions):
+        """Generate the means of the arms for ``nbRepetitions`` repetitions at once, as a ``(nbRepetitions, nbArms)`` array, that replaces the history of means.
+
+        - If the generator of means accepts a ``nbRepetitions`` argument (like :func:`Arms.randomMeans`), only one vectorized call is done.
+        """
+        if _acceptsNbRepetitions(self.newMeans):
+            allMeans = np.asarray(self.newMeans(nbRepetitions=nbRepetitions, **self.args))
+        else:
+            allMeans = np.array([self.newMeans(**self.args) for _ in range(nbRepetitions)])
+        assert np.shape(allMeans) == (nbRepetitions, self.nbArms), "Error: the generator of means {} gave an array of shape {} instead of {}...".format(self.newMeans, np.shape(allMeans), (nbRepetitions, self.nbArms))  # DEBUG
+        self._historyOfMeans = list(allMeans)
+        self._t = nbRepetitions
+        return allMeans
+
+    def repetition(self, repeatId):
+        """Return a light copy of this problem for the repetition ``repeatId``, after a call to :meth:`newRandomArmsOfRepetitions`.
+
+        - It only holds the means of that repetition, so it is cheap to deep-copy or to send to a parallel worker, and its :meth:`newRandomArms` returns these means.
+        """
+        means = self._historyOfMeans[repeatId]
+        view = copy(self)
+        view._historyOfMeans = [means]
+        view._meansOfRepetition = means
+        view._arms = [self.arm_type(mean) for mean in means]
+        return view
+
     # All these properties arms, means, minArm, maxArm cannot be attributes, as the means of arms change at every experiments
 
     @property
@@ -706,53 +932,40 @@ class ChangingAtEachRepMAB(MAB):
     #
     # --- Compute lower bounds
 
+    def _complexityKey(self):
+        """ Key identifying the current problem, for :meth:`_memoized`: all the draws of means."""
+        allMeans = np.asarray(self._historyOfMeans, dtype=float)
+        return allMeans.tobytes(), allMeans.shape, self._sparsity
+
+    def _termsOfSuboptimalArms(self, oneTerm):
+        """ Array of shape (R, K) of ``oneTerm(max(means), mean)`` for all the R draws of means, with 0 for the best arms."""
+        allMeans = np.asarray(self._historyOfMeans, dtype=float)
+        maxMeans = np.broadcast_to(np.max(allMeans, axis=1)[:, np.newaxis], allMeans.shape)
+        notBest = allMeans != maxMeans
+        terms = np.zeros_like(allMeans)
+        if np.any(notBest):
+            terms[notBest] = np.vectorize(oneTerm, otypes=[float])(maxMeans[notBest], allMeans[notBest])
+        return terms
+
     def lowerbound(self):
         """ Compute the constant C(mu), for [Lai & Robbins] lower-bound for this MAB problem (complexity), using functions from :mod:`kullback` (averaged on all the draws of new means)."""
-        oneLR = self.arms[0].oneLR
-        return np.mean([
-                        sum(
-                            oneLR(np.max(means), m)
-                            for m in means
-                            if m != np.max(means)
-                        )
-                        for means in self._historyOfMeans
-                        ])
+        return self._memoized('lowerbound', lambda: np.mean(np.sum(self._termsOfSuboptimalArms(self.arms[0].oneLR), axis=1)))
 
     def hoifactor(self):
         """ Compute the HOI factor H_OI(mu), the Optimal Arm Identification (OI) factor, for this MAB problem (complexity). Cf. (3.3) in Navikkumar MODI's thesis, "Machine Learning and Statistical Decision Making for Green Radio" (2017) (averaged on all the draws of new means)."""
-        oneHOI = self.arms[0].oneHOI
-        return np.mean([
-                        sum(
-                            oneHOI(np.max(means), m)
-                            for m in means
-                            if m != np.max(means)
-                        ) / float(len(means))
-                        for means in self._historyOfMeans
-                        ])
+        return self._memoized('hoifactor', lambda: np.mean(np.sum(self._termsOfSuboptimalArms(self.arms[0].oneHOI), axis=1) / float(self.nbArms)))
 
     def lowerbound_multiplayers(self, nbPlayers=1):
         """ Compute our multi-players lower bound for this MAB problem (complexity), using functions from :mod:`kullback`. """
-        oneLR = self.arms[0].oneLR
-        kl = self.arms[0].kl
+        return self._memoized('lowerbound_multiplayers', self._lowerbound_multiplayers, nbPlayers)
 
+    def _lowerbound_multiplayers(self, nbPlayers):
         avg_our_lowerbound, avg_anandkumar_lowerbound, avg_centralized_lowerbound = 0.0, 0.0, 0.0
 
         for means in self._historyOfMeans:
-            sortedMeans = sorted(self.means)
-            assert nbPlayers <= len(sortedMeans), "Error: this lowerbound_multiplayers() for a MAB problem is only valid when there is less users than arms. Here M = {} > K = {} ...".format(nbPlayers, len(sortedMeans))  # DEBUG
-            # FIXME it is highly suboptimal to have a lowerbound = 0 if nbPlayers == nbArms ! We have to finish the theoretical analysis!
-            bestMeans = sortedMeans[-nbPlayers:]
-            worstMeans = sortedMeans[:-nbPlayers]
-            worstOfBestMean = bestMeans[0]
-
-            # Our lower bound is this:
-            centralized_lowerbound = sum(oneLR(worstOfBestMean, oneOfWorstMean) for oneOfWorstMean in worstMeans)
-
+            centralized_lowerbound, anandkumar_lowerbound = self._terms_multiplayers(means, nbPlayers)
             our_lowerbound = nbPlayers * centralized_lowerbound
 
-            # The initial lower bound in Theorem 6 from [Anandkumar et al., 2010]
-            anandkumar_lowerbound = sum(sum((worstOfBestMean - oneOfWorstMean) / kl(oneOfWorstMean, oneOfBestMean) for oneOfWorstMean in worstMeans) for oneOfBestMean in bestMeans)
-
             # Store them
             avg_our_lowerbound += our_lowerbound
             avg_anandkumar_lowerbound += anandkumar_lowerbound
@@ -774,6 +987,56 @@ class ChangingAtEachRepMAB(MAB):
         return avg_our_lowerbound, avg_anandkumar_lowerbound, avg_centralized_lowerbound
 
 
+# --- Schedule of change points
+
+class ChangePointSchedule(object):
+    r""" Sorted schedule of change points (or of any other events), exposing the next change time.
+
+    - A simulation loop calls :meth:`is_change_point` at every time step :math:`t = 0, 1, \dots`, and it only compares :math:`t` to one integer, :attr:`next_change`, instead of scanning the list of change points.
+    - ``t in schedule`` is also possible, with a binary search.
+
+    >>> schedule = ChangePointSchedule([0, 500, 200, 200])
+    >>> schedule.next_change
+    0
+    >>> [t for t in range(1000) if schedule.is_change_point(t)]
+    [0, 200, 500]
+    >>> schedule.next_change
+    inf
+    >>> 500 in schedule, 501 in schedule
+    (True, False)
+    """
+
+    def __init__(self, changePoints=()):
+        self.changePoints = np.unique(np.asarray(changePoints, dtype=int))  #: Sorted array of the change points, without duplicates.
+        self._index = 0
+        self.next_change = float('+inf')  #: Next change point, or ``+inf`` if there is no more.
+        self._update_next_change()
+
+    def _update_next_change(self):
+        self.next_change = int(self.changePoints[self._index]) if self._index < len(self.changePoints) else float('+inf')
+
+    def is_change_point(self, t):
+        """ True iff ``t`` is a change point, and then move to the next one. It has to be called with increasing values of ``t``."""
+        while self.next_change < t:  # if some time steps were skipped
+            self._index += 1
+            self._update_next_change()
+        if t == self.next_change:
+            self._index += 1
+            self._update_next_change()
+            return True
+        return False
+
+    def __contains__(self, t):
+        i = np.searchsorted(self.changePoints, t)
+        return i < len(self.changePoints) and self.changePoints[i] == t
+
+    def __len__(self):
+        return len(self.changePoints)
+
+    def __repr__(self):
+        return "ChangePointSchedule({}, next_change={})".format(list(self.changePoints), self.next_change)
+
+
 # --- PieceWiseStationaryMAB
 
 class PieceWiseStationaryMAB(MAB):
@@ -823,6 +1086,7 @@ class PieceWiseStationaryMAB(MAB):
         if 0 not in self.changePoints and len(self.listOfMeans) == len(self.changePoints) - 1:
             self.changePoints = [0] + self.changePoints
         assert len(self.listOfMeans) == len(self.changePoints), "Error: the list of means {} does not has the same length as the list of change points {}...".format(self.listOfMeans, self.changePoints)  # DEBUG
+        self._scheduleOfChangePoints = ChangePointSchedule(self.changePoints)
 
         # XXX try to read sparsity
         self._sparsity = configuration["sparsity"] if "sparsity" in configuration else None
@@ -859,7 +1123,7 @@ class PieceWiseStationaryMAB(MAB):
     def newRandomArms(self, t=None, onlyOneArm=None, verbose=VERBOSE):
         """Fake function, there is nothing random here, it is just to tell the piece-wise stationary MAB problem to maybe use the next interval.
         """
-        if t > 0 and t in self.changePoints:
+        if t > 0 and t in self._scheduleOfChangePoints:
             if verbose: print("  - BREAKPOINT For a PieceWiseStationaryMAB object, the function newRandomArms was called, with t = {}, and current interval was {}, so means was = {} and will be = {}...".format(t, self.currentInterval, self.listOfMeans[self.currentInterval], self.listOfMeans[self.currentInterval + 1]))  # DEBUG
             self.currentInterval += 1  # next interval!
         else:
@@ -927,53 +1191,57 @@ class PieceWiseStationaryMAB(MAB):
     #
     # --- Helper to compute vector of min arms, max arms, all arms
 
+    def _changePointsAndMeans(self):
+        """Return the list of change points (assumed to be sorted), and the list of the mean vectors of each interval (used by :meth:`get_segments`)."""
+        return self.changePoints, self.listOfMeans
+
+    def get_segments(self, horizon=None):
+        """Return the compact piece-wise constant representation of the means of the arms, for a piece-wise stationary MAB.
+
+        - It is a tuple ``(lengths, means)``: ``lengths`` is the vector of the lengths of the intervals (clipped to ``[0, horizon)``, so some can be ``0``), and ``means`` is a numpy array of shape (number of intervals, nbArms).
+        - It is computed only once for each horizon, each list of change points and each list of means, and kept in memory.
+        - Only the first ``len(changePoints)`` mean vectors are used, if there are more.
+        - For instance, with means ``[[0.1, 0.9], [0.5, 0.2], [0.7, 0.3]]`` and change points ``[0, 3, 5]``, and ``horizon=7``, it gives ``lengths = [3, 2, 2]``, and ``horizon=4`` gives ``lengths = [3, 1, 0]``.
+        """
+        changePoints, listOfMeans = self._changePointsAndMeans()
+        if horizon is None:
+            horizon = np.max(changePoints)
+        means = np.array(listOfMeans[:len(changePoints)], dtype=float).reshape((len(changePoints), self.nbArms))
+        key = (int(horizon), tuple(changePoints), means.tobytes())
+        if getattr(self, '_cacheOfSegments', None) is None:
+            self._cacheOfSegments = dict()  # {(horizon, changePoints, means): (lengths, means)}
+        if key not in self._cacheOfSegments:
+            # the interval j is [changePoints[j], changePoints[j+1]), and the first one always starts at t=0
+            boundaries = np.clip(np.concatenate(([0], changePoints[1:], [horizon])), 0, horizon).astype(int)
+            lengths = np.diff(boundaries)
+            lengths.setflags(write=False)
+            means.setflags(write=False)
+            self._cacheOfSegments[key] = (lengths, means)
+        return self._cacheOfSegments[key]
+
     def get_minArm(self, horizon=None):
         """Return the smallest mean of the arms, for a piece-wise stationary MAB
 
-        - It is a vector of length horizon.
+        - It is a vector of length horizon, expanded from :meth:`get_segments`.
         """
-        if horizon is None:
-            horizon = np.max(self.changePoints)
-        mapOfMinArms = [np.min(means) for means in self.listOfMeans]
-        meansOfMinArms = np.zeros(horizon)
-        nbChangePoint = 0
-        for t in range(horizon):
-            if nbChangePoint < len(self.changePoints) - 1 and t >= self.changePoints[nbChangePoint + 1]:
-                nbChangePoint += 1
-            meansOfMinArms[t] = mapOfMinArms[nbChangePoint]
-        return meansOfMinArms
+        lengths, means = self.get_segments(horizon=horizon)
+        return np.repeat(np.min(means, axis=1), lengths)
 
     def get_maxArm(self, horizon=None):
         """Return the vector of max mean of the arms, for a piece-wise stationary MAB.
 
-        - It is a vector of length horizon.
+        - It is a vector of length horizon, expanded from :meth:`get_segments`.
         """
-        if horizon is None:
-            horizon = np.max(self.changePoints)
-        mapOfMaxArms = [np.max(means) for means in self.listOfMeans]
-        meansOfMaxArms = np.ones(horizon)
-        nbChangePoint = 0
-        for t in range(horizon):
-            if nbChangePoint < len(self.changePoints) - 1 and t >= self.changePoints[nbChangePoint + 1]:
-                nbChangePoint += 1
-            meansOfMaxArms[t] = mapOfMaxArms[nbChangePoint]
-        return meansOfMaxArms
+        lengths, means = self.get_segments(horizon=horizon)
+        return np.repeat(np.max(means, axis=1), lengths)
 
     def get_allMeans(self, horizon=None):
         """Return the vector of mean of the arms, for a piece-wise stationary MAB.
 
-        - It is a numpy array of shape (nbArms, horizon).
+        - It is a numpy array of shape (nbArms, horizon), expanded from :meth:`get_segments`.
         """
-        if horizon is None:
-            horizon = np.max(self.changePoints)
-        meansOfArms = np.ones((self.nbArms, horizon))
-        for armId in range(self.nbArms):
-            nbChangePoint = 0
-            for t in range(horizon):
-                if nbChangePoint < len(self.changePoints) - 1 and t >= self.changePoints[nbChangePoint + 1]:
-                    nbChangePoint += 1
-                meansOfArms[armId][t] = self.listOfMeans[nbChangePoint][armId]
-        return meansOfArms
+        lengths, means = self.get_segments(horizon=horizon)
+        return np.repeat(means.T, lengths, axis=1)
 
     #
     # --- Compute lower bounds
@@ -1034,6 +1302,7 @@ class NonStationaryMAB(PieceWiseStationaryMAB):
         print(" - with 'newMeans' =", self.newMeans)  # DEBUG
         self.changePoints = params["changePoints"]  #: List of the change points
         print(" - with 'changePoints' =", self.changePoints)  # DEBUG
+        self._scheduleOfChangePoints = ChangePointSchedule(self.changePoints)
         self.onlyOneArm = params.get("onlyOneArm", None)  #: None by default, but can be "uniform" to only change *one* arm at each change point.
         print(" - with 'onlyOneArm' =", self.onlyOneArm)  # DEBUG
         self.args = params["args"]  #: Args to give to function
@@ -1082,7 +1351,7 @@ class NonStationaryMAB(PieceWiseStationaryMAB):
 
         .. warning:: TODO? So far the only change points we consider is when the means of arms change, but the family of distributions stay the same. I could implement a more generic way, for instance to be able to test algorithms that detect change between different families of distribution (e.g., from a Gaussian of variance=1 to a Gaussian of variance=2, with different or not means).
         """
-        if ((t > 0 and t not in self.changePoints) or (t in self._historyOfChangePoints)):
+        if ((t > 0 and t not in self._scheduleOfChangePoints) or (t in self._historyOfMeans)):
             # return the latest generate means
             return self._historyOfMeans[self._historyOfChangePoints[-1]]
         self._historyOfChangePoints.append(t)
@@ -1103,61 +1372,40 @@ class NonStationaryMAB(PieceWiseStationaryMAB):
                 if arm not in onlyOneArm:
                     one_draw_of_means[arm] = self._historyOfMeans[self._historyOfChangePoints[-2]][arm]
         self._historyOfMeans[t] = one_draw_of_means
-        self._arms = [self.arm_type(mean) for mean in one_draw_of_means]
+        if getattr(self, '_arms', None) is not None and len(self._arms) == len(one_draw_of_means):
+            try:
+                # update the main parameter of the existing arms in place, instead of creating new arms
+                for arm, mean in zip(self._arms, one_draw_of_means):
+                    arm.set_param(mean)
+            except NotImplementedError:
+                # or create new arms, with the random generators of the previous ones
+                generators = [arm._generator for arm in self._arms]
+                self._arms = [self.arm_type(mean) for mean in one_draw_of_means]
+                for arm, generator in zip(self._arms, generators):
+                    arm.set_random_generator(generator)
+            self._forgetDrawingGroups()
+        else:
+            self._arms = [self.arm_type(mean) for mean in one_draw_of_means]
         self.nbArms = len(self._arms)  # useless
         if verbose or self._verbose:
             print("\n  - Creating a new dynamic list of means = {} for arms: NonStationaryMAB = {} ...".format(np.array(one_draw_of_means), repr(self)))  # DEBUG
             # print("Currently self._t = {} and self._historyOfMeans = {} ...".format(self._t, self._historyOfMeans))  # DEBUG
         return one_draw_of_means
 
-    def get_minArm(self, horizon=None):
-        """Return the smallest mean of the arms, for a non-stationary MAB
-
-        - It is a vector of length horizon.
-        """
-        if horizon is None:
-            horizon = np.max(self._historyOfChangePoints)
-        mapOfMinArms = [np.min (self._historyOfMeans[tau]) for tau in sorted(self._historyOfChangePoints)]
-        meansOfMinArms = np.zeros(horizon)
-        nbChangePoint = 0
-        for t in range(horizon):
-            if nbChangePoint < len(self._historyOfChangePoints) - 1 and t >= self._historyOfChangePoints[nbChangePoint + 1]:
-                nbChangePoint += 1
-            meansOfMinArms[t] = mapOfMinArms[nbChangePoint]
-        return meansOfMinArms
-
-    def get_maxArm(self, horizon=None):
-        """Return the vector of max mean of the arms, for a non-stationary MAB.
-
-        - It is a vector of length horizon.
-        """
-        if horizon is None:
-            horizon = np.max(self._historyOfChangePoints)
-        mapOfMaxArms = [np.max(self._historyOfMeans[tau]) for tau in sorted(self._historyOfChangePoints)]
-        meansOfMaxArms = np.ones(horizon)
-        nbChangePoint = 0
-        for t in range(horizon):
-            if nbChangePoint < len(self._historyOfChangePoints) - 1 and t >= self._historyOfChangePoints[nbChangePoint + 1]:
-                nbChangePoint += 1
-            meansOfMaxArms[t] = mapOfMaxArms[nbChangePoint]
-        return meansOfMaxArms
+    @property
+    def arms(self):
+        """Return the *current* list of arms."""
+        return self._arms
 
-    def get_allMeans(self, horizon=None):
-        """Return the vector of mean of the arms, for a non-stationary MAB.
+    @property
+    def means(self):
+        """Return the *current* list of means of arms, generated at the last change point."""
+        return self._historyOfMeans[self._historyOfChangePoints[-1]]
 
-        - It is a numpy array of shape (nbArms, horizon).
-        """
-        if horizon is None:
-            horizon = np.max(self._historyOfChangePoints)
-        mapOfArms = [self._historyOfMeans[tau] for tau in sorted(self._historyOfChangePoints)]
-        meansOfArms = np.ones((self.nbArms, horizon))
-        for armId in range(self.nbArms):
-            nbChangePoint = 0
-            for t in range(horizon):
-                if nbChangePoint < len(self._historyOfChangePoints) - 1 and t >= self._historyOfChangePoints[nbChangePoint + 1]:
-                    nbChangePoint += 1
-                meansOfArms[armId][t] = mapOfArms[nbChangePoint][armId]
-        return meansOfArms
+    def _changePointsAndMeans(self):
+        """Return the sorted list of the change points seen so far, and the list of the mean vectors of each interval (used by :meth:`get_segments`, :meth:`get_minArm`, :meth:`get_maxArm` and :meth:`get_allMeans`)."""
+        changePoints = sorted(self._historyOfChangePoints)
+        return changePoints, [self._historyOfMeans[tau] for tau in changePoints]
 
 
 # --- IncreasingMAB
@@ -9,20 +9,24 @@ import numpy as np
 
 
 class ResultMultiPlayers(object):
-    """ ResultMultiPlayers accumulators, for the multi-players case. """
+    """ ResultMultiPlayers accumulators, for the multi-players case.
+
+    - The pulls of all the players at all times are not stored in a dense ``(nbPlayers, nbArms, horizon)`` array: as each player pulls at most one arm at each time, they are given by :attr:`choices` (see :meth:`addAllPulls`).
+    - If ``sparse`` is True, the players are not all activated at each time: the choices start at -1 (a non-activated player), and only the activated players are stored (see :meth:`storeActive`).
+    """
 
     # , delta_t_save=1
-    def __init__(self, nbArms, horizon, nbPlayers, means=None):
+    def __init__(self, nbArms, horizon, nbPlayers, means=None, sparse=False):
         """ Create ResultMultiPlayers."""
         # self._means = means  # Keep the means for ChangingAtEachRepMAB cases
-        self.choices = np.zeros((nbPlayers, horizon), dtype=int)  #: Store all the choices of all the players
+        self.choices = np.full((nbPlayers, horizon), -1 if sparse else 0, dtype=int)  #: Store all the choices of all the players
         self.rewards = np.zeros((nbPlayers, horizon))  #: Store all the rewards of all the players, to compute the mean
         # self.rewardsSquared = np.zeros((nbPlayers, horizon))  #: Store all the rewards**2 of all the players, to compute the variance  # XXX uncomment if needed
         self.pulls = np.zeros((nbPlayers, nbArms), dtype=int)  #: Store the pulls of all the players
-        self.allPulls = np.zeros((nbPlayers, nbArms, horizon), dtype=int)  #: Store all the pulls of all the players
-        self.collisions = np.zeros((nbArms, horizon), dtype=int)  #: Store the collisions on all the arms
+        self.collisions = np.zeros((nbArms, horizon), dtype=np.min_scalar_type(nbPlayers))  #: Store the collisions on all the arms (at most nbPlayers on one arm, so with a small dtype)
         self.running_time = -1  #: Store the running time of the experiment
         self.memory_consumption = -1  #: Store the memory consumption of the experiment
+        self.rankTransitions = None  #: Store the transitions between the configurations of the ranks of the players, if they are counted (see :class:`EvaluatorMultiPlayers.RankTransitions`)
 
     def store(self, time, choices, rewards, pulls, collisions):
         """ Store results."""
@@ -30,5 +34,23 @@ class ResultMultiPlayers(object):
         self.rewards[:, time] = rewards
         # self.rewardsSquared[:, time] = rewards ** 2  # XXX uncomment if needed
         self.pulls += pulls
-        self.allPulls[:, :, time] = pulls
         self.collisions[:, time] = collisions
+
+    def storeActive(self, time, playerIds, choices, rewards, pulls, collisions):
+        """ Store results of the activated players ``playerIds`` only, with ``choices``, ``rewards`` and ``pulls`` given for them (the others keep a choice of -1 and a reward of 0)."""
+        self.choices[playerIds, time] = choices
+        self.rewards[playerIds, time] = rewards
+        self.pulls[playerIds] += pulls
+        self.collisions[:, time] = collisions
+
+    def addAllPulls(self, allPulls):
+        """ Add the pulls of all the players at all times to the array ``allPulls``, of shape ``(nbPlayers, nbArms, horizon)``, directly from :attr:`choices` (a negative choice is a non-activated player, who pulled no arm)."""
+        players, times = np.nonzero(self.choices >= 0)
+        allPulls[players, self.choices[players, times], times] += 1
+        return allPulls
+
+    @property
+    def allPulls(self):
+        """ The pulls of all the players at all times, as a dense array of shape ``(nbPlayers, nbArms, horizon)``, computed from :attr:`choices` when it is asked (prefer :meth:`addAllPulls` to accumulate them)."""
+        nbPlayers, horizon = np.shape(self.choices)
+        return self.addAllPulls(np.zeros((nbPlayers, np.shape(self.pulls)[1], horizon), dtype=int))
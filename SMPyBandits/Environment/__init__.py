@@ -4,7 +4,7 @@
 - :class:`MAB`, :class:`MarkovianMAB`, :class:`ChangingAtEachRepMAB`, :class:`IncreasingMAB`, :class:`PieceWiseStationaryMAB`, :class:`NonStationaryMAB` objects, used to wrap the problems (essentially a list of arms).
 - :class:`Result` and :class:`ResultMultiPlayers` objects, used to wrap simulation results (list of decisions and rewards).
 - :class:`Evaluator` environment, used to wrap simulation, for the single player case.
-- :class:`EvaluatorMultiPlayers` environment, used to wrap simulation, for the multi-players case.
+- :class:`EvaluatorMultiPlayers` environment, used to wrap simulation, for the multi-players case, and :func:`startAllEvaluators` to run many of them with one pool of tasks.
 - :class:`EvaluatorSparseMultiPlayers` environment, used to wrap simulation, for the multi-players case with sparse activated players.
 - :mod:`CollisionModels` implements different collision models.
 
@@ -29,7 +29,7 @@ from .Evaluator import Evaluator
 
 from .CollisionModels import *
 from .ResultMultiPlayers import ResultMultiPlayers
-from .EvaluatorMultiPlayers import EvaluatorMultiPlayers
+from .EvaluatorMultiPlayers import EvaluatorMultiPlayers, startAllEvaluators
 from .EvaluatorSparseMultiPlayers import EvaluatorSparseMultiPlayers
 
 from .plotsettings import DPI, signature, maximizeWindow, palette, makemarkers, wraptext
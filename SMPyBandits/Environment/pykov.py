@@ -24,6 +24,14 @@
 .. module:: A Python module for finite Markov chains.
    :platform: Unix, Windows, Mac
 
+.. note::
+
+   The ``Matrix`` and ``Chain`` objects are still dictionaries, but they also
+   keep a cached scipy.sparse CSR representation, with a stable mapping between
+   states and positions (see ``Matrix._csr_`` and ``Matrix._el2pos_``).
+   Products, powers and steady-state solves work directly on it, and their
+   results keep it, as long as the dictionary is not modified.
+
 .. moduleauthor::
    Riccardo Scalco <riccardo.scalco@gmail.com>
 
@@ -87,6 +95,14 @@ def _del_cache(fn):
             del self._fundamental_matrix
         except AttributeError:
             pass
+        try:
+            del self._el2pos
+        except AttributeError:
+            pass
+        try:
+            del self._csr
+        except AttributeError:
+            pass
         return fn(*args, **kwargs)
     return wrapper
 
@@ -120,10 +136,10 @@ class Vector(OrderedDict):
 
         if data:
             self.update([item for item in six.iteritems(data)
-                         if abs(item[1]) > numpy.finfo(numpy.float).eps])
+                         if abs(item[1]) > numpy.finfo(float).eps])
         if len(kwargs):
             self.update([item for item in six.iteritems(kwargs)
-                         if abs(item[1]) > numpy.finfo(numpy.float).eps])
+                         if abs(item[1]) > numpy.finfo(float).eps])
 
     def __getitem__(self, key):
         """
@@ -148,7 +164,7 @@ class Vector(OrderedDict):
         >>> q
         {'C': 0.4, 'B': 0.6}
         """
-        if abs(value) > numpy.finfo(numpy.float).eps:
+        if abs(value) > numpy.finfo(float).eps:
             OrderedDict.__setitem__(self, key, value)
         elif key in self:
             del self[key]
@@ -172,7 +188,7 @@ class Vector(OrderedDict):
         if isinstance(M, Matrix):
             e2p, p2e = M._el2pos_()
             x = self._toarray(e2p)
-            A = M._dok_(e2p).tocsr().transpose()
+            A = M._csr_().transpose()
             y = A.dot(x)
             result = Vector()
             result._fromarray(y, e2p)
@@ -412,7 +428,7 @@ class Matrix(OrderedDict):
 
         if data:
             self.update([item for item in six.iteritems(data)
-                        if abs(item[1]) > numpy.finfo(numpy.float).eps])
+                        if abs(item[1]) > numpy.finfo(float).eps])
 
     def __getitem__(self, *args):
         """
@@ -456,7 +472,7 @@ class Matrix(OrderedDict):
         >>> T.states()
         {'A', 'B'}
         """
-        if abs(value) > numpy.finfo(numpy.float).eps:
+        if abs(value) > numpy.finfo(float).eps:
             OrderedDict.__setitem__(self, key, value)
         elif key in self:
             del self[key]
@@ -584,6 +600,55 @@ class Matrix(OrderedDict):
             self[pos2el[ii[0]], pos2el[ii[1]]] = val
         return None
 
+    def _csr_(self, el2pos=None):
+        """
+        Return the scipy.sparse CSR matrix of the OrderedDict.
+
+        The CSR matrix is built once, with the states mapping given by
+        :meth:`_el2pos_`, and cached on the object until it is modified.
+        If another mapping ``el2pos`` is given, a new matrix is built.
+
+        >>> T = Matrix({('A','B'): .3, ('A','A'): .7, ('B','A'): 1.})
+        >>> T._csr_() is T._csr_()
+        True
+        """
+        if el2pos is None or el2pos == self._el2pos_()[0]:
+            try:
+                return self._csr
+            except AttributeError:
+                self._csr = self._build_csr_(self._el2pos_()[0])
+                return self._csr
+        return self._build_csr_(el2pos)
+
+    def _build_csr_(self, el2pos):
+        """
+        Return a new scipy.sparse CSR matrix of the OrderedDict, with the states mapping ``el2pos``.
+        """
+        m = len(el2pos)
+        n = len(self)
+        rows = numpy.fromiter((el2pos[k[0]] for k in six.iterkeys(self)), dtype=int, count=n)
+        cols = numpy.fromiter((el2pos[k[1]] for k in six.iterkeys(self)), dtype=int, count=n)
+        data = numpy.fromiter((float(v) for v in six.itervalues(self)), dtype=float, count=n)
+        return ss.csr_matrix((data, (rows, cols)), shape=(m, m))
+
+    def _from_csr_(self, mat, el2pos, pos2el):
+        """
+        Fill an empty Matrix from a scipy.sparse matrix.
+
+        If every state of the mapping is still used, the sparse matrix and the
+        mapping are kept as the cached representation of the result, so that
+        a chain of products or powers never converts back to dictionaries.
+        """
+        mat = ss.coo_matrix(mat)
+        keep = numpy.abs(mat.data) > numpy.finfo(float).eps
+        rows, cols, data = mat.row[keep], mat.col[keep], mat.data[keep]
+        for i, j, value in zip(rows, cols, data):
+            OrderedDict.__setitem__(self, (pos2el[i], pos2el[j]), value)
+        if len(numpy.union1d(rows, cols)) == len(pos2el):
+            self._el2pos = (el2pos, pos2el)
+            self._csr = ss.csr_matrix((data, (rows, cols)), shape=mat.shape)
+        return None
+
     def _numpy_mat(self, el2pos):
         """
         Return a numpy.matrix object from a dictionary.
@@ -615,13 +680,21 @@ class Matrix(OrderedDict):
 
     def _el2pos_(self):
         """
+        Return the mappings state -> position and position -> state.
+
+        The mappings are cached on the object until it is modified, so that
+        the positions are stable across the operations.
         """
-        el2pos = {}
-        pos2el = {}
-        for pos, element in enumerate(list(self.states())):
-            el2pos[element] = pos
-            pos2el[pos] = element
-        return el2pos, pos2el
+        try:
+            return self._el2pos
+        except AttributeError:
+            el2pos = {}
+            pos2el = {}
+            for pos, element in enumerate(list(self.states())):
+                el2pos[element] = pos
+                pos2el[pos] = element
+            self._el2pos = (el2pos, pos2el)
+            return self._el2pos
 
     def stochastic(self):
         """
@@ -745,10 +818,24 @@ class Matrix(OrderedDict):
         {('A', 'A'): 1.0, ('B', 'B'): 1.0}
         """
         el2pos, pos2el = self._el2pos_()
-        P = self._numpy_mat(el2pos)
-        P = P**n
         res = Matrix()
-        res._from_numpy_mat(P, pos2el)
+        if n < 0:
+            P = self._numpy_mat(el2pos)
+            P = P**n
+            res._from_numpy_mat(P, pos2el)
+            return res
+        # Same binary decomposition as numpy.linalg.matrix_power, on the CSR matrix
+        P = self._csr_()
+        result = ss.identity(len(el2pos), format='csr')
+        z = None
+        first = True
+        while n > 0:
+            z = P if z is None else z.dot(z)
+            n, bit = divmod(n, 2)
+            if bit:
+                result = z if first else result.dot(z)
+                first = False
+        res._from_csr_(result, el2pos, pos2el)
         return res
 
     def pow(self, n):
@@ -773,21 +860,21 @@ class Matrix(OrderedDict):
         if isinstance(v, Vector):
             e2p, p2e = self._el2pos_()
             x = v._toarray(e2p)
-            M = self._dok_(e2p).tocsr()
+            M = self._csr_()
             y = M.dot(x)
             result = Vector()
             result._fromarray(y, e2p)
             return result
         elif isinstance(v, Matrix):
             e2p, p2e = self._el2pos_()
-            M = self._dok_(e2p).tocsr()
-            N = v._dok_(e2p).tocsr()
-            C = M.dot(N).todok()
+            M = self._csr_()
+            N = v._csr_(e2p)
+            C = M.dot(N)
             if 'Chain' in repr(self.__class__):
                 res = Chain()
             elif 'Matrix' in repr(self.__class__):
                 res = Matrix()
-            res._from_dok_(C, p2e)
+            res._from_csr_(C, e2p, p2e)
             return res
         elif isinstance(v, int) or isinstance(v, float):
             return Matrix(OrderedDict([(key, value * v) for key, value in
@@ -900,9 +987,9 @@ class Matrix(OrderedDict):
         """
         e2p, p2e = self._el2pos_()
         if method == "UMFPACK_At":
-            A = self._dok_(e2p).tocsr().transpose()
+            A = self._csr_().transpose().tocsc()
         else:
-            A = self._dok_(e2p).tocsr()
+            A = self._csr_()
         bb = b._toarray(e2p)
         x = ssl.spsolve(A, bb, use_umfpack=True)
         res = Vector()
@@ -978,13 +1065,13 @@ class Chain(Matrix):
         except AttributeError:
             e2p, p2e = self._el2pos_()
             m = len(e2p)
-            P = self._dok_(e2p).tocsr()
+            P = self._csr_()
             Q = ss.eye(m, format='csr') - P
             e = numpy.zeros(m)
             e[-1] = 1.
-            Q = Q.transpose()
+            Q = Q.transpose().tocsc()
             # not elegant singular matrix error
-            Q[0, 0] = Q[0, 0] + _machineEpsilon()
+            Q = Q + ss.csc_matrix(([_machineEpsilon()], ([0], [0])), shape=(m, m))
             x = ssl.spsolve(Q, e, use_umfpack=True)
             x = x / sum(x)
             res = Vector()
@@ -1261,7 +1348,7 @@ class Chain(Matrix):
         except AttributeError:
             el2pos, pos2el = self._el2pos_()
             p = self.steady()._toarray(el2pos)
-            P = self._numpy_mat(el2pos)
+            P = numpy.matrix(self._csr_().toarray())
             d = len(p)
             A = numpy.matrix([p for i in range(d)])
             I = numpy.matrix(numpy.identity(d))
@@ -38,11 +38,12 @@ __author__ = "Lilian Besson"
 __version__ = "0.6"
 
 import numpy as np
-import numpy.random as rn
 try:
     from .BasePolicy import BasePolicy
+    from .categorical import categorical_draw
 except ImportError:
     from BasePolicy import BasePolicy
+    from categorical import categorical_draw
 
 
 # Default values for the parameters
@@ -239,7 +240,7 @@ class Aggregator(BasePolicy):
         # 1. make vote every child
         self._makeChildrenChoose()
         # 2. select the vote to trust, randomly
-        return rn.choice(self.choices, p=self.trusts)
+        return self.choices[categorical_draw(self.trusts)]
 
     def choiceWithRank(self, rank=1):
         """ Make each child vote, with rank, then sample the decision by `importance sampling <https://en.wikipedia.org/wiki/Importance_sampling>`_ on their votes with the trust probabilities."""
@@ -248,7 +249,7 @@ class Aggregator(BasePolicy):
         else:
             for i, child in enumerate(self.children):
                 self.choices[i] = child.choiceWithRank(rank)
-            return rn.choice(self.choices, p=self.trusts)
+            return self.choices[categorical_draw(self.trusts)]
 
     def choiceFromSubSet(self, availableArms='all'):
         """ Make each child vote, on subsets of arms, then sample the decision by `importance sampling <https://en.wikipedia.org/wiki/Importance_sampling>`_ on their votes with the trust probabilities."""
@@ -257,7 +258,7 @@ class Aggregator(BasePolicy):
         else:
             for i, child in enumerate(self.children):
                 self.choices[i] = child.choiceFromSubSet(availableArms)
-            return rn.choice(self.choices, p=self.trusts)
+            return self.choices[categorical_draw(self.trusts)]
 
     def choiceMultiple(self, nb=1):
         """ Make each child vote, multiple times, then sample the decision by `importance sampling <https://en.wikipedia.org/wiki/Importance_sampling>`_ on their votes with the trust probabilities."""
@@ -268,7 +269,7 @@ class Aggregator(BasePolicy):
             for i, child in enumerate(self.children):
                 choices[i] = child.choiceMultiple(nb)
                 self.choices[i] = choices[i][0]
-            this_choices = choices[rn.choice(self.nbChildren, replace=False, p=self.trusts)]
+            this_choices = choices[categorical_draw(self.trusts)]
             return this_choices
 
     def choiceIMP(self, nb=1, startWithChoiceMultiple=True):
@@ -280,7 +281,7 @@ class Aggregator(BasePolicy):
             for i, child in enumerate(self.children):
                 choices[i] = child.choiceIMP(nb)
                 self.choices[i] = choices[i][0]
-            this_choices = choices[rn.choice(self.nbChildren, replace=False, p=self.trusts)]
+            this_choices = choices[categorical_draw(self.trusts)]
             return this_choices
 
     def estimatedOrder(self):
@@ -293,9 +294,7 @@ class Aggregator(BasePolicy):
             if hasattr(child, 'estimatedOrder'):
                 orders.append(child.estimatedOrder())
                 trusts.append(alltrusts[i])
-        trusts = np.asarray(trusts)
-        trusts /= np.sum(trusts)
-        chosenOrder = int(rn.choice(len(orders), size=1, replace=False, p=trusts))
+        chosenOrder = categorical_draw(trusts)
         return orders[chosenOrder]
 
     def estimatedBestArms(self, M=1):
@@ -14,8 +14,10 @@ np.seterr(divide='ignore')  # XXX dangerous in general, controlled here!
 
 try:
     from .IndexPolicy import IndexPolicy
+    from .exploration_tables import approximatedfhgittins_exploration_table, time_bucket_width
 except ImportError:
     from IndexPolicy import IndexPolicy
+    from exploration_tables import approximatedfhgittins_exploration_table, time_bucket_width
 
 #: Default value for the parameter :math:`\alpha > 0` for ApproximatedFHGittins.
 ALPHA = 0.125
@@ -33,7 +35,7 @@ class ApproximatedFHGittins(IndexPolicy):
     """
 
     def __init__(self, nbArms, horizon=None,
-                 alpha=ALPHA, distortion_horizon=DISTORTION_HORIZON,
+                 alpha=ALPHA, distortion_horizon=DISTORTION_HORIZON, use_table=False,
                  lower=0., amplitude=1.):
         super(ApproximatedFHGittins, self).__init__(nbArms, lower=lower, amplitude=amplitude)
         assert alpha > 0, "Error: parameter 'alpha' for ApproximatedFHGittins should be > 0."  # DEBUG
@@ -41,6 +43,9 @@ class ApproximatedFHGittins(IndexPolicy):
         assert distortion_horizon >= 1, "Error: parameter 'distortion_horizon' for ApproximatedFHGittins should be >= 1."  # DEBUG
         self.distortion_horizon = distortion_horizon  #: Parameter :math:`\tau > 0`.
         self.horizon = int(horizon)  #: Parameter :math:`T` = known horizon of the experiment.
+        #: If True, the exploration terms are read from a precomputed table, see :func:`exploration_tables.approximatedfhgittins_exploration_table`.
+        #: If the horizon is large, the table uses buckets of time steps, and the indexes are then (slightly optimistic) approximations.
+        self.use_table = use_table
 
     def __str__(self):
         if self.alpha == ALPHA:
@@ -78,8 +83,12 @@ class ApproximatedFHGittins(IndexPolicy):
             return (self.rewards[arm] / self.pulls[arm]) + np.sqrt((2. * self.alpha) / self.pulls[arm] * np.log(m_by_Nk / np.sqrt(np.log(m_by_Nk))))
 
     def computeAllIndex(self):
-        """ Compute the current indexes for all arms, in a vectorized manner."""
-        m_by_Nk = float(self.m) / self.pulls
-        indexes = (self.rewards / self.pulls) + np.sqrt((2. * self.alpha) / self.pulls * np.log(m_by_Nk / np.sqrt(np.maximum(0, np.log(m_by_Nk)))))
+        """ Compute the current indexes for all arms, in a vectorized manner (with a lookup in the precomputed table if :attr:`use_table`, as long as :math:`N_k(t) \leq t \leq T`)."""
+        if self.use_table and self.t <= self.horizon:
+            table = approximatedfhgittins_exploration_table(self.horizon, self.alpha, self.distortion_horizon)
+            indexes = (self.rewards / self.pulls) + table[self.t // time_bucket_width(self.horizon), self.pulls]
+        else:
+            m_by_Nk = float(self.m) / self.pulls
+            indexes = (self.rewards / self.pulls) + np.sqrt((2. * self.alpha) / self.pulls * np.log(m_by_Nk / np.sqrt(np.maximum(0, np.log(m_by_Nk)))))
         indexes[self.pulls < 1] = float('+inf')
         self.index[:] = indexes
@@ -367,6 +367,17 @@ class BESA(IndexPolicy):
         else:
             self.all_rewards = { k : [] for k in range(nbArms) }
 
+    def reset(self, horizon=None):
+        """ Reset the policy in place, and only reallocate :attr:`all_rewards` if the new horizon is larger than the memory already allocated."""
+        super(BESA, self).reset(horizon=horizon)
+        if self._has_horizon:
+            if self.horizon + 1 > np.shape(self.all_rewards)[1]:
+                self.all_rewards = np.zeros((self.nbArms, self.horizon + 1))
+            self.all_rewards.fill(-1e5)  # Just security, to be sure they don't count as zero in some computation
+        else:
+            for k in range(self.nbArms):
+                self.all_rewards[k] = []
+
     def __str__(self):
         """ -> str"""
         b1, b2, b3, b4, b5, b6 = not self.random_subsample, not self.randomized_tournament, self.minPullsOfEachArm > 1, not self._has_horizon, self.non_binary, self.non_recursive
@@ -8,6 +8,7 @@ from __future__ import division, print_function  # Python 2 compatibility
 __author__ = "Lilian Besson"
 __version__ = "0.9"
 
+import inspect
 import numpy as np
 
 #: If True, every time a reward is received, a warning message is displayed if it lies outsides of ``[lower, lower + amplitude]``.
@@ -15,6 +16,25 @@ CHECKBOUNDS = True
 CHECKBOUNDS = False
 
 
+def _argsOf(function):
+    """ Names of the arguments of this function (with :func:`inspect.getargspec` in Python 2, where :func:`inspect.signature` does not exist)."""
+    try: return list(inspect.signature(function).parameters)
+    except AttributeError: return inspect.getargspec(function).args
+
+
+def canResetInPlace(policy):
+    """ True if the policy can be reset in place for a new horizon, with its method ``reset(horizon=...)``: if its class overrides :meth:`BasePolicy.reset` (to update what it computes from its horizon), or if its constructor does not take a horizon at all.
+
+    - A wrapper (with an underlying ``policy``) that overrides it can be reset in place if its underlying policy can.
+    - Otherwise, the policy may have computed other parameters from its horizon in its ``__init__``, so it has to be created again.
+    """
+    klass = next(klass for klass in type(policy).__mro__ if 'reset' in klass.__dict__)
+    if klass is BasePolicy:
+        return 'horizon' not in _argsOf(type(policy).__init__)
+    underlying = getattr(policy, 'policy', None)
+    return not isinstance(underlying, BasePolicy) or canResetInPlace(underlying)
+
+
 class BasePolicy(object):
     """ Base class for any policy."""
 
@@ -43,6 +63,18 @@ class BasePolicy(object):
         self.pulls.fill(0)
         self.rewards.fill(0)
 
+    def reset(self, horizon=None):
+        """ Reset the policy *in place* for a new game, possibly with a new value for its ``horizon`` parameter, without creating a new object.
+
+        - If ``horizon`` is given and the policy has an attribute ``horizon``, it is updated (an ``AttributeError`` is raised if it is read-only),
+        - Then :meth:`startGame` zeroes the internal memory, by reusing the existing arrays.
+
+        .. warning:: A policy that computes other parameters from its horizon in its ``__init__``, or that allocates memory depending on it, has to override this method (see for instance :meth:`Policies.ExploreThenCommit.ETC_KnownGap.reset`). Otherwise, it has to be created again for a new horizon (see :func:`canResetInPlace`).
+        """
+        if horizon is not None and hasattr(self, 'horizon'):
+            self.horizon = horizon
+        self.startGame()
+
     if CHECKBOUNDS:
         # XXX useless checkBounds feature
         def getReward(self, arm, reward):
@@ -39,8 +39,18 @@ class BaseWrapperPolicy(BasePolicy):
         # now for the underlying policy
         if createNewPolicy:
             self.policy = self._policy(self.nbArms, lower=self.lower, amplitude=self.amplitude, *self._args, **self._kwargs)
-        # now also start game for the underlying policy
-        self.policy.startGame()
+            # now also start game for the underlying policy
+            self.policy.startGame()
+        else:
+            # or reuse the existing one
+            self.policy.reset()
+        self.rewards = self.policy.rewards  # just pointers to the underlying arrays!
+        self.pulls = self.policy.pulls      # just pointers to the underlying arrays!
+
+    def reset(self, horizon=None):
+        """ Reset the wrapper *in place*, and its underlying policy with its :meth:`BasePolicy.reset` method (possibly with a new ``horizon``), instead of creating a new underlying policy."""
+        super(BaseWrapperPolicy, self).startGame()
+        self.policy.reset(horizon=horizon)
         self.rewards = self.policy.rewards  # just pointers to the underlying arrays!
         self.pulls = self.policy.pulls      # just pointers to the underlying arrays!
 
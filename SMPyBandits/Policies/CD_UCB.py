@@ -117,7 +117,7 @@ class CD_IndexPolicy(BaseWrapperPolicy):
             # print("The current sum/mean of all rewards for this arm is =", np.sum(self.all_rewards[arm]), np.mean(self.all_rewards[arm]))  # DEBUG
             # Fully restart the algorithm ?!
             if self._full_restart_when_refresh:
-                self.startGame(createNewPolicy=False)
+                self.reset()
             # Or simply reset one of the empirical averages?
             else:
                 self.rewards[arm] = np.sum(self.all_rewards[arm])
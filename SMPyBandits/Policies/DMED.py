@@ -12,10 +12,10 @@ import numpy as np
 np.seterr(divide='ignore')  # XXX dangerous in general, controlled here!
 
 try:
-    from .kullback import klBern
+    from .kullback import klBern, vectorized_kl
     from .BasePolicy import BasePolicy
 except ImportError:
-    from kullback import klBern
+    from kullback import klBern, vectorized_kl
     from BasePolicy import BasePolicy
 
 
@@ -32,14 +32,14 @@ class DMED(BasePolicy):
 
     def __init__(self, nbArms, genuine=GENUINE, tolerance=1e-4, kl=klBern, lower=0., amplitude=1.):
         super(DMED, self).__init__(nbArms, lower=lower, amplitude=amplitude)
-        self.kl = np.vectorize(kl)  #: kl function to use
-        self.kl.__name__ = kl.__name__
+        self.kl = vectorized_kl(kl)  #: kl function to use, working on numpy arrays (see :func:`kullback.vectorized_kl`)
+        self.klname = kl.__name__[2:]  #: Short name of the kl function, used for :meth:`__str__`
         self.tolerance = tolerance  #: Numerical tolerance
         self.genuine = genuine  #: Flag to know which variant is implemented, DMED or DMED+
         self.nextActions = list(range(nbArms))  #: List of next actions to play, every next step is playing ``nextActions.pop(0)``
 
     def __str__(self):
-        return r"DMED{}({})".format("$^+$" if self.genuine else "", self.kl.__name__[2:])
+        return r"DMED{}({})".format("$^+$" if self.genuine else "", self.klname)
 
     def startGame(self):
         """ Initialize the policy for a new game."""
@@ -78,11 +78,13 @@ class DMED(BasePolicy):
         if len(self.nextActions) == 0:
             empiricalMeans = self.rewards / self.pulls
             bestEmpiricalMean = np.max(empiricalMeans)
+            # one numpy expression for all the arms, as self.kl works on arrays
+            divergences = self.pulls * self.kl(empiricalMeans, bestEmpiricalMean)
             if self.genuine:
-                self.nextActions = np.nonzero(self.pulls * self.kl(empiricalMeans, bestEmpiricalMean) < np.log(self.t / self.pulls))[0]
+                self.nextActions = np.nonzero(divergences < np.log(self.t / self.pulls))[0]
             else:
-                self.nextActions = np.nonzero(self.pulls * self.kl(empiricalMeans, bestEmpiricalMean) < np.log(self.t))[0]
-            self.nextActions = list(self.nextActions)
+                self.nextActions = np.nonzero(divergences < np.log(self.t))[0]
+            self.nextActions = self.nextActions.tolist()
         # Play next action
         return self.nextActions.pop(0)
 
@@ -27,6 +27,13 @@ r""" A policy that acts as a wrapper on another policy `P`, assumed to be *horiz
    instead its attribute `horizon` or `_horizon` is updated. Be sure that this is enough to really
    change the internal value used by the policy. Some policy use T only once to compute others parameters,
    which should be updated as well. A manual implementation of the `__setattr__` method can help.
+
+.. note::
+
+   If `FULL_RESTART=True`, the underlying algorithm is not recreated either, if it can be reset in place:
+   it is created only once, and then reset with its `reset(horizon=...)` method (see :meth:`Policies.BasePolicy.reset`),
+   at every breakpoint and at the beginning of every game. A policy that computes other parameters from its horizon
+   without overriding `reset` is still recreated (see :func:`Policies.BasePolicy.canResetInPlace`).
 """
 from __future__ import division, print_function  # Python 2 compatibility
 
@@ -36,9 +43,11 @@ __version__ = "0.9"
 
 import numpy as np
 try:
+    from .BasePolicy import canResetInPlace
     from .BaseWrapperPolicy import BaseWrapperPolicy
     from .UCBH import UCBH
 except ImportError:
+    from BasePolicy import canResetInPlace
     from BaseWrapperPolicy import BaseWrapperPolicy
     from UCBH import UCBH
 try:
@@ -587,11 +596,28 @@ class DoublingTrickWrapper(BaseWrapperPolicy):
     # --- Start game by creating new underlying policy
 
     def startGame(self):
-        """ Initialize the policy for a new game."""
+        """ Initialize the policy for a new game.
+
+        - The underlying policy is created only the first time, and then it is reset in place with its ``reset(horizon=...)`` method, if it can be (see :meth:`restartPolicy`).
+        """
         super(BaseWrapperPolicy, self).startGame()
         # super(DoublingTrickWrapper, self).startGame()  # WARNING no
         self._i = 0  # reinitialize this
         self.horizon = self._first_horizon  #: Last guess for the horizon
+        self.restartPolicy()
+
+    def restartPolicy(self):
+        """ Restart the underlying policy with the current guess for the horizon.
+
+        - It is reset in place if it can be (see :func:`BasePolicy.canResetInPlace`), and if its horizon is not read-only,
+        - Otherwise, a new underlying policy is created, as the parameters it computed from its previous horizon are wrong for the new one.
+        """
+        if self.policy is not None and canResetInPlace(self.policy):
+            try:
+                self.policy.reset(horizon=self.horizon)
+                return
+            except AttributeError:
+                pass  # read-only horizon, it has to be created again
         try:
             self.policy = self._policy(self.nbArms, horizon=self.horizon, lower=self.lower, amplitude=self.amplitude, *self._args, **self._kwargs)
         except Exception as e:
@@ -625,14 +651,9 @@ class DoublingTrickWrapper(BaseWrapperPolicy):
             self.horizon = new_horizon
             # now we have to update or restart the underlying policy
             if self.full_restart:
-                try:
-                    self.policy = self._policy(self.nbArms, horizon=self.horizon, lower=self.lower, amplitude=self.amplitude, *self._args, **self._kwargs)
-                except Exception as e:
-                    # print("Received exception {} when trying to create the underlying policy... maybe the 'horizon={}' keyword argument was not understood correctly? Retrying without it...".format(e, self.horizon))  # DEBUG
-                    self.policy = self._policy(self.nbArms, lower=self.lower, amplitude=self.amplitude, *self._args, **self._kwargs)
-                # now also start game for the underlying policy
-                self.policy.startGame()
-                # print("   ==> Fully restarting the underlying policy by creating a new object... Now it is = {} ...".format(self.policy))  # DEBUG
+                # reset the underlying policy in place with its new horizon, or create a new one if it cannot be
+                self.restartPolicy()
+                # print("   ==> Fully restarting the underlying policy... Now it is = {} ...".format(self.policy))  # DEBUG
             else:
                 if hasattr(self.policy, 'horizon'):
                     try:
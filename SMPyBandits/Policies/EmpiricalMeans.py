@@ -17,6 +17,8 @@ except ImportError:
 class EmpiricalMeans(IndexPolicy):
     """ The naive Empirical Means policy for bounded bandits: like UCB but without a bias correction term. Note that it is equal to UCBalpha with alpha=0, only quicker."""
 
+    allIndexBroadcasts = True
+
     def computeIndex(self, arm):
         r""" Compute the current index, at time t and after :math:`N_k(t)` pulls of arm k:
 
@@ -14,8 +14,10 @@ import numpy as np
 import numpy.random as rn
 try:
     from .BasePolicy import BasePolicy
+    from .categorical import categorical_draw
 except ImportError:
     from BasePolicy import BasePolicy
+    from categorical import categorical_draw
 
 #: self.unbiased is a flag to know if the rewards are used as biased estimator,
 #: i.e., just :math:`r_t`, or unbiased estimators, :math:`r_t / trusts_t`.
@@ -114,13 +116,13 @@ class Exp3(BasePolicy):
     # --- Choice methods
 
     def choice(self):
-        """One random selection, with probabilities = trusts, thank to :func:`numpy.random.choice`."""
+        """One random selection, with probabilities = trusts, thank to :func:`categorical.categorical_draw`."""
         # Force to first visit each arm once in the first steps
         if self.t < self.nbArms:
             # DONE we could use a random permutation instead of deterministic order!
             return self._initial_exploration[self.t]
         else:
-            return rn.choice(self.nbArms, p=self.trusts)
+            return categorical_draw(self.trusts)
 
     def choiceWithRank(self, rank=1):
         """Multiple (rank >= 1) random selection, with probabilities = trusts, thank to :func:`numpy.random.choice`, and select the last one (less probable).
@@ -133,11 +135,11 @@ class Exp3(BasePolicy):
             return rn.choice(self.nbArms, size=rank, replace=False, p=self.trusts)[rank - 1]
 
     def choiceFromSubSet(self, availableArms='all'):
-        """One random selection, from availableArms, with probabilities = trusts, thank to :func:`numpy.random.choice`."""
+        """One random selection, from availableArms, with probabilities = trusts, thank to :func:`categorical.categorical_draw`."""
         if (self.t < self.nbArms) or (availableArms == 'all') or (len(availableArms) == self.nbArms):
             return self.choice()
         else:
-            return rn.choice(availableArms, p=self.trusts[availableArms])
+            return availableArms[categorical_draw(self.trusts[availableArms])]
 
     def choiceMultiple(self, nb=1):
         """Multiple (nb >= 1) random selection, with probabilities = trusts, thank to :func:`numpy.random.choice`."""
@@ -243,7 +245,7 @@ class Exp3ELM(Exp3):
             return self._initial_exploration[self.t]
         else:
             p = self.trusts[self.availableArms]
-            return rn.choice(self.availableArms, p=p / np.sum(p))
+            return self.availableArms[categorical_draw(p)]
 
     def getReward(self, arm, reward):
         r""" Get reward and update the weights, as in Exp3, but also update the variance term :math:`V_k(t)` for all arms, and the set of available arms :math:`\mathcal{A}(t)`, by removing arms whose empirical accumulated reward and variance term satisfy a certain inequality.
@@ -54,6 +54,14 @@ class ETC_KnownGap(EpsilonGreedy):
     def __str__(self):
         return r"ETC_KnownGap($T={}$, $\Delta={:.3g}$, $T_0={}$)".format(self.horizon, self.gap, self.max_t)
 
+    def reset(self, horizon=None):
+        """ Reset the policy in place, and recompute :attr:`max_t` if a new horizon is given."""
+        super(ETC_KnownGap, self).reset(horizon=None)
+        if horizon is not None:
+            self.horizon = int(horizon)
+            m = max(0, int(np.floor(((2. / self.gap**2) * np.log(self.horizon * self.gap**2 / 2.)))))
+            self.max_t = self.nbArms * m
+
     # This decorator @property makes this method an attribute, cf. https://docs.python.org/2/library/functions.html#property
     @property
     def epsilon(self):
@@ -136,6 +144,16 @@ class ETC_FixedBudget(EpsilonGreedy):
     def __str__(self):
         return r"ETC_FixedBudget($T={}$, $\Delta={:.3g}$, $T_0={}$)".format(self.horizon, self.gap, self.max_t)
 
+    def reset(self, horizon=None):
+        """ Reset the policy in place, and recompute :attr:`max_t` if a new horizon is given."""
+        super(ETC_FixedBudget, self).reset(horizon=None)
+        self.round_robin_index = -1
+        self.best_identified_arm = None
+        if horizon is not None:
+            self.horizon = int(horizon)
+            n = np.ceil(2 * abs(lambertw(self.horizon**2 * self.gap**4 / (32 * np.pi))) / self.gap**2)
+            self.max_t = self.nbArms * n
+
     def choice(self):
         r""" For n rounds, choose each arm sequentially in a Round-Robin phase, then commit to the arm with highest empirical average.
 
@@ -274,6 +292,13 @@ class DeltaUCB(BasePolicy):
     def __str__(self):
         return r"DeltaUCB($T={}$, $\Delta={:.3g}$, $alpha={:.3g}$)".format(self.horizon, self.gap, self.alpha)
 
+    def reset(self, horizon=None):
+        """ Reset the policy in place, and recompute :attr:`epsilon_T` if a new horizon is given."""
+        super(DeltaUCB, self).reset(horizon=None)
+        if horizon is not None:
+            self.horizon = int(horizon)
+            self.epsilon_T = self.gap * (np.log(np.exp(1) + self.horizon * self.gap**2))**(-1/8.0)
+
     def choice(self):
         r""" Chose between the most chosen and the least chosen arm, based on the following criteria:
 
@@ -14,11 +14,11 @@ np.seterr(divide='ignore')  # XXX dangerous in general, controlled here!
 try:
     from .DMED import DMED
     from .usenumba import jit
-    from .kullback import klBern
+    from .kullback import klBern, VECTORIZED_KL
 except ImportError:
     from DMED import DMED
     from usenumba import jit
-    from kullback import klBern
+    from kullback import klBern, VECTORIZED_KL
 
 
 # --- Utilitary functions Dinf
@@ -48,6 +48,11 @@ def Dinf(x=None, mu=None, kl=klBern,
         D_{\inf}(x, d) \simeq \inf_{\max(\mu, \mathrm{lowerbound}) \leq y \leq \mathrm{upperbound}} \mathrm{kl}(x, y).
 
     .. note:: It uses a call the :func:`scipy.optimize.minimize_scalar`. If this fails, it uses a **bisection search**, and one call to ``kl`` for each step of the bisection search.
+
+    >>> Dinf(0.2, 0.5)  # doctest: +ELLIPSIS
+    0.1927...
+    >>> round(Dinf(0.7, 0.5), 6)
+    0.0
     """
     # lower and upper bounds
     l = max(lowerbound, mu)
@@ -58,8 +63,8 @@ def Dinf(x=None, mu=None, kl=klBern,
         tol=precision,
         options={"maxiter": max_iterations, "disp": False}
     )
-    if hasattr(res, "x"):
-        return res.x
+    if hasattr(res, "fun"):
+        return res.fun
     else:
         print("Warning: the call to scipy.optimize.minimize_scalar failed, using hand-written bisection search instead...")  # DEBUG
     # start in the middle
@@ -79,6 +84,24 @@ def Dinf(x=None, mu=None, kl=klBern,
     return current_kl
 
 
+def Dinf_vect(xs, mu, kl_vect=VECTORIZED_KL[klBern],
+        lowerbound=0, upperbound=1
+    ):
+    r""" The :math:`D_{\inf}` index computation, vectorized on ``xs`` and solved in closed form.
+
+    - It is only valid for the KL divergences of the one-dimensional exponential families (Bernoulli, Gaussian, Poisson, exponential, etc), for which :math:`y \mapsto \mathrm{kl}(x, y)` is decreasing for :math:`y \leq x` and increasing for :math:`y \geq x`,
+    - So the infimum is reached in the projection of ``x`` on :math:`[\max(\mu, \mathrm{lowerbound}), \mathrm{upperbound}]`, and there is no need for one numerical search for each value of ``xs``,
+    - ``kl_vect`` has to accept numpy arrays, see :data:`kullback.VECTORIZED_KL`.
+
+    .. math:: D_{\inf}(x, d) = \mathrm{kl}(x, \min(\max(x, \max(\mu, \mathrm{lowerbound})), \mathrm{upperbound})).
+
+    >>> Dinf_vect([0.2, 0.5, 0.7], 0.5)  # doctest: +ELLIPSIS
+    array([0.1927..., 0...       , 0...       ])
+    """
+    xs = np.asarray(xs, dtype=float)
+    return kl_vect(xs, np.clip(xs, max(lowerbound, mu), upperbound))
+
+
 # --- IMED
 
 class IMED(DMED):
@@ -89,18 +112,23 @@ class IMED(DMED):
 
     def __init__(self, nbArms, tolerance=1e-4, kl=klBern, lower=0., amplitude=1.):
         super(IMED, self).__init__(nbArms, tolerance=tolerance, kl=kl, lower=lower, amplitude=amplitude)
+        self.closed_form_Dinf = kl in VECTORIZED_KL  #: Flag to know if :func:`Dinf_vect` can be used instead of one numerical search per arm.
 
     def __str__(self):
-        return r"IMED({})".format(self.kl.__name__[2:])
+        return r"IMED({})".format(self.klname)
 
     def one_Dinf(self, x, mu):
         r""" Compute the :math:`D_{\inf}` solution, for one value of ``x``, and one value for ``mu``."""
         return Dinf(x=x, mu=mu, kl=self.kl, lowerbound=self.lower, upperbound=self.lower + self.amplitude, precision=self.tolerance)
 
-    # XXX Use this hack to vectorize one_Dinf ?
-    # Dinf = np.vectorize(one_Dinf) ?
     def Dinf(self, xs, mu):
-        r""" Compute the :math:`D_{\inf}` solution, for a vector of value of ``xs``, and one value for ``mu``."""
+        r""" Compute the :math:`D_{\inf}` solution, for a vector of value of ``xs``, and one value for ``mu``.
+
+        - With :func:`Dinf_vect` if the KL divergence has an array-native version (one numpy expression for all the arms),
+        - Or with one call to :meth:`one_Dinf` for each value of ``xs`` otherwise.
+        """
+        if self.closed_form_Dinf:
+            return Dinf_vect(xs, mu, kl_vect=self.kl, lowerbound=self.lower, upperbound=self.lower + self.amplitude)
         return np.array([ self.one_Dinf(x, mu) for x in xs ])
 
     def choice(self):
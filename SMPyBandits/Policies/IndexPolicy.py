@@ -19,6 +19,17 @@ except (ImportError, SystemError):
 class IndexPolicy(BasePolicy):
     """ Class that implements a generic index policy."""
 
+    #: True if :meth:`computeAllIndex` only uses numpy operations on :attr:`pulls`, :attr:`rewards` and :attr:`t` that broadcast, so that it also computes at once the indexes of M players stored as ``(M, K)`` arrays (see :class:`PoliciesMultiPlayers.PlayerBank`). It is only trusted for the class that defines :meth:`computeAllIndex`.
+    allIndexBroadcasts = False
+
+    @classmethod
+    def allIndexBroadcastsFor(cls):
+        """ True if the :meth:`computeAllIndex` of this class also works on ``(M, K)`` arrays, ie., if the class that defines it sets its own :attr:`allIndexBroadcasts` to True (a subclass that overrides :meth:`computeAllIndex` does not inherit it)."""
+        for klass in cls.__mro__:
+            if 'computeAllIndex' in klass.__dict__:
+                return klass.__dict__.get('allIndexBroadcasts', False)
+        return False
+
     def __init__(self, nbArms, lower=0., amplitude=1.):
         """ New generic index policy.
 
@@ -21,6 +21,8 @@ class MOSS(IndexPolicy):
     Reference: [Audibert & Bubeck, 2010](http://www.jmlr.org/papers/volume11/audibert10a/audibert10a.pdf).
     """
 
+    allIndexBroadcasts = True
+
     def computeIndex(self, arm):
         r""" Compute the current index, at time t and after :math:`N_k(t)` pulls of arm k, if there is K arms:
 
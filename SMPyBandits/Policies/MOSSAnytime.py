@@ -25,6 +25,8 @@ class MOSSAnytime(MOSS):
     Reference: [Degenne & Perchet, 2016](http://proceedings.mlr.press/v48/degenne16.pdf).
     """
 
+    allIndexBroadcasts = True
+
     def __init__(self, nbArms, alpha=ALPHA, lower=0., amplitude=1.):
         super(MOSSAnytime, self).__init__(nbArms, lower=lower, amplitude=amplitude)
         self.alpha = alpha  #: Parameter :math:`\alpha \geq 0` for the computations of the index. Optimal value seems to be :math:`1.35`.
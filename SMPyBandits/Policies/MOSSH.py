@@ -12,8 +12,10 @@ np.seterr(divide='ignore')  # XXX dangerous in general, controlled here!
 
 try:
     from .MOSS import MOSS
+    from .exploration_tables import mossh_exploration_table, use_exploration_table
 except ImportError:
     from MOSS import MOSS
+    from exploration_tables import mossh_exploration_table, use_exploration_table
 
 
 class MOSSH(MOSS):
@@ -21,9 +23,10 @@ class MOSSH(MOSS):
     Reference: [Audibert & Bubeck, 2010](http://www.jmlr.org/papers/volume11/audibert10a/audibert10a.pdf).
     """
 
-    def __init__(self, nbArms, horizon=None, lower=0., amplitude=1.):
+    def __init__(self, nbArms, horizon=None, use_table=True, lower=0., amplitude=1.):
         super(MOSSH, self).__init__(nbArms, lower=lower, amplitude=amplitude)
         self.horizon = int(horizon)  #: Parameter :math:`T` = known horizon of the experiment.
+        self.use_table = use_table  #: If True, the exploration terms are read from a precomputed table, see :func:`exploration_tables.mossh_exploration_table`.
 
     def __str__(self):
         return r"MOSS-H($T={}$)".format(self.horizon)
@@ -35,11 +38,16 @@ class MOSSH(MOSS):
         """
         if self.pulls[arm] < 1:
             return float('+inf')
+        elif self.use_table and use_exploration_table(self.t, self.horizon):
+            return (self.rewards[arm] / self.pulls[arm]) + mossh_exploration_table(self.horizon, self.nbArms)[self.pulls[arm]]
         else:
             return (self.rewards[arm] / self.pulls[arm]) + np.sqrt(max(0, np.log(self.horizon / (self.nbArms * self.pulls[arm]))) / self.pulls[arm])
 
     def computeAllIndex(self):
-        """ Compute the current indexes for all arms, in a vectorized manner."""
-        indexes = (self.rewards / self.pulls) + np.sqrt(np.maximum(0., np.log(self.horizon / (self.nbArms * self.pulls))) / self.pulls)
+        """ Compute the current indexes for all arms, in a vectorized manner (with a lookup in the precomputed table, as long as :math:`N_k(t) \leq t \leq T`)."""
+        if self.use_table and use_exploration_table(self.t, self.horizon):
+            indexes = (self.rewards / self.pulls) + mossh_exploration_table(self.horizon, self.nbArms)[self.pulls]
+        else:
+            indexes = (self.rewards / self.pulls) + np.sqrt(np.maximum(0., np.log(self.horizon / (self.nbArms * self.pulls))) / self.pulls)
         indexes[self.pulls < 1] = float('+inf')
         self.index[:] = indexes
@@ -135,7 +135,7 @@ class Monitored_IndexPolicy(BaseWrapperPolicy):
             self.last_update_time_tau = self.t
             # Fully restart the algorithm ?!
             if self._full_restart_when_refresh:
-                self.startGame(createNewPolicy=False)
+                self.reset()
             # Or simply reset one of the empirical averages?
             else:
                 self.rewards[arm] = np.sum(self.all_rewards[arm])
@@ -87,7 +87,7 @@ class SlidingWindowRestart(BaseWrapperPolicy):
             if np.abs(empirical_average - small_empirical_average) >= self._threshold:
                 # Fully restart the algorithm ?!
                 if self._full_restart_when_refresh:
-                    self.startGame(createNewPolicy=False)
+                    self.reset()
                 # Or simply reset one of the empirical averages?
                 else:
                     self.rewards[arm] = np.sum(self.last_rewards[arm])
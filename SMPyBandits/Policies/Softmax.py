@@ -15,8 +15,10 @@ import numpy.random as rn
 
 try:
     from .BasePolicy import BasePolicy
+    from .categorical import categorical_draw
 except ImportError:
     from BasePolicy import BasePolicy
+    from categorical import categorical_draw
 
 #: self.unbiased is a flag to know if the rewards are used as biased estimator,
 #: i.e., just :math:`r_t`, or unbiased estimators, :math:`r_t / trusts_t`.
@@ -93,13 +95,13 @@ class Softmax(BasePolicy):
     # --- Choice methods
 
     def choice(self):
-        """One random selection, with probabilities = trusts, thank to :func:`numpy.random.choice`."""
+        """One random selection, with probabilities = trusts, thank to :func:`categorical.categorical_draw`."""
         # Force to first visit each arm once in the first steps
         if self.t < self.nbArms:
             # return self.t  # random permutation instead of deterministic order!
             return self._initial_exploration[self.t]  # DONE
         else:
-            return rn.choice(self.nbArms, p=self.trusts)
+            return categorical_draw(self.trusts)
 
     def choiceWithRank(self, rank=1):
         """Multiple (rank >= 1) random selection, with probabilities = trusts, thank to :func:`numpy.random.choice`, and select the last one (least probable one).
@@ -112,13 +114,13 @@ class Softmax(BasePolicy):
             return rn.choice(self.nbArms, size=rank, replace=False, p=self.trusts)[-1]
 
     def choiceFromSubSet(self, availableArms='all'):
-        """One random selection, from availableArms, with probabilities = trusts, thank to :func:`numpy.random.choice`."""
+        """One random selection, from availableArms, with probabilities = trusts, thank to :func:`categorical.categorical_draw`."""
         if self.t < self.nbArms:
             return availableArms[self.t % len(availableArms)]
         elif (availableArms == 'all') or (len(availableArms) == self.nbArms):
             return self.choice()
         else:
-            return rn.choice(availableArms, p=self.trusts[availableArms])
+            return availableArms[categorical_draw(self.trusts[availableArms])]
 
     def choiceMultiple(self, nb=1):
         """Multiple (nb >= 1) random selection, with probabilities = trusts, thank to :func:`numpy.random.choice`."""
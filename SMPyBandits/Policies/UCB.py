@@ -24,6 +24,8 @@ class UCB(IndexPolicy):
     - Reference: [Lai & Robbins, 1985].
     """
 
+    allIndexBroadcasts = True
+
     def computeIndex(self, arm):
         r""" Compute the current index, at time t and after :math:`N_k(t)` pulls of arm k:
 
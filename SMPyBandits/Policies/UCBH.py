@@ -21,6 +21,8 @@ class UCBH(UCBalpha):
     Reference: [Audibert et al. 09].
     """
 
+    allIndexBroadcasts = True
+
     def __init__(self, nbArms, horizon=None, alpha=ALPHA, lower=0., amplitude=1.):
         super(UCBH, self).__init__(nbArms, lower=lower, amplitude=amplitude)
         self.horizon = int(horizon)  #: Parameter :math:`T` = known horizon of the experiment.
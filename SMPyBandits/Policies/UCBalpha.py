@@ -26,6 +26,8 @@ class UCBalpha(UCB):
     Reference: [Auer et al. 02].
     """
 
+    allIndexBroadcasts = True
+
     def __init__(self, nbArms, alpha=ALPHA, lower=0., amplitude=1.):
         super(UCBalpha, self).__init__(nbArms, lower=lower, amplitude=amplitude)
         assert alpha >= 0, "Error: the alpha parameter for UCBalpha class has to be >= 0."  # DEBUG
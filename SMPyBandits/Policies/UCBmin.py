@@ -22,6 +22,8 @@ class UCBmin(UCB):
     Reference: [Anandkumar et al., 2010].
     """
 
+    allIndexBroadcasts = True
+
     def computeIndex(self, arm):
         r""" Compute the current index, at time t and after :math:`N_k(t)` pulls of arm k:
 
@@ -3,7 +3,9 @@
 
 - Reference: [Fang Liu et al, 2018](https://arxiv.org/abs/1804.05929).
 
-.. warning:: The whole goal of their paper is to provide a numerically efficient alternative to kl-UCB, so for my comparison to be fair, I should either use the Python versions of klUCB utility functions (using :mod:`kullback`) or write C or Cython versions of this UCBoost module. My conclusion is that kl-UCB is *always* faster than UCBoost.
+.. warning:: The whole goal of their paper is to provide a numerically efficient alternative to kl-UCB, so for my comparison to be fair, I should either use the Python versions of klUCB utility functions (using :mod:`kullback`) or write C or Cython versions of this UCBoost module. My conclusion is that kl-UCB is *always* faster than UCBoost, *if the indexes are computed arm by arm*.
+
+.. note:: All the policies now compute their indexes for all arms at once, in :meth:`computeAllIndex`: each distance of the set D is solved for all arms with one numpy expression (see the ``solution_pb_*_vect`` functions), and the minimum is taken on the stacked array. These functions are compiled with :func:`numba.jit` if numba is available (see :mod:`usenumba`), and are pure numpy otherwise.
 """
 from __future__ import division, print_function  # Python 2 compatibility
 
@@ -42,6 +44,18 @@ tolerance_with_upperbound = 1.0001
 CHECK_SOLUTION = True
 CHECK_SOLUTION = False  # XXX Faster!
 
+def _means_and_upperbounds(policy):
+    r""" Empirical means and upper-bounds on the distances, for all arms of an UCBoost-like ``policy`` (with a parameter ``c``):
+
+    .. math:: \hat{\mu}_k(t) = \frac{X_k(t)}{N_k(t)}, \;\; \delta_k(t) = \frac{\log(t) + c\log(\log(t))}{N_k(t)}.
+
+    - Arms never pulled are counted as pulled once, to avoid any division by zero: their indexes have to be set to :math:`+\infty` by the caller.
+    """
+    pulls = np.maximum(policy.pulls, 1)
+    log_t = log(max(1, policy.t))
+    return policy.rewards / pulls, (log_t + policy.c * log(max(1, log_t))) / pulls
+
+
 # --- New distance and algorithm: quadratic
 
 # @jit
@@ -77,6 +91,16 @@ def solution_pb_sq(p, upperbound, check_solution=CHECK_SOLUTION):
     # return q_star
 
 
+@jit
+def solution_pb_sq_vect(p, upperbound):
+    r""" Vectorized version of :func:`solution_pb_sq`, for arrays ``p`` and ``upperbound``.
+
+    >>> solution_pb_sq_vect(np.array([0.1, 0.5, 0.9]), np.array([0.02, 0.08, 0.18]))
+    array([0.2, 0.7, 1.2])
+    """
+    return p + np.sqrt(upperbound / 2.)
+
+
 class UCB_sq(IndexPolicy):
     """ The UCB(d_sq) policy for bounded bandits (on [0, 1]).
 
@@ -106,12 +130,12 @@ class UCB_sq(IndexPolicy):
             return solution_pb_sq(self.rewards[arm] / self.pulls[arm], log(self.t) / self.pulls[arm])  # XXX Faster if c=0
         return solution_pb_sq(self.rewards[arm] / self.pulls[arm], (log(self.t) + self.c * log(max(1, log(self.t)))) / self.pulls[arm])
 
-    # TODO make this vectorized function working!
-    # def computeAllIndex(self):
-    #     """ Compute the current indexes for all arms, in a vectorized manner."""
-    #     indexes = solution_pb_bq(self.rewards / self.pulls, (log(self.t) + self.c * log(max(1, log(self.t)))) / self.pulls)
-    #     indexes[self.pulls < 1] = float('+inf')
-    #     self.index[:] = indexes
+    def computeAllIndex(self):
+        """ Compute the current indexes for all arms, in a vectorized manner."""
+        p, upperbound = _means_and_upperbounds(self)
+        indexes = solution_pb_sq_vect(p, upperbound)
+        indexes[self.pulls < 1] = float('+inf')
+        self.index[:] = indexes
 
 
 # --- New distance and algorithm: biquadratic
@@ -154,6 +178,16 @@ def solution_pb_bq(p, upperbound, check_solution=CHECK_SOLUTION):
     # return q_star
 
 
+@jit
+def solution_pb_bq_vect(p, upperbound):
+    r""" Vectorized version of :func:`solution_pb_bq`, for arrays ``p`` and ``upperbound``.
+
+    >>> solution_pb_bq_vect(np.array([0.1, 0.5, 0.9]), np.array([0.02, 0.08, 0.18]))  # doctest: +ELLIPSIS
+    array([0.1998..., 0.6991..., 1.        ])
+    """
+    return np.minimum(1, p + np.sqrt(-2.25 + np.sqrt(5.0625 + 2.25 * upperbound)))
+
+
 class UCB_bq(IndexPolicy):
     """ The UCB(d_bq) policy for bounded bandits (on [0, 1]).
 
@@ -183,6 +217,13 @@ class UCB_bq(IndexPolicy):
             return solution_pb_bq(self.rewards[arm] / self.pulls[arm], log(self.t) / self.pulls[arm])  # XXX Faster if c=0
         return solution_pb_bq(self.rewards[arm] / self.pulls[arm], (log(self.t) + self.c * log(max(1, log(self.t)))) / self.pulls[arm])
 
+    def computeAllIndex(self):
+        """ Compute the current indexes for all arms, in a vectorized manner."""
+        p, upperbound = _means_and_upperbounds(self)
+        indexes = solution_pb_bq_vect(p, upperbound)
+        indexes[self.pulls < 1] = float('+inf')
+        self.index[:] = indexes
+
 
 # --- New distance and algorithm: Hellinger
 
@@ -226,6 +267,19 @@ def solution_pb_hellinger(p, upperbound, check_solution=CHECK_SOLUTION):
     # return q_star
 
 
+@jit
+def solution_pb_hellinger_vect(p, upperbound):
+    r""" Vectorized version of :func:`solution_pb_hellinger`, for arrays ``p`` and ``upperbound``.
+
+    >>> solution_pb_hellinger_vect(np.array([0.1, 0.5, 0.9]), np.array([0.02, 0.08, 0.18]))  # doctest: +ELLIPSIS
+    array([0.3309..., 0.7180..., 0.9       ])
+    """
+    sqrt_p = np.sqrt(p)
+    # the max(0, .) is only useful for the values of the upperbound where p is returned
+    solution = (1 - upperbound/2.) * sqrt_p + np.sqrt(np.maximum(0., (1 - p) * (upperbound - upperbound**2 / 4.))) ** 2
+    return np.where(upperbound < (2 - 2 * sqrt_p), solution, p)
+
+
 class UCB_h(IndexPolicy):
     """ The UCB(d_h) policy for bounded bandits (on [0, 1]).
 
@@ -255,6 +309,13 @@ class UCB_h(IndexPolicy):
             return solution_pb_hellinger(self.rewards[arm] / self.pulls[arm], log(self.t) / self.pulls[arm])  # XXX Faster if c=0
         return solution_pb_hellinger(self.rewards[arm] / self.pulls[arm], (log(self.t) + self.c * log(max(1, log(self.t)))) / self.pulls[arm])
 
+    def computeAllIndex(self):
+        """ Compute the current indexes for all arms, in a vectorized manner."""
+        p, upperbound = _means_and_upperbounds(self)
+        indexes = solution_pb_hellinger_vect(p, upperbound)
+        indexes[self.pulls < 1] = float('+inf')
+        self.index[:] = indexes
+
 
 # --- New distance and algorithm: lower-bound on the Kullback-Leibler distance
 
@@ -310,6 +371,17 @@ def solution_pb_kllb(p, upperbound, check_solution=CHECK_SOLUTION):
     # return q_star
 
 
+@jit
+def solution_pb_kllb_vect(p, upperbound):
+    r""" Vectorized version of :func:`solution_pb_kllb`, for arrays ``p`` and ``upperbound``.
+
+    >>> solution_pb_kllb_vect(np.array([0.1, 0.5, 0.9]), np.array([0.02, 0.08, 0.18]))  # doctest: +ELLIPSIS
+    array([0.3184..., 0.7869..., 0.9935...])
+    """
+    p = np.minimum(np.maximum(p, eps), 1 - eps)  # XXX project [0,1] to [eps,1-eps]
+    return 1 - (1 - p) * np.exp((p * np.log(p) - upperbound) / (1 - p))
+
+
 class UCB_lb(IndexPolicy):
     """ The UCB(d_lb) policy for bounded bandits (on [0, 1]).
 
@@ -339,6 +411,13 @@ class UCB_lb(IndexPolicy):
             return solution_pb_kllb(self.rewards[arm] / self.pulls[arm], log(self.t) / self.pulls[arm])  # XXX Faster if c=0
         return solution_pb_kllb(self.rewards[arm] / self.pulls[arm], (log(self.t) + self.c * log(max(1, log(self.t)))) / self.pulls[arm])
 
+    def computeAllIndex(self):
+        """ Compute the current indexes for all arms, in a vectorized manner."""
+        p, upperbound = _means_and_upperbounds(self)
+        indexes = solution_pb_kllb_vect(p, upperbound)
+        indexes[self.pulls < 1] = float('+inf')
+        self.index[:] = indexes
+
 
 # --- New distance and algorithm: a shifted tangent line function of d_kl
 
@@ -386,6 +465,19 @@ def solution_pb_t(p, upperbound, check_solution=CHECK_SOLUTION):
     # return q_star
 
 
+@jit
+def solution_pb_t_vect(p, upperbound):
+    r""" Vectorized version of :func:`solution_pb_t`, for arrays ``p`` and ``upperbound``.
+
+    - The term :math:`p \log(p / (p + 1))` is taken to be :math:`0` for :math:`p = 0` (its limit), instead of failing.
+
+    >>> solution_pb_t_vect(np.array([0., 0.1, 0.5, 0.9]), np.array([0.02, 0.02, 0.08, 0.18]))  # doctest: +ELLIPSIS
+    array([0.1634..., 0.3640..., 1.        , 1.        ])
+    """
+    p_log_p = p * np.log(np.maximum(p, eps) / (p + 1))
+    return np.minimum(1, ((p + 1) / 2.) * (upperbound - p_log_p - np.log(2 / (p + 1)) + 1))
+
+
 class UCB_t(IndexPolicy):
     """ The UCB(d_t) policy for bounded bandits (on [0, 1]).
 
@@ -417,6 +509,13 @@ class UCB_t(IndexPolicy):
             return solution_pb_t(self.rewards[arm] / self.pulls[arm], log(self.t) / self.pulls[arm])  # XXX Faster if c=0
         return solution_pb_t(self.rewards[arm] / self.pulls[arm], (log(self.t) + self.c * log(max(1, log(self.t)))) / self.pulls[arm])
 
+    def computeAllIndex(self):
+        """ Compute the current indexes for all arms, in a vectorized manner."""
+        p, upperbound = _means_and_upperbounds(self)
+        indexes = solution_pb_t_vect(p, upperbound)
+        indexes[self.pulls < 1] = float('+inf')
+        self.index[:] = indexes
+
 
 # --- Now the generic UCBoost algorithm
 
@@ -446,6 +545,15 @@ _distance_of_key = {
     'solution_pb_t': solution_pb_t,
 }
 
+# Same, for the vectorized versions, used in :meth:`UCBoost.computeAllIndex`.
+_vect_distance_of_key = {
+    'solution_pb_sq': solution_pb_sq_vect,
+    'solution_pb_bq': solution_pb_bq_vect,
+    'solution_pb_hellinger': solution_pb_hellinger_vect,
+    'solution_pb_kllb': solution_pb_kllb_vect,
+    'solution_pb_t': solution_pb_t_vect,
+}
+
 
 class UCBoost(IndexPolicy):
     """ The UCBoost policy for bounded bandits (on [0, 1]).
@@ -497,6 +605,16 @@ class UCBoost(IndexPolicy):
             for key in self.set_D
         )
 
+    def computeAllIndex(self):
+        r""" Compute the current indexes for all arms, in a vectorized manner: each distance of ``set_D`` is solved for all the arms, in a stacked array of shape ``(|D|, K)``, and the indexes are the minimum on the first axis."""
+        p, upperbound = _means_and_upperbounds(self)
+        solutions = np.empty((len(self.set_D), self.nbArms))
+        for i, key in enumerate(self.set_D):
+            solutions[i] = _vect_distance_of_key[key](p, upperbound)
+        indexes = np.min(solutions, axis=0)
+        indexes[self.pulls < 1] = float('+inf')
+        self.index[:] = indexes
+
 
 _bq_h_lb = [solution_pb_bq, solution_pb_hellinger, solution_pb_kllb]
 
@@ -644,6 +762,38 @@ def min_solutions_pb_from_epsilon(p, upperbound, epsilon=0.001, check_solution=C
     return min_of_solutions
 
 
+@jit
+def min_solutions_pb_from_epsilon_vect(p, upperbound, epsilon=0.001):
+    r""" Vectorized version of :func:`min_solutions_pb_from_epsilon`, for arrays ``p`` and ``upperbound``, with early termination.
+
+    - As :math:`q_k \geq p` for :math:`k \geq \tau_1(p)`, :math:`k \mapsto d_{kl}(p, q_k)` is increasing, and the minimum of the solutions is the first :math:`q_k` such that :math:`\delta < d_{kl}(p, q_k)` (or :math:`1` if there is none),
+    - So instead of trying all the :math:`\tau_2(p) - \tau_1(p) = \mathcal{O}(\frac{1}{\varepsilon})` values of :math:`k`, this first :math:`k` is found with a bisection search, in :math:`\mathcal{O}(\log(\frac{1}{\varepsilon}))` steps, for all the arms at once.
+
+    >>> p, upperbound = np.array([0.1, 0.5, 0.9]), np.array([0.02, 0.08, 0.18])
+    >>> min_solutions_pb_from_epsilon_vect(p, upperbound, epsilon=0.01)  # doctest: +ELLIPSIS
+    array([0.1722..., 0.6939..., 1.        ])
+    >>> [min_solutions_pb_from_epsilon(pk, uk, epsilon=0.01) for pk, uk in zip(p, upperbound)]  # doctest: +ELLIPSIS
+    [0.1722..., 0.6939..., 1]
+    """
+    eta = epsilon / (1.0 + epsilon)
+    log_1_minus_eta = log(1 - eta)
+    p = np.minimum(np.maximum(p, eps), 1 - eps)  # XXX project [0,1] to [eps,1-eps]
+    tau_1_p = np.ceil(np.log(1 - p) / log_1_minus_eta)
+    tau_2_p = np.ceil(np.log(1 - np.exp(- epsilon / p)) / log_1_minus_eta)
+
+    # bisection search of the first k in [tau_1_p, tau_2_p] such that upperbound < kl(p, q_k), or tau_2_p + 1 if there is none
+    low, high = tau_1_p, tau_2_p + 1
+    searching = low < high
+    while np.any(searching):
+        middle = np.floor((low + high) / 2.)
+        q_middle = np.minimum(np.maximum(1 - (1.0 - eta) ** middle, eps), 1 - eps)
+        above = upperbound < (p * np.log(p / q_middle) + (1 - p) * np.log((1 - p) / (1 - q_middle)))
+        high = np.where(searching & above, middle, high)
+        low = np.where(searching & ~above, middle + 1, low)
+        searching = low < high
+    return np.where(low <= tau_2_p, 1 - (1.0 - eta) ** low, 1.)
+
+
 class UCBoostEpsilon(IndexPolicy):
     r""" The UCBoostEpsilon policy for bounded bandits (on [0, 1]).
 
@@ -685,3 +835,16 @@ class UCBoostEpsilon(IndexPolicy):
             ),
             min_solutions
         )
+
+    def computeAllIndex(self):
+        r""" Compute the current indexes for all arms, in a vectorized manner, using :func:`min_solutions_pb_from_epsilon_vect`."""
+        p, upperbound = _means_and_upperbounds(self)
+        indexes = np.minimum(
+            np.minimum(
+                solution_pb_kllb_vect(p, upperbound),
+                solution_pb_sq_vect(p, upperbound)
+            ),
+            min_solutions_pb_from_epsilon_vect(p, upperbound, epsilon=self.epsilon)
+        )
+        indexes[self.pulls < 1] = float('+inf')
+        self.index[:] = indexes
@@ -207,6 +207,7 @@ from .MEGA import MEGA  # Cf. [Avner & Mannor, 2014](https://arxiv.org/abs/1404.
 # --- Utility functions
 
 from .with_proba import with_proba
+from .categorical import AliasTable, categorical_draw
 
 # --- KL-UCB index functions
 from .usenumba import jit
@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+r""" Fast samplers for categorical distributions, used instead of :func:`numpy.random.choice` with a ``p`` argument.
+
+- :func:`numpy.random.choice` checks and normalizes the probability vector, and builds its cumulative distribution function, at *every* call. This is a large overhead when only one sample is needed.
+- For a *fixed* distribution (e.g., :class:`Arms.DiscreteArm`), an :class:`AliasTable` is built once, in :math:`\mathcal{O}(K)`, and then each sample costs :math:`\mathcal{O}(1)`: one uniform draw, one comparison.
+- For a distribution that *changes at every step* (e.g., the trusts of :class:`Exp3`, :class:`Softmax` or :class:`Aggregator`), building a table is useless, and :func:`categorical_draw` simply inverts the cumulative sum of the (possibly unnormalized) weights with a binary search, without any validation.
+
+- Example:
+
+>>> import numpy as np; np.random.seed(0)  # reproductible
+>>> table = AliasTable([0.25, 0.5, 0.25])
+>>> [table.draw() for _ in range(10)]
+[1, 2, 1, 1, 1, 1, 1, 2, 1, 1]
+>>> table.draw_nparray((2, 5))
+array([[2, 1, 1, 1, 0],
+       [0, 0, 2, 2, 2]])
+>>> categorical_draw([1., 2., 1.])  # weights do not have to be normalized
+2
+"""
+from __future__ import division, print_function  # Python 2 compatibility
+
+__author__ = "Lilian Besson"
+__version__ = "0.9"
+
+import numpy as np
+from numpy.random import random_sample
+
+
+class AliasTable(object):
+    r""" Walker's alias table for a fixed categorical distribution over :math:`\{0, \dots, K-1\}`, built with Vose's algorithm.
+
+    - A sample is obtained with one uniform :math:`U \in [0, K)`: with :math:`i = \lfloor U \rfloor`, return :math:`i` if :math:`U - i < q_i`, otherwise return the alias :math:`a_i`.
+    - The probabilities do not have to be normalized, but they have to be non-negative.
+    """
+
+    def __init__(self, probabilities):
+        probabilities = np.asarray(probabilities, dtype=float)
+        assert probabilities.ndim == 1 and len(probabilities) > 0, "Error: the probabilities for AliasTable have to be a non-empty vector."  # DEBUG
+        assert np.all(probabilities >= 0) and np.sum(probabilities) > 0, "Error: the probabilities for AliasTable have to be non-negative and not all zero."  # DEBUG
+        size = len(probabilities)
+        self.size = size  #: Number of categories :math:`K`.
+        scaled = probabilities * (size / np.sum(probabilities))
+        self.thresholds = np.ones(size)  #: Thresholds :math:`q_i` of each column.
+        self.aliases = np.arange(size)  #: Aliases :math:`a_i` of each column.
+        small = [i for i in range(size) if scaled[i] < 1]
+        large = [i for i in range(size) if scaled[i] >= 1]
+        while small and large:
+            i, j = small.pop(), large.pop()
+            self.thresholds[i] = scaled[i]
+            self.aliases[i] = j
+            scaled[j] -= 1 - scaled[i]
+            if scaled[j] < 1:
+                small.append(j)
+            else:
+                large.append(j)
+        # Remaining columns are full (up to rounding errors)
+        for i in small + large:
+            self.thresholds[i] = 1.
+
+    def draw(self, generator=None):
+        r""" Draw one random index, in :math:`\mathcal{O}(1)`, from the random ``generator`` (by default, the global :mod:`numpy.random` stream)."""
+        u = (random_sample() if generator is None else generator.random()) * self.size
+        i = int(u)
+        return i if (u - i) < self.thresholds[i] else int(self.aliases[i])
+
+    def draw_nparray(self, shape=(1,), generator=None):
+        """ Draw a numpy array of random indexes, of a certain shape, from the random ``generator`` (by default, the global :mod:`numpy.random` stream)."""
+        u = (random_sample(shape) if generator is None else generator.random(shape)) * self.size
+        i = u.astype(int)
+        return np.where((u - i) < self.thresholds[i], i, self.aliases[i])
+
+
+def categorical_draw(weights):
+    r""" Draw one random index :math:`i` with probability proportional to ``weights[i]``, by a binary search in the cumulative sum of the weights.
+
+    - No validation is done: the weights have to be non-negative, but they do not have to sum to :math:`1`.
+    - It is much faster than ``numpy.random.choice(len(weights), p=weights)``, and it is meant for distributions that change at every call (for fixed distributions, use an :class:`AliasTable`).
+    """
+    cumulative = np.cumsum(weights)
+    index = int(np.searchsorted(cumulative, random_sample() * cumulative[-1], side='right'))
+    return min(index, len(cumulative) - 1)
+
+
+# Only export and expose the samplers defined here
+__all__ = ["AliasTable", "categorical_draw"]
+
+
+# --- Debugging
+
+if __name__ == "__main__":
+    # Code for debugging purposes.
+    from doctest import testmod
+    print("\nTesting automatically all the docstring written in each functions of this module :")
+    testmod(verbose=True)
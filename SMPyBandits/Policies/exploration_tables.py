@@ -0,0 +1,177 @@
+# -*- coding: utf-8 -*-
+r""" Precomputed lookup tables for the exploration terms of horizon-dependent index policies.
+
+- For :class:`MOSSH`, :class:`klUCBPlusPlus` and :class:`klUCBswitch`, the exploration term only depends on the number of pulls :math:`N_k(t)` of an arm, and on the constants :math:`T` and :math:`K`. It can be stored in a 1D table of size :math:`T+1`, indexed by :math:`N_k(t)`, and the tables are *exact*.
+- For :class:`ApproximatedFHGittins`, the exploration term also depends on the time :math:`t` (through :math:`m = \tau T - t + 1`), so a 2D table is used, indexed by a *time bucket* and :math:`N_k(t)`. Its size is bounded by :data:`MAX_TABLE_SIZE`: if :math:`T (T+1)` is too large, the time steps are grouped in buckets of equal width, and the value at the beginning of each bucket is used (it is the largest value, so the index is slightly optimistic).
+
+- The 1D tables are only used if they fit in :data:`MAX_TABLE_SIZE` (see :func:`use_exploration_table`), otherwise the policies compute their exploration terms with the formula.
+
+- The tables are built only once for each configuration, and stored in a module-level cache (:data:`_TABLES`), in read-only arrays. The cache keeps at most :data:`MAX_CACHE_SIZE` entries in total, by forgetting the least recently used tables (e.g., the tables of the previous guesses of a :class:`DoublingTrickWrapper`). The policies only keep the key of their table, so tables are not copied by :func:`copy.deepcopy` (e.g., at every repetition in the :class:`Environment.Evaluator`) nor pickled when sent to ``joblib`` workers, where they are rebuilt once per process.
+
+- Example:
+
+>>> table = mossh_exploration_table(100, 2)
+>>> table.shape
+(101,)
+>>> round(table[10], 6)  # sqrt(log(100 / (2 * 10)) / 10)
+0.401178
+>>> table is mossh_exploration_table(100, 2)  # cached
+True
+"""
+from __future__ import division, print_function  # Python 2 compatibility
+
+__author__ = "Lilian Besson"
+__version__ = "0.9"
+
+from collections import OrderedDict
+import numpy as np
+np.seterr(divide='ignore', invalid='ignore')  # XXX dangerous in general, controlled here!
+
+
+#: Maximum number of entries of one table (``2**22`` floats is 32 MB).
+MAX_TABLE_SIZE = 2 ** 22
+
+#: Maximum total number of entries of the tables kept in the cache :data:`_TABLES` (``2**24`` floats is 128 MB).
+MAX_CACHE_SIZE = 2 ** 24
+
+#: Cache of the tables, shared by all the policies of one process, from the least to the most recently used. Keys are tuples ``(name, parameters...)``.
+_TABLES = OrderedDict()
+
+
+def cached_table(name, builder, *params):
+    """ Return the table ``builder(*params)``, by building it only the first time, and storing it in the module cache :data:`_TABLES`, as a read-only array.
+
+    - The least recently used tables are forgotten, to keep at most :data:`MAX_CACHE_SIZE` entries in the cache.
+
+    >>> _TABLES.clear()
+    >>> for size in [2 ** 22, 2 ** 23, 2 ** 22 + 1]:
+    ...     _ = cached_table("test", np.zeros, size)
+    >>> [key[1] for key in _TABLES]  # the first one was forgotten
+    [8388608, 4194305]
+    >>> _TABLES.clear()
+    """
+    key = (name,) + params
+    try:
+        # Move it to the end, as the most recently used (OrderedDict.move_to_end is not in Python 2)
+        _TABLES[key] = _TABLES.pop(key)
+        return _TABLES[key]
+    except KeyError:
+        table = builder(*params)
+        table.setflags(write=False)
+        _TABLES[key] = table
+        size = sum(t.size for t in _TABLES.values())
+        while size > MAX_CACHE_SIZE and len(_TABLES) > 1:
+            size -= _TABLES.popitem(last=False)[1].size
+        return table
+
+
+def use_exploration_table(t, horizon, max_size=MAX_TABLE_SIZE):
+    r""" True if the 1D table of size :math:`T+1` can be used at time :math:`t`: if :math:`t \leq T` (so :math:`N_k(t) \leq T`), and if it fits in ``max_size``.
+
+    >>> use_exploration_table(10, 100), use_exploration_table(101, 100), use_exploration_table(10, MAX_TABLE_SIZE)
+    (True, False, False)
+    """
+    return t <= horizon < max_size
+
+
+def _pulls_range(horizon):
+    r""" Array of all the possible number of pulls :math:`[0, 1, \dots, T]`, with 0 replaced by 1 to avoid divisions by zero (unpulled arms have an infinite index anyway)."""
+    pulls = np.arange(int(horizon) + 1, dtype=float)
+    pulls[0] = 1
+    return pulls
+
+
+# --- Tables of the exploration terms of each policy
+
+
+def _build_mossh(horizon, nbArms):
+    pulls = _pulls_range(horizon)
+    return np.sqrt(np.maximum(0., np.log(horizon / (nbArms * pulls))) / pulls)
+
+
+def mossh_exploration_table(horizon, nbArms):
+    r""" Table of the exploration terms of :class:`MOSSH`, indexed by :math:`N_k(t)`:
+
+    .. math:: \sqrt{\max\left(0, \frac{\log\left(\frac{T}{K N_k(t)}\right)}{N_k(t)}\right)}.
+    """
+    return cached_table("MOSSH", _build_mossh, int(horizon), int(nbArms))
+
+
+def _build_mossplus(horizon, nbArms):
+    pulls = _pulls_range(horizon)
+    return np.sqrt(np.maximum(0., np.log(horizon / (nbArms * pulls))) / (2 * pulls))
+
+
+def mossplus_exploration_table(horizon, nbArms):
+    r""" Table of the exploration terms of the MOSS+ index of :class:`klUCBswitch`, indexed by :math:`N_k(t)`:
+
+    .. math:: \sqrt{\frac{\max(0, \log(T / (K N_k(t))))}{2 N_k(t)}}.
+    """
+    return cached_table("MOSS+", _build_mossplus, int(horizon), int(nbArms))
+
+
+def _build_klucbplus(horizon, nbArms, c):
+    pulls = _pulls_range(horizon)
+    return c * np.log(horizon / (nbArms * pulls)) / pulls
+
+
+def klucbplus_exploration_table(horizon, nbArms, c=1.):
+    r""" Table of the exploration levels of the kl-UCB+ index of :class:`klUCBswitch`, indexed by :math:`N_k(t)`:
+
+    .. math:: \frac{c \log(T / (K N_k(t)))}{N_k(t)}.
+    """
+    return cached_table("kl-UCB+", _build_klucbplus, int(horizon), int(nbArms), float(c))
+
+
+def _build_klucbplusplus(horizon, nbArms, c):
+    pulls = _pulls_range(horizon)
+    y = horizon / (nbArms * pulls)
+    return c * np.maximum(0., np.log(y * (1. + np.maximum(0., np.log(y)) ** 2))) / pulls
+
+
+def klucbplusplus_exploration_table(horizon, nbArms, c=1.):
+    r""" Table of the exploration levels of :class:`klUCBPlusPlus`, indexed by :math:`N_k(t)`:
+
+    .. math:: \frac{c g(N_k(t), T, K)}{N_k(t)}, \;\; g(t, T, K) := \log^+(y (1 + \log^+(y)^2)), \;\; y := \frac{T}{K t}.
+    """
+    return cached_table("kl-UCB++", _build_klucbplusplus, int(horizon), int(nbArms), float(c))
+
+
+def time_bucket_width(horizon, max_size=MAX_TABLE_SIZE):
+    r""" Smallest width :math:`w \geq 1` of the time buckets such that a table of :math:`\lceil (T+1) / w \rceil \times (T+1)` entries fits in ``max_size``.
+
+    >>> time_bucket_width(1000)
+    1
+    >>> time_bucket_width(10000)
+    24
+    """
+    horizon = int(horizon)
+    return max(1, int(np.ceil((horizon + 1) ** 2 / float(max_size))))
+
+
+def _build_approximatedfhgittins(horizon, alpha, distortion_horizon, width):
+    pulls = _pulls_range(horizon)
+    times = np.arange(0, horizon + 1, width, dtype=float)
+    m = np.maximum((distortion_horizon * horizon) - times + 1, 1)
+    m_by_Nk = m[:, np.newaxis] / pulls[np.newaxis, :]
+    return np.sqrt((2. * alpha) / pulls * np.log(m_by_Nk / np.sqrt(np.maximum(0, np.log(m_by_Nk)))))
+
+
+def approximatedfhgittins_exploration_table(horizon, alpha, distortion_horizon, max_size=MAX_TABLE_SIZE):
+    r""" Table of the exploration terms of :class:`ApproximatedFHGittins`, indexed by the time bucket :math:`\lfloor t / w \rfloor` and :math:`N_k(t)`:
+
+    .. math:: \sqrt{\frac{2 \alpha}{N_k(t)} \log\left( \frac{m}{N_k(t) \log^{1/2}\left( \frac{m}{N_k(t)} \right)} \right)}, \;\; m = \tau T - t + 1.
+
+    - The width :math:`w` of the buckets is given by :func:`time_bucket_width`, and the table is exact if :math:`w = 1`.
+    """
+    width = time_bucket_width(horizon, max_size=max_size)
+    return cached_table("ApprFHG", _build_approximatedfhgittins, int(horizon), float(alpha), float(distortion_horizon), width)
+
+
+# --- Debugging
+
+if __name__ == "__main__":
+    # Code for debugging purposes.
+    from doctest import testmod
+    print("\nTesting automatically all the docstring written in each functions of this module :")
+    testmod(verbose=True)
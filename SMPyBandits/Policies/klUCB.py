@@ -36,6 +36,8 @@ class klUCB(IndexPolicy):
     Reference: [Garivier & Cappé - COLT, 2011](https://arxiv.org/pdf/1102.2490.pdf).
     """
 
+    allIndexBroadcasts = True
+
     def __init__(self, nbArms, tolerance=TOLERANCE, klucb=klucbBern, c=c, lower=0., amplitude=1.):
         super(klUCB, self).__init__(nbArms, lower=lower, amplitude=amplitude)
         self.c = c  #: Parameter c
@@ -24,6 +24,8 @@ class klUCBH(klUCB):
     Reference: [Lai 87](https://projecteuclid.org/download/pdf_1/euclid.aos/1176350495)
     """
 
+    allIndexBroadcasts = True
+
     def __init__(self, nbArms, horizon=None, tolerance=1e-4, klucb=klucbBern, c=c, lower=0., amplitude=1.):
         super(klUCBH, self).__init__(nbArms, tolerance=tolerance, klucb=klucb, c=c, lower=lower, amplitude=amplitude)
         self.horizon = int(horizon)  #: Parameter :math:`T` = known horizon of the experiment.
@@ -22,6 +22,8 @@ class klUCBPlus(klUCB):
     Reference: [Cappé et al. 13](https://arxiv.org/pdf/1210.1136.pdf)
     """
 
+    allIndexBroadcasts = True
+
     def __str__(self):
         name = self.klucb.__name__[5:]
         if name == "Bern": name = ""
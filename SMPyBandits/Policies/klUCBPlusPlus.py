@@ -14,9 +14,11 @@ np.seterr(divide='ignore')  # XXX dangerous in general, controlled here!
 try:
     from .kullback import klucbBern
     from .klUCB import klUCB, c
+    from .exploration_tables import klucbplusplus_exploration_table, use_exploration_table
 except ImportError:
     from kullback import klucbBern
     from klUCB import klUCB, c
+    from exploration_tables import klucbplusplus_exploration_table, use_exploration_table
 
 
 # --- Numerical functions required for the function g(n) for kl-UCB++
@@ -55,10 +57,11 @@ class klUCBPlusPlus(klUCB):
     Reference: [Menard & Garivier, ALT 2017](https://hal.inria.fr/hal-01475078)
     """
 
-    def __init__(self, nbArms, horizon=None, tolerance=1e-4, klucb=klucbBern, c=c, lower=0., amplitude=1.):
+    def __init__(self, nbArms, horizon=None, tolerance=1e-4, klucb=klucbBern, c=c, use_table=True, lower=0., amplitude=1.):
         super(klUCBPlusPlus, self).__init__(nbArms, tolerance=tolerance, klucb=klucb, c=c, lower=lower, amplitude=amplitude)
         self.nbArms = float(self.nbArms)  # Just speed up type casting by forcing it to be a float
         self.horizon = int(horizon)  #: Parameter :math:`T` = known horizon of the experiment.
+        self.use_table = use_table  #: If True, the exploration levels are read from a precomputed table, see :func:`exploration_tables.klucbplusplus_exploration_table`.
 
     def __str__(self):
         name = "" if self.klucb.__name__[5:] == "Bern" else ", " + self.klucb.__name__[5:]
@@ -84,12 +87,18 @@ class klUCBPlusPlus(klUCB):
         """
         if self.pulls[arm] < 1:
             return float('+inf')
+        elif self.use_table and use_exploration_table(self.t, self.horizon):
+            return self.klucb(self.rewards[arm] / self.pulls[arm], klucbplusplus_exploration_table(self.horizon, self.nbArms, self.c)[self.pulls[arm]], self.tolerance)
         else:
             # XXX We could adapt tolerance to the value of self.t
             return self.klucb(self.rewards[arm] / self.pulls[arm], self.c * g(self.pulls[arm], self.horizon, self.nbArms) / self.pulls[arm], self.tolerance)
 
     def computeAllIndex(self):
-        """ Compute the current indexes for all arms, in a vectorized manner."""
-        indexes = self.klucb(self.rewards / self.pulls, self.c * np_g(self.pulls, self.horizon, self.nbArms) / self.pulls, self.tolerance)
+        """ Compute the current indexes for all arms, in a vectorized manner (with a lookup in the precomputed table, as long as :math:`N_k(t) \leq t \leq T`)."""
+        if self.use_table and use_exploration_table(self.t, self.horizon):
+            levels = klucbplusplus_exploration_table(self.horizon, self.nbArms, self.c)[self.pulls]
+        else:
+            levels = self.c * np_g(self.pulls, self.horizon, self.nbArms) / self.pulls
+        indexes = self.klucb(self.rewards / self.pulls, levels, self.tolerance)
         indexes[self.pulls < 1] = float('+inf')
         self.index[:] = indexes
@@ -26,6 +26,8 @@ class klUCBloglog(klUCB):
     Reference: [Garivier & Cappé - COLT, 2011].
     """
 
+    allIndexBroadcasts = True
+
     def __str__(self):
         return r"kl-UCB({}{}{})".format("" if self.c == 1 else r"$c={:.3g}$, ".format(self.c), r"$\log\log$, ", self.klucb.__name__[5:])
 
@@ -13,11 +13,13 @@ import numpy as np
 np.seterr(divide='ignore')  # XXX dangerous in general, controlled here!
 
 try:
-    from .kullback import klucbBern
+    from .kullback import klucbBern, klucbBern_vect, vectorized_klucb
     from .klUCB import klUCB, c
+    from .exploration_tables import klucbplus_exploration_table, mossplus_exploration_table, use_exploration_table
 except ImportError:
-    from kullback import klucbBern
+    from kullback import klucbBern, klucbBern_vect, vectorized_klucb
     from klUCB import klUCB, c
+    from exploration_tables import klucbplus_exploration_table, mossplus_exploration_table, use_exploration_table
 
 
 #: Default value for the tolerance for computing numerical approximations of the kl-UCB indexes.
@@ -60,15 +62,15 @@ def klucbplus_index(reward, pull, horizon, nbArms, klucb=klucbBern, c=c, toleran
     return klucb(reward / pull, c * log(horizon / (nbArms * pull)) / pull, tolerance)
 
 
-# def klucbplus_indexes(rewards, pulls, horizon, nbArms, klucb=klucbBern, c=c, tolerance=TOLERANCE):
-#     r""" The kl-UCB+ indexes, from [Cappé et al. 13](https://arxiv.org/pdf/1210.1136.pdf):
+def klucbplus_indexes(rewards, pulls, horizon, nbArms, klucb=klucbBern_vect, c=c, tolerance=TOLERANCE):
+    r""" The kl-UCB+ indexes, from [Cappé et al. 13](https://arxiv.org/pdf/1210.1136.pdf), vectorized version of :func:`klucbplus_index` (``klucb`` has to accept arrays, see :func:`kullback.vectorized_klucb`):
 
-#     .. math::
+    .. math::
 
-#         \hat{\mu}_k(t) &= \frac{X_k(t)}{N_k(t)}, \\
-#         I^{KL+}_k(t) &= \sup\limits_{q \in [a, b]} \left\{ q : \mathrm{kl}(\hat{\mu}_k(t), q) \leq \frac{c \log(T / (K * N_k(t)))}{N_k(t)} \right\}.
-#     """
-#     return klucb(rewards / pulls, c * np.log(horizon / (nbArms * pulls)) / pulls, tolerance)
+        \hat{\mu}_k(t) &= \frac{X_k(t)}{N_k(t)}, \\
+        I^{KL+}_k(t) &= \sup\limits_{q \in [a, b]} \left\{ q : \mathrm{kl}(\hat{\mu}_k(t), q) \leq \frac{c \log(T / (K * N_k(t)))}{N_k(t)} \right\}.
+    """
+    return klucb(rewards / pulls, c * np.log(horizon / (nbArms * pulls)) / pulls, tolerance)
 
 
 def mossplus_index(reward, pull, horizon, nbArms):
@@ -81,14 +83,14 @@ def mossplus_index(reward, pull, horizon, nbArms):
     return (reward / pull) + sqrt(max(0, log(horizon / (nbArms * pull))) / (2 * pull))
 
 
-# def mossplus_indexes(rewards, pulls, horizon, nbArms):
-#     r""" The MOSS+ indexes, from [Audibert & Bubeck, 2010](http://www.jmlr.org/papers/volume11/audibert10a/audibert10a.pdf):
+def mossplus_indexes(rewards, pulls, horizon, nbArms):
+    r""" The MOSS+ indexes, from [Audibert & Bubeck, 2010](http://www.jmlr.org/papers/volume11/audibert10a/audibert10a.pdf), vectorized version of :func:`mossplus_index`:
 
-#     .. math::
+    .. math::
 
-#         I^{MOSS+}_k(t) = \frac{X_k(t)}{N_k(t)} + \sqrt{\max\left(0, \frac{\log\left(\frac{T}{K N_k(t)}\right)}{N_k(t)}\right)}.
-#     """
-#     return (rewards / pulls) + np.sqrt(np.maximum(0, np.log(horizon / (nbArms * pulls))) / (2 * pulls))
+        I^{MOSS+}_k(t) = \frac{X_k(t)}{N_k(t)} + \sqrt{\max\left(0, \frac{\log\left(\frac{T}{K N_k(t)}\right)}{N_k(t)}\right)}.
+    """
+    return (rewards / pulls) + np.sqrt(np.maximum(0, np.log(horizon / (nbArms * pulls))) / (2 * pulls))
 
 
 # --- Classes
@@ -102,13 +104,15 @@ class klUCBswitch(klUCB):
 
     def __init__(self, nbArms, horizon=None,
             threshold="best",
-            tolerance=TOLERANCE, klucb=klucbBern, c=c,
+            tolerance=TOLERANCE, klucb=klucbBern, c=c, use_table=True,
             lower=0., amplitude=1.
         ):
         super(klUCBswitch, self).__init__(nbArms, tolerance=tolerance, klucb=klucb, c=c, lower=lower, amplitude=amplitude)
         assert horizon is not None, "Error: the klUCBswitch policy require knowledge of the horizon T. Use klUCBswitchAnytime if you need an anytime variant."  # DEBUG
         assert horizon >= 1, "Error: the horizon T should be >= 1."  # DEBUG
         self.horizon = horizon  #: Parameter :math:`T` = known horizon of the experiment.
+        self.use_table = use_table  #: If True, the exploration terms of both indexes are read from precomputed tables, see :mod:`exploration_tables`.
+        self.klucb_vect = vectorized_klucb(klucb)  #: Array-native version of the kl-UCB index function, used in :meth:`computeAllIndex`.
 
         # A function, like :func:`threshold_switch`, of T and K, to decide when to switch from kl-UCB indexes to MOSS indexes (for each arm).
         self._threshold_switch_name = "?"
@@ -124,12 +128,20 @@ class klUCBswitch(klUCB):
         else:
             threshold_switch = threshold
             self._threshold_switch_name = threshold.__name__
+        self._threshold_switch = threshold_switch
         #: For klUCBswitch (not the anytime variant), we can precompute the threshold as it is constant, :math:`= f(T, K)`.
         self.constant_threshold_switch = threshold_switch(self.horizon, self.nbArms)
 
         #: Initialize internal memory: at first, every arm uses the kl-UCB index, then some will switch to MOSS. (Array of K bool).
         self.use_MOSS_index = np.zeros(nbArms, dtype=bool)
 
+    def reset(self, horizon=None):
+        """ Reset the policy in place, and recompute :attr:`constant_threshold_switch` if a new horizon is given."""
+        super(klUCBswitch, self).reset(horizon=horizon)
+        self.use_MOSS_index.fill(False)
+        if horizon is not None:
+            self.constant_threshold_switch = self._threshold_switch(self.horizon, self.nbArms)
+
     def __str__(self):
         name = "" if self.klucb.__name__[5:] == "Bern" else self.klucb.__name__[5:] + ", "
         complement = "$T={}${}{}{}".format(self.horizon, name, "" if self.c == 1 else r", $c={:.3g}$".format(self.c), "" if self._threshold_switch_name == "" else ", {}".format(self._threshold_switch_name))
@@ -149,22 +161,38 @@ class klUCBswitch(klUCB):
         """
         if self.pulls[arm] < 1:
             return float('+inf')
+        if not self.use_MOSS_index[arm] and self.pulls[arm] > self.constant_threshold_switch:
+            self.use_MOSS_index[arm] = True
+        if self.use_table and use_exploration_table(self.t, self.horizon):
+            # read the exploration terms from the precomputed tables
+            if self.use_MOSS_index[arm]:
+                return (self.rewards[arm] / self.pulls[arm]) + mossplus_exploration_table(self.horizon, self.nbArms)[self.pulls[arm]]
+            else:
+                return self.klucb(self.rewards[arm] / self.pulls[arm], klucbplus_exploration_table(self.horizon, self.nbArms, self.c)[self.pulls[arm]], self.tolerance)
         elif self.use_MOSS_index[arm]:
-            # no need to compute the threshold, we already use the MOSS index
             return mossplus_index(self.rewards[arm], self.pulls[arm], self.horizon, self.nbArms)
-        else:
-            if self.pulls[arm] > self.constant_threshold_switch:
-                self.self.use_MOSS_index[arm] = True
-                return mossplus_index(self.rewards[arm], self.pulls[arm], self.horizon, self.nbArms)
-            else:  # default is to use kl-UCB index
-                return klucbplus_index(self.rewards[arm], self.pulls[arm], self.horizon, self.nbArms, klucb=self.klucb, c=self.c, tolerance=self.tolerance)
+        else:  # default is to use kl-UCB index
+            return klucbplus_index(self.rewards[arm], self.pulls[arm], self.horizon, self.nbArms, klucb=self.klucb, c=self.c, tolerance=self.tolerance)
+
+    def computeAllIndex(self):
+        """ Compute the current indexes for all arms, in a vectorized manner.
 
-    # def computeAllIndex(self):
-    #     """ Compute the current indexes for all arms, in a vectorized manner."""
-    #     # XXX I don't think I could hack numpy operations to be faster than a loop for this algorithm
-    #     indexes = FIXME
-    #     indexes[self.pulls < 1] = float('+inf')
-    #     self.index[:] = indexes
+        - A boolean mask :attr:`use_MOSS_index` selects the arms using the MOSS+ index, and the kl-UCB+ indexes of the other arms are computed with an array-native solver (see :func:`kullback.vectorized_klucb`).
+        """
+        self.use_MOSS_index |= self.pulls > self.constant_threshold_switch
+        use_klucb = ~self.use_MOSS_index
+        if self.use_table and use_exploration_table(self.t, self.horizon):
+            means = self.rewards / self.pulls
+            indexes = means + mossplus_exploration_table(self.horizon, self.nbArms)[self.pulls]
+            if np.any(use_klucb):
+                levels = klucbplus_exploration_table(self.horizon, self.nbArms, self.c)[self.pulls[use_klucb]]
+                indexes[use_klucb] = self.klucb_vect(means[use_klucb], levels, self.tolerance)
+        else:
+            indexes = mossplus_indexes(self.rewards, self.pulls, self.horizon, self.nbArms)
+            if np.any(use_klucb):
+                indexes[use_klucb] = klucbplus_indexes(self.rewards[use_klucb], self.pulls[use_klucb], self.horizon, self.nbArms, klucb=self.klucb_vect, c=self.c, tolerance=self.tolerance)
+        indexes[self.pulls < 1] = float('+inf')
+        self.index[:] = indexes
 
 
 # --- Numerical functions required for the indexes for anytime variant kl-UCB-switch
@@ -174,16 +202,18 @@ def logplus(x):
     r""" The :math:`\log_+` function.
 
     .. math:: \log_+(x) := \max(0, \log(x)).
+
+    - It is :math:`0` for :math:`x \leq 1`, including for :math:`x \leq 0` (:func:`moss_index` can call it on negative values).
     """
-    return max(0, log(x))
+    return log(max(1, x))
 
 
-# def logplus_vect(x):
-#     r""" The :math:`\log_+` function.
+def logplus_vect(x):
+    r""" The :math:`\log_+` function.
 
-#     .. math:: \log_+(x) := \max(0, \log(x)).
-#     """
-#     return np.maximum(0, np.log(x))
+    .. math:: \log_+(x) := \max(0, \log(x)).
+    """
+    return np.log(np.maximum(1, x))
 
 
 def phi(x):
@@ -194,12 +224,12 @@ def phi(x):
     return logplus(x * (1 + (logplus(x))**2))
 
 
-# def phi_vect(x):
-#     r""" The :math:`\phi(x)` function defined in equation (6) in their paper.
+def phi_vect(x):
+    r""" The :math:`\phi(x)` function defined in equation (6) in their paper.
 
-#     .. math:: \phi(x) := \log_+(x (1 + (\log_+(x))^2)).
-#     """
-#     return logplus_vect(x * (1 + (logplus_vect(x))**2))
+    .. math:: \phi(x) := \log_+(x (1 + (\log_+(x))^2)).
+    """
+    return logplus_vect(x * (1 + (logplus_vect(x))**2))
 
 
 def klucb_index(reward, pull, t, nbArms, klucb=klucbBern, c=c, tolerance=TOLERANCE):
@@ -213,15 +243,15 @@ def klucb_index(reward, pull, t, nbArms, klucb=klucbBern, c=c, tolerance=TOLERAN
     return klucb(reward / pull, c * phi(t / (nbArms * pull)) / pull, tolerance)
 
 
-# def klucb_indexes(rewards, pulls, t, nbArms, klucb=klucbBern, c=c, tolerance=TOLERANCE):
-#     r""" The kl-UCB indexes, from [Garivier & Cappé - COLT, 2011](https://arxiv.org/pdf/1102.2490.pdf):
+def klucb_indexes(rewards, pulls, t, nbArms, klucb=klucbBern_vect, c=c, tolerance=TOLERANCE):
+    r""" The kl-UCB indexes, from [Garivier & Cappé - COLT, 2011](https://arxiv.org/pdf/1102.2490.pdf), vectorized version of :func:`klucb_index` (``klucb`` has to accept arrays, see :func:`kullback.vectorized_klucb`):
 
-#     .. math::
+    .. math::
 
-#         \hat{\mu}_k(t) &= \frac{X_k(t)}{N_k(t)}, \\
-#         I^{KL}_k(t) &= \sup\limits_{q \in [a, b]} \left\{ q : \mathrm{kl}(\hat{\mu}_k(t), q) \leq \frac{c \log(t / N_k(t))}{N_k(t)} \right\}.
-#     """
-#     return klucb(rewards / pulls, c * phi_vect(t / (nbArms * pulls)) / pulls, tolerance)
+        \hat{\mu}_k(t) &= \frac{X_k(t)}{N_k(t)}, \\
+        I^{KL}_k(t) &= \sup\limits_{q \in [a, b]} \left\{ q : \mathrm{kl}(\hat{\mu}_k(t), q) \leq \frac{c \log(t / N_k(t))}{N_k(t)} \right\}.
+    """
+    return klucb(rewards / pulls, c * phi_vect(t / (nbArms * pulls)) / pulls, tolerance)
 
 
 def moss_index(reward, pull, t, nbArms):
@@ -234,14 +264,14 @@ def moss_index(reward, pull, t, nbArms):
     return (reward / pull) + sqrt(phi(log(t / (nbArms * pull))) / (2 * pull))
 
 
-# def moss_indexes(rewards, pulls, t, nbArms):
-#     r""" The MOSS indexes, from [Audibert & Bubeck, 2010](http://www.jmlr.org/papers/volume11/audibert10a/audibert10a.pdf):
+def moss_indexes(rewards, pulls, t, nbArms):
+    r""" The MOSS indexes, from [Audibert & Bubeck, 2010](http://www.jmlr.org/papers/volume11/audibert10a/audibert10a.pdf), vectorized version of :func:`moss_index`:
 
-#     .. math::
+    .. math::
 
-#         I^{MOSS}_k(t) &= \frac{X_k(t)}{N_k(t)} + \sqrt{\max\left(0, \frac{\log\left(\frac{t}{K N_k(t)}\right)}{N_k(t)}\right)}.
-#     """
-#     return (rewards / pulls) + np.sqrt(phi_vect(np.log(t / (nbArms * pulls))) / (2 * pulls))
+        I^{MOSS}_k(t) &= \frac{X_k(t)}{N_k(t)} + \sqrt{\max\left(0, \frac{\log\left(\frac{t}{K N_k(t)}\right)}{N_k(t)}\right)}.
+    """
+    return (rewards / pulls) + np.sqrt(phi_vect(np.log(t / (nbArms * pulls))) / (2 * pulls))
 
 
 
@@ -304,7 +334,20 @@ class klUCBswitchAnytime(klUCBswitch):
             return moss_index(self.rewards[arm], self.pulls[arm], self.t, self.nbArms)
         else:
             if self.pulls[arm] > self.threshold_switch(self.t, self.nbArms):
-                self.self.use_MOSS_index[arm] = True
+                self.use_MOSS_index[arm] = True
                 return moss_index(self.rewards[arm], self.pulls[arm], self.t, self.nbArms)
             else:  # default is to use kl-UCB index
                 return klucb_index(self.rewards[arm], self.pulls[arm], self.t, self.nbArms, klucb=self.klucb, c=self.c, tolerance=self.tolerance)
+
+    def computeAllIndex(self):
+        """ Compute the current indexes for all arms, in a vectorized manner.
+
+        - A boolean mask :attr:`use_MOSS_index` selects the arms using the MOSS index, and the kl-UCB indexes of the other arms are computed with an array-native solver (see :func:`kullback.vectorized_klucb`).
+        """
+        self.use_MOSS_index |= self.pulls > self.threshold_switch(self.t, self.nbArms)
+        use_klucb = ~self.use_MOSS_index
+        indexes = moss_indexes(self.rewards, self.pulls, self.t, self.nbArms)
+        if np.any(use_klucb):
+            indexes[use_klucb] = klucb_indexes(self.rewards[use_klucb], self.pulls[use_klucb], self.t, self.nbArms, klucb=self.klucb_vect, c=self.c, tolerance=self.tolerance)
+        indexes[self.pulls < 1] = float('+inf')
+        self.index[:] = indexes
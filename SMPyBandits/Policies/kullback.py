@@ -9,8 +9,10 @@
 
 .. warning::
 
-    All functions are *not* vectorized, and assume only one value for each argument.
-    If you want vectorized function, use the wrapper :py:class:`numpy.vectorize`:
+    All functions are *not* vectorized, and assume only one value for each argument,
+    except :func:`klBern_vect`, :func:`klPoisson_vect`, :func:`klExp_vect` and :func:`klGauss_vect` (see :func:`vectorized_kl`),
+    and :func:`klucbBern_vect`, :func:`klucbGauss_vect` and :func:`klucbPoisson_vect` (see :func:`vectorized_klucb`).
+    If you want other vectorized functions, use the wrapper :py:class:`numpy.vectorize`:
 
     >>> import numpy as np
     >>> klBern_vect = np.vectorize(klBern)
@@ -353,6 +355,94 @@ def klGauss(x, y, sig2x=0.25, sig2y=None):
         return (x - y) ** 2 / (2. * sig2y) + 0.5 * ((sig2x/sig2y)**2 - 1 - log(sig2x/sig2y))
 
 
+# --- Vectorized Kullback-Leibler divergence functions, working on numpy arrays
+
+def klBern_vect(x, y):
+    r""" Kullback-Leibler divergence for Bernoulli distributions, vectorized version of :func:`klBern` (on both ``x`` and ``y``).
+
+    >>> klBern_vect([0.1, 0.5, 0.9], 0.2)  # doctest: +ELLIPSIS
+    array([0.036..., 0.223..., 1.145...])
+    >>> klBern_vect(0.4, [0.2, 0.3, 0.4])  # doctest: +ELLIPSIS
+    array([0.104..., 0.022..., 0...])
+    >>> klBern_vect([0.1, 0.5, 0.9], [0.2, 0.3, 0.4])  # doctest: +ELLIPSIS
+    array([0.036..., 0.087..., 0.550...])
+    >>> klBern_vect([0, 0.5], [1, 0.5])  # Should be +inf, but 0 --> eps, 1 --> 1 - eps  # doctest: +ELLIPSIS
+    array([34.53957599,  0.        ])
+    """
+    x = np.minimum(np.maximum(x, eps), 1 - eps)
+    y = np.minimum(np.maximum(y, eps), 1 - eps)
+    return x * np.log(x / y) + (1 - x) * np.log((1 - x) / (1 - y))
+
+
+def klPoisson_vect(x, y):
+    r""" Kullback-Leibler divergence for Poison distributions, vectorized version of :func:`klPoisson`.
+
+    >>> klPoisson_vect([3, 2, 1, 3, 6], [3, 1, 2, 6, 8])  # doctest: +ELLIPSIS
+    array([0.        , 0.38629436, 0.30685282, 0.92055846, 0.27390757])
+    >>> klPoisson_vect([1, 0], 0)  # doctest: +ELLIPSIS
+    array([33.53877639,  0.        ])
+    """
+    x = np.maximum(x, eps)
+    y = np.maximum(y, eps)
+    return y - x + x * np.log(x / y)
+
+
+def klExp_vect(x, y):
+    r""" Kullback-Leibler divergence for exponential distributions, vectorized version of :func:`klExp`.
+
+    >>> klExp_vect([3, 3, 1, 2, 6], [3, 6, 2, 1, 8])  # doctest: +ELLIPSIS
+    array([0.        , 0.19314718, 0.19314718, 0.30685282, 0.03768207])
+    >>> klExp_vect([-3, 3, -3], [2, -2, -2])
+    array([inf, inf, inf])
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    positive = (x > 0) & (y > 0)
+    ratio = np.maximum(x, eps) / np.maximum(y, eps)
+    return np.where(positive, ratio - 1 - np.log(ratio), float('+inf'))
+
+
+def klGauss_vect(x, y, sig2x=0.25, sig2y=None):
+    r""" Kullback-Leibler divergence for Gaussian distributions, vectorized version of :func:`klGauss` (on ``x`` and ``y`` only).
+
+    >>> klGauss_vect([-1, 0, 1], 0.1)  # doctest: +ELLIPSIS
+    array([2.42, 0.02, 1.62])
+    >>> klGauss_vect([3, 3, 1, -3], [3, 6, 2, 2], sig2x=10)
+    array([0.  , 0.45, 0.05, 1.25])
+    >>> klGauss_vect([0, 1], 0, sig2x=0.25, sig2y=0.5)  # doctest: +ELLIPSIS
+    array([-0.0284...,  0.9715...])
+    """
+    x = np.asarray(x, dtype=float)
+    if sig2y is None or - eps < (sig2y - sig2x) < eps:
+        return (x - y) ** 2 / (2. * sig2x)
+    else:
+        return (x - y) ** 2 / (2. * sig2y) + 0.5 * ((sig2x/sig2y)**2 - 1 - log(sig2x/sig2y))
+
+
+#: Array-native versions of some of the KL divergences, see :func:`vectorized_kl`.
+VECTORIZED_KL = {
+    klBern: klBern_vect,
+    klPoisson: klPoisson_vect,
+    klExp: klExp_vect,
+    klGauss: klGauss_vect,
+}
+
+
+def vectorized_kl(kl):
+    r""" Return a version of the KL divergence ``kl`` that accepts numpy arrays.
+
+    - It is the array-native version (from :data:`VECTORIZED_KL`) if there is one, or a :py:class:`numpy.vectorize` wrapper on ``kl`` otherwise (much slower).
+
+    >>> vectorized_kl(klBern) is klBern_vect
+    True
+    >>> vectorized_kl(klGamma)([3, 2], 6)  # doctest: +ELLIPSIS
+    array([0.193147..., 0.431945...])
+    """
+    if kl in VECTORIZED_KL:
+        return VECTORIZED_KL[kl]
+    return np.vectorize(kl)
+
+
 # --- KL functions, for the KL-UCB policy
 
 @jit
@@ -598,6 +688,89 @@ def klucbGamma(x, d, precision=1e-6):
     return klucb(x, d, klGamma, max(upperbound, 1e2), min(-1e2, lowerbound), precision)
 
 
+# --- Vectorized KL-UCB functions, working on numpy arrays
+
+def klucb_vect(x, d, kl_vect, upperbound,
+        precision=1e-6, lowerbound=float('-inf'), max_iterations=50,
+    ):
+    r""" The generic KL-UCB index computation, vectorized version of :func:`klucb`.
+
+    - ``x``, ``d`` and ``upperbound`` can be arrays (of the same shape), and ``kl_vect`` has to be a vectorized KL divergence (:func:`klBern_vect`, :func:`klPoisson_vect` etc, see :func:`vectorized_kl`),
+    - The bisection search is done in parallel for all the values, each value stops being updated as soon as it is precise enough: the results are the same as with :func:`klucb`.
+
+    >>> x, d = np.array([0.1, 0.5, 0.9]), 0.2
+    >>> klucb_vect(x, d, klBern_vect, 1., lowerbound=0, precision=1e-6)  # doctest: +ELLIPSIS
+    array([0.378391..., 0.787088..., 0.994489...])
+    """
+    x, d = np.broadcast_arrays(np.asarray(x, dtype=float), np.asarray(d, dtype=float))
+    value = np.maximum(x, lowerbound)
+    u = np.broadcast_to(np.asarray(upperbound, dtype=float), value.shape)
+    for _ in range(max_iterations):
+        active = u - value > precision
+        if not np.any(active):
+            break
+        m = (value + u) * 0.5
+        above = kl_vect(x, m) > d
+        u = np.where(active & above, m, u)
+        value = np.where(active & ~above, m, value)
+    return (value + u) * 0.5
+
+
+def klucbBern_vect(x, d, precision=1e-6):
+    """ KL-UCB index computation for Bernoulli distributions, vectorized version of :func:`klucbBern`.
+
+    >>> klucbBern_vect([0.1, 0.5, 0.9], 0.2)  # doctest: +ELLIPSIS
+    array([0.378391..., 0.787088..., 0.994489...])
+    >>> klucbBern_vect(0.1, [0.4, 0.9])  # doctest: +ELLIPSIS
+    array([0.519475..., 0.734714...])
+    """
+    upperbound = np.minimum(1., klucbGauss_vect(x, d, sig2x=0.25))  # variance 1/4 for [0,1] bounded distributions
+    return klucb_vect(x, d, klBern_vect, upperbound, precision)
+
+
+def klucbGauss_vect(x, d, sig2x=0.25, precision=0.):
+    """ KL-UCB index computation for Gaussian distributions, vectorized version of :func:`klucbGauss`.
+
+    >>> klucbGauss_vect([0.1, 0.5, 0.9], 0.2)  # doctest: +ELLIPSIS
+    array([0.416227..., 0.816227..., 1.216227...])
+    """
+    return np.asarray(x, dtype=float) + np.sqrt(np.abs(2 * sig2x * np.asarray(d, dtype=float)))
+
+
+def klucbPoisson_vect(x, d, precision=1e-6):
+    """ KL-UCB index computation for Poisson distributions, vectorized version of :func:`klucbPoisson`.
+
+    >>> klucbPoisson_vect([0.1, 0.5, 0.9], 0.2)  # doctest: +ELLIPSIS
+    array([0.450523..., 1.089376..., 1.640112...])
+    """
+    x, d = np.asarray(x, dtype=float), np.asarray(d, dtype=float)
+    upperbound = x + d + np.sqrt(d * d + 2 * x * d)  # looks safe, to check: left (Gaussian) tail of Poisson dev
+    return klucb_vect(x, d, klPoisson_vect, upperbound, precision)
+
+
+#: Array-native versions of some of the KL-UCB index functions, see :func:`vectorized_klucb`.
+VECTORIZED_KLUCB = {
+    klucbBern: klucbBern_vect,
+    klucbGauss: klucbGauss_vect,
+    klucbPoisson: klucbPoisson_vect,
+}
+
+
+def vectorized_klucb(klucb):
+    r""" Return a version of the KL-UCB index function ``klucb`` that accepts numpy arrays.
+
+    - It is the array-native version (from :data:`VECTORIZED_KLUCB`) if there is one, or a :py:class:`numpy.vectorize` wrapper on ``klucb`` otherwise (much slower).
+
+    >>> vectorized_klucb(klucbBern) is klucbBern_vect
+    True
+    >>> vectorized_klucb(klucbExp)([0.1, 0.5], 0.2)  # doctest: +ELLIPSIS
+    array([0.202741..., 1.013706...])
+    """
+    if klucb in VECTORIZED_KLUCB:
+        return VECTORIZED_KLUCB[klucb]
+    return np.vectorize(klucb)
+
+
 # --- KL functions, for the KL Lower Confidence Bound
 
 @jit
@@ -11,9 +11,12 @@ __version__ = "0.9"
 from random import random
 import numpy as np
 import numpy.random as rn
+from numpy.random import random_sample
 
 from .BaseMPPolicy import BaseMPPolicy
 from .ChildPointer import ChildPointer
+from .PlayerBank import PlayerBank, canUseBank, randomArgmaxRows
+from .PhaseBank import PhaseBank
 from .with_proba import with_proba
 
 
@@ -181,6 +184,56 @@ class oneALOHA(ChildPointer):
         return self.chosenArm
 
 
+# --- Class ALOHABank
+
+class ALOHABank(PhaseBank):
+    """ Bank of all the children of an :class:`ALOHA` policy: the underlying index policies are stored as in a :class:`PlayerBank.PlayerBank`, and the memories of the ALOHA protocol of the children as in a :class:`PhaseBank.PhaseBank`."""
+
+    scalars = {'t': int, 'p': float, 'chosenArm': int, 'p0': float, 'alpha_p0': float}
+    rows = {'tnext': int}
+    noneable = ('chosenArm',)
+
+    def owners(self):
+        """ The memories of the ALOHA protocol are owned by the children."""
+        return self.mother.children
+
+    def bind(self):
+        """ Bind the memories of the underlying players to the rows of the bank, and read the memories of the children."""
+        PlayerBank.bind(self)
+        PhaseBank.bind(self)
+
+    def choices(self):
+        """ The players who did not give up their arm keep it, and the others choose the best arm among their available arms."""
+        if not self._bound:
+            self.bind()
+        self.t += 1
+        ids = np.flatnonzero(self.chosenArm < 0)
+        if len(ids) > 0:
+            index = self.computeAllIndex()[ids]
+            available = self.tnext[ids] <= self.t[ids, np.newaxis]  # Identify available arms
+            unavailable = ~np.any(available, axis=1)
+            for _ in range(np.count_nonzero(unavailable)):
+                print("WARNING: IndexPolicy.choiceFromSubSet([]): the argument availableArms should not be empty.")  # DEBUG
+            available[unavailable] = True  # the underlying policy chooses among all the arms
+            bestIndex = np.max(np.where(available, index, -np.inf), axis=1)
+            self.chosenArm[ids] = randomArgmaxRows(available & (index == bestIndex[:, np.newaxis]))
+        return self.chosenArm.copy()
+
+    def getRewards(self, playerIds, arms, rewards):
+        """ Give these rewards to the underlying policies of these players, and update their probabilities of persistance."""
+        self.updateRewards(playerIds, arms, rewards)
+        self.p[playerIds] = self.p[playerIds] * self.alpha_p0[playerIds] + (1 - self.alpha_p0[playerIds])
+
+    def handleCollisions(self, playerIds, arms, rewards):
+        """ With probability :math:`1 - p`, the players give up their arm, that is unavailable for a random time."""
+        ids = playerIds[random_sample(len(playerIds)) < 1 - self.p[playerIds]]
+        upper_tnext = np.asarray(self.mother.children[0].ftnext(self.t[ids])).astype(int)
+        delta_tnext_k = rn.randint(low=0, high=1 + upper_tnext)
+        self.tnext[ids, self.chosenArm[ids]] = self.t[ids] + 1 + delta_tnext_k
+        self.p[ids] = self.p0[ids]  # Reinitialize the proba p
+        self.chosenArm[ids] = -1  # We give up this arm
+
+
 # --- Class ALOHA
 
 class ALOHA(BaseMPPolicy):
@@ -199,6 +252,7 @@ class ALOHA(BaseMPPolicy):
         - alpha_p0: scaling in the update for p[t+1] <- alpha_p0 p[t] + (1 - alpha_p0)
         - ftnext: general function, default to t -> t^beta, to know from where to sample a random time t_next(k), until when the chosenArm is unavailable. t -> log(1 + t) is also possible.
         - (optional) beta: if present, overwrites ftnext, which will be t --> t^beta.
+        - bank: (keyword only) if True (and if the players are index policies), all the players are stored in an :class:`ALOHABank`, in order to compute their choices at once (see :mod:`PhaseBank`).
 
         - `*args`, `**kwargs`: arguments, named arguments, given to playerAlgo.
 
@@ -215,11 +269,17 @@ class ALOHA(BaseMPPolicy):
         >>> s = ALOHA(nbPlayers, nbArms, UCBalpha, p0=p0, alpha_p0=alpha_p0, beta=0.5, alpha=1)
         >>> [ child.choice() for child in s.children ]
         [1, 0, 5, 2, 15, 3]
+        >>> s = ALOHA(nbPlayers, nbArms, UCBalpha, p0=p0, alpha_p0=alpha_p0, beta=0.5, bank=True, alpha=1)
+        >>> for child in s.bank:
+        ...     child.startGame()
+        >>> s.bank.choices()
+        array([15, 13,  3,  3, 15,  1])
 
         - To get a list of usable players, use ``s.children``.
         - Warning: ``s._players`` is for internal use ONLY!
         """
         assert nbPlayers > 0, "Error, the parameter 'nbPlayers' for rhoRand class has to be > 0."
+        bank = kwargs.pop('bank', False)  # Keyword only, it is not given to playerAlgo
         self.nbPlayers = nbPlayers  #: Number of players
         self.nbArms = nbArms  #: Number of arms
         # Internal memory
@@ -230,10 +290,19 @@ class ALOHA(BaseMPPolicy):
             self._players[playerId] = playerAlgo(nbArms, *args, lower=lower, amplitude=amplitude, **kwargs)
             # Initialize proxy child
             self.children[playerId] = oneALOHA(nbPlayers, self, playerId, nbArms, p0=p0, alpha_p0=alpha_p0, ftnext=ftnext, beta=beta)
+        self.bank = ALOHABank(self) if bank and canUseBank(self._players) else None  #: :class:`ALOHABank` of the players, or None.
 
     def __str__(self):
         return "ALOHA({} x {})".format(self.nbPlayers, str(self._players[0]))
 
+    # --- Proxy methods
+
+    def _startGame_one(self, playerId):
+        """Forward the call to self._players[playerId], and the bank will read the new memories."""
+        if self.bank is not None:
+            self.bank._bound = False
+        return self._players[playerId].startGame()
+
 
 # --- Debugging
 
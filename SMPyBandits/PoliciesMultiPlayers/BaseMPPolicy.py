@@ -12,6 +12,8 @@ __version__ = "0.3"
 class BaseMPPolicy(object):
     """ Base class for any multi-players policy."""
 
+    bank = None  #: Optional bank of all the players, to compute their choices at once (see :class:`PlayerBank.PlayerBank`).
+
     def __init__(self):
         """New policy"""
         pass
@@ -1,13 +1,14 @@
 # -*- coding: utf-8 -*-
 """ :func:`DepRound`: implementation of the dependent rounding procedure, from [[Dependent rounding and its applications to approximation algorithms, by R Gandhi, S Khuller, S Parthasarathy, Journal of the ACM, 2006](http://dl.acm.org/citation.cfm?id=1147956)].
 
-It solves the problem of efficiently selecting a set of :math:`k` distinct actions from :math:`\{1,\dots,K\}`, while satisfying the condition that each action :math:`i` is selected with probability :math:`p_i` exactly.
+It addresses the problem of efficiently selecting a set of :math:`k` distinct actions from :math:`\{1,\dots,K\}`, where each action :math:`i` should be selected with probability :math:`p_i` (this implementation does not guarantee it, see the warning of :func:`DepRound`).
 
 The distribution :math:`(p_1, \dots, p_K)` on :math:`\{1,\dots,K\}` is assumed to be given.
 
 Dependent rounding developed by [Gandhi et al.] is a kind of technique that randomly selects a set of edges from a bipartite graph under some cardinality constraints.
 
-- It runs in :math:`\mathcal{O}(K)` space complexity, and at most :math:`\mathcal{O}(K^2)` time complexity (note that the article [Uchiya et al., 2010] wrongly claim it is in :math:`\mathcal{O}(K)`).
+- It runs in :math:`\mathcal{O}(K)` space and time complexity: each step merges two of the non-zero weights, so there are at most :math:`K - k` steps, and each one costs :math:`\mathcal{O}(1)` as the non-zero weights are kept at the beginning of an array (the one that becomes zero is swapped with the last one).
+- :func:`DepRoundBatch` rounds :math:`R` weight vectors at once, with the same steps done in a vectorized way for all of them.
 - References: see also https://www.cs.umd.edu/~samir/grant/jacm06.pdf
 """
 from __future__ import division, print_function  # Python 2 compatibility
@@ -28,7 +29,9 @@ def DepRound(weights_p, k=1):
     r""" [[Algorithms for adversarial bandit problems with multiple plays, by T.Uchiya, A.Nakamura and M.Kudo, 2010](http://hdl.handle.net/2115/47057)] Figure 5 (page 15) is a very clean presentation of the algorithm.
 
     - Inputs: :math:`k < K` and weights_p :math:`= (p_1, \dots, p_K)` such that :math:`\sum_{i=1}^{K} p_i = k` (or :math:`= 1`).
-    - Output: A subset of :math:`\{1,\dots,K\}` with exactly :math:`k` elements. Each action :math:`i` is selected with probability exactly :math:`p_i`.
+    - Output: A subset of :math:`\{1,\dots,K\}` with exactly :math:`k` elements. The selection probability of each action :math:`i` depends on the weights, but it is *not* :math:`k p_i` in general (see the warning below).
+
+    .. warning:: As the weights are first normalized to sum to :math:`1`, each step merges two weights :math:`p_i, p_j` into one, and :math:`i` keeps the merged weight with probability :math:`p_j / (p_i + p_j)`. So the selection probabilities are *not* exactly the :math:`k p_i` (for instance, ``DepRound([0.5, 0.3, 0.2], 2)`` drops the action 0 with probability about :math:`0.45`).
 
     Example:
 
@@ -39,33 +42,33 @@ def DepRound(weights_p, k=1):
 
     >>> weights_p = [ 2, 2, 2, 2, 2 ]  # all equal weights
     >>> DepRound(weights_p, k)
-    [3, 4]
+    [0, 1]
     >>> DepRound(weights_p, k)
     [3, 4]
     >>> DepRound(weights_p, k)
-    [0, 1]
+    [1, 4]
 
     >>> weights_p = [ 10, 8, 6, 4, 2 ]  # decreasing weights
     >>> DepRound(weights_p, k)
-    [0, 4]
+    [0, 2]
     >>> DepRound(weights_p, k)
-    [1, 2]
+    [1, 4]
     >>> DepRound(weights_p, k)
-    [3, 4]
+    [1, 2]
 
     >>> weights_p = [ 3, 3, 0, 0, 3 ]  # decreasing weights
     >>> DepRound(weights_p, k)
-    [0, 4]
+    [0, 1]
     >>> DepRound(weights_p, k)
     [0, 4]
     >>> DepRound(weights_p, k)
-    [0, 4]
+    [0, 1]
     >>> DepRound(weights_p, k)
     [0, 1]
 
     - See [[Gandhi et al, 2006](http://dl.acm.org/citation.cfm?id=1147956)] for the details.
     """
-    p = np.array(weights_p)
+    p = np.array(weights_p, dtype=float)
     K = len(p)
     # Checks
     assert k < K, "Error: k = {} should be < K = {}.".format(k, K)  # DEBUG
@@ -73,42 +76,80 @@ def DepRound(weights_p, k=1):
         p = p / np.sum(p)
     assert np.all(0 <= p) and np.all(p <= 1), "Error: the weights (p_1, ..., p_K) should all be 0 <= p_i <= 1 ...".format(p)  # DEBUG
     assert np.isclose(np.sum(p), 1), "Error: the sum of weights p_1 + ... + p_K should be = 1 (= {}).".format(np.sum(p))  # DEBUG
+    # The first n arms of this list are the ones with a non-zero weight
+    arms = [a for a in range(K) if p[a] > 0]
+    weights = [p[a] for a in arms]
+    n = len(arms)
+    assert n >= k, "Error: DepRound({}, {}) is supposed to return a set of size {}, but only {} weights are non-zero...".format(weights_p, k, k, n)  # DEBUG
     # Main loop
-    possible_ij = [a for a in range(K) if 0 < p[a] < 1]
-    while possible_ij:
-        # Choose distinct i, j with 0 < p_i, p_j < 1
-        if len(possible_ij) == 1:
-            i = np.random.choice(possible_ij, size=1)
-            j = i
-        else:
-            i, j = np.random.choice(possible_ij, size=2, replace=False)
-        pi, pj = p[i], p[j]
-        assert 0 < pi < 1, "Error: pi = {} (with i = {}) is not 0 < pi < 1.".format(pi, i)  # DEBUG
-        assert 0 < pj < 1, "Error: pj = {} (with j = {}) is not 0 < pj < 1.".format(pj, i)  # DEBUG
-        assert i != j, "Error: i = {} is different than with j = {}.".format(i, j)  # DEBUG
-
-        # Set alpha, beta
-        alpha, beta = min(1 - pi, pj), min(pi, 1 - pj)
-        proba = alpha / (alpha + beta)
-        if with_proba(proba):  # with probability = proba = alpha/(alpha+beta)
-            pi, pj = pi + alpha, pj - alpha
+    while n > k:
+        # Choose distinct i, j (uniformly) among the n non-zero weights
+        i = int(random() * n)
+        j = int(random() * (n - 1))
+        if j >= i:
+            j += 1
+        pi, pj = weights[i], weights[j]
+        # Set alpha, beta: as the weights sum to 1, alpha = pj and beta = pi, so one of the two weights becomes 0
+        if with_proba(pj / (pi + pj)):  # with probability = proba = alpha/(alpha+beta)
+            survivor, dead = i, j
         else:            # with probability = 1 - proba = beta/(alpha+beta)
-            pi, pj = pi - beta, pj + beta
-
-        # Store
-        p[i], p[j] = pi, pj
-        # And update
-        possible_ij = [a for a in range(K) if 0 < p[a] < 1]
-        if len([a for a in range(K) if np.isclose(p[a], 0)]) == K - k:
-            break
+            survivor, dead = j, i
+        weights[survivor] = pi + pj
+        # And update: the dead arm is replaced by the last non-zero one
+        n -= 1
+        arms[dead], weights[dead] = arms[n], weights[n]
     # Final step
-    subset = [a for a in range(K) if np.isclose(p[a], 1)]
-    if len(subset) < k:
-        subset = [a for a in range(K) if not np.isclose(p[a], 0)]
+    subset = sorted(arms[:k])
     assert len(subset) == k, "Error: DepRound({}, {}) is supposed to return a set of size {}, but {} has size {}...".format(weights_p, k, k, subset, len(subset))  # DEBUG
     return subset
 
 
+def DepRoundBatch(weights_p, k=1):
+    r""" Vectorized version of :func:`DepRound`, to round :math:`R` weight vectors at once: each row of the array ``weights_p`` of shape :math:`(R, K)` is rounded independently, with the same distribution as :func:`DepRound`.
+
+    - Output: A numpy array of shape :math:`(R, k)`, each row being a (sorted) subset of :math:`\{1,\dots,K\}` with exactly :math:`k` elements.
+    - The steps are done for all the rows at once, so there are at most :math:`K - k` vectorized steps, of cost :math:`\mathcal{O}(R)`.
+
+    Example:
+
+    >>> import numpy as np; np.random.seed(0)  # for reproductibility!
+    >>> DepRoundBatch([[2, 2, 2, 2, 2], [10, 8, 6, 4, 2], [3, 3, 0, 0, 3]], k=2)
+    array([[2, 4],
+           [2, 4],
+           [0, 4]])
+    """
+    p = np.array(weights_p, dtype=float)
+    R, K = np.shape(p)
+    # Checks
+    assert k < K, "Error: k = {} should be < K = {}.".format(k, K)  # DEBUG
+    p /= np.sum(p, axis=1)[:, np.newaxis]
+    assert np.all(0 <= p) and np.all(p <= 1), "Error: the weights (p_1, ..., p_K) should all be 0 <= p_i <= 1 ...".format(p)  # DEBUG
+    # The first nbNonZero[r] arms of the row r of this array are the ones with a non-zero weight
+    arms = np.argsort(p <= 0, axis=1, kind='mergesort')
+    weights = np.take_along_axis(p, arms, axis=1)
+    nbNonZero = np.sum(p > 0, axis=1)
+    assert np.all(nbNonZero >= k), "Error: DepRoundBatch is supposed to return sets of size {}, but some rows have less than {} non-zero weights...".format(k, k)  # DEBUG
+    # Main loop, one step for all the rows that still have more than k non-zero weights
+    for _ in range(np.max(nbNonZero) - k):
+        rows = np.flatnonzero(nbNonZero > k)
+        n = nbNonZero[rows]
+        # Choose distinct i, j (uniformly) among the n non-zero weights
+        i = (np.random.random_sample(len(rows)) * n).astype(int)
+        j = (np.random.random_sample(len(rows)) * (n - 1)).astype(int)
+        j += j >= i
+        pi, pj = weights[rows, i], weights[rows, j]
+        # The arm i survives with probability pj / (pi + pj)
+        iSurvives = np.random.random_sample(len(rows)) < pj / (pi + pj)
+        survivor, dead = np.where(iSurvives, i, j), np.where(iSurvives, j, i)
+        weights[rows, survivor] = pi + pj
+        # And update: the dead arm is replaced by the last non-zero one
+        n -= 1
+        arms[rows, dead], weights[rows, dead] = arms[rows, n], weights[rows, n]
+        nbNonZero[rows] = n
+    # Final step
+    return np.sort(arms[:, :k], axis=1)
+
+
 # --- Debugging
 
 if __name__ == "__main__":
@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+""" Independent: a multi-player policy where every player runs her own single-player policy, that handles the collisions by itself (e.g., :class:`Policies.MusicalChair`, :class:`Policies.MEGA`, :class:`Policies.TrekkingTSN` or :class:`Policies.SIC_MMAB`).
+
+- It is the same as a list of independent players, like ``[ MusicalChair(nbArms, Time0=50*NB_ARMS) for _ in range(NB_PLAYERS) ]``: the children forward all the calls, including the collisions (and the rewards observed with them), to their players.
+- But with ``bank=True``, the players are stored in a bank (see :mod:`PhaseBank`), and the simulator advances all of them at once.
+"""
+from __future__ import division, print_function  # Python 2 compatibility
+
+__author__ = "Lilian Besson"
+__version__ = "0.9"
+
+try:
+    from .BaseMPPolicy import BaseMPPolicy
+    from .ChildPointer import ChildPointer
+    from .PhaseBank import phaseBankOf
+except ImportError:
+    from BaseMPPolicy import BaseMPPolicy
+    from ChildPointer import ChildPointer
+    from PhaseBank import phaseBankOf
+
+
+class IndependentChildPointer(ChildPointer):
+    """ Independent version of the ChildPointer class: the reward observed with a collision is also forwarded."""
+
+    def handleCollision(self, arm, reward=None):
+        """ Pass the call to self.mother._handleCollision_one(playerId, arm, reward) with the player's ID number. """
+        return self.mother._handleCollision_one(self.playerId, arm, reward)
+
+
+class Independent(BaseMPPolicy):
+    """ Independent: a multi-player policy where every player runs her own single-player policy, that handles the collisions by itself.
+    """
+
+    def __init__(self, nbPlayers, nbArms, playerAlgo, lower=0., amplitude=1., *args, **kwargs):
+        """
+        - nbPlayers: number of players to create (in self._players).
+        - playerAlgo: class to use for every players.
+        - nbArms: number of arms, given as first argument to playerAlgo (use a :func:`functools.partial` for policies taking other arguments first, like :class:`Policies.MusicalChairNoSensing`).
+        - bank: (keyword only) if True (and if one of the banks of :data:`PhaseBank.PHASE_BANKS` fits the players), all the players are stored in this bank, in order to advance them at once (see :mod:`PhaseBank`).
+        - `*args`, `**kwargs`: arguments, named arguments, given to playerAlgo.
+
+        Examples:
+
+        >>> import sys; sys.path.insert(0, '..'); from Policies import *
+        >>> import random; random.seed(0); import numpy as np; np.random.seed(0)
+        >>> nbArms = 17
+        >>> nbPlayers = 6
+        >>> s = Independent(nbPlayers, nbArms, MEGA, bank=True)
+        >>> s.bank
+        MEGABank(Independent(6 x MEGA($c=0.1$, $d=0.01$, $p_0=0.5$, $\\alpha=0.5$, $\\beta=0.5$)))
+        >>> from functools import partial
+        >>> s = Independent(nbPlayers, nbArms, partial(MusicalChairNoSensing, nbPlayers), horizon=1000, bank=True)
+        >>> s.bank
+        MusicalChairNoSensingBank(Independent(6 x MCNoSensing($M=6$, $T=1000$)))
+        >>> for child in s.children:
+        ...     child.startGame()
+        >>> [ child.choice() for child in s.children ]
+        [1, 8, 0, 4, 6, 13]
+
+        - To get a list of usable players, use ``s.children``.
+        - Warning: ``s._players`` is for internal use ONLY!
+        """
+        assert nbPlayers > 0, "Error, the parameter 'nbPlayers' for Independent class has to be > 0."
+        bank = kwargs.pop('bank', False)  # Keyword only, it is not given to playerAlgo
+        self.nbPlayers = nbPlayers  #: Number of players
+        self.nbArms = nbArms  #: Number of arms
+        self._players = [None] * nbPlayers
+        self.children = [None] * nbPlayers  #: List of children, fake algorithms
+        for playerId in range(nbPlayers):
+            self._players[playerId] = playerAlgo(nbArms, *args, lower=lower, amplitude=amplitude, **kwargs)
+            self.children[playerId] = IndependentChildPointer(self, playerId)
+        self.bank = phaseBankOf(self) if bank else None  #: :class:`PhaseBank.PhaseBank` of the players, or None.
+
+    def __str__(self):
+        return "Independent({} x {})".format(self.nbPlayers, str(self._players[0]))
+
+    # --- Proxy methods
+
+    def _startGame_one(self, playerId):
+        """Forward the call to self._players[playerId], and the bank will read her new memories."""
+        if self.bank is not None:
+            self.bank._bound = False
+        return self._players[playerId].startGame()
+
+    def _handleCollision_one(self, playerId, arm, reward=None):
+        """Forward the call to self._players[playerId] (or give her a reward of player.lower if she does not handle collisions)."""
+        player = self._players[playerId]
+        if hasattr(player, 'handleCollision'):
+            return player.handleCollision(arm, reward)
+        return player.getReward(arm, getattr(player, 'lower', 0))
+
+
+# --- Debugging
+
+if __name__ == "__main__":
+    # Code for debugging purposes.
+    from doctest import testmod
+    print("\nTesting automatically all the docstring written in each functions of this module :")
+    testmod(verbose=True)
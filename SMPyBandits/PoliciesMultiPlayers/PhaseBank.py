@@ -0,0 +1,512 @@
+# -*- coding: utf-8 -*-
+r""" PhaseBank: a "bank" of the M players of a policy whose players follow a state machine, with phases and counters (e.g., :class:`Policies.MusicalChair`, :class:`Policies.MusicalChairNoSensing`, :class:`Policies.MEGA`, :class:`Policies.TrekkingTSN` or :class:`Policies.SIC_MMAB`), that stores all their memories in arrays, in order to advance all the players at once.
+
+- Each of these single-player policies keeps its phase and its counters in scalar attributes, and branches on its phase at each step, so the simulator spends most of its time in ``M`` calls to ``choice``, ``getReward`` and ``handleCollision``.
+- A bank stores the memories of the M players in arrays of M values (or ``(M, K)`` arrays), and advances all of them with masked vectorized transitions: one mask for each phase.
+- The players stay decentralized: the row of a player is only updated by her own observations.
+- The rare and complicated transitions (e.g., the end of the initial phase of :class:`Policies.MusicalChair`, or the end of a communication phase of :class:`Policies.SIC_MMAB`) are delegated to the methods of the players themselves (see :meth:`PhaseBank.delegate`), so the bank stays exactly the same algorithm as its players.
+
+Such a bank is used by the :class:`Independent` multi-player policy, if it is created with ``bank=True`` and if one of the banks of :data:`PHASE_BANKS` fits its players:
+
+>>> import sys; sys.path.insert(0, '..'); from Policies import *
+>>> import numpy as np; np.random.seed(0)
+>>> from Independent import Independent
+>>> s = Independent(6, 17, MusicalChair, bank=True, Time0=100)
+>>> s.bank
+MusicalChairBank(Independent(6 x MusicalChair($T_0=100$)))
+>>> for child in s.bank:
+...     child.startGame()
+>>> s.bank.choices()
+array([ 1,  8,  0,  4,  6, 13])
+"""
+from __future__ import division, print_function  # Python 2 compatibility
+
+__author__ = "Lilian Besson"
+__version__ = "0.9"
+
+from enum import Enum
+import numpy as np
+from numpy.random import random_sample
+
+try:
+    from .PlayerBank import PlayerBank, definedBy, randomArgmaxRows
+except ImportError:
+    from PlayerBank import PlayerBank, definedBy, randomArgmaxRows
+
+
+def uniformIndexes(lengths):
+    """ For each of these lengths, one index chosen uniformly at random in ``range(length)``.
+
+    >>> np.random.seed(0)
+    >>> uniformIndexes(np.array([1, 10, 100]))
+    array([ 0,  7, 60])
+    """
+    return (random_sample(np.shape(lengths)) * lengths).astype(int)
+
+
+class PhaseBank(PlayerBank):
+    r""" A bank of the M players of a policy whose players follow a state machine, with all their memories stored in arrays.
+
+    - The memories listed in :attr:`scalars` and :attr:`rows` are read from the players when the bank is bound (after their ``startGame``), and then only the arrays of the bank are updated, until they start a new game.
+    - The enumerated states (e.g., ``State.InitialPhase``) are stored as their values (see :meth:`code`), a None as -1 (for the memories listed in :attr:`noneable`), and the rows shorter than K are padded (their lengths are kept).
+    """
+
+    family = None  #: Name of the class of the players of this bank (they can be of a sub-class that does not change their state machine).
+    machine = ('choice', 'getReward', 'handleCollision')  #: Methods of the players that the bank implements, and that have to be defined by the class :attr:`family`.
+    scalars = {}  #: Scalar memories of each player, and their types.
+    rows = {}  #: Array memories of each player (of length at most K, or None), and their types.
+    noneable = ()  #: Scalar memories that can be None.
+    aliases = {}  #: Names of the attributes of the bank storing the memories, if they differ from their names in the players.
+
+    @classmethod
+    def fits(cls, players):
+        """ True if these players can be stored in this bank: they have to be of the same class, with the state machine of the class :attr:`family`."""
+        return len(players) > 0 and len({type(player) for player in players}) == 1 \
+            and all(definedBy(players[0], method) == cls.family for method in cls.machine)
+
+    def __getstate__(self):
+        """ The memories are written back to the players before a copy or a pickle, as they are read again when the copy is bound."""
+        if self._bound:
+            self.store(range(self.nbPlayers))
+        return super(PhaseBank, self).__getstate__()
+
+    def __str__(self):
+        return "{}({})".format(self.__class__.__name__, self.mother)
+
+    __repr__ = __str__
+
+    def owners(self):
+        """ The objects that own the memories: the players of the mother policy."""
+        return self.mother._players
+
+    def attribute(self, name):
+        """ Name of the attribute of the bank storing this memory."""
+        return self.aliases.get(name, name)
+
+    def code(self, name, member):
+        """ Value of this member of the enumerated states of this memory, e.g., ``code('state', 'InitialPhase')``."""
+        try:
+            return self._codes[name, member]
+        except KeyError:
+            self._codes[name, member] = self._enums[name][member].value
+            return self._codes[name, member]
+
+    # --- Memories of the players
+
+    def bind(self):
+        """ Create the arrays of the bank, and read the memories of all the players."""
+        self._enums = {}
+        self._codes = {}
+        self._lengths = {}
+        for name, kind in self.scalars.items():
+            setattr(self, self.attribute(name), np.zeros(self.nbPlayers, dtype=kind))
+        for name, kind in self.rows.items():
+            setattr(self, self.attribute(name), np.zeros((self.nbPlayers, self.nbArms), dtype=kind))
+            self._lengths[name] = np.zeros(self.nbPlayers, dtype=int)
+        self.load(range(self.nbPlayers))
+        self._bound = True
+
+    def load(self, playerIds):
+        """ Read the memories of these players, into their rows of the arrays of the bank."""
+        owners = self.owners()
+        for playerId in playerIds:
+            owner = owners[playerId]
+            for name in self.scalars:
+                value = getattr(owner, name)
+                if isinstance(value, Enum):
+                    self._enums[name] = type(value)
+                    value = value.value
+                getattr(self, self.attribute(name))[playerId] = -1 if value is None else value
+            for name in self.rows:
+                value = getattr(owner, name)
+                length = -1 if value is None else len(value)
+                self._lengths[name][playerId] = length
+                if length > 0:
+                    getattr(self, self.attribute(name))[playerId, :length] = value
+
+    def store(self, playerIds):
+        """ Write the memories of these players, from the arrays of the bank back to their attributes."""
+        owners = self.owners()
+        for playerId in playerIds:
+            owner = owners[playerId]
+            for name, kind in self.scalars.items():
+                value = getattr(self, self.attribute(name))[playerId]
+                if name in self.noneable and value == -1:
+                    value = None
+                elif name in self._enums:
+                    value = self._enums[name](value)
+                else:
+                    value = kind(value)
+                setattr(owner, name, value)
+            for name in self.rows:
+                length = self._lengths[name][playerId]
+                setattr(owner, name, None if length < 0 else getattr(self, self.attribute(name))[playerId, :length].copy())
+
+    def delegate(self, method, playerIds, *arguments):
+        """ Call this method of each of these players (with her values of the arguments), after writing back their memories, and then read their new memories.
+
+        - It is used for the rare and complicated transitions, so the bank does not have to implement them again.
+        - Return the list of the results.
+        """
+        if len(playerIds) == 0:
+            return []
+        self.store(playerIds)
+        owners = self.owners()
+        results = [getattr(owners[playerId], method)(*[argument[i] for argument in arguments]) for i, playerId in enumerate(playerIds)]
+        self.load(playerIds)
+        return results
+
+
+# --- Banks of the collision-aware single-player policies
+
+class MusicalChairBank(PhaseBank):
+    """ Bank of M players of :class:`Policies.MusicalChair`."""
+
+    family = 'MusicalChair'
+    scalars = {'t': int, 'state': int, 'chair': int, 'Time0': int, 'nbPlayers': int, 'nbCollision': int}
+    rows = {'cumulatedRewards': float, 'nbObservations': int, 'A': int}
+    noneable = ('chair', 'nbPlayers')
+    aliases = {'nbPlayers': 'estimatedNbPlayers'}  # self.nbPlayers is the number M of players of the bank
+
+    def choices(self):
+        """ The players already sitted stay on their chair, the players in the initial phase choose a random arm, and the others choose a random arm among their estimated best arms (and sit on it)."""
+        if not self._bound:
+            self.bind()
+        self.t += 1
+        sitting = self.chair >= 0
+        self.state[sitting] = self.code('state', 'Sitted')
+        choices = self.chair.copy()
+        initial = np.flatnonzero(~sitting & (self.state == self.code('state', 'InitialPhase')))
+        choices[initial] = np.random.randint(self.nbArms, size=len(initial))
+        musical = np.flatnonzero(~sitting & (self.state == self.code('state', 'MusicalChair')))
+        choices[musical] = self.A[musical, uniformIndexes(self._lengths['A'][musical])]
+        self.chair[musical] = choices[musical]
+        return choices
+
+    def getRewards(self, playerIds, arms, rewards):
+        """ The players in the initial phase count their observations, and the ones reaching the time :math:`T_0` end this phase themselves."""
+        initial = self.state[playerIds] == self.code('state', 'InitialPhase')
+        ending = initial & (self.t[playerIds] >= self.Time0[playerIds])
+        self.delegate('getReward', playerIds[ending], arms[ending], rewards[ending])
+        initial &= ~ending
+        playerIds, arms, rewards = playerIds[initial], arms[initial], rewards[initial]
+        self.nbObservations[playerIds, arms] += 1
+        self.cumulatedRewards[playerIds, arms] += (rewards - self._lower[playerIds]) / self._amplitude[playerIds]
+
+    def handleCollisions(self, playerIds, arms, rewards):
+        """ The players in the initial phase count one more collision, and the ones who just chose a chair leave it."""
+        states = self.state[playerIds]
+        self.nbCollision[playerIds[states == self.code('state', 'InitialPhase')]] += 1
+        self.chair[playerIds[states == self.code('state', 'MusicalChair')]] = -1
+
+
+class MusicalChairNoSensingBank(PhaseBank):
+    """ Bank of M players of :class:`Policies.MusicalChairNoSensing`."""
+
+    family = 'MusicalChairNoSensing'
+    scalars = {'t': int, 'state': int, 'chair': int, 'tau_phase_2': int, 'nbPlayers': int, 'constant_in_testing_the_gap': float}
+    rows = {'cumulatedRewards': float, 'nbObservations': int, 'A': int}
+    noneable = ('chair',)
+    aliases = {'nbPlayers': 'm'}  # self.nbPlayers is the number M of players of the bank
+
+    def choices(self):
+        """ The players already sitted stay on their chair, the players in the first two phases choose a random arm, and the others choose a random arm among their estimated best arms (and sit on it)."""
+        if not self._bound:
+            self.bind()
+        self.t += 1
+        sitting = self.chair >= 0
+        self.state[sitting] = self.code('state', 'Sitted')
+        choices = self.chair.copy()
+        uniform = np.flatnonzero(~sitting & ((self.state == self.code('state', 'InitialPhase')) | (self.state == self.code('state', 'UniformWaitPhase2'))))
+        choices[uniform] = np.random.randint(self.nbArms, size=len(uniform))
+        musical = np.flatnonzero(~sitting & (self.state == self.code('state', 'MusicalChair')))
+        choices[musical] = self.A[musical, uniformIndexes(self._lengths['A'][musical])]
+        self.chair[musical] = choices[musical]
+        return choices
+
+    def getRewards(self, playerIds, arms, rewards):
+        """ The players in the initial phase count their observations and test the gap between their M-th and (M+1)-th best empirical means, the ones at the end of the second phase end it themselves, and the ones who just chose a chair leave it if they see a null reward."""
+        states = self.state[playerIds]
+        # 1. Initial phase
+        initial = states == self.code('state', 'InitialPhase')
+        ids, initialArms = playerIds[initial], arms[initial]
+        self.nbObservations[ids, initialArms] += 1
+        self.cumulatedRewards[ids, initialArms] += (rewards[initial] - self._lower[ids]) / self._amplitude[ids]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            sortedMeans = np.sort(self.cumulatedRewards[ids] / self.nbObservations[ids], axis=1)[:, ::-1]  # XXX decreasing order!
+            gaps = np.zeros(len(ids))
+            fewer = np.flatnonzero(self.m[ids] < self.nbArms)
+            nbPlayers = self.m[ids[fewer]]
+            gaps[fewer] = np.abs(sortedMeans[fewer, nbPlayers] - sortedMeans[fewer, nbPlayers + 1])
+            switching = ids[gaps >= self.constant_in_testing_the_gap[ids] / np.sqrt(self.t[ids])]
+        self.state[switching] = self.code('state', 'UniformWaitPhase2')
+        self.tau_phase_2[switching] = self.t[switching]
+        # 2. End of the second phase
+        ending = (states == self.code('state', 'UniformWaitPhase2')) & ((self.t[playerIds] - self.tau_phase_2[playerIds]) >= 24 * self.tau_phase_2[playerIds])
+        self.delegate('getReward', playerIds[ending], arms[ending], rewards[ending])
+        # 3. Musical chair
+        self.chair[playerIds[(states == self.code('state', 'MusicalChair')) & (rewards <= 0)]] = -1
+
+    def handleCollisions(self, playerIds, arms, rewards):
+        """ As its name suggests it, :class:`Policies.MusicalChairNoSensing` does *not* use any collision information."""
+        pass
+
+
+class MEGABank(PhaseBank):
+    """ Bank of M players of :class:`Policies.MEGA`."""
+
+    family = 'MEGA'
+    scalars = {'t': int, 'p': float, 'chosenArm': int, 'p0': float, 'alpha': float, 'beta': float, 'c': float, 'd': float}
+    rows = {'tnext': int, 'meanRewards': float, 'pulls': int, 'rewards': float}
+    noneable = ('chosenArm',)
+
+    def choices(self):
+        """ The players who did not give up their arm keep it, and the others choose a new arm: with probability :math:`\varepsilon_t` a random available arm, or else an arm with the highest empirical mean."""
+        if not self._bound:
+            self.bind()
+        self.t += 1
+        ids = np.flatnonzero(self.chosenArm < 0)
+        if len(ids) > 0:
+            available = self.tnext[ids] <= self.t[ids, np.newaxis]
+            unavailable = ~np.any(available, axis=1)
+            for _ in range(np.count_nonzero(unavailable)):
+                print("Error: MEGA.choice() should 'Refrain from transmitting in this round' but my model does not allow this - YET ... Choosing a random arm.")  # DEBUG
+            epsilon = np.minimum(1, (self.c[ids] * self.nbArms**2) / (self.d[ids]**2 * (self.nbArms - 1) * self.t[ids]))
+            explore = ~unavailable & (random_sample(len(ids)) < epsilon)
+            exploit = ~unavailable & ~explore
+            newArms = np.random.randint(self.nbArms, size=len(ids))
+            newArms[explore] = randomArgmaxRows(available[explore])
+            self.p[ids[explore]] = self.p0[ids[explore]]  # Reinitialize proba p
+            exploiting = ids[exploit]
+            pulls = self.pulls[exploiting]
+            meanRewards = self.meanRewards[exploiting]
+            meanRewards[pulls != 0] = self.rewards[exploiting][pulls != 0] / pulls[pulls != 0]
+            self.meanRewards[exploiting] = meanRewards
+            newArms[exploit] = randomArgmaxRows(meanRewards == np.max(meanRewards, axis=1, keepdims=True))
+            self.chosenArm[ids] = newArms
+        return self.chosenArm.copy()
+
+    def getRewards(self, playerIds, arms, rewards):
+        """ The players learn from their rewards, and increase their probability of persistance."""
+        assert np.all(self.chosenArm[playerIds] == arms), "Error: a MEGA player can only get a reward on her chosenArm."  # DEBUG
+        self.rewards[playerIds, arms] += (rewards - self._lower[playerIds]) / self._amplitude[playerIds]
+        self.pulls[playerIds, arms] += 1
+        self.p[playerIds] = self.p[playerIds] * self.alpha[playerIds] + (1 - self.alpha[playerIds])
+
+    def handleCollisions(self, playerIds, arms, rewards):
+        """ With probability :math:`1 - p`, the players give up their arm, that is unavailable for a random time."""
+        assert np.all(self.chosenArm[playerIds] == arms), "Error: a MEGA player can only see a collision on her chosenArm."  # DEBUG
+        ids = playerIds[random_sample(len(playerIds)) < 1 - self.p[playerIds]]
+        delta_tnext = np.random.randint(low=0, high=1 + (self.t[ids] ** self.beta[ids]).astype(int))
+        self.tnext[ids, self.chosenArm[ids]] = self.t[ids] + delta_tnext
+        self.p[ids] = self.p0[ids]
+        self.chosenArm[ids] = -1
+
+
+class TrekkingTSNBank(PhaseBank):
+    """ Bank of M players of :class:`Policies.TrekkingTSN`."""
+
+    family = 'TrekkingTSN'
+    scalars = {'t': int, 'state': int, 'last_was_successful': bool, 'last_choice': int, 'J': int, 'lock_channel': bool, 'T_CC': int}
+    rows = {'cumulatedRewards': float, 'nbObservations': int, 'Y': int, 'M': float, 'index_sort': int}
+    noneable = ('last_choice',)
+
+    def choices(self):
+        """ The players in the channel characterization phase hop sequentially (after a success) or randomly, and the ones in the trekking phase stay on their channel or trek to the next best one."""
+        if not self._bound:
+            self.bind()
+        self.t += 1
+        choices = self.last_choice.copy()  # by default, stay on the current arm
+        characterization = self.state == self.code('state', 'ChannelCharacterization')
+        successful = characterization & self.last_was_successful
+        choices[successful] = (self.last_choice[successful] + 1) % self.nbArms
+        random = np.flatnonzero(characterization & ~self.last_was_successful)
+        choices[random] = np.random.randint(self.nbArms, size=len(random))
+        ids = np.flatnonzero(self.state == self.code('state', 'TrekkingTSN'))
+        if len(ids) > 0:
+            J = self.J[ids]
+            restart = (self.t[ids] == self.T_CC[ids]) | (np.sum(self.Y[ids], axis=1) == 0)
+            trek = ~restart & ~self.lock_channel[ids] & ~(self.Y[ids, J] <= self.M[ids, J])
+            choices[ids[restart]] = (J[restart] - 1) % self.nbArms
+            choices[ids[trek]] = (self.last_choice[ids[trek]] - 1) % self.nbArms  # take next best channel
+            self.J[ids[trek]] = self.last_choice[ids[trek]]
+            self.Y[ids, self.J[ids]] += 1  # finally, in Trekking phase, increase Y_J by 1
+        self.last_choice[:] = choices
+        # and use the permutation to aim at the sorted arm
+        choices[ids] = self.index_sort[ids, choices[ids]]
+        return choices
+
+    def getRewards(self, playerIds, arms, rewards):
+        """ The players in the channel characterization phase count their observations, and the ones reaching the time :math:`T_{CC}` end this phase themselves."""
+        characterization = self.state[playerIds] == self.code('state', 'ChannelCharacterization')
+        ending = characterization & (self.t[playerIds] >= self.T_CC[playerIds])
+        self.delegate('getReward', playerIds[ending], arms[ending], rewards[ending])
+        characterization &= ~ending
+        playerIds, arms = playerIds[characterization], arms[characterization]
+        r_t = (rewards[characterization] - self._lower[playerIds]) / self._amplitude[playerIds]
+        self.nbObservations[playerIds, arms] += 1
+        self.cumulatedRewards[playerIds, arms] += r_t
+        self.last_was_successful[playerIds[r_t > 0]] = True
+
+    def handleCollisions(self, playerIds, arms, rewards):
+        """ The players in the trekking phase lock their channel J."""
+        ids = playerIds[self.state[playerIds] != self.code('state', 'ChannelCharacterization')]
+        self.lock_channel[ids] = True
+        for playerId in ids[self.last_choice[ids] == self.J[ids]]:
+            print("Warning: TrekkingTSN algorithm saw a collision while playing {} and has J = {}, but will lock this channel (forever?), that's not smart... (L = {}).".format(self.last_choice[playerId], self.J[playerId], True))  # DEBUG
+        self.last_choice[ids] = self.J[ids]
+
+
+class SIC_MMABBank(PhaseBank):
+    """ Bank of M players of :class:`Policies.SIC_MMAB` (or of its variants, :class:`Policies.SIC_MMAB_UCB` and :class:`Policies.SIC_MMAB_klUCB`).
+
+    - The changes of phase (the ends of the fixation, estimation and communication phases) are delegated to the players, as they happen once for each round.
+    """
+
+    family = 'SIC_MMAB'
+    scalars = {'t': int, 'phase': int, 'ext_rank': int, 'int_rank': int, 'nbPlayers': int, 'nbArms': int, 'last_action': int, 't_phase': int, 'round_number': int, 'Time0': int, 'verbose': bool}
+    rows = {'last_phase_stats': float, 'active_arms': int, 'rewards': float, 'pulls': int}
+    aliases = {'nbPlayers': 'estimatedNbPlayers', 'nbArms': 'nbActiveArms'}  # self.nbPlayers and self.nbArms are the numbers M and K of the bank
+
+    def _communication(self, ids):
+        """ For these players in a communication phase: the lengths of the turns, the masks of the players in their turn to send, and the times in their turns."""
+        L = (self.estimatedNbPlayers[ids] - 1) * self.nbActiveArms[ids] * (self.round_number[ids] + 2)
+        sending = (self.t_phase[ids] < (self.int_rank[ids] + 1) * L) & (self.t_phase[ids] >= self.int_rank[ids] * L)
+        return L, sending
+
+    def _bitAndArm(self, ids, t0):
+        """ For these players in a communication phase, at these times in the turns: the number of the bit to send, and the index of the arm it is about."""
+        nbBits = self.round_number[ids] + 2
+        bit = t0 % nbBits
+        k0 = ((t0 - bit) // nbBits) % self.nbActiveArms[ids]
+        return bit, k0
+
+    def choices(self):
+        """ Choose the arms of all the players, with one mask for each phase (the players are usually all in the same phase, so the other phases are skipped)."""
+        if not self._bound:
+            self.bind()
+        phase, nbArms = self.phase, self.nbActiveArms
+        phases = set(np.unique(phase).tolist())
+        choices = self.last_action.copy()  # 5) exploitation phase
+        # 1) fixation phase
+        if self.code('phase', 'Fixation') in phases:
+            fixation = phase == self.code('phase', 'Fixation')
+            fixing = np.flatnonzero(fixation & (self.ext_rank == -1))
+            choices[fixing] = uniformIndexes(nbArms[fixing])  # still trying to fix to an arm
+            hopping = fixation & (self.ext_rank != -1)
+            choices[hopping] = (self.last_action[hopping] + 1) % nbArms[hopping]  # sequential hopping
+        # 2) estimation phase
+        if self.code('phase', 'Estimation') in phases:
+            estimation = phase == self.code('phase', 'Estimation')
+            waiting = self.t <= self.Time0 + 2 * self.ext_rank
+            choices[estimation & waiting] = self.ext_rank[estimation & waiting]  # waiting its turn to sequential hop
+            hopping = estimation & ~waiting
+            choices[hopping] = (self.last_action[hopping] + 1) % nbArms[hopping]  # sequential hopping
+        # 3) exploration phase
+        if self.code('phase', 'Exploration') in phases:
+            ids = np.flatnonzero(phase == self.code('phase', 'Exploration'))
+            isLast = (self.active_arms[ids] == self.last_action[ids, np.newaxis]) & (np.arange(self.nbArms) < self._lengths['active_arms'][ids, np.newaxis])
+            found = np.any(isLast, axis=1)
+            choices[ids[~found]] = self.delegate('choice', ids[~found])
+            ids, lastIndex = ids[found], np.argmax(isLast[found], axis=1)
+            choices[ids] = self.active_arms[ids, (lastIndex + 1) % nbArms[ids]]
+        # 4) communication phase
+        if self.code('phase', 'Communication') in phases:
+            ids = np.flatnonzero(phase == self.code('phase', 'Communication'))
+            choices[ids] = self.active_arms[ids, self.int_rank[ids]]
+            L, sending = self._communication(ids)
+            ids, L = ids[sending], L[sending]  # your turn to communicate
+            t0 = self.t_phase[ids] % L
+            bit, k0 = self._bitAndArm(ids, t0)
+            k = self.active_arms[ids, k0]
+            sends = ((self.last_phase_stats[ids, k].astype(int) >> bit) % 2) == 1  # has to send the bit
+            ids, bit, k0, k, t0 = ids[sends], bit[sends], k0[sends], k[sends], t0[sends]
+            playerToSendTo = (t0 - bit - (self.round_number[ids] + 2) * k0) // ((self.round_number[ids] + 2) * nbArms[ids])
+            playerToSendTo = (playerToSendTo + (playerToSendTo >= self.int_rank[ids])) % nbArms[ids]
+            choices[ids] = self.active_arms[ids, playerToSendTo]
+            for i in np.flatnonzero(self.verbose[ids]):
+                print('Communicate bit {} about arm {}, at player on arm {}, by player {} at timestep {}'.format(bit[i], k[i], choices[ids[i]], self.ext_rank[ids[i]], self.t_phase[ids[i]]))  # DEBUG
+        return choices
+
+    def getRewards(self, playerIds, arms, rewards, collision=False):
+        """ Update the memories of these players, with one mask for each phase (the changes of phase are delegated to the players)."""
+        if len(playerIds) == 0:
+            return
+        assert np.all((rewards == 0) | (rewards == 1)), "Error: SIC-MMAB works only for binary rewards!"  # DEBUG
+        phase = self.phase[playerIds]
+        phases = set(np.unique(phase).tolist())
+        # the changes of phase are done by the players themselves
+        ending = np.zeros(len(playerIds), dtype=bool)
+        if self.code('phase', 'Fixation') in phases:
+            ending |= (phase == self.code('phase', 'Fixation')) & (self.t[playerIds] == self.Time0[playerIds])
+        if self.code('phase', 'Estimation') in phases:
+            ending |= (phase == self.code('phase', 'Estimation')) & (self.t[playerIds] == self.Time0[playerIds] + 2 * self.nbActiveArms[playerIds])
+        if self.code('phase', 'Communication') in phases:
+            nbPlayers = self.estimatedNbPlayers[playerIds]
+            ending |= (phase == self.code('phase', 'Communication')) & (
+                (self.t_phase[playerIds] + 1 == nbPlayers * (nbPlayers - 1) * self.nbActiveArms[playerIds] * (self.round_number[playerIds] + 2))
+                | (nbPlayers == 1)
+            )
+        if np.any(ending):
+            self.delegate('getReward', playerIds[ending], arms[ending], rewards[ending], np.full(np.count_nonzero(ending), collision))
+            playerIds, arms, rewards, phase = playerIds[~ending], arms[~ending], rewards[~ending], phase[~ending]
+        self.last_action[playerIds] = arms
+        # 1) fixation phase
+        if not collision and self.code('phase', 'Fixation') in phases:
+            ids = playerIds[(phase == self.code('phase', 'Fixation')) & (self.ext_rank[playerIds] == -1)]
+            # successfully fixed, decide the external rank
+            self.ext_rank[ids] = (self.Time0[ids] + self.last_action[ids] - self.t[ids]) % self.nbActiveArms[ids]
+        # 2) estimation phase
+        if collision and self.code('phase', 'Estimation') in phases:  # collision with a player
+            ids = playerIds[phase == self.code('phase', 'Estimation')]
+            # it also increases the internal rank at the same time
+            self.int_rank[ids[self.t[ids] <= self.Time0[ids] + 2 * self.ext_rank[ids]]] += 1
+            self.estimatedNbPlayers[ids] += 1
+        # 3) exploration phase
+        if self.code('phase', 'Exploration') in phases:
+            exploration = phase == self.code('phase', 'Exploration')
+            ids, exploredArms = playerIds[exploration], arms[exploration]
+            self.last_phase_stats[ids, exploredArms] += rewards[exploration]
+            self.rewards[ids, exploredArms] += rewards[exploration]
+            self.t_phase[ids] += 1
+            ids = ids[self.t_phase[ids] == (2 << self.round_number[ids]) * self.nbActiveArms[ids]]
+            self.phase[ids] = self.code('phase', 'Communication')  # end of exploration round
+            self.t_phase[ids] = 0
+        # 4) communication phase
+        if self.code('phase', 'Communication') in phases:
+            ids = playerIds[phase == self.code('phase', 'Communication')]
+            if collision:  # reception case
+                L, sending = self._communication(ids)
+                receiving, L = ids[~sending], L[~sending]
+                bit, k0 = self._bitAndArm(receiving, self.t_phase[receiving] % L)
+                self.rewards[receiving, self.active_arms[receiving, k0]] += 2 ** bit  # Extract ONE bit from actual_time
+            self.t_phase[ids] += 1
+        # End of all the cases
+        self.t[playerIds] += 1
+
+    def handleCollisions(self, playerIds, arms, rewards):
+        """ The players see the collisions and the rewards: the same updates as :meth:`getRewards`, with a collision."""
+        for playerId, arm, reward in zip(playerIds[self.verbose[playerIds]], arms[self.verbose[playerIds]], rewards[self.verbose[playerIds]]):
+            print("A SIC_MMAB player got a collision on arm {} at time {} with reward = {}.".format(arm, self.t[playerId], reward))  # DEBUG
+        self.getRewards(playerIds, arms, rewards, collision=True)
+
+
+#: The banks of the single-player policies handling the collisions by themselves (see :class:`Independent`).
+PHASE_BANKS = [MusicalChairBank, MusicalChairNoSensingBank, MEGABank, TrekkingTSNBank, SIC_MMABBank]
+
+
+def phaseBankOf(mother):
+    """ A bank of the players of this multi-player policy, from the first bank of :data:`PHASE_BANKS` that fits them, or None."""
+    for bank in PHASE_BANKS:
+        if bank.fits(mother._players):
+            return bank(mother)
+    return None
+
+
+# --- Debugging
+
+if __name__ == "__main__":
+    # Code for debugging purposes.
+    from doctest import testmod
+    print("\nTesting automatically all the docstring written in each functions of this module :")
+    testmod(verbose=True)
@@ -0,0 +1,186 @@
+# -*- coding: utf-8 -*-
+r""" PlayerBank: a "bank" of the M players of a decentralized multi-player policy (e.g., :class:`rhoRand`, :class:`RandTopM`, :class:`MCTopM` or :class:`Selfish`), that stores their memories as ``(M, K)`` arrays, in order to compute all their choices at once.
+
+- Each child of such a policy is a :class:`ChildPointer` to a full single-player policy, so the simulator usually asks ``M`` times per step for ``player.choice()``, and each call computes the indexes of one player.
+- If all the players are index policies (see :class:`Policies.IndexPolicy`), the rows of the ``(M, K)`` arrays :attr:`PlayerBank.pulls`, :attr:`PlayerBank.rewards` and :attr:`PlayerBank.index` of the bank *are* the arrays ``pulls``, ``rewards`` and ``index`` of the players, so the indexes of the M players are computed in one vectorized call to :meth:`computeAllIndex` (if it only uses broadcasting numpy operations, see ``Policies.IndexPolicy.allIndexBroadcasts``), and the ranks and choices of all the players are then computed in one step.
+- The policies stay decentralized: the row of a player is only updated by its own observations.
+- A bank is used by the simulator (see ``Environment.EvaluatorMultiPlayers.delayed_play``) in place of the list of children, as it also implements the batched ``getRewards(playerIds, arms, rewards)`` and ``handleCollisions(playerIds, arms, rewards)`` used by the collision models (see :mod:`Environment.CollisionModels`).
+
+Each multi-player policy defines its own bank, inheriting from :class:`PlayerBank` and implementing :meth:`PlayerBank.choices`, :meth:`PlayerBank.getRewards` and :meth:`PlayerBank.handleCollisions` as its children would do (for instance, :class:`rhoRand.rhoRandBank`). It is used if the policy is created with ``bank=True``:
+
+>>> import sys; sys.path.insert(0, '..'); from Policies import *
+>>> import numpy as np; np.random.seed(0)
+>>> from rhoRand import rhoRand
+>>> s = rhoRand(6, 17, UCB, bank=True)
+>>> bank = s.bank
+>>> len(bank), bank[0] is s.children[0]
+(6, True)
+>>> for child in bank:
+...     child.startGame()
+>>> np.shape(bank.choices())
+(6,)
+"""
+from __future__ import division, print_function  # Python 2 compatibility
+
+__author__ = "Lilian Besson"
+__version__ = "0.9"
+
+from copy import copy
+import numpy as np
+from numpy.random import random_sample
+
+
+def definedBy(policy, method):
+    """ Name of the class that defines this method of the policy (or None)."""
+    for klass in type(policy).__mro__:
+        if method in klass.__dict__:
+            return klass.__name__
+    return None
+
+
+def broadcastsOverPlayers(policy):
+    """ True if the method ``computeAllIndex`` of this policy also works on ``(M, K)`` arrays, as told by ``Policies.IndexPolicy.allIndexBroadcastsFor``."""
+    return hasattr(policy, 'allIndexBroadcastsFor') and policy.allIndexBroadcastsFor()
+
+
+def canUseBank(players):
+    """ True if these players can be stored in a :class:`PlayerBank`: they have to be index policies of the same class, that do not change the way an index policy chooses its arms."""
+    if len(players) == 0 or len({type(player) for player in players}) != 1:
+        return False
+    player = players[0]
+    return all(hasattr(player, name) for name in ('pulls', 'rewards', 'index', 'computeAllIndex')) \
+        and all(definedBy(player, method) == 'IndexPolicy' for method in ('choice', 'choiceWithRank', 'estimatedOrder', 'estimatedBestArms'))
+
+
+def randomArgmaxRows(isCandidate):
+    """ For each row of the boolean array ``isCandidate``, choose uniformly at random one of the columns that are candidates (or one of all the columns, if none is).
+
+    >>> np.random.seed(0)
+    >>> randomArgmaxRows(np.array([[False, True, False], [True, True, False], [False, False, False]]))
+    array([1, 0, 2])
+    """
+    return np.argmax(isCandidate + random_sample(np.shape(isCandidate)), axis=1)
+
+
+class PlayerBank(object):
+    r""" A bank of the M players of a multi-player policy, with their memories stored as ``(M, K)`` arrays.
+
+    - It is a sequence of the children of the mother policy (``len(bank)``, ``bank[playerId]``, ``for child in bank``), so it can be used in place of their list.
+    - The memories of the players are bound to the rows of the bank before the first vectorized call, and again after a copy or a pickle of the mother policy (numpy does not keep the views when copying arrays).
+    """
+
+    def __init__(self, mother):
+        self.mother = mother  #: Pointer to the mother policy.
+        self.nbPlayers = len(mother._players)  #: Number of players M.
+        self.nbArms = mother.nbArms  #: Number of arms K.
+        self.pulls = np.zeros((self.nbPlayers, self.nbArms), dtype=int)  #: Number of pulls of each arm, for each player (one row for each player).
+        self.rewards = np.zeros((self.nbPlayers, self.nbArms))  #: Cumulated rewards of each arm, for each player.
+        self.index = np.zeros((self.nbPlayers, self.nbArms))  #: Indexes of each arm, for each player.
+        player = mother._players[0]
+        self._broadcasts = broadcastsOverPlayers(player)  # One vectorized call to computeAllIndex, or one call for each player?
+        self._baseGetReward = definedBy(player, 'getReward') == 'BasePolicy'  # Can the rewards be given in one vectorized step?
+        self._lower = np.array([p.lower for p in mother._players], dtype=float)
+        self._amplitude = np.array([p.amplitude for p in mother._players], dtype=float)
+        self._proxy = None
+        self._bound = False
+
+    def __getstate__(self):
+        """ The views are lost after a copy or a pickle, so the players have to be bound again."""
+        state = self.__dict__.copy()
+        state['_proxy'] = None
+        state['_bound'] = False
+        return state
+
+    def __str__(self):
+        return "PlayerBank({})".format(self.mother)
+
+    # --- The bank as a sequence of children
+
+    def __len__(self):
+        return self.nbPlayers
+
+    def __getitem__(self, playerId):
+        return self.mother.children[playerId]
+
+    def __iter__(self):
+        return iter(self.mother.children)
+
+    # --- Memories of the players
+
+    def bind(self):
+        """ Make the arrays ``pulls``, ``rewards`` and ``index`` of each player be views on its row of the bank (the current values are kept)."""
+        for playerId, player in enumerate(self.mother._players):
+            for name in ('pulls', 'rewards', 'index'):
+                rows = getattr(self, name)
+                rows[playerId] = getattr(player, name)
+                setattr(player, name, rows[playerId])
+        # This fake player sees all the players, so its computeAllIndex computes all the indexes
+        self._proxy = copy(self.mother._players[0])
+        self._proxy.pulls, self._proxy.rewards, self._proxy.index = self.pulls, self.rewards, self.index
+        self._bound = True
+
+    def times(self):
+        """ Internal times of all the players, as a column of shape ``(M, 1)``."""
+        return np.array([[player.t] for player in self.mother._players])
+
+    def computeAllIndex(self):
+        """ Compute the indexes of all the arms for all the players, and return them as a ``(M, K)`` array: with one vectorized call if possible, or one call for each player."""
+        if not self._bound:
+            self.bind()
+        if self._broadcasts:
+            self._proxy.t = self.times()
+            type(self._proxy).computeAllIndex(self._proxy)
+        else:
+            for playerId, player in enumerate(self.mother._players):
+                player.computeAllIndex()
+                self.index[playerId] = player.index
+        return self.index
+
+    def updateRewards(self, playerIds, arms, rewards):
+        """ Give these rewards to the underlying policies of these players: in one vectorized step if they use ``BasePolicy.getReward``, or with one call to ``getReward`` for each player."""
+        if not self._bound:
+            self.bind()
+        if self._baseGetReward:
+            self.pulls[playerIds, arms] += 1
+            self.rewards[playerIds, arms] += (rewards - self._lower[playerIds]) / self._amplitude[playerIds]
+            for playerId in playerIds:
+                self.mother._players[playerId].t += 1
+        else:
+            for playerId, arm, reward in zip(playerIds, arms, rewards):
+                self.mother._players[playerId].getReward(arm, reward)
+
+    # --- Vectorized choices
+
+    def choiceWithRank(self, ranks=1):
+        """ For each player, choose an arm whose index is the rank-th best (uniformly at random among the ties), as ``IndexPolicy.choiceWithRank`` does for one player."""
+        index = self.computeAllIndex()
+        ranks = np.broadcast_to(ranks, (self.nbPlayers,))
+        chosenIndex = np.sort(index, axis=1)[np.arange(self.nbPlayers), self.nbArms - ranks]
+        return randomArgmaxRows(index == chosenIndex[:, np.newaxis])
+
+    def estimatedOrder(self):
+        """ For each player, the estimated order of the arms (by increasing indexes), as a ``(M, K)`` array."""
+        return np.argsort(self.computeAllIndex(), axis=1)
+
+    # --- Interface for the simulator, to be implemented by each multi-player policy
+
+    def choices(self):
+        """ Numpy array of the choices of all the players for this step."""
+        raise NotImplementedError("This method choices() has to be implemented in the class inheriting from PlayerBank.")
+
+    def getRewards(self, playerIds, arms, rewards):
+        """ Give these rewards to these players (who pulled these arms, without collision)."""
+        raise NotImplementedError("This method getRewards(playerIds, arms, rewards) has to be implemented in the class inheriting from PlayerBank.")
+
+    def handleCollisions(self, playerIds, arms, rewards):
+        """ Inform these players of their collisions on these arms (where they observed these rewards)."""
+        raise NotImplementedError("This method handleCollisions(playerIds, arms, rewards) has to be implemented in the class inheriting from PlayerBank.")
+
+
+# --- Debugging
+
+if __name__ == "__main__":
+    # Code for debugging purposes.
+    from doctest import testmod
+    print("\nTesting automatically all the docstring written in each functions of this module :")
+    testmod(verbose=True)
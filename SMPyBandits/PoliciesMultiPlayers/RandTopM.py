@@ -21,9 +21,11 @@ import numpy.random as rn
 try:
     from .BaseMPPolicy import BaseMPPolicy
     from .ChildPointer import ChildPointer
+    from .PlayerBank import PlayerBank, canUseBank, randomArgmaxRows
 except ImportError:
     from BaseMPPolicy import BaseMPPolicy
     from ChildPointer import ChildPointer
+    from PlayerBank import PlayerBank, canUseBank, randomArgmaxRows
 
 
 #: Whether to use or not the variant with the "chair": after using an arm successfully (no collision), a player won't move after future collisions (she assumes the other will move). But she will still change her chosen arm if it lies outside of the estimated M-best. :class:`RandTopM` (and variants) uses `False` and :class:`MCTopM` (and variants) uses `True`.
@@ -177,6 +179,73 @@ class oneRandTopM(ChildPointer):
         return self.mother._players[self.playerId].index
 
 
+# --- Class RandTopMBank, for all the children at once
+
+class RandTopMBank(PlayerBank):
+    """ Bank of all the children of a :class:`RandTopM` policy (or a variant): the state of each player (chosen arm, sitted or not, etc) stays in her child, and only the indexes and the estimates of the M-best arms are computed at once."""
+
+    def choices(self):
+        """ Each player reconsiders her chosen arm, all at once, as in :meth:`oneRandTopM.choice`."""
+        children = self.mother.children
+        maxRank = self.mother.maxRank
+        index = self.computeAllIndex()
+        rows = np.arange(self.nbPlayers)
+        chosen = np.array([-1 if child.chosen_arm is None else child.chosen_arm for child in children])
+        exploring = np.array([child.t < child.nbArms for child in children])  # Force to sample each arm at least one
+        if np.any(exploring):
+            exploringIndex = index[exploring]
+            chosen[exploring] = randomArgmaxRows(exploringIndex == np.max(exploringIndex, axis=1)[:, np.newaxis])
+        if not np.all(exploring):  # But now, trust the estimated set Mbest
+            order = np.argsort(index, axis=1)
+            current_Mbest, worst_current = order[:, -maxRank:], order[:, -maxRank]
+            outside = ~exploring & ~np.any(current_Mbest == chosen[:, np.newaxis], axis=1)
+            if self.mother.exitIfWorstWasPicked:
+                outside |= ~exploring & (chosen == worst_current)
+            for playerId in np.flatnonzero(outside):
+                child = children[playerId]
+                if child._withChair:
+                    child.sitted = False
+                if child._pickWorstFirst:
+                    chosen[playerId] = worst_current[playerId]
+                elif child._pickPrevWorstFirst:
+                    # Same as child.worst_previous__and__current_Mbest(), without computing again the M-best
+                    prev_WorstThenChair = np.intersect1d(current_Mbest[playerId], child.prevWorst)
+                    chosen[playerId] = rn.choice(prev_WorstThenChair if len(prev_WorstThenChair) > 0 else current_Mbest[playerId])
+                else:
+                    chosen[playerId] = rn.choice(current_Mbest[playerId])  # New random arm
+        # Done
+        for child, arm in zip(children, chosen):
+            child.chosen_arm = arm
+            child.t += 1
+        if self.mother.pickPrevWorstFirst:
+            isPrevWorst = index <= index[rows, chosen][:, np.newaxis]
+            allPrevWorst = np.split(np.nonzero(isPrevWorst)[1], np.cumsum(np.sum(isPrevWorst, axis=1))[:-1])
+            for child, prevWorst in zip(children, allPrevWorst):
+                child.prevWorst = prevWorst
+        return chosen
+
+    def getRewards(self, playerIds, arms, rewards):
+        """ Give these rewards to the underlying policies of these players, who sit down if they play with a chair."""
+        self.updateRewards(playerIds, arms, rewards)
+        children = self.mother.children
+        for playerId in playerIds:
+            child = children[playerId]
+            if child._withChair and child.t >= child.nbArms:
+                child.sitted = True
+
+    def handleCollisions(self, playerIds, arms, rewards):
+        """ The underlying policies of these players learn these rewards, and the players who are not sitted get a new random arm from their current estimate of Mbest."""
+        self.updateRewards(playerIds, arms, rewards)
+        children = self.mother.children
+        moving = np.array([playerId for playerId in playerIds if not (children[playerId]._withChair and children[playerId].sitted)], dtype=int)
+        if len(moving) > 0:
+            maxRank = self.mother.maxRank
+            current_Mbest = np.argsort(self.computeAllIndex()[moving], axis=1)[:, -maxRank:]
+            newArms = current_Mbest[np.arange(len(moving)), rn.randint(maxRank, size=len(moving))]  # New random arms
+            for playerId, arm in zip(moving, newArms):
+                children[playerId].chosen_arm = arm
+
+
 # --- Class RandTopM
 
 class RandTopM(BaseMPPolicy):
@@ -199,6 +268,7 @@ class RandTopM(BaseMPPolicy):
         - exitIfWorstWasPicked: see ``EXIT_IF_WORST_WAS_PICKED``,
         - pickPrevWorstFirst: see ``OPTIM_PICK_PREV_WORST_FIRST``,
         - maxRank: maximum rank allowed by the RandTopM child (default to nbPlayers, but for instance if there is 2 × RandTopM[UCB] + 2 × RandTopM[klUCB], maxRank should be 4 not 2).
+        - bank: (keyword only) if True (and if the players are index policies), all the players are stored in a :class:`RandTopMBank`, in order to compute their choices at once (see :mod:`PlayerBank`). It is also accepted by all the variants, like :class:`MCTopM`.
         - `*args`, `**kwargs`: arguments, named arguments, given to playerAlgo.
 
         Example:
@@ -216,6 +286,7 @@ class RandTopM(BaseMPPolicy):
         .. warning:: ``s._players`` is for internal use ONLY!
         """
         assert nbPlayers > 0, "Error, the parameter 'nbPlayers' for RandTopM class has to be > 0."  # DEBUG
+        bank = kwargs.pop('bank', False)  # Keyword only, it is not given to playerAlgo
         if maxRank is None:
             maxRank = nbPlayers
         self.maxRank = maxRank  #: Max rank, usually nbPlayers but can be different
@@ -230,6 +301,7 @@ class RandTopM(BaseMPPolicy):
         for playerId in range(nbPlayers):
             self._players[playerId] = playerAlgo(nbArms, *args, lower=lower, amplitude=amplitude, **kwargs)
             self.children[playerId] = oneRandTopM(maxRank, withChair, pickWorstFirst, exitIfWorstWasPicked, pickPrevWorstFirst, self, playerId)
+        self.bank = RandTopMBank(self) if bank and canUseBank(self._players) else None  #: :class:`RandTopMBank` of the players, or None.
 
     def __str__(self):
         return "RandTopM({} x {})".format(self.nbPlayers, str(self._players[0]))
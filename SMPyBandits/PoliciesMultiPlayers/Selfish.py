@@ -9,12 +9,16 @@ from __future__ import division, print_function  # Python 2 compatibility
 __author__ = "Lilian Besson"
 __version__ = "0.5"
 
+import numpy as np
+
 try:
     from .BaseMPPolicy import BaseMPPolicy
     from .ChildPointer import ChildPointer
+    from .PlayerBank import PlayerBank, canUseBank
 except ImportError:
     from BaseMPPolicy import BaseMPPolicy
     from ChildPointer import ChildPointer
+    from PlayerBank import PlayerBank, canUseBank
 
 
 class SelfishChildPointer(ChildPointer):
@@ -36,6 +40,23 @@ class SelfishChildPointer(ChildPointer):
 PENALTY = None
 
 
+class SelfishBank(PlayerBank):
+    """ Bank of all the children of a :class:`Selfish` policy: each player aims at her best arm."""
+
+    def choices(self):
+        """ Each player chooses her best arm, all at once."""
+        return self.choiceWithRank(1)
+
+    def getRewards(self, playerIds, arms, rewards):
+        """ Give these rewards to the underlying policies of these players."""
+        self.updateRewards(playerIds, arms, rewards)
+
+    def handleCollisions(self, playerIds, arms, rewards):
+        """ Give a reward of 0, or player.lower, or self.penalty, to these players (the observed rewards are not used)."""
+        penalty = self.mother.penalty
+        self.updateRewards(playerIds, arms, self._lower[playerIds] if penalty is None else np.full(len(playerIds), penalty, dtype=float))
+
+
 class Selfish(BaseMPPolicy):
     """ Selfish: a multi-player policy where every player is selfish, playing on their side.
 
@@ -48,6 +69,7 @@ class Selfish(BaseMPPolicy):
         - nbPlayers: number of players to create (in self._players).
         - playerAlgo: class to use for every players.
         - nbArms: number of arms, given as first argument to playerAlgo.
+        - bank: (keyword only) if True (and if the players are index policies), all the players are stored in a :class:`SelfishBank`, in order to compute their choices at once (see :mod:`PlayerBank`).
         - `*args`, `**kwargs`: arguments, named arguments, given to playerAlgo.
 
         Examples:
@@ -68,6 +90,7 @@ class Selfish(BaseMPPolicy):
         .. warning:: I want my code to stay compatible with Python 2, so I cannot use the `new syntax of keyword-only argument <https://www.python.org/dev/peps/pep-3102/>`_. It would make more sense to have ``*args, penalty=PENALTY, lower=0., amplitude=1., **kwargs`` instead of ``penalty=PENALTY, lower=0., amplitude=1., *args, **kwargs`` but I can't.
         """
         assert nbPlayers > 0, "Error, the parameter 'nbPlayers' for Selfish class has to be > 0."
+        bank = kwargs.pop('bank', False)  # Keyword only, it is not given to playerAlgo
         self.nbPlayers = nbPlayers  #: Number of players
         self.penalty = penalty  #: Penalty = reward given in case of collision
         self._players = [None] * nbPlayers
@@ -79,6 +102,7 @@ class Selfish(BaseMPPolicy):
             if hasattr(self._players[playerId], 'handleCollision'):  # XXX they should not have such method!
                 print("Warning: Selfish found a player #{} which has a method 'handleCollision' : Selfish should NOT be used with bandit algorithms aware of collision-avoidance!".format(playerId))  # DEBUG
                 # raise ValueError("Invalid child policy {} for Selfish algorithm! It should not have a collision avoidance protocol!".format(self._players[playerId]))
+        self.bank = SelfishBank(self) if bank and canUseBank(self._players) else None  #: :class:`SelfishBank` of the players, or None.
 
     def __str__(self):
         return "Selfish({} x {})".format(self.nbPlayers, str(self._players[0]))
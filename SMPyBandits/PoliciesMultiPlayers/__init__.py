@@ -15,6 +15,9 @@
 - :class:`rhoCentralized` is a semi-centralized version where orthogonal ranks 1..M are given to the players, instead of just giving them the value of M, but a decentralized learning policy is still used to learn the best arms.
 - :class:`RandTopM` is another approach, similar to :class:`rhoRandSticky` and :class:`MusicalChair`, but we hope it will be better, and we succeed in analyzing more easily.
 
+- :class:`PlayerBank`: with ``bank=True``, :class:`Selfish`, :class:`rhoRand`, :class:`RandTopM` (and its variants, like :class:`MCTopM`) and :class:`ALOHA` store the memories of their M players as ``(M, K)`` arrays, and the simulator computes all the choices at once.
+- :class:`Independent` and :class:`PhaseBank`: the players of the collision-aware policies (:class:`Policies.MusicalChair`, :class:`Policies.MusicalChairNoSensing`, :class:`Policies.MEGA`, :class:`Policies.TrekkingTSN` and :class:`Policies.SIC_MMAB`) are independent, and with ``bank=True`` their phases and counters are stored as arrays, and the simulator advances all their state machines at once.
+
 
 All policies have the same interface, as described in :class:`BaseMPPolicy` for decentralized policies,
 and :class:`BaseCentralizedPolicy` for centralized policies,
@@ -43,6 +46,13 @@ __version__ = "0.8"
 # Mine, fully decentralized one
 from .Selfish import Selfish
 
+# Bank of the players of one policy, to compute all their choices at once
+from .PlayerBank import PlayerBank
+
+# Independent players of the collision-aware policies, and the bank of their state machines
+from .Independent import Independent
+from .PhaseBank import PhaseBank
+
 # Mine, centralized ones (but only knowledge of nbArms)
 from .CentralizedFixed import CentralizedFixed
 from .CentralizedCycling import CentralizedCycling
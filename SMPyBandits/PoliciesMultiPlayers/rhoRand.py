@@ -14,14 +14,17 @@ from __future__ import division, print_function  # Python 2 compatibility
 __author__ = "Lilian Besson"
 __version__ = "0.5"
 
+import numpy as np
 import numpy.random as rn
 
 try:
     from .BaseMPPolicy import BaseMPPolicy
     from .ChildPointer import ChildPointer
+    from .PlayerBank import PlayerBank, canUseBank
 except ImportError:
     from BaseMPPolicy import BaseMPPolicy
     from ChildPointer import ChildPointer
+    from PlayerBank import PlayerBank, canUseBank
 
 
 # --- Class oneRhoRand, for children
@@ -65,6 +68,27 @@ class oneRhoRand(ChildPointer):
         return result
 
 
+# --- Class rhoRandBank, for all the children at once
+
+class rhoRandBank(PlayerBank):
+    """ Bank of all the children of a :class:`rhoRand` policy: each player aims at the arm of her rank, and her rank stays in her child (``child.rank``)."""
+
+    def choices(self):
+        """ Each player chooses an arm with her current rank, all at once."""
+        return self.choiceWithRank(np.array([child.rank for child in self.mother.children]))
+
+    def getRewards(self, playerIds, arms, rewards):
+        """ Give these rewards to the underlying policies of these players."""
+        self.updateRewards(playerIds, arms, rewards)
+
+    def handleCollisions(self, playerIds, arms, rewards):
+        """ The underlying policies of these players learn these rewards, and these players get new fully random ranks."""
+        self.updateRewards(playerIds, arms, rewards)
+        children = self.mother.children
+        for playerId in playerIds:
+            children[playerId].rank = 1 + rn.randint(children[playerId].maxRank)  # New random rank
+
+
 # --- Class rhoRand
 
 class rhoRand(BaseMPPolicy):
@@ -79,6 +103,7 @@ class rhoRand(BaseMPPolicy):
         - playerAlgo: class to use for every players.
         - nbArms: number of arms, given as first argument to playerAlgo.
         - maxRank: maximum rank allowed by the rhoRand child (default to nbPlayers, but for instance if there is 2 × rhoRand[UCB] + 2 × rhoRand[klUCB], maxRank should be 4 not 2).
+        - bank: (keyword only) if True (and if the players are index policies), all the players are stored in a :class:`rhoRandBank`, in order to compute their choices at once (see :mod:`PlayerBank`).
         - `*args`, `**kwargs`: arguments, named arguments, given to playerAlgo.
 
         Example:
@@ -93,10 +118,19 @@ class rhoRand(BaseMPPolicy):
         >>> [ child.choice() for child in s.children ]
         [9, 4, 6, 12, 1, 6]
 
+        With a bank, the choices of all the players are computed at once (with the same distribution, but not the same random numbers):
+
+        >>> s = rhoRand(nbPlayers, nbArms, UCB, bank=True)
+        >>> for child in s.bank:
+        ...     child.startGame()
+        >>> s.bank.choices()
+        array([5, 6, 3, 6, 6, 3])
+
         - To get a list of usable players, use ``s.children``.
         - Warning: ``s._players`` is for internal use ONLY!
         """
         assert nbPlayers > 0, "Error, the parameter 'nbPlayers' for rhoRand class has to be > 0."
+        bank = kwargs.pop('bank', False)  # Keyword only, it is not given to playerAlgo
         if maxRank is None:
             maxRank = nbPlayers
         self.maxRank = maxRank  #: Max rank, usually nbPlayers but can be different
@@ -107,9 +141,10 @@ class rhoRand(BaseMPPolicy):
         for playerId in range(nbPlayers):
             self._players[playerId] = playerAlgo(nbArms, *args, lower=lower, amplitude=amplitude, **kwargs)
             self.children[playerId] = oneRhoRand(maxRank, self, playerId)
+        self.bank = rhoRandBank(self) if bank and canUseBank(self._players) else None  #: :class:`rhoRandBank` of the players, or None.
 
     def __str__(self):
-        return "rhoRand({} x {}{})".format(self.nbPlayers, str(self._players[0]))
+        return "rhoRand({} x {})".format(self.nbPlayers, str(self._players[0]))
 
 
 # --- Debugging
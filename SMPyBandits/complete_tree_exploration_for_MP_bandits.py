@@ -11,12 +11,13 @@ Features:
 
 - For the means of each arm, :math:`\mu_1, \dots, \mu_K`, this script can use exact formal computations with sympy, or fractions with Fraction, or float number.
 - The graph can contain all nodes from root to leafs, or only leafs (with summed probabilities), and possibly only the absorbing nodes are showed.
+- The leafs can be computed without building the tree, level by level, by merging the equal states of each depth (a transposition table), possibly with a pool of processes, and with float probabilities to go faster.
 - Support export of the tree to a GraphViz dot graph, and can save it to SVG/PNG and LaTeX (with Tikz) and PDF etc.
 - By default, the root is highlighted in green and the absorbing nodes are in red.
 
 .. warning:: I still have to fix these issues:
 
-   - TODO : right now, it is not so efficient, could it be improved? I don't think I can do anything in a smarter way, in pure Python.
+   - TODO : building the whole tree is not so efficient, prefer the memoized exploration (``MEMOIZED=True``) if only the leafs are needed.
 
 
 Requirements:
@@ -47,6 +48,7 @@ __version__ = "0.7"
 from collections import Counter, deque
 from fractions import Fraction
 from itertools import product
+from multiprocessing import cpu_count
 from os import getenv, chdir, getcwd
 from os.path import join as os_path_join
 from os.path import dirname, basename
@@ -85,6 +87,7 @@ if version_info.major < 3:  # Python 2 compatibility if needed
 PLOT_DIR = os_path_join("plots", "trees")  #: Directory for the plots
 
 from Arms.usenumba import jit
+from Environment.usejoblib import USE_JOBLIB, Parallel, delayed
 
 def tupleit1(anarray):
     """Convert a non-hashable 1D numpy array to a hashable tuple."""
@@ -124,6 +127,15 @@ CONCISE = mybool(getenv('CONCISE', CONCISE))
 FULLHASH = not CONCISE  #: Use only Stilde, N for hashing the states.
 FULLHASH = mybool(getenv('FULLHASH', FULLHASH))
 
+MEMOIZED = True  #: By default, compute only the leafs, level by level, by merging the equal states of each depth (see :meth:`State.explore_leafs_to_depth`).
+MEMOIZED = mybool(getenv('MEMOIZED', MEMOIZED))
+
+N_JOBS = 1  #: Number of processes used to expand the states of each level, for the memoized exploration.
+N_JOBS = int(getenv('N_JOBS', N_JOBS))
+
+NUMERIC = False  #: By default, use formal means and probabilities. If True, use float means and probabilities, which is much faster.
+NUMERIC = mybool(getenv('NUMERIC', NUMERIC))
+
 # FORMAT = "pdf"  #: Format used to save the graphs.
 FORMAT = "svg"  #: Format used to save the graphs.
 FORMAT = getenv("FORMAT", FORMAT)
@@ -597,6 +609,20 @@ def proba2str(proba, latex=False, html_in_var_names=False):
     return str_proba
 
 
+def merge_equal_leafs(complete_probas, leafs):
+    """Merge the equal leafs (with the same hash) and sum their probabilities."""
+    uniq_complete_probas = dict()
+    uniq_leafs = dict()
+    for proba, leaf in zip(complete_probas, leafs):
+        h = hash(leaf)
+        if h in uniq_leafs:
+            uniq_complete_probas[h] += proba
+        else:
+            uniq_complete_probas[h] = proba
+            uniq_leafs[h] = leaf
+    return [simplify(p) for p in uniq_complete_probas.values()], list(uniq_leafs.values())
+
+
 # --- Transform .tex to .pdf
 
 def tex2pdf(filename):
@@ -644,6 +670,7 @@ class State(object):
         assert len(mus) == self.K, "Error: 'mus' list is not of size K ..."  # DEBUG
         self.children = []  #: list of next state, representing all the possible transitions
         self.probas = []  #: probabilities of transitions
+        self.unique_leafs = None  #: probabilities and unique leafs, if they were computed without the tree (see :meth:`explore_leafs_to_depth`)
 
     # --- Utility
 
@@ -798,6 +825,7 @@ class State(object):
     def explore_from_node_to_depth(self, depth=1):
         """Compute recursively the one_depth children of the root and its children."""
         print("\nFor depth = {}, exploring from this node :\n{}".format(depth, self))  # DEBUG
+        self.unique_leafs = None
         if depth == 0:
             return
         self.compute_one_depth()
@@ -827,6 +855,45 @@ class State(object):
         self.children = list(uniq_children.values())
         # Done for computing all the children and probability of transitions
 
+    # --- Level-synchronous exploration, with a transposition table
+
+    def key(self):
+        """Key of the state, to merge the equal states of one depth: unlike :meth:`__hash__`, it uses all of S, Stilde, N, Ntilde, so two states with the same key have the same subtree."""
+        return (tupleit2(self.S), tupleit2(self.Stilde), tupleit2(self.N), tupleit2(self.Ntilde))
+
+    def explore_leafs_to_depth(self, depth=1, n_jobs=N_JOBS):
+        """Compute the unique leafs at this depth and their probabilities, level by level, without storing the tree.
+
+        - The equal states of each depth are merged (with :meth:`key`) and their probabilities are summed, so each state is expanded once, instead of once for each path reaching it (as in :meth:`explore_from_node_to_depth`), and only two levels are kept in memory.
+        - If ``n_jobs != 1``, the states of each level are expanded by a pool of processes (with joblib).
+        - The leafs are merged as in :meth:`get_unique_leafs`, and kept in :attr:`unique_leafs`.
+        """
+        print("\nFor depth = {}, exploring level by level from this node :\n{}".format(depth, self))  # DEBUG
+        level = {self.key(): [self.copy(), 1]}
+        for _ in range(depth):
+            states = list(level.values())
+            if USE_JOBLIB and n_jobs != 1 and len(states) > 1:
+                # a few chunks for each process, to balance the work
+                nbChunks = min(len(states), 4 * (cpu_count() if n_jobs < 0 else n_jobs))
+                tables = Parallel(n_jobs=n_jobs)(delayed(expand_states)(states[i::nbChunks]) for i in range(nbChunks))
+            else:
+                tables = [expand_states(states)]
+            level = tables[0]
+            for table in tables[1:]:
+                for key, (child, proba) in table.items():
+                    if key in level:
+                        level[key][1] += proba
+                    else:
+                        level[key] = [child, proba]
+            for child_and_proba in level.values():
+                child_and_proba[1] = simplify(child_and_proba[1])
+            print("   at depth {} we saw {} different unique states...".format(states[0][0].t + 1, len(level)))
+        self.depth = depth
+        leafs = [child for child, _ in level.values()]
+        complete_probas = [proba for _, proba in level.values()]
+        self.unique_leafs = merge_equal_leafs(complete_probas, leafs)
+        return self.unique_leafs
+
     def all_absorbing_states(self, depth=1):
         """Generator that yields all the absorbing nodes of the tree, one by one.
 
@@ -934,17 +1001,9 @@ class State(object):
 
     def get_unique_leafs(self):
         """Compute all the leafs (deepest children) and merge the common one to compute their full probabilities."""
-        uniq_complete_probas = dict()
-        uniq_leafs = dict()
-        complete_probas, leafs = self.get_all_leafs()
-        for proba, leaf in zip(complete_probas, leafs):
-            h = hash(leaf)
-            if h in uniq_leafs:
-                uniq_complete_probas[h] += proba
-            else:
-                uniq_complete_probas[h] = proba
-                uniq_leafs[h] = leaf
-        return [simplify(p) for p in uniq_complete_probas.values()], list(uniq_leafs.values())
+        if self.unique_leafs is not None:
+            return self.unique_leafs
+        return merge_equal_leafs(*self.get_all_leafs())
 
     def proba_reaching_absorbing_state(self):
         """Compute the probability of reaching a leaf that is an absorbing state."""
@@ -997,6 +1056,10 @@ class StateWithMemory(State):
             # return hash(tupleit2(self.S) + tupleit2(self.N) + tupleit1(self.memories))  # if U is used instead of Utilde
             return hash(tupleit2(self.Stilde)) + hash(tupleit2(self.N)) + hash(tupleit1(self.memories))
 
+    def key(self):
+        """Key of the state, to merge the equal states of one depth: S, Stilde, N, Ntilde and the memories of the players."""
+        return super(StateWithMemory, self).key() + (tupleit1(self.memories), )
+
     def is_absorbing(self):
         """Try to detect if this state is absorbing, ie only one transition is possible, and again infinitely for the only child.
 
@@ -1042,15 +1105,32 @@ class StateWithMemory(State):
                     yield (delta, proba)
 
 
+def expand_states(states_and_probas):
+    """Expand these states of one level (given with their probabilities): return their children, merged in a dictionary ``key: [child, probability]`` (used by :meth:`State.explore_leafs_to_depth`, possibly in another process)."""
+    children = dict()
+    for state, proba in states_and_probas:
+        for delta, proba_of_delta in state.all_deltas():
+            child = delta(state.copy())
+            child.depth = 0
+            key = child.key()
+            if key in children:
+                children[key][1] += proba * proba_of_delta
+            else:
+                children[key] = [child, proba * proba_of_delta]
+    return children
+
+
 # --- Main function
 
-def main(depth=1, players=None, update_memories=None, mus=None, M=2, K=2, S=None, Stilde=None, N=None, Ntilde=None, find_only_N=None):
+def main(depth=1, players=None, update_memories=None, mus=None, M=2, K=2, S=None, Stilde=None, N=None, Ntilde=None, find_only_N=None, memoized=MEMOIZED, n_jobs=N_JOBS, numeric=NUMERIC):
     """Compute all the transitions, and print them."""
     if S is not None:
         M = min(np.shape(S))
         K = max(np.shape(S))
     if mus is None:
-        mus = symbol_means(K=K)
+        mus = uniform_means(nbArms=K) if numeric else symbol_means(K=K)
+    elif numeric:
+        mus = [float(proba2float(mu, K=len(mus))) for mu in mus]
     K = len(mus)
     if players is None:
         players = [default_policy for _ in range(M)]
@@ -1091,12 +1171,16 @@ def main(depth=1, players=None, update_memories=None, mus=None, M=2, K=2, S=None
         for proba, bad_child in zip(complete_probas, leafs):
             print("At depth {}, this node was found to be absorbing with probability {}:\n{}".format(bad_child.t, proba, bad_child))
     else:
-        # Explore from the root
-        root.explore_from_node_to_depth(depth=depth)
-        # Print everything
-        # root.pretty_print_result_recursively()
-        # Get all leafs
-        complete_probas, leafs = root.get_unique_leafs()
+        if memoized:
+            # Explore from the root, level by level, and get the unique leafs
+            complete_probas, leafs = root.explore_leafs_to_depth(depth=depth, n_jobs=n_jobs)
+        else:
+            # Explore from the root
+            root.explore_from_node_to_depth(depth=depth)
+            # Print everything
+            # root.pretty_print_result_recursively()
+            # Get all leafs
+            complete_probas, leafs = root.get_unique_leafs()
         print("\n\n\nThere are {} unique leafs for depth {}...".format(len(leafs), depth))
         for proba, leaf in zip(complete_probas, leafs):
             print("\n Leaf with probability = {}:\n{}".format(proba, leaf))
@@ -1121,7 +1205,7 @@ def main(depth=1, players=None, update_memories=None, mus=None, M=2, K=2, S=None
 
 # --- Main script
 
-def test(depth=1, M=2, K=2, S=None, Stilde=None, N=None, Ntilde=None, mus=None, debug=True, all_players=None, all_update_memories=None, find_only_N=None):
+def test(depth=1, M=2, K=2, S=None, Stilde=None, N=None, Ntilde=None, mus=None, debug=True, all_players=None, all_update_memories=None, find_only_N=None, memoized=MEMOIZED, n_jobs=N_JOBS, numeric=NUMERIC):
     """Test the main exploration function for various all_players."""
     results = []
     if all_players is None:
@@ -1132,7 +1216,7 @@ def test(depth=1, M=2, K=2, S=None, Stilde=None, N=None, Ntilde=None, mus=None,
         players = [ policy for _ in range(M) ]
         update_memories = [ update_memory for _ in range(M) ] if update_memory is not None else None
         # get the result
-        root, complete_probas, leafs = main(depth=depth, players=players, update_memories=update_memories, S=S, N=N, Stilde=Stilde, Ntilde=Ntilde, M=M, K=K, mus=mus, find_only_N=find_only_N)
+        root, complete_probas, leafs = main(depth=depth, players=players, update_memories=update_memories, S=S, N=N, Stilde=Stilde, Ntilde=Ntilde, M=M, K=K, mus=mus, find_only_N=find_only_N, memoized=memoized, n_jobs=n_jobs, numeric=numeric)
         if find_only_N is None:
             # computing absorbing states
             nb_absorbing, bad_proba = root.proba_reaching_absorbing_state()
@@ -1140,6 +1224,7 @@ def test(depth=1, M=2, K=2, S=None, Stilde=None, N=None, Ntilde=None, mus=None,
             for onlyabsorbing, onlyleafs in product((True, False), (True, False)):
                 if nb_absorbing == 0 and onlyabsorbing:  continue
                 if depth == 1 and onlyleafs:  continue
+                if not onlyleafs and root.unique_leafs is not None:  continue  # the tree was not stored
                 for latex, ext in ((True, 'svg'), (False, 'svg')):  # , (False, 'png')
                     try:
                         filename = "Tree_exploration_K={}_M={}_depth={}__{}{}{}{}.gv".format(
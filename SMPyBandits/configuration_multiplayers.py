@@ -254,9 +254,11 @@ configuration["successive_players"] = [
     [ SIC_MMAB(nbArms, HORIZON) for _ in range(NB_PLAYERS) ],
     [ SIC_MMAB_UCB(nbArms, HORIZON) for _ in range(NB_PLAYERS) ],
     [ SIC_MMAB_klUCB(nbArms, HORIZON) for _ in range(NB_PLAYERS) ],
+    # Independent(NB_PLAYERS, nbArms, SIC_MMAB, horizon=HORIZON, bank=True).children,  # XXX same players, advanced at once by a bank
 
     # # XXX stupid version with fixed T0 : cannot adapt to any problem
     # [ TrekkingTSN(nbArms, theta=0.1, epsilon=0.1, delta=0.1) for _ in range(NB_PLAYERS) ],
+    # Independent(NB_PLAYERS, nbArms, TrekkingTSN, theta=0.1, epsilon=0.1, delta=0.1, bank=True).children,  # XXX same players, advanced at once by a bank
     # # FIXME test this new TrekkingTSN algorithm!
 
     # ---- rhoRand etc
@@ -329,6 +331,7 @@ configuration["successive_players"] = [
 
     # --- FIXME MusicalChairNoSensing (selfish), a better Musical Chair
     # [ MusicalChairNoSensing(nbPlayers=NB_PLAYERS, nbArms=nbArms, horizon=HORIZON) for _ in range(NB_PLAYERS) ],
+    # Independent(NB_PLAYERS, nbArms, partial(MusicalChairNoSensing, NB_PLAYERS), horizon=HORIZON, bank=True).children,  # XXX same players, advanced at once by a bank (from functools import partial)
 
     # # --- 22) Comparing Selfish, rhoRand, rhoLearn, RandTopM for klUCB, and estimating M
     # # CentralizedMultiplePlay(NB_PLAYERS, nbArms, EmpiricalMeans).children,
@@ -343,12 +346,14 @@ configuration["successive_players"] = [
     # # XXX By trial and error??
     # # d should be smaller than the gap Delta = mu_M* - mu_(M-1)* (gap between Mbest and Mworst)
     # [ MEGA(nbArms, p0=0.1, alpha=0.1, beta=0.5, c=0.1, d=0.99*GAP) for _ in range(NB_PLAYERS) ],  # XXX always linear regret!
+    # Independent(NB_PLAYERS, nbArms, MEGA, p0=0.1, alpha=0.1, beta=0.5, c=0.1, d=0.99*GAP, bank=True).children,  # XXX same players, advanced at once by a bank
 
     # # XXX stupid version with fixed T0 : cannot adapt to any problem
     # [ MusicalChair(nbArms, Time0=1000) for _ in range(NB_PLAYERS) ],
     [ MusicalChair(nbArms, Time0=50*NB_ARMS) for _ in range(NB_PLAYERS) ],
     [ MusicalChair(nbArms, Time0=100*NB_ARMS) for _ in range(NB_PLAYERS) ],
     [ MusicalChair(nbArms, Time0=150*NB_ARMS) for _ in range(NB_PLAYERS) ],
+    # Independent(NB_PLAYERS, nbArms, MusicalChair, Time0=50*NB_ARMS, bank=True).children,  # XXX same players, advanced at once by a bank
     # # # XXX cheated version, with known gap (epsilon < Delta) and proba of success 5% !
     # [ MusicalChair(nbArms, Time0=optimalT0(nbArms=NB_ARMS, epsilon=0.99*GAP, delta=0.5)) for _ in range(NB_PLAYERS) ],
     # [ MusicalChair(nbArms, Time0=optimalT0(nbArms=NB_ARMS, epsilon=0.99*GAP, delta=0.1)) for _ in range(NB_PLAYERS) ],
@@ -390,6 +395,7 @@ configuration["successive_players"] = [
 # ] + [
 #     ALOHA(NB_PLAYERS, nbArms, BayesUCB, p0=p0, alpha_p0=alpha_p0, beta=beta).children
 #     # ALOHA(NB_PLAYERS, nbArms, BayesUCB, p0=p0, alpha_p0=alpha_p0, ftnext=tnext_log).children,
+#     # ALOHA(NB_PLAYERS, nbArms, BayesUCB, p0=p0, alpha_p0=alpha_p0, beta=beta, bank=True).children,  # XXX same players, choices computed at once by a bank
 #     for alpha_p0, beta in product([0.05, 0.25, 0.5, 0.75, 0.95], repeat=2)
 #     # for alpha_p0, beta in product([0.1, 0.5, 0.9], repeat=2)
 # ]
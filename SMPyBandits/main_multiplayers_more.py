@@ -20,13 +20,13 @@ import pickle
 
 # Local imports
 try:
-    from Environment import EvaluatorMultiPlayers, notify, start_tracemalloc, display_top_tracemalloc
+    from Environment import EvaluatorMultiPlayers, startAllEvaluators, notify, start_tracemalloc, display_top_tracemalloc
     if 'configuration_multiplayers_with_aggregation' in sys.argv:
         from configuration_multiplayers_with_aggregation import configuration
     else:
         from configuration_multiplayers import configuration
 except ImportError:
-    from SMPyBandits.Environment import EvaluatorMultiPlayers, notify, start_tracemalloc, display_top_tracemalloc
+    from SMPyBandits.Environment import EvaluatorMultiPlayers, startAllEvaluators, notify, start_tracemalloc, display_top_tracemalloc
     if 'configuration_multiplayers_with_aggregation' in sys.argv:
         from SMPyBandits.configuration_multiplayers_with_aggregation import configuration
     else:
@@ -106,7 +106,8 @@ if __name__ == '__main__':
     N_players = len(configuration["successive_players"])
 
     # List to keep all the EvaluatorMultiPlayers objects
-    evaluators = [[None] * N_players] * len(configuration["environment"])
+    evaluators = [[None] * N_players for _ in configuration["environment"]]
+    evaluations, hashvalues = [], []
 
     for playersId, players in enumerate(configuration["successive_players"]):
         print("\n\n\nConsidering the list of players :\n", players)  # DEBUG
@@ -114,250 +115,246 @@ if __name__ == '__main__':
         configuration['players'] = players
 
         # (almost) unique hash from the configuration
-        hashvalue = abs(hash((tuple(configuration.keys()), tuple([(len(k) if isinstance(k, (dict, tuple, list)) else k) for k in configuration.values()]))))
-        evaluation = EvaluatorMultiPlayers(configuration)
+        hashvalues.append(abs(hash((tuple(configuration.keys()), tuple([(len(k) if isinstance(k, (dict, tuple, list)) else k) for k in configuration.values()])))))
+        # Each evaluator keeps its own copy of the configuration, as they are all started at the end
+        evaluations.append(EvaluatorMultiPlayers(dict(configuration)))
 
-        # Start the evaluation and then print final ranking and plot, for each environment
+    if debug_memory: start_tracemalloc()  # DEBUG
+
+    # Start the evaluation of all the lists of players on all the environments, with one pool of tasks, and then print final ranking and plot, as soon as each one is finished
+    for playersId, envId in startAllEvaluators(evaluations, n_jobs=configuration['n_jobs'], verbosity=configuration['verbosity']):
+        evaluation, hashvalue = evaluations[playersId], hashvalues[playersId]
+        env = evaluation.envs[envId]
         M = evaluation.nbPlayers
         N = len(evaluation.envs)
+        if do_comparison_plots:
+            evaluators[envId][playersId] = evaluation
+
+        # Display the final rankings for that env
+        print("\nGiving the final ranks for the list of players #{} ...".format(playersId + 1))
+        evaluation.printFinalRanking(envId)
+        print("\nGiving the vector of final regrets ...")
+        evaluation.printLastRegrets(envId)
+        print("\nGiving the mean and std running times ...")
+        evaluation.printRunningTimes(envId)
+        print("\nGiving the mean and std memory consumption ...")
+        evaluation.printMemoryConsumption(envId)
+        if debug_memory: display_top_tracemalloc()  # DEBUG
 
-        for envId, env in enumerate(evaluation.envs):
-            # # Plot histogram for rewards for that env
-            # if do_simple_plots and interactive:
-            #     env.plotHistogram(evaluation.horizon * evaluation.repetitions)
-
-            if debug_memory: start_tracemalloc()  # DEBUG
-
-            # Evaluate just that env
-            evaluation.startOneEnv(envId, env)
-            if do_comparison_plots:
-                evaluators[envId][playersId] = evaluation
-
-            # Display the final rankings for that env
-            print("\nGiving the final ranks ...")
-            evaluation.printFinalRanking(envId)
-            print("\nGiving the vector of final regrets ...")
-            evaluation.printLastRegrets(envId)
-            print("\nGiving the mean and std running times ...")
-            evaluation.printRunningTimes(envId)
-            print("\nGiving the mean and std memory consumption ...")
-            evaluation.printMemoryConsumption(envId)
-            if debug_memory: display_top_tracemalloc()  # DEBUG
-
-            # Sub folder with a useful name
-            subfolder = "MP__K{}_M{}_T{}_N{}__{}_algos".format(env.nbArms, M, configuration['horizon'], configuration['repetitions'], N_players)
-            # Get the name of the output file
-            imagename = "main____env{}-{}_{}".format((playersId + envId * N_players) + 1, N * N_players, hashvalue)
-            # Create the sub folder
-            plot_dir = os.path.join(PLOT_DIR, subfolder)
-
-            mainfig = os.path.join(plot_dir, imagename)
-            savefig = mainfig
-            picklename = mainfig + '.pickle'
-            h5pyname = mainfig + '.hdf5'
+        # Sub folder with a useful name
+        subfolder = "MP__K{}_M{}_T{}_N{}__{}_algos".format(env.nbArms, M, configuration['horizon'], configuration['repetitions'], N_players)
+        # Get the name of the output file
+        imagename = "main____env{}-{}_{}".format((playersId + envId * N_players) + 1, N * N_players, hashvalue)
+        # Create the sub folder
+        plot_dir = os.path.join(PLOT_DIR, subfolder)
 
-            if saveallfigs:
-                if os.path.isdir(plot_dir):
-                    print("{} is already a directory here...".format(plot_dir))
-                elif os.path.isfile(plot_dir):
-                    raise ValueError("[ERROR] {} is a file, cannot use it as a directory !".format(plot_dir))
-                else:
-                    mkdir(plot_dir)
-
-                if USE_PICKLE:
-                    with open(picklename, 'wb') as picklefile:
-                        print("Saving the EvaluatorMultiPlayers 'evaluation' objet to", picklename, "...")
-                        pickle.dump(evaluation, picklefile, pickle.HIGHEST_PROTOCOL)
-                if USE_HD5:
-                    evaluation.saveondisk(h5pyname)
-
-            if not do_simple_plots:
-                break
-
-            # --- Also plotting the running times
-            if saveallfigs:
-                savefig = mainfig.replace('main', 'main_RunningTimes')
-                print(" - Plotting the running times, and saving the plot to {} ...".format(savefig))
-                evaluation.plotRunningTimes(envId, savefig=savefig)  # XXX To save the figure
-            else:
-                evaluation.plotRunningTimes(envId)  # XXX To plot without saving
+        mainfig = os.path.join(plot_dir, imagename)
+        savefig = mainfig
+        picklename = mainfig + '.pickle'
+        h5pyname = mainfig + '.hdf5'
 
-            # --- Also plotting the memory consumption
-            if saveallfigs:
-                savefig = mainfig.replace('main', 'main_MemoryConsumption')
-                print(" - Plotting the memory consumption, and saving the plot to {} ...".format(savefig))
-                evaluation.plotMemoryConsumption(envId, savefig=savefig)  # XXX To save the figure
+        if saveallfigs:
+            if os.path.isdir(plot_dir):
+                print("{} is already a directory here...".format(plot_dir))
+            elif os.path.isfile(plot_dir):
+                raise ValueError("[ERROR] {} is a file, cannot use it as a directory !".format(plot_dir))
             else:
-                evaluation.plotMemoryConsumption(envId)  # XXX To plot without saving
+                mkdir(plot_dir)
 
-            # --- Also plotting the decentralized rewards
-            print("\n\n- Plotting the decentralized rewards")
-            if saveallfigs:
-                print("  and saving the plot to {} ...".format(savefig))
-                savefig = mainfig
-                evaluation.plotRewards(envId, savefig=savefig)
-            else:
-                evaluation.plotRewards(envId)  # XXX To plot without saving
-
-            # --- Also plotting the centralized fairness
-            for fairness in ['STD'] if savefig else ['Ampl', 'STD', 'RajJain', 'Mean']:
-                print("\n\n- Plotting the centralized fairness (%s)" % fairness)
-                if saveallfigs:
-                    savefig = mainfig.replace('main', 'main_Fairness%s' % fairness)
-                    print("  and saving the plot to {} ...".format(savefig))
-                    evaluation.plotFairness(envId, savefig=savefig, fairness=fairness)
-                else:
-                    evaluation.plotFairness(envId, fairness=fairness)  # XXX To plot without saving
-
-            # --- Also plotting the centralized regret
-            print("\n\n- Plotting the centralized regret")
-            if saveallfigs:
-                savefig = mainfig.replace('main', 'main_RegretCentralized')
-                print("  and saving the plot to {} ...".format(savefig))
-                evaluation.plotRegretCentralized(envId, savefig=savefig, normalized=False, subTerms=subTerms)
-            else:
-                evaluation.plotRegretCentralized(envId, normalized=False, subTerms=subTerms)  # XXX To plot without saving
+            if USE_PICKLE:
+                with open(picklename, 'wb') as picklefile:
+                    print("Saving the EvaluatorMultiPlayers 'evaluation' objet to", picklename, "...")
+                    pickle.dump(evaluation, picklefile, pickle.HIGHEST_PROTOCOL)
+            if USE_HD5:
+                evaluation.saveondisk(h5pyname)
 
-            # --- Also plotting the centralized regret in semilogx
-            print("\n\n- Plotting the centralized regret")
-            if saveallfigs:
-                savefig = mainfig.replace('main', 'main_RegretCentralized_semilogx')
-                print("  and saving the plot to {} ...".format(savefig))
-                evaluation.plotRegretCentralized(envId, savefig=savefig, semilogx=True, normalized=False, subTerms=subTerms)
-            else:
-                evaluation.plotRegretCentralized(envId, semilogx=True, normalized=False, subTerms=subTerms)  # XXX To plot without saving
+        if not do_simple_plots:
+            continue
 
-            # --- Also plotting the centralized regret in semilogy
-            print("\n\n- Plotting the centralized regret")
-            if saveallfigs:
-                savefig = mainfig.replace('main', 'main_RegretCentralized_semilogy')
-                print("  and saving the plot to {} ...".format(savefig))
-                evaluation.plotRegretCentralized(envId, savefig=savefig, semilogy=True, normalized=False, subTerms=subTerms)
-            else:
-                evaluation.plotRegretCentralized(envId, semilogy=True, normalized=False, subTerms=subTerms)  # XXX To plot without saving
+        # --- Also plotting the running times
+        if saveallfigs:
+            savefig = mainfig.replace('main', 'main_RunningTimes')
+            print(" - Plotting the running times, and saving the plot to {} ...".format(savefig))
+            evaluation.plotRunningTimes(envId, savefig=savefig)  # XXX To save the figure
+        else:
+            evaluation.plotRunningTimes(envId)  # XXX To plot without saving
+
+        # --- Also plotting the memory consumption
+        if saveallfigs:
+            savefig = mainfig.replace('main', 'main_MemoryConsumption')
+            print(" - Plotting the memory consumption, and saving the plot to {} ...".format(savefig))
+            evaluation.plotMemoryConsumption(envId, savefig=savefig)  # XXX To save the figure
+        else:
+            evaluation.plotMemoryConsumption(envId)  # XXX To plot without saving
 
-            # --- Also plotting the centralized regret in loglog
-            print("\n\n- Plotting the centralized regret")
+        # --- Also plotting the decentralized rewards
+        print("\n\n- Plotting the decentralized rewards")
+        if saveallfigs:
+            print("  and saving the plot to {} ...".format(savefig))
+            savefig = mainfig
+            evaluation.plotRewards(envId, savefig=savefig)
+        else:
+            evaluation.plotRewards(envId)  # XXX To plot without saving
+
+        # --- Also plotting the centralized fairness
+        for fairness in ['STD'] if savefig else ['Ampl', 'STD', 'RajJain', 'Mean']:
+            print("\n\n- Plotting the centralized fairness (%s)" % fairness)
             if saveallfigs:
+                savefig = mainfig.replace('main', 'main_Fairness%s' % fairness)
                 print("  and saving the plot to {} ...".format(savefig))
-                savefig = mainfig.replace('main', 'main_RegretCentralized_loglog')
-                evaluation.plotRegretCentralized(envId, savefig=savefig, loglog=True, normalized=False, subTerms=subTerms)
+                evaluation.plotFairness(envId, savefig=savefig, fairness=fairness)
             else:
-                evaluation.plotRegretCentralized(envId, loglog=True, normalized=False, subTerms=subTerms)  # XXX To plot without saving
-
-            # # --- Also plotting the normalized centralized rewards
-            # print("\n\n- Plotting the normalized centralized regret")
-            # if saveallfigs:
-            #     savefig = mainfig.replace('main', 'main_NormalizedRegretCentralized')
-            #     print("  and saving the plot to {} ...".format(savefig))
-            #     evaluation.plotRegretCentralized(envId, savefig=savefig, normalized=True, subTerms=subTerms)
-            # else:
-            #     evaluation.plotRegretCentralized(envId, normalized=True, subTerms=subTerms)  # XXX To plot without saving
-
-            # # --- Also plotting the number of switches
-            # print("\n\n- Plotting the number of switches")
-            # if saveallfigs:
-            #     savefig = mainfig.replace('main', 'main_NbSwitchs')
-            #     print("  and saving the plot to {} ...".format(savefig))
-            #     evaluation.plotNbSwitchs(envId, savefig=savefig, cumulated=False)
-            # else:
-            #     evaluation.plotNbSwitchs(envId, cumulated=False)  # XXX To plot without saving
-
-            # # --- Also plotting the cumulative number of switches
-            # print("\n\n- Plotting the cumulative number of switches")
-            # if saveallfigs:
-            #     savefig = mainfig.replace('main', 'main_CumNbSwitchs')
-            #     print("  and saving the plot to {} ...".format(savefig))
-            #     evaluation.plotNbSwitchs(envId, savefig=savefig, cumulated=True)
-            # else:
-            #     evaluation.plotNbSwitchs(envId, cumulated=True)  # XXX To plot without saving
-
-            # # --- Also plotting the probability of picking the best arm
-            # print("\n- Plotting the probability of picking the best arm")
-            # if saveallfigs:
-            #     savefig = mainfig.replace('main', 'main_BestArmPulls')
-            #     print("  and saving the plot to {} ...".format(savefig))
-            #     evaluation.plotBestArmPulls(envId, savefig=savefig)
-            # else:
-            #     evaluation.plotBestArmPulls(envId)  # XXX To plot without saving
-
-            # # --- Also plotting the histograms of regrets
-            # print("\n- Plotting the histograms of regrets")
-            # if saveallfigs:
-            #     evaluation.plotLastRegrets(envId, subplots=False)
-            #     print("  and saving the plot to {} ...".format(savefig))
-            #     savefig = mainfig.replace('main', 'main_HistogramsRegret')
-            #     evaluation.plotLastRegrets(envId, subplots=True, savefig=savefig)
-            # else:
-            #     evaluation.plotLastRegrets(envId, subplots=False)  # XXX To plot without saving
-            #     evaluation.plotLastRegrets(envId, subplots=True)  # XXX To plot without saving
-
-            # # --- Also plotting the probability of transmission on a free channel
-            # print("\n- Plotting the probability of transmission on a free channel")
-            # if saveallfigs:
-            #     savefig = mainfig.replace('main', 'main_FreeTransmissions')
-            #     print("  and saving the plot to {} ...".format(savefig))
-            #     evaluation.plotFreeTransmissions(envId, savefig=savefig)
-            # else:
-            #     evaluation.plotFreeTransmissions(envId)  # XXX To plot without saving
-
-            # # --- Also plotting the number of pulls of all arms
-            # print("\n- Plotting the number of pulls of all arms")
-            # if saveallfigs:
-            #     savefig = mainfig.replace('main', 'main_AllPulls')
-            #     print("  and saving the plot to {} ...".format(savefig))
-            #     evaluation.plotAllPulls(envId, savefig=savefig, cumulated=False, normalized=False)
-            # else:
-            #     evaluation.plotAllPulls(envId, cumulated=False, normalized=False)  # XXX To plot without saving
-
-            # # --- Also plotting the cumulative number of pulls of all arms
-            # print("\n- Plotting the cumulative number of pulls of all arms")
-            # if saveallfigs:
-            #     savefig = mainfig.replace('main', 'main_CumAllPulls')
-            #     print("  and saving the plot to {} ...".format(savefig))
-            #     evaluation.plotAllPulls(envId, savefig=savefig, cumulated=True, normalized=False)
-            # else:
-            #     evaluation.plotAllPulls(envId, cumulated=True, normalized=False)  # XXX To plot without saving
-
-            # # XXX Also plotting the cumulative number of pulls of all arms
-            # print("\n- Plotting the cumulative number of pulls of all arms")
-            # if saveallfigs:
-            #     savefig = mainfig.replace('main', 'main_NormalizedAllPulls')
-            #     print("  and saving the plot to {} ...".format(savefig))
-            #     evaluation.plotAllPulls(envId, savefig=savefig, cumulated=True, normalized=True)
-            # else:
-            #     evaluation.plotAllPulls(envId, cumulated=True, normalized=True)  # XXX To plot without saving
-
-            # # --- Also plotting the total nb of collision as a function of time
-            # print("\n- Plotting the total nb of collision as a function of time")
-            # if saveallfigs:
-            #     savefig = mainfig.replace('main', 'main_NbCollisions')
-            #     print("  and saving the plot to {} ...".format(savefig))
-            #     evaluation.plotNbCollisions(envId, savefig=savefig, cumulated=False)
-            # else:
-            #     evaluation.plotNbCollisions(envId, cumulated=False)  # XXX To plot without saving
-
-            # --- Also plotting the total nb of collision as a function of time
-            print("\n- Plotting the cumulated total nb of collision as a function of time")
+                evaluation.plotFairness(envId, fairness=fairness)  # XXX To plot without saving
+
+        # --- Also plotting the centralized regret
+        print("\n\n- Plotting the centralized regret")
+        if saveallfigs:
+            savefig = mainfig.replace('main', 'main_RegretCentralized')
+            print("  and saving the plot to {} ...".format(savefig))
+            evaluation.plotRegretCentralized(envId, savefig=savefig, normalized=False, subTerms=subTerms)
+        else:
+            evaluation.plotRegretCentralized(envId, normalized=False, subTerms=subTerms)  # XXX To plot without saving
+
+        # --- Also plotting the centralized regret in semilogx
+        print("\n\n- Plotting the centralized regret")
+        if saveallfigs:
+            savefig = mainfig.replace('main', 'main_RegretCentralized_semilogx')
+            print("  and saving the plot to {} ...".format(savefig))
+            evaluation.plotRegretCentralized(envId, savefig=savefig, semilogx=True, normalized=False, subTerms=subTerms)
+        else:
+            evaluation.plotRegretCentralized(envId, semilogx=True, normalized=False, subTerms=subTerms)  # XXX To plot without saving
+
+        # --- Also plotting the centralized regret in semilogy
+        print("\n\n- Plotting the centralized regret")
+        if saveallfigs:
+            savefig = mainfig.replace('main', 'main_RegretCentralized_semilogy')
+            print("  and saving the plot to {} ...".format(savefig))
+            evaluation.plotRegretCentralized(envId, savefig=savefig, semilogy=True, normalized=False, subTerms=subTerms)
+        else:
+            evaluation.plotRegretCentralized(envId, semilogy=True, normalized=False, subTerms=subTerms)  # XXX To plot without saving
+
+        # --- Also plotting the centralized regret in loglog
+        print("\n\n- Plotting the centralized regret")
+        if saveallfigs:
+            print("  and saving the plot to {} ...".format(savefig))
+            savefig = mainfig.replace('main', 'main_RegretCentralized_loglog')
+            evaluation.plotRegretCentralized(envId, savefig=savefig, loglog=True, normalized=False, subTerms=subTerms)
+        else:
+            evaluation.plotRegretCentralized(envId, loglog=True, normalized=False, subTerms=subTerms)  # XXX To plot without saving
+
+        # # --- Also plotting the normalized centralized rewards
+        # print("\n\n- Plotting the normalized centralized regret")
+        # if saveallfigs:
+        #     savefig = mainfig.replace('main', 'main_NormalizedRegretCentralized')
+        #     print("  and saving the plot to {} ...".format(savefig))
+        #     evaluation.plotRegretCentralized(envId, savefig=savefig, normalized=True, subTerms=subTerms)
+        # else:
+        #     evaluation.plotRegretCentralized(envId, normalized=True, subTerms=subTerms)  # XXX To plot without saving
+
+        # # --- Also plotting the number of switches
+        # print("\n\n- Plotting the number of switches")
+        # if saveallfigs:
+        #     savefig = mainfig.replace('main', 'main_NbSwitchs')
+        #     print("  and saving the plot to {} ...".format(savefig))
+        #     evaluation.plotNbSwitchs(envId, savefig=savefig, cumulated=False)
+        # else:
+        #     evaluation.plotNbSwitchs(envId, cumulated=False)  # XXX To plot without saving
+
+        # # --- Also plotting the cumulative number of switches
+        # print("\n\n- Plotting the cumulative number of switches")
+        # if saveallfigs:
+        #     savefig = mainfig.replace('main', 'main_CumNbSwitchs')
+        #     print("  and saving the plot to {} ...".format(savefig))
+        #     evaluation.plotNbSwitchs(envId, savefig=savefig, cumulated=True)
+        # else:
+        #     evaluation.plotNbSwitchs(envId, cumulated=True)  # XXX To plot without saving
+
+        # # --- Also plotting the probability of picking the best arm
+        # print("\n- Plotting the probability of picking the best arm")
+        # if saveallfigs:
+        #     savefig = mainfig.replace('main', 'main_BestArmPulls')
+        #     print("  and saving the plot to {} ...".format(savefig))
+        #     evaluation.plotBestArmPulls(envId, savefig=savefig)
+        # else:
+        #     evaluation.plotBestArmPulls(envId)  # XXX To plot without saving
+
+        # # --- Also plotting the histograms of regrets
+        # print("\n- Plotting the histograms of regrets")
+        # if saveallfigs:
+        #     evaluation.plotLastRegrets(envId, subplots=False)
+        #     print("  and saving the plot to {} ...".format(savefig))
+        #     savefig = mainfig.replace('main', 'main_HistogramsRegret')
+        #     evaluation.plotLastRegrets(envId, subplots=True, savefig=savefig)
+        # else:
+        #     evaluation.plotLastRegrets(envId, subplots=False)  # XXX To plot without saving
+        #     evaluation.plotLastRegrets(envId, subplots=True)  # XXX To plot without saving
+
+        # # --- Also plotting the probability of transmission on a free channel
+        # print("\n- Plotting the probability of transmission on a free channel")
+        # if saveallfigs:
+        #     savefig = mainfig.replace('main', 'main_FreeTransmissions')
+        #     print("  and saving the plot to {} ...".format(savefig))
+        #     evaluation.plotFreeTransmissions(envId, savefig=savefig)
+        # else:
+        #     evaluation.plotFreeTransmissions(envId)  # XXX To plot without saving
+
+        # # --- Also plotting the number of pulls of all arms
+        # print("\n- Plotting the number of pulls of all arms")
+        # if saveallfigs:
+        #     savefig = mainfig.replace('main', 'main_AllPulls')
+        #     print("  and saving the plot to {} ...".format(savefig))
+        #     evaluation.plotAllPulls(envId, savefig=savefig, cumulated=False, normalized=False)
+        # else:
+        #     evaluation.plotAllPulls(envId, cumulated=False, normalized=False)  # XXX To plot without saving
+
+        # # --- Also plotting the cumulative number of pulls of all arms
+        # print("\n- Plotting the cumulative number of pulls of all arms")
+        # if saveallfigs:
+        #     savefig = mainfig.replace('main', 'main_CumAllPulls')
+        #     print("  and saving the plot to {} ...".format(savefig))
+        #     evaluation.plotAllPulls(envId, savefig=savefig, cumulated=True, normalized=False)
+        # else:
+        #     evaluation.plotAllPulls(envId, cumulated=True, normalized=False)  # XXX To plot without saving
+
+        # # XXX Also plotting the cumulative number of pulls of all arms
+        # print("\n- Plotting the cumulative number of pulls of all arms")
+        # if saveallfigs:
+        #     savefig = mainfig.replace('main', 'main_NormalizedAllPulls')
+        #     print("  and saving the plot to {} ...".format(savefig))
+        #     evaluation.plotAllPulls(envId, savefig=savefig, cumulated=True, normalized=True)
+        # else:
+        #     evaluation.plotAllPulls(envId, cumulated=True, normalized=True)  # XXX To plot without saving
+
+        # # --- Also plotting the total nb of collision as a function of time
+        # print("\n- Plotting the total nb of collision as a function of time")
+        # if saveallfigs:
+        #     savefig = mainfig.replace('main', 'main_NbCollisions')
+        #     print("  and saving the plot to {} ...".format(savefig))
+        #     evaluation.plotNbCollisions(envId, savefig=savefig, cumulated=False)
+        # else:
+        #     evaluation.plotNbCollisions(envId, cumulated=False)  # XXX To plot without saving
+
+        # --- Also plotting the total nb of collision as a function of time
+        print("\n- Plotting the cumulated total nb of collision as a function of time")
+        if saveallfigs:
+            savefig = mainfig.replace('main', 'main_CumNbCollisions')
+            print("  and saving the plot to {} ...".format(savefig))
+            evaluation.plotNbCollisions(envId, savefig=savefig, cumulated=True, upperbound=False)
+        else:
+            evaluation.plotNbCollisions(envId, cumulated=True, upperbound=False)  # XXX To plot without saving
+
+        # --- Also plotting the frequency of collision in each arm
+        for piechart in [False, True]:
+            print("\n- Plotting the frequency of collision in each arm")
             if saveallfigs:
-                savefig = mainfig.replace('main', 'main_CumNbCollisions')
+                savefig = mainfig.replace('main', 'main_FrequencyCollisions%s' % ('' if piechart else 'Hist'))
                 print("  and saving the plot to {} ...".format(savefig))
-                evaluation.plotNbCollisions(envId, savefig=savefig, cumulated=True, upperbound=False)
+                evaluation.plotFrequencyCollisions(envId, savefig=savefig, piechart=piechart)
             else:
-                evaluation.plotNbCollisions(envId, cumulated=True, upperbound=False)  # XXX To plot without saving
-
-            # --- Also plotting the frequency of collision in each arm
-            for piechart in [False, True]:
-                print("\n- Plotting the frequency of collision in each arm")
-                if saveallfigs:
-                    savefig = mainfig.replace('main', 'main_FrequencyCollisions%s' % ('' if piechart else 'Hist'))
-                    print("  and saving the plot to {} ...".format(savefig))
-                    evaluation.plotFrequencyCollisions(envId, savefig=savefig, piechart=piechart)
-                else:
-                    evaluation.plotFrequencyCollisions(envId, piechart=piechart)  # XXX To plot without saving
+                evaluation.plotFrequencyCollisions(envId, piechart=piechart)  # XXX To plot without saving
 
-            if saveallfigs:
-                print("\n\n==> To see the figures, do :\neog", os.path.join(plot_dir, "main*{}.png".format(hashvalue)))  # DEBUG
+        if saveallfigs:
+            print("\n\n==> To see the figures, do :\neog", os.path.join(plot_dir, "main*{}.png".format(hashvalue)))  # DEBUG
 
     #
     # Compare different MP strategies on the same figures